@@ -0,0 +1,149 @@
+"""
+API 서버 부하 테스트: 동시 연결 N개로 POST /api/optimize를 보내고 처리량과 지연 백분위수를 출력합니다.
+
+    python loadtest.py --url http://127.0.0.1:5001 -c 64 -n 2000
+    python loadtest.py --server flask --server asgi -c 64 -n 2000   # 서버를 직접 띄워 비교
+
+표준 라이브러리 asyncio 연결(keep-alive)만 사용하므로 클라이언트 스레드 수가 결과에 영향을 주지 않습니다.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from urllib.parse import urlsplit
+from typing import Dict, List, Any, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_TEXTS = [
+    "노을 지는 해변에서 산책하는 고양이 사진을 상세하게 만들어주세요",
+    "블로그 포스트를 작성해주세요",
+    "Summarize this article in three bullet points",
+    "밝고 화창한 날에 해변에서 뛰노는 강아지의 사진",
+]
+
+# 비교용 서버 실행 명령 (backend 디렉토리 기준)
+SERVER_COMMANDS = {
+    "flask": [sys.executable, "src/main.py"],
+    "asgi": [sys.executable, "-m", "uvicorn", "src.asgi:app", "--host", "127.0.0.1", "--log-level", "warning"],
+}
+
+
+async def worker(host: str, port: int, path: str, bodies: List[bytes], counter: List[int], total: int,
+                 latencies: List[float], errors: List[str]) -> None:
+    """연결 하나로 요청을 순서대로 보냅니다 (요청 수가 total에 도달할 때까지)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total:
+            n = counter[0]
+            counter[0] += 1
+            body = bodies[n % len(bodies)]
+            head = (f"POST {path} HTTP/1.1\r\nHost: {host}:{port}\r\nContent-Type: application/json\r\n"
+                    f"Cache-Control: no-cache\r\nContent-Length: {len(body)}\r\n\r\n").encode("latin-1")
+            started = time.perf_counter()
+            writer.write(head + body)
+            status, response_headers = await read_head(reader)
+            await reader.readexactly(int(response_headers.get("content-length", "0")))
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(str(status))
+            if response_headers.get("connection", "").lower() == "close":
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+    finally:
+        writer.close()
+
+
+async def read_head(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    """응답 상태 코드와 헤더를 읽습니다."""
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            return status, headers
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def run(url: str, concurrency: int, total: int, model_id: str) -> Dict[str, Any]:
+    """부하 테스트를 실행하고 처리량/지연 통계를 반환합니다."""
+    parts = urlsplit(url)
+    bodies = [json.dumps({"input_text": f"{text} {n}", "model_id": model_id}, ensure_ascii=False).encode("utf-8")
+              for n, text in enumerate(DEFAULT_TEXTS * 4)]
+    counter, latencies, errors = [0], [], []
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(parts.hostname, parts.port or 80, "/api/optimize", bodies, counter, total,
+                                  latencies, errors) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": round(elapsed, 2),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(0.50), 1),
+        "p95_ms": round(percentile(0.95), 1),
+        "p99_ms": round(percentile(0.99), 1),
+    }
+
+
+def wait_for_port(port: int, timeout: float = 60.0) -> None:
+    """서버가 포트를 열 때까지 기다립니다."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"서버가 포트 {port}에서 시작되지 않았습니다.")
+
+
+def run_server(name: str, port: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """서버를 띄우고 예열 요청 후 부하 테스트를 실행합니다."""
+    command = SERVER_COMMANDS[name] + (["--port", str(port)] if name == "asgi" else [])
+    env = dict(os.environ, PORT=str(port))
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        url = f"http://127.0.0.1:{port}"
+        asyncio.run(run(url, 4, 40, args.model))
+        return asyncio.run(run(url, args.concurrency, args.requests, args.model))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="POST /api/optimize 부하 테스트")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (예: http://127.0.0.1:5001)")
+    parser.add_argument("--server", action="append", choices=sorted(SERVER_COMMANDS),
+                        help="직접 띄워 측정할 서버 (여러 번 지정 가능)")
+    parser.add_argument("-c", "--concurrency", type=int, default=64, help="동시 연결 수")
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="전체 요청 수")
+    parser.add_argument("--model", default="gpt-4o", help="최적화 대상 모델 ID")
+    parser.add_argument("--port", type=int, default=5099, help="--server로 띄울 서버 포트")
+    args = parser.parse_args()
+
+    if args.url:
+        print(json.dumps(asyncio.run(run(args.url, args.concurrency, args.requests, args.model))))
+    for name in args.server or []:
+        print(json.dumps({"server": name, **run_server(name, args.port, args)}))
+    if not args.url and not args.server:
+        parser.error("--url 또는 --server를 지정하세요.")
+
+
+if __name__ == "__main__":
+    main()
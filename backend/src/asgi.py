@@ -0,0 +1,446 @@
+"""
+ASGI 서버 진입점: main.py(Flask)와 같은 API 라우트를 asyncio 이벤트 루프 하나에서 처리합니다.
+
+    uvicorn src.asgi:app --host 0.0.0.0 --port 5001
+
+요청마다 작업 스레드를 붙잡아 두는 대신, 프롬프트 최적화는 PromptOptimizer.optimize_prompt_async로
+작업 스레드 풀에서 단계별로 실행하고 이벤트 루프는 다른 요청을 계속 받습니다.
+처리 중에 클라이언트 연결이 끊기면 해당 요청을 취소합니다.
+"""
+
+import os
+import re
+import sys
+import json
+import asyncio
+import logging
+import functools
+import mimetypes
+from datetime import datetime
+from urllib.parse import parse_qs
+from typing import Dict, List, Any, Awaitable, Callable, Optional, Tuple
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.optimizer import PromptOptimizer
+from src.services.model_metadata import ModelMetadataSnapshot, SerializedPayload
+from src.services.api_requests import (
+    CORS_ORIGINS, CORS_ALLOW_HEADERS, CORS_ALLOW_METHODS,
+    validate_optimize_request, validate_batch_request, validate_compare_request, wants_cache
+)
+from src.utils.nlp_analyzer import start_nltk_warmup
+
+try:
+    import uvicorn
+    UVICORN_AVAILABLE = True
+except ImportError:
+    UVICORN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 프론트엔드 빌드 결과 (main.py의 static_folder와 같은 위치)
+STATIC_FOLDER = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'frontend', 'dist'))
+
+# 요청 본문 최대 크기(바이트)
+MAX_BODY_BYTES = int(os.environ.get('ASGI_MAX_BODY_BYTES', str(1024 * 1024)))
+
+# 응답 헤더 목록 (ASGI 형식: 바이트 이름/값 쌍)
+Headers = List[Tuple[bytes, bytes]]
+
+
+class ClientDisconnected(Exception):
+    """응답을 보내기 전에 클라이언트 연결이 끊김"""
+
+
+class Request:
+    """ASGI scope와 읽어 둔 본문으로 만든 요청 정보"""
+
+    def __init__(self, scope: Dict[str, Any], body: bytes):
+        self.method: str = scope['method']
+        self.path: str = scope['path']
+        self.query = {key: values[-1] for key, values in parse_qs(scope.get('query_string', b'').decode('latin-1')).items()}
+        self.headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope.get('headers', [])}
+        self.body = body
+        self.params: Dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        query = '?' + '&'.join(f"{key}={value}" for key, value in self.query.items()) if self.query else ''
+        return f"http://{self.headers.get('host', '')}{self.path}{query}"
+
+    @property
+    def is_json(self) -> bool:
+        return self.headers.get('content-type', '').split(';')[0].strip().endswith('json')
+
+    def json(self) -> Any:
+        """JSON 본문 (본문이 없으면 None, 잘못된 JSON이면 ValueError)"""
+        return json.loads(self.body) if self.body else None
+
+    @property
+    def no_cache(self) -> bool:
+        """Cache-Control: no-cache 요청 헤더 여부"""
+        directives = [directive.strip().lower() for directive in self.headers.get('cache-control', '').split(',')]
+        return 'no-cache' in directives
+
+    def etag_matches(self, etag: str) -> bool:
+        """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+        header = self.headers.get('if-none-match')
+        if not header:
+            return False
+        tags = [tag.strip() for tag in header.split(',')]
+        return '*' in tags or f'"{etag}"' in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+
+class Response:
+    """상태 코드, 본문, 헤더로 이루어진 응답"""
+
+    def __init__(self, body: bytes = b'', status: int = 200, content_type: Optional[str] = 'application/json',
+                 headers: Optional[Headers] = None):
+        self.body = body
+        self.status = status
+        self.headers: Headers = list(headers or [])
+        if content_type is not None:
+            self.headers.append((b'content-type', content_type.encode('latin-1')))
+
+    @classmethod
+    def json(cls, payload: Any, status: int = 200) -> "Response":
+        return cls(json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8'), status)
+
+    @classmethod
+    def error(cls, message: str, status: int) -> "Response":
+        return cls.json({"success": False, "error": message}, status)
+
+    async def send(self, send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        headers = self.headers + [(b'content-length', str(len(self.body)).encode('latin-1'))]
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': self.body})
+
+
+class PromptOptimizerASGI:
+    """
+    main.py와 같은 API를 제공하는 ASGI 애플리케이션
+
+    PromptOptimizer는 lifespan 시작 시(또는 첫 요청 시) 만들고 종료 시 작업 스레드를 정리합니다.
+    """
+
+    def __init__(self, optimizer: Optional[PromptOptimizer] = None, static_folder: str = STATIC_FOLDER):
+        """
+        Args:
+            optimizer: 사용할 PromptOptimizer (None이면 시작 시 기본 설정으로 생성)
+            static_folder: 프론트엔드 정적 파일 디렉토리
+        """
+        self.optimizer = optimizer
+        self.model_metadata = ModelMetadataSnapshot(optimizer) if optimizer is not None else None
+        self.static_folder = static_folder
+        self._start_lock: Optional[asyncio.Lock] = None
+        # 처리 중 연결이 끊겨 취소된 요청 수
+        self.disconnects = 0
+
+        # (메서드, 경로 패턴, 처리 함수, 500 오류 메시지 접두어)
+        self.routes = [
+            ('GET', re.compile(r'/api/health'), self.health_check, "서버 상태 확인 중 오류 발생"),
+            ('GET', re.compile(r'/api/models'), self.get_available_models, "모델 정보 조회 중 오류 발생"),
+            ('POST', re.compile(r'/api/optimize'), self.optimize_prompt, "프롬프트 최적화 중 오류 발생"),
+            ('POST', re.compile(r'/api/optimize/batch'), self.optimize_prompt_batch, "배치 프롬프트 최적화 중 오류 발생"),
+            ('GET', re.compile(r'/api/model/(?P<model_id>[^/]+)/tips'), self.get_model_tips, "모델 팁 조회 중 오류 발생"),
+            ('GET', re.compile(r'/api/model/(?P<model_id>[^/]+)/structure'), self.get_model_structure, "모델 구조 조회 중 오류 발생"),
+            ('GET', re.compile(r'/api/model/(?P<model_id>[^/]+)/info'), self.get_model_info, "모델 정보 조회 중 오류 발생"),
+            ('POST', re.compile(r'/api/compare'), self.compare_models, "모델 비교 중 오류 발생"),
+        ]
+
+    # ASGI 진입점
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._handle_http(scope, receive, send)
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await self.startup()
+                except Exception as e:
+                    logger.error(f"ASGI 서버 시작 실패: {str(e)}")
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def startup(self) -> None:
+        """PromptOptimizer를 만들고 NLTK 리소스 로딩을 백그라운드에서 시작합니다."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.optimizer is None:
+                # 모델 매니페스트/분석기 초기화는 이벤트 루프 밖에서
+                self.optimizer = await asyncio.get_running_loop().run_in_executor(None, PromptOptimizer)
+                self.model_metadata = ModelMetadataSnapshot(self.optimizer)
+                start_nltk_warmup()
+
+    def shutdown(self) -> None:
+        """PromptOptimizer의 작업 스레드를 종료합니다."""
+        if self.optimizer is not None:
+            self.optimizer.shutdown()
+
+    async def _handle_http(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if self.optimizer is None:
+            await self.startup()
+        try:
+            body = await self._read_body(receive)
+        except ClientDisconnected:
+            return
+        except ValueError:
+            await self._with_cors(scope, Response.error("요청 본문이 너무 큽니다.", 413)).send(send)
+            return
+
+        request = Request(scope, body)
+        self._log_request(request)
+        try:
+            response = await self._dispatch(request, receive)
+        except ClientDisconnected:
+            self.disconnects += 1
+            logger.info(f"클라이언트 연결 종료로 요청 취소: {request.method} {request.path}")
+            return
+        await self._with_cors(scope, response).send(send)
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                raise ClientDisconnected()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise ValueError("request body too large")
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    @staticmethod
+    def _log_request(request: Request) -> None:
+        """모든 요청을 로깅합니다 (main.py의 log_request_info와 같음)."""
+        logger.info(f"요청: {request.method} {request.url}")
+        logger.info(f"헤더: {request.headers}")
+        if request.is_json:
+            logger.info(f"요청 본문: {request.body.decode('utf-8', 'replace')}")
+
+    async def _dispatch(self, request: Request, receive: Callable) -> Response:
+        if request.method == 'OPTIONS':
+            return Response(status=200, content_type=None)
+
+        for method, pattern, handler, error_prefix in self.routes:
+            match = pattern.fullmatch(request.path)
+            if match is None or method != request.method:
+                continue
+            request.params = match.groupdict()
+            try:
+                return await self._until_disconnect(receive, handler(request))
+            except ClientDisconnected:
+                raise
+            except Exception as e:
+                logger.error(f"{error_prefix}: {str(e)}")
+                return Response.error(f"{error_prefix}: {str(e)}", 500)
+
+        # main.py처럼 나머지 GET 경로는 프론트엔드 정적 파일, 그 외 메서드는 405
+        if request.method == 'GET':
+            return await self.serve(request)
+        return Response.error("허용되지 않은 메서드입니다.", 405)
+
+    @staticmethod
+    async def _until_disconnect(receive: Callable, handler: Awaitable[Response]) -> Response:
+        """
+        처리 함수를 실행하면서 연결 종료를 기다리고, 먼저 끊기면 처리를 취소합니다.
+
+        본문을 모두 읽은 뒤의 receive는 연결이 끊길 때까지 반환하지 않습니다.
+        """
+        task = asyncio.ensure_future(handler)
+
+        async def wait_disconnect() -> None:
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+
+        watcher = asyncio.ensure_future(wait_disconnect())
+        try:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            watcher.cancel()
+        if not task.done():
+            task.cancel()
+            raise ClientDisconnected()
+        return task.result()
+
+    def _with_cors(self, scope: Dict[str, Any], response: Response) -> Response:
+        """허용된 오리진의 요청이면 CORS 헤더를 추가합니다."""
+        origin = next((value.decode('latin-1') for name, value in scope.get('headers', []) if name.lower() == b'origin'), None)
+        if origin in CORS_ORIGINS:
+            response.headers += [
+                (b'access-control-allow-origin', origin.encode('latin-1')),
+                (b'vary', b'Origin'),
+            ]
+            if scope.get('method') == 'OPTIONS':
+                response.headers += [
+                    (b'access-control-allow-methods', ', '.join(CORS_ALLOW_METHODS).encode('latin-1')),
+                    (b'access-control-allow-headers', ', '.join(CORS_ALLOW_HEADERS).encode('latin-1')),
+                ]
+        return response
+
+    @staticmethod
+    def _json_body(request: Request) -> Any:
+        try:
+            return request.json()
+        except ValueError:
+            return None
+
+    def _snapshot_response(self, request: Request, payload: SerializedPayload) -> Response:
+        """
+        직렬화된 메타데이터 응답을 강한 ETag와 함께 반환합니다.
+        If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+        """
+        headers = [(b'etag', f'"{payload.etag}"'.encode('latin-1')), (b'cache-control', b'no-cache')]
+        if request.etag_matches(payload.etag):
+            return Response(status=304, content_type=None, headers=headers)
+        return Response(payload.body, headers=headers)
+
+    @staticmethod
+    async def _run_sync(func: Callable[..., Any], *args: Any) -> Any:
+        """
+        동기 함수를 기본 작업 스레드 풀에서 실행합니다.
+        모델 지연 로딩(모듈 import, 생성자)이나 메타데이터 직렬화가 이벤트 루프를 막지 않도록 사용합니다.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+    # API 라우트들
+
+    async def health_check(self, request: Request) -> Response:
+        """서버 상태 확인 엔드포인트"""
+        return Response.json({
+            "status": "ok",
+            "timestamp": datetime.now().isoformat(),
+            "version": "1.0.0",
+            "result_cache": self.optimizer.get_result_cache_stats()
+        })
+
+    async def get_available_models(self, request: Request) -> Response:
+        """사용 가능한 모든 모델 정보를 반환하는 엔드포인트"""
+        return self._snapshot_response(request, await self._run_sync(self.model_metadata.models))
+
+    async def optimize_prompt(self, request: Request) -> Response:
+        """사용자 입력을 분석하고 선택된 모델에 최적화된 프롬프트를 생성하는 엔드포인트"""
+        data = self._json_body(request)
+        error = validate_optimize_request(data)
+        if error:
+            return Response.error(error, 400)
+
+        result = await self.optimizer.optimize_prompt_async(
+            data['input_text'], data['model_id'], data.get('additional_params', {}),
+            use_cache=wants_cache(data, request.no_cache))
+        return Response.json(result)
+
+    async def optimize_prompt_batch(self, request: Request) -> Response:
+        """하나의 입력을 여러 모델에 대해 한 번에 최적화하는 엔드포인트"""
+        data = self._json_body(request)
+        error = validate_batch_request(data)
+        if error:
+            return Response.error(error, 400)
+
+        results = await self.optimizer.optimize_batch_async(
+            data['input_text'], data['model_ids'], data.get('additional_params', {}),
+            use_cache=wants_cache(data, request.no_cache))
+        return Response.json({
+            "success": True,
+            "original_input": data['input_text'],
+            "results": results
+        })
+
+    async def get_model_tips(self, request: Request) -> Response:
+        """특정 모델의 최적화 팁을 반환하는 엔드포인트"""
+        model_id = request.params['model_id']
+        capability = request.query.get('capability')
+        return Response.json({
+            "success": True,
+            "model_id": model_id,
+            "capability": capability,
+            "tips": await self._run_sync(self.optimizer.get_model_specific_tips, model_id, capability)
+        })
+
+    async def get_model_structure(self, request: Request) -> Response:
+        """특정 모델의 프롬프트 구조를 반환하는 엔드포인트"""
+        model_id = request.params['model_id']
+        payload = await self._run_sync(self.model_metadata.model_structure, model_id)
+        if payload is None:
+            error = await self._run_sync(self.optimizer.get_model_prompt_structure, model_id)
+            return Response.error(error["error"], 404)
+        return self._snapshot_response(request, payload)
+
+    async def get_model_info(self, request: Request) -> Response:
+        """특정 모델의 정보를 반환하는 엔드포인트"""
+        model_id = request.params['model_id']
+        payload = await self._run_sync(self.model_metadata.model_info, model_id)
+        if payload is None:
+            error = await self._run_sync(self.optimizer.get_model_info, model_id)
+            return Response.error(error["error"], 404)
+        return self._snapshot_response(request, payload)
+
+    async def compare_models(self, request: Request) -> Response:
+        """여러 모델을 비교하는 엔드포인트"""
+        data = self._json_body(request)
+        error = validate_compare_request(data)
+        if error:
+            return Response.error(error, 400)
+        return Response.json({
+            "success": True,
+            "comparison": await self._run_sync(self.optimizer.compare_models, data['model_ids'])
+        })
+
+    async def serve(self, request: Request) -> Response:
+        """프론트엔드 정적 파일 서빙 (없는 경로는 index.html)"""
+        relative = request.path.lstrip('/')
+        path = os.path.realpath(os.path.join(self.static_folder, relative))
+        if not relative or not path.startswith(os.path.realpath(self.static_folder) + os.sep) or not os.path.isfile(path):
+            path = os.path.join(self.static_folder, 'index.html')
+        if not os.path.isfile(path):
+            return Response.error("요청한 리소스를 찾을 수 없습니다.", 404)
+
+        def read() -> bytes:
+            with open(path, 'rb') as f:
+                return f.read()
+
+        body = await self._run_sync(read)
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        return Response(body, content_type=content_type)
+
+
+app = PromptOptimizerASGI()
+
+if __name__ == '__main__':
+    # 로깅 설정 (main.py와 같음)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("api_server.log", encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+    if not UVICORN_AVAILABLE:
+        logger.error("uvicorn이 설치되어 있지 않습니다: pip install uvicorn")
+        sys.exit(1)
+
+    # 환경 변수에서 포트 가져오기 (기본값: 5001)
+    port = int(os.environ.get('PORT', 5001))
+    logger.info(f"ASGI 서버를 포트 {port}에서 시작합니다.")
+    uvicorn.run(app, host='0.0.0.0', port=port, log_config=None)
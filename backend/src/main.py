@@ -11,6 +11,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # 프롬프트 최적화 엔진 임포트
 from src.services.optimizer import PromptOptimizer
+from src.services.model_metadata import ModelMetadataSnapshot, SerializedPayload
+from src.services.api_requests import (
+    CORS_ORIGINS, CORS_ALLOW_HEADERS, CORS_ALLOW_METHODS,
+    validate_optimize_request, validate_batch_request, validate_compare_request, wants_cache
+)
+from src.utils.nlp_analyzer import start_nltk_warmup
 
 # 로깅 설정
 logging.basicConfig(
@@ -31,21 +37,10 @@ sys.stderr.reconfigure(encoding='utf-8', errors='backslashreplace')
 app = Flask(__name__, static_folder='../../frontend/dist')
 
 # CORS 설정 개선 - 명시적인 오리진 허용
-CORS(app, origins=[
-    "http://localhost:5173",      # Vite 개발 서버
-    "http://127.0.0.1:5173",      # 로컬호스트 대안
-    "http://localhost:3000",      # Create React App (대안)
-    "http://127.0.0.1:3000",      # 로컬호스트 대안
-], 
+CORS(app, origins=CORS_ORIGINS,
 supports_credentials=False,       # 쿠키 지원 비활성화 (보안상)
-allow_headers=[
-    'Content-Type', 
-    'Authorization',
-    'X-Requested-With',
-    'Accept',
-    'Origin'
-],
-methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']
+allow_headers=CORS_ALLOW_HEADERS,
+methods=CORS_ALLOW_METHODS
 )
 
 # 요청 로깅 미들웨어
@@ -62,6 +57,24 @@ def log_request_info():
 # 프롬프트 최적화 엔진 초기화
 optimizer = PromptOptimizer()
 
+# 모델 목록/정보/구조 응답은 레지스트리 버전마다 한 번만 직렬화
+model_metadata = ModelMetadataSnapshot(optimizer)
+
+
+def snapshot_response(payload: SerializedPayload):
+    """
+    직렬화된 메타데이터 응답을 강한 ETag와 함께 반환합니다.
+    If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    if request.if_none_match.contains_weak(payload.etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(payload.body, mimetype='application/json')
+    response.set_etag(payload.etag)
+    # 캐시는 하되 매번 ETag로 재검증
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
 # API 라우트들 (먼저 정의)
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -71,7 +84,8 @@ def health_check():
     return jsonify({
         "status": "ok",
         "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "result_cache": optimizer.get_result_cache_stats()
     })
 
 @app.route('/api/models', methods=['GET'])
@@ -80,11 +94,7 @@ def get_available_models():
     사용 가능한 모든 AI 모델 정보를 반환하는 엔드포인트
     """
     try:
-        models = optimizer.get_available_models()
-        return jsonify({
-            "success": True,
-            "models": models
-        })
+        return snapshot_response(model_metadata.models())
     except Exception as e:
         logger.error(f"모델 정보 조회 중 오류 발생: {str(e)}")
         return jsonify({
@@ -100,40 +110,23 @@ def optimize_prompt():
     try:
         data = request.json
         
-        # 필수 파라미터 확인
-        if not data or 'input_text' not in data or 'model_id' not in data:
+        # 요청 본문 검증
+        error = validate_optimize_request(data)
+        if error:
             return jsonify({
                 "success": False,
-                "error": "필수 파라미터가 누락되었습니다. 'input_text'와 'model_id'는 필수입니다."
+                "error": error
             }), 400
         
         input_text = data['input_text']
         model_id = data['model_id']
         additional_params = data.get('additional_params', {})
         
-        # 입력 텍스트 검증
-        if not input_text or not isinstance(input_text, str):
-            return jsonify({
-                "success": False,
-                "error": "유효하지 않은 입력 텍스트입니다."
-            }), 400
-        
-        # 모델 ID 검증
-        if not model_id or not isinstance(model_id, str):
-            return jsonify({
-                "success": False,
-                "error": "유효하지 않은 모델 ID입니다."
-            }), 400
-        
-        # 추가 파라미터 검증
-        if additional_params and not isinstance(additional_params, dict):
-            return jsonify({
-                "success": False,
-                "error": "유효하지 않은 추가 파라미터 형식입니다."
-            }), 400
+        # 결과 캐시 우회: 요청 본문의 "use_cache": false 또는 Cache-Control: no-cache 헤더
+        use_cache = wants_cache(data, bool(request.cache_control.no_cache))
         
         # 프롬프트 최적화 실행
-        result = optimizer.optimize_prompt(input_text, model_id, additional_params)
+        result = optimizer.optimize_prompt(input_text, model_id, additional_params, use_cache=use_cache)
         
         # 결과 반환
         return jsonify(result)
@@ -145,6 +138,44 @@ def optimize_prompt():
             "error": f"프롬프트 최적화 중 오류 발생: {str(e)}"
         }), 500
 
+@app.route('/api/optimize/batch', methods=['POST'])
+def optimize_prompt_batch():
+    """
+    하나의 입력을 여러 모델에 대해 한 번에 최적화하는 엔드포인트
+    (입력 분석은 한 번만 수행하고, 모델별 결과와 오류를 model_ids 순서로 반환)
+    """
+    try:
+        data = request.json
+        
+        # 요청 본문 검증
+        error = validate_batch_request(data)
+        if error:
+            return jsonify({
+                "success": False,
+                "error": error
+            }), 400
+        
+        input_text = data['input_text']
+        model_ids = data['model_ids']
+        additional_params = data.get('additional_params', {})
+        use_cache = wants_cache(data, bool(request.cache_control.no_cache))
+        
+        # 모델별 프롬프트 최적화 실행 (분석 공유)
+        results = optimizer.optimize_batch(input_text, model_ids, additional_params, use_cache=use_cache)
+        
+        return jsonify({
+            "success": True,
+            "original_input": input_text,
+            "results": results
+        })
+    
+    except Exception as e:
+        logger.error(f"배치 프롬프트 최적화 중 오류 발생: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": f"배치 프롬프트 최적화 중 오류 발생: {str(e)}"
+        }), 500
+
 @app.route('/api/model/<model_id>/tips', methods=['GET'])
 def get_model_tips(model_id):
     """
@@ -173,19 +204,15 @@ def get_model_structure(model_id):
     특정 모델의 프롬프트 구조를 반환하는 엔드포인트
     """
     try:
-        structure = optimizer.get_model_prompt_structure(model_id)
+        payload = model_metadata.model_structure(model_id)
         
-        if "error" in structure:
+        if payload is None:
             return jsonify({
                 "success": False,
-                "error": structure["error"]
+                "error": optimizer.get_model_prompt_structure(model_id)["error"]
             }), 404
         
-        return jsonify({
-            "success": True,
-            "model_id": model_id,
-            "structure": structure
-        })
+        return snapshot_response(payload)
     except Exception as e:
         logger.error(f"모델 구조 조회 중 오류 발생: {str(e)}")
         return jsonify({
@@ -199,19 +226,15 @@ def get_model_info(model_id):
     특정 모델의 정보를 반환하는 엔드포인트
     """
     try:
-        info = optimizer.get_model_info(model_id)
+        payload = model_metadata.model_info(model_id)
         
-        if "error" in info:
+        if payload is None:
             return jsonify({
                 "success": False,
-                "error": info["error"]
+                "error": optimizer.get_model_info(model_id)["error"]
             }), 404
         
-        return jsonify({
-            "success": True,
-            "model_id": model_id,
-            "info": info
-        })
+        return snapshot_response(payload)
     except Exception as e:
         logger.error(f"모델 정보 조회 중 오류 발생: {str(e)}")
         return jsonify({
@@ -227,22 +250,16 @@ def compare_models():
     try:
         data = request.json
         
-        # 필수 파라미터 확인
-        if not data or 'model_ids' not in data:
+        # 요청 본문 검증
+        error = validate_compare_request(data)
+        if error:
             return jsonify({
                 "success": False,
-                "error": "필수 파라미터가 누락되었습니다. 'model_ids'는 필수입니다."
+                "error": error
             }), 400
         
         model_ids = data['model_ids']
         
-        # 모델 ID 목록 검증
-        if not isinstance(model_ids, list) or not model_ids:
-            return jsonify({
-                "success": False,
-                "error": "유효하지 않은 모델 ID 목록입니다."
-            }), 400
-        
         # 모델 비교 실행
         comparison = optimizer.compare_models(model_ids)
         
@@ -311,5 +328,8 @@ if __name__ == '__main__':
     logger.info(f"서버를 포트 {port}에서 시작합니다.")
     logger.info(f"디버그 모드: {debug}")
     
+    # NLTK 리소스는 요청 처리를 막지 않도록 백그라운드에서 로딩
+    start_nltk_warmup()
+    
     # 서버 시작
     app.run(host='0.0.0.0', port=port, debug=debug) 
\ No newline at end of file
@@ -10,30 +10,20 @@ from . import image_models
 from . import video_models
 from . import music_models
 
-# 개별 모델 클래스들
-from .text_models import (
-    GPT4oModel,
-    Gemini25ProModel,
-    Grok3Model,
-    VercelV0Model,
-    GPTo3Model
-)
+# 개별 모델 클래스 이름 -> 서브 패키지 (처음 참조될 때 해당 모델 모듈만 임포트)
+_MODEL_PACKAGES = {
+    name: package
+    for package in (text_models, image_models, video_models, music_models)
+    for name in package.__all__
+}
 
-from .image_models import (
-    DALLE3Model,
-    Imagen3Model,
-    MidjourneyV6Model
-)
 
-from .video_models import (
-    GoogleVeo3Model,
-    PikaModel,
-    SoraModel
-)
+def __getattr__(name):
+    package = _MODEL_PACKAGES.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(package, name)
 
-from .music_models import (
-    SunoModel,
-)
 
 __all__ = [
     # 기본 클래스
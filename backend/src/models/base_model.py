@@ -5,6 +5,17 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 
+# 모델 카테고리를 나타내는 생성 기능 -> 카테고리
+CATEGORY_CAPABILITIES = {
+    "text_generation": "text",
+    "image_generation": "image",
+    "video_generation": "video",
+    "music_generation": "music"
+}
+
+# 생성 기능이 선언되지 않은 모델의 카테고리
+DEFAULT_CATEGORY = "text"
+
 class BaseModel(ABC):
     """
     모든 AI 모델 최적화 모듈의 기본 클래스
@@ -27,6 +38,19 @@ class BaseModel(ABC):
         self.supports_multimodal = False
         self.best_practices = []
         
+    @property
+    def category(self) -> str:
+        """
+        모델 카테고리(text, image, video, music)를 반환합니다.
+        
+        capabilities에서 처음 등장하는 생성 기능으로 결정하며, 없으면 텍스트 모델로 간주합니다.
+        """
+        for capability in self.capabilities:
+            category = CATEGORY_CAPABILITIES.get(capability)
+            if category:
+                return category
+        return DEFAULT_CATEGORY
+        
     @abstractmethod
     def get_prompt_structure(self) -> Dict[str, Any]:
         """
@@ -1,9 +1,21 @@
 """
 음악 생성 모델들을 위한 패키지
+
+모델 클래스는 처음 참조될 때 해당 모듈만 임포트합니다.
 """
 
-from .suno_model import SunoModel
+import importlib
+
+# 클래스 이름 -> 모듈 이름
+_MODEL_MODULES = {
+    'SunoModel': 'suno_model',
+}
+
+__all__ = list(_MODEL_MODULES)
+
 
-__all__ = [
-    'SunoModel'
-] 
\ No newline at end of file
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
@@ -0,0 +1,164 @@
+"""
+모델 레지스트리 모듈: 정적 매니페스트(model_id -> 모듈:클래스, 기능 태그)로 모델 목록을 제공하고,
+모델 클래스는 처음 요청될 때만 임포트하고 인스턴스를 만듭니다.
+"""
+
+import os
+import json
+import logging
+import importlib
+import threading
+from collections.abc import Mapping
+from typing import Dict, List, Any, Iterator, Iterable, Set, Tuple
+
+from .base_model import BaseModel
+
+# 기본 매니페스트 파일
+DEFAULT_MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifest.json')
+
+# 시작 시 미리 불러올 모델 ID 목록 (쉼표 구분, 환경 변수)
+PRELOAD_ENV = 'MODEL_PRELOAD'
+
+# 매니페스트 항목의 필수 키
+MANIFEST_KEYS = ('model_id', 'module', 'class', 'model_name', 'provider', 'category',
+                 'capabilities', 'supports_multimodal')
+
+
+def load_manifest(path: str = DEFAULT_MANIFEST_PATH) -> List[Dict[str, Any]]:
+    """매니페스트 파일(JSON)을 읽어 모델 항목 목록을 반환합니다."""
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)['models']
+    for entry in entries:
+        missing = [key for key in MANIFEST_KEYS if key not in entry]
+        if missing:
+            raise ValueError(f"매니페스트 항목에 필수 키가 없습니다: {entry.get('model_id')} - {missing}")
+    return entries
+
+
+def preload_from_env() -> List[str]:
+    """MODEL_PRELOAD 환경 변수의 모델 ID 목록을 반환합니다."""
+    return [model_id.strip() for model_id in os.environ.get(PRELOAD_ENV, '').split(',') if model_id.strip()]
+
+
+class ModelRegistry(Mapping):
+    """
+    model_id -> 모델 인스턴스 매핑
+
+    dict처럼 쓸 수 있으며(`in`, `[]`, `keys`, `items`), `in`과 `keys`, `describe`는 매니페스트만
+    보고 답합니다. `[]`로 처음 요청된 모델만 모듈을 임포트하고 인스턴스를 만들어 기억합니다.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]], package: str = __package__):
+        """
+        Args:
+            entries: 매니페스트 모델 항목 목록
+            package: 항목의 module 경로(상대 경로)의 기준 패키지
+        """
+        self.logger = logging.getLogger(__name__)
+        self.package = package
+        self._entries: Dict[str, Dict[str, Any]] = {entry['model_id']: entry for entry in entries}
+        self._instances: Dict[str, BaseModel] = {}
+        # register로 직접 등록한 모델 ID (요약 정보를 매니페스트 대신 인스턴스에서 읽음)
+        self._registered: Set[str] = set()
+        # 모델 목록/메타데이터가 바뀔 때마다 증가 (지연 로딩은 메타데이터를 바꾸지 않음)
+        self.version = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_manifest(cls, path: str = DEFAULT_MANIFEST_PATH) -> "ModelRegistry":
+        """매니페스트 파일로 레지스트리를 만듭니다."""
+        return cls(load_manifest(path))
+
+    def __getitem__(self, model_id: str) -> BaseModel:
+        model = self._instances.get(model_id)
+        if model is None:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                raise KeyError(model_id)
+            with self._lock:
+                model = self._instances.get(model_id)
+                if model is None:
+                    model = self._instantiate(entry)
+                    self._instances[model_id] = model
+        return model
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._entries or model_id in self._instances
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._entries
+        for model_id in self._instances:
+            if model_id not in self._entries:
+                yield model_id
+
+    def __len__(self) -> int:
+        return len(self._entries) + sum(1 for model_id in self._instances if model_id not in self._entries)
+
+    def _instantiate(self, entry: Dict[str, Any]) -> BaseModel:
+        """매니페스트 항목의 모듈을 임포트하고 모델 인스턴스를 만듭니다."""
+        module = importlib.import_module(f".{entry['module']}", package=self.package)
+        model = getattr(module, entry['class'])()
+        if model.model_id != entry['model_id']:
+            raise ValueError(f"매니페스트의 model_id와 클래스의 model_id가 다릅니다: {entry['model_id']} != {model.model_id}")
+        self.logger.info(f"모델 로드 성공: {model.model_id} ({model.model_name})")
+        return model
+
+    def register(self, model: BaseModel) -> None:
+        """이미 만든 모델 인스턴스를 등록합니다 (매니페스트에 있는 ID면 해당 항목을 대체)."""
+        with self._lock:
+            self._instances[model.model_id] = model
+            self._registered.add(model.model_id)
+            self.version += 1
+
+    def preload(self, model_ids: Iterable[str]) -> List[str]:
+        """
+        자주 쓰는 모델을 미리 불러옵니다.
+
+        Returns:
+            불러온 모델 ID 목록 (매니페스트에 없거나 불러오지 못한 ID는 경고만 남김)
+        """
+        loaded = []
+        for model_id in model_ids:
+            try:
+                self[model_id]
+                loaded.append(model_id)
+            except KeyError:
+                self.logger.warning(f"미리 불러올 모델이 매니페스트에 없습니다: {model_id}")
+            except Exception as e:
+                self.logger.warning(f"모델 미리 불러오기 실패: {model_id} - {e}")
+        return loaded
+
+    @property
+    def loaded(self) -> Tuple[str, ...]:
+        """인스턴스가 만들어진 모델 ID"""
+        return tuple(self._instances)
+
+    def categories(self) -> Dict[str, str]:
+        """모델 ID -> 카테고리 (모델을 불러오지 않음)"""
+        categories = {model_id: entry['category'] for model_id, entry in self._entries.items()}
+        categories.update({model_id: model.category for model_id, model in self._instances.items()})
+        return categories
+
+    def describe(self, model_id: str) -> Dict[str, Any]:
+        """
+        모델 목록용 요약 정보 (model_id, model_name, provider, capabilities, supports_multimodal)
+
+        register로 등록한 모델은 인스턴스에서, 나머지는 매니페스트에서 읽으므로 모델을 불러오지 않습니다.
+        """
+        if model_id in self._registered:
+            source = self._instances[model_id]
+            return {
+                "model_id": model_id,
+                "model_name": source.model_name,
+                "provider": source.provider,
+                "capabilities": source.capabilities,
+                "supports_multimodal": source.supports_multimodal
+            }
+        entry = self._entries[model_id]
+        return {
+            "model_id": model_id,
+            "model_name": entry['model_name'],
+            "provider": entry['provider'],
+            "capabilities": list(entry['capabilities']),
+            "supports_multimodal": entry['supports_multimodal']
+        }
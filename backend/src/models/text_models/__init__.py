@@ -1,17 +1,25 @@
 """
 텍스트 생성 모델들을 위한 패키지
+
+모델 클래스는 처음 참조될 때 해당 모듈만 임포트합니다.
 """
 
-from .gpt4o_model import GPT4oModel
-from .gemini_25_pro_model import Gemini25ProModel
-from .grok3_model import Grok3Model
-from .vercel_v0_model import VercelV0Model
-from .gpt_o3_model import GPTo3Model
+import importlib
+
+# 클래스 이름 -> 모듈 이름
+_MODEL_MODULES = {
+    'GPT4oModel': 'gpt4o_model',
+    'Gemini25ProModel': 'gemini_25_pro_model',
+    'Grok3Model': 'grok3_model',
+    'VercelV0Model': 'vercel_v0_model',
+    'GPTo3Model': 'gpt_o3_model',
+}
+
+__all__ = list(_MODEL_MODULES)
+
 
-__all__ = [
-    'GPT4oModel',
-    'Gemini25ProModel', 
-    'Grok3Model',
-    'VercelV0Model',
-    'GPTo3Model'
-] 
\ No newline at end of file
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
@@ -1,13 +1,23 @@
 """
 비디오 생성 모델들을 위한 패키지
+
+모델 클래스는 처음 참조될 때 해당 모듈만 임포트합니다.
 """
 
-from .google_veo3_model import GoogleVeo3Model
-from .pika_model import PikaModel
-from .sora_model import SoraModel
+import importlib
+
+# 클래스 이름 -> 모듈 이름
+_MODEL_MODULES = {
+    'GoogleVeo3Model': 'google_veo3_model',
+    'PikaModel': 'pika_model',
+    'SoraModel': 'sora_model',
+}
+
+__all__ = list(_MODEL_MODULES)
+
 
-__all__ = [
-    'GoogleVeo3Model',
-    'PikaModel',
-    'SoraModel'
-] 
\ No newline at end of file
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
@@ -0,0 +1,84 @@
+"""
+API 요청 검증 모듈: Flask 서버(main.py)와 ASGI 서버(asgi.py)가 같은 규칙과 오류 메시지로
+요청 본문을 검증하도록 공유하는 함수와 설정을 제공합니다.
+"""
+
+from typing import Dict, Any, Optional
+
+# 배치 최적화 요청 하나에 담을 수 있는 최대 모델 수
+MAX_BATCH_MODELS = 16
+
+# 브라우저 요청을 허용할 프론트엔드 오리진
+CORS_ORIGINS = [
+    "http://localhost:5173",      # Vite 개발 서버
+    "http://127.0.0.1:5173",      # 로컬호스트 대안
+    "http://localhost:3000",      # Create React App (대안)
+    "http://127.0.0.1:3000",      # 로컬호스트 대안
+]
+
+CORS_ALLOW_HEADERS = ['Content-Type', 'Authorization', 'X-Requested-With', 'Accept', 'Origin']
+CORS_ALLOW_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']
+
+
+def validate_optimize_request(data: Any) -> Optional[str]:
+    """/api/optimize 요청 본문을 검증합니다. 오류가 없으면 None, 있으면 오류 메시지를 반환합니다."""
+    # 필수 파라미터 확인
+    if not data or not isinstance(data, dict) or 'input_text' not in data or 'model_id' not in data:
+        return "필수 파라미터가 누락되었습니다. 'input_text'와 'model_id'는 필수입니다."
+
+    # 입력 텍스트 검증
+    if not data['input_text'] or not isinstance(data['input_text'], str):
+        return "유효하지 않은 입력 텍스트입니다."
+
+    # 모델 ID 검증
+    if not data['model_id'] or not isinstance(data['model_id'], str):
+        return "유효하지 않은 모델 ID입니다."
+
+    return _validate_additional_params(data)
+
+
+def validate_batch_request(data: Any) -> Optional[str]:
+    """/api/optimize/batch 요청 본문을 검증합니다."""
+    # 필수 파라미터 확인
+    if not data or not isinstance(data, dict) or 'input_text' not in data or 'model_ids' not in data:
+        return "필수 파라미터가 누락되었습니다. 'input_text'와 'model_ids'는 필수입니다."
+
+    # 입력 텍스트 검증
+    if not data['input_text'] or not isinstance(data['input_text'], str):
+        return "유효하지 않은 입력 텍스트입니다."
+
+    # 모델 ID 목록 검증
+    model_ids = data['model_ids']
+    if (not model_ids or not isinstance(model_ids, list) or len(model_ids) > MAX_BATCH_MODELS
+            or not all(model_id and isinstance(model_id, str) for model_id in model_ids)):
+        return f"유효하지 않은 모델 ID 목록입니다. 1~{MAX_BATCH_MODELS}개의 모델 ID 문자열이 필요합니다."
+
+    return _validate_additional_params(data)
+
+
+def validate_compare_request(data: Any) -> Optional[str]:
+    """/api/compare 요청 본문을 검증합니다."""
+    # 필수 파라미터 확인
+    if not data or not isinstance(data, dict) or 'model_ids' not in data:
+        return "필수 파라미터가 누락되었습니다. 'model_ids'는 필수입니다."
+
+    # 모델 ID 목록 검증
+    if not isinstance(data['model_ids'], list) or not data['model_ids']:
+        return "유효하지 않은 모델 ID 목록입니다."
+
+    return None
+
+
+def _validate_additional_params(data: Dict[str, Any]) -> Optional[str]:
+    """추가 파라미터 검증"""
+    additional_params = data.get('additional_params', {})
+    if additional_params and not isinstance(additional_params, dict):
+        return "유효하지 않은 추가 파라미터 형식입니다."
+    return None
+
+
+def wants_cache(data: Dict[str, Any], no_cache_header: bool) -> bool:
+    """
+    결과 캐시 사용 여부: 요청 본문의 "use_cache": false 또는 Cache-Control: no-cache 헤더면 우회합니다.
+    """
+    return data.get('use_cache', True) is not False and not no_cache_header
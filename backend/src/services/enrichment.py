@@ -0,0 +1,147 @@
+"""
+분석 보강 단계 모듈: 기본 입력 분석과 별도로 실행되는 선택적 분석(NLP 등)을 요청별 시간 예산
+안에서만 분석 결과에 합칩니다.
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Tuple, Optional
+
+from ..utils.nlp_analyzer import NLPAnalyzer
+
+# 요청당 보강 단계 기본 시간 예산(밀리초), 환경 변수로 변경 가능
+DEFAULT_DEADLINE_MS = float(os.environ.get("ENRICHMENT_DEADLINE_MS", "50"))
+
+
+class EnrichmentStage:
+    """
+    분석 보강 단계 기본 클래스
+
+    하위 클래스는 name을 정하고 enrich에서 분석 결과에 합칠 필드를 반환합니다.
+    enrich는 작업 스레드에서 호출되므로 스레드 안전해야 합니다.
+    """
+
+    name = "base"
+
+    def enrich(self, text: str) -> Dict[str, Any]:
+        """텍스트를 분석하여 분석 결과에 합칠 필드를 반환합니다."""
+        raise NotImplementedError
+
+
+class NLPEnrichmentStage(EnrichmentStage):
+    """NLPAnalyzer의 언어, 핵심 구문, 복잡도 점수를 분석 결과에 더하는 단계"""
+
+    name = "nlp"
+
+    def __init__(self, analyzer: Optional[Any] = None):
+        """
+        Args:
+            analyzer: analyze(text)가 NLPAnalysisResult를 반환하는 분석기
+                      (NLPAnalyzer 또는 NLPProcessPool, None이면 의도 분류를 끈 새 NLPAnalyzer;
+                      의도는 InputAnalyzer의 intent 필드로 한 번만 계산)
+        """
+        self.analyzer = analyzer if analyzer is not None else NLPAnalyzer(classify_intent=False)
+
+    def enrich(self, text: str) -> Dict[str, Any]:
+        result = self.analyzer.analyze(text)
+        return {
+            "language": result.language,
+            "key_phrases": result.key_phrases,
+            "complexity_score": result.complexity_score
+        }
+
+
+class PendingEnrichment:
+    """한 요청에 대해 실행 중인 보강 단계들 (EnrichmentRunner.start가 반환)"""
+
+    def __init__(self, runner: "EnrichmentRunner", started: float,
+                 futures: List[Tuple[EnrichmentStage, Optional[Future]]]):
+        self._runner = runner
+        self._started = started
+        self._futures = futures
+
+    def collect(self) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        시작 시점부터 시간 예산이 끝날 때까지 결과를 기다립니다.
+
+        Returns:
+            (분석 결과에 합칠 필드, 단계 이름 -> 실행 기록)
+            실행 기록: applied(결과 반영 여부), status(applied/timeout/error/rejected),
+            elapsed_ms(단계 실행 시간, 끝나지 않았으면 None), waited_ms(요청 스레드가 기다린 시간)
+        """
+        deadline = self._started + self._runner.deadline_ms / 1000.0
+        fields: Dict[str, Any] = {}
+        report: Dict[str, Dict[str, Any]] = {}
+
+        for stage, future in self._futures:
+            wait_start = time.perf_counter()
+            record: Dict[str, Any] = {"applied": False, "status": "rejected", "elapsed_ms": None}
+
+            if future is not None:
+                try:
+                    stage_fields, elapsed = future.result(timeout=max(0.0, deadline - wait_start))
+                    fields.update(stage_fields)
+                    record.update(applied=True, status="applied", elapsed_ms=round(elapsed * 1000.0, 3))
+                except FutureTimeoutError:
+                    # 아직 시작하지 않은 작업은 취소하고, 실행 중인 작업은 결과만 버림
+                    future.cancel()
+                    record["status"] = "timeout"
+                except Exception as e:
+                    self._runner.logger.warning(f"분석 보강 단계 실패: {stage.name} - {e}")
+                    record["status"] = "error"
+
+            record["waited_ms"] = round((time.perf_counter() - wait_start) * 1000.0, 3)
+            report[stage.name] = record
+
+        return fields, report
+
+
+class EnrichmentRunner:
+    """
+    보강 단계들을 작업 스레드에서 실행하고 요청별 시간 예산 안에 끝난 결과만 모으는 실행기
+
+    요청 처리 초반에 start를 호출하면 기본 분석과 보강 단계가 함께 진행되며,
+    collect는 start 시점부터 deadline_ms가 지나면 끝나지 않은 단계를 건너뜁니다.
+    """
+
+    def __init__(self, stages: List[EnrichmentStage], deadline_ms: float = DEFAULT_DEADLINE_MS,
+                 max_workers: int = 2):
+        """
+        Args:
+            stages: 실행할 보강 단계 목록
+            deadline_ms: 요청당 시간 예산(밀리초)
+            max_workers: 보강 단계를 실행할 작업 스레드 수
+        """
+        self.stages = list(stages)
+        self.deadline_ms = deadline_ms
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enrichment")
+
+    def start(self, text: str) -> PendingEnrichment:
+        """모든 보강 단계를 작업 스레드에 넣고 대기 객체를 반환합니다."""
+        started = time.perf_counter()
+        futures: List[Tuple[EnrichmentStage, Optional[Future]]] = []
+        for stage in self.stages:
+            try:
+                futures.append((stage, self._executor.submit(self._run_stage, stage, text)))
+            except RuntimeError as e:
+                # 종료된 실행기
+                self.logger.warning(f"분석 보강 단계 제출 실패: {stage.name} - {e}")
+                futures.append((stage, None))
+        return PendingEnrichment(self, started, futures)
+
+    def enrich(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """보강 단계를 실행하고 시간 예산 안의 결과를 바로 모읍니다."""
+        return self.start(text).collect()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """작업 스레드를 종료합니다."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    @staticmethod
+    def _run_stage(stage: EnrichmentStage, text: str) -> Tuple[Dict[str, Any], float]:
+        start = time.perf_counter()
+        fields = stage.enrich(text)
+        return fields, time.perf_counter() - start
@@ -0,0 +1,87 @@
+"""
+모델 메타데이터 스냅샷 모듈: 시작 후 바뀌지 않는 모델 목록/정보/프롬프트 구조 응답을
+모델 레지스트리 버전마다 한 번만 JSON 바이트로 직렬화하고 강한 ETag와 함께 제공합니다.
+"""
+
+import json
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SerializedPayload:
+    """직렬화된 응답 본문과 강한 ETag (따옴표 없는 값)"""
+    body: bytes
+    etag: str
+
+
+def serialize_payload(payload: Dict[str, Any]) -> SerializedPayload:
+    """응답 딕셔너리를 압축 JSON(UTF-8)으로 직렬화하고 본문 해시로 ETag를 만듭니다."""
+    body = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return SerializedPayload(body=body, etag=hashlib.sha256(body).hexdigest()[:32])
+
+
+class ModelMetadataSnapshot:
+    """
+    PromptOptimizer의 모델 메타데이터 응답(/api/models, /api/model/<id>/info, /api/model/<id>/structure)을
+    직렬화해 기억하는 스냅샷
+
+    모델 목록은 매니페스트 요약 정보로 만들고, 모델별 정보/구조는 해당 모델이 처음 요청될 때
+    만듭니다. 레지스트리 버전이 바뀌면(register_model) 기억한 응답을 모두 버립니다.
+    """
+
+    def __init__(self, optimizer: Any):
+        """
+        Args:
+            optimizer: models 레지스트리와 get_model_info/get_model_prompt_structure를 가진 PromptOptimizer
+        """
+        self.optimizer = optimizer
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        # (종류, 모델 ID) -> 직렬화된 응답
+        self._payloads: Dict[Tuple[str, str], SerializedPayload] = {}
+
+    def models(self) -> SerializedPayload:
+        """모델 목록 응답"""
+        return self._get(("models", ""), lambda: {
+            "success": True,
+            "models": self.optimizer.get_available_models()
+        })
+
+    def model_info(self, model_id: str) -> Optional[SerializedPayload]:
+        """모델 정보 응답 (지원하지 않는 모델이면 None)"""
+        return self._get(("info", model_id), lambda: self._model_payload(
+            model_id, "info", self.optimizer.get_model_info))
+
+    def model_structure(self, model_id: str) -> Optional[SerializedPayload]:
+        """프롬프트 구조 응답 (지원하지 않는 모델이면 None)"""
+        return self._get(("structure", model_id), lambda: self._model_payload(
+            model_id, "structure", self.optimizer.get_model_prompt_structure))
+
+    @staticmethod
+    def _model_payload(model_id: str, field: str, getter: Callable[[str], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        value = getter(model_id)
+        if "error" in value:
+            return None
+        return {"success": True, "model_id": model_id, field: value}
+
+    def _get(self, key: Tuple[str, str], build: Callable[[], Optional[Dict[str, Any]]]) -> Optional[SerializedPayload]:
+        version = self.optimizer.models.version
+        payload = self._payloads.get(key) if self._version == version else None
+        if payload is not None:
+            return payload
+
+        with self._lock:
+            if self._version != version:
+                self._payloads.clear()
+                self._version = version
+            payload = self._payloads.get(key)
+            if payload is None:
+                data = build()
+                if data is None:
+                    return None
+                payload = serialize_payload(data)
+                self._payloads[key] = payload
+        return payload
@@ -2,14 +2,30 @@
 프롬프트 최적화 엔진: 사용자 입력을 분석하고 AI 모델별로 최적화된 프롬프트를 생성합니다.
 """
 
-from typing import Dict, Any, List, Optional
-import importlib
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import os
 import re
+import copy
+import asyncio
+import functools
+import threading
 
 from ..utils.input_analyzer import InputAnalyzer
-from ..utils.intent_detector import IntentDetector # Resolved import
+from ..utils.intent_signal import IntentSignal
+from ..utils.tokenized_input import TokenizedInput
+from .enrichment import EnrichmentRunner, EnrichmentStage, NLPEnrichmentStage, DEFAULT_DEADLINE_MS
+from .result_cache import OptimizationResultCache
 from ..models.base_model import BaseModel
+from ..models.registry import ModelRegistry, DEFAULT_MANIFEST_PATH, preload_from_env
+
+# 배치 요청에서 모델별 프롬프트 생성을 동시에 실행할 최대 작업 스레드 수 (환경 변수로 변경 가능)
+# 모델 단계는 순수 파이썬 코드라서 CPU 코어 수보다 많은 스레드는 전환 비용만 늘림
+DEFAULT_BATCH_WORKERS = int(os.environ.get("OPTIMIZE_BATCH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# 비동기 API에서 분석/프롬프트 생성 단계를 실행할 작업 스레드 수 (환경 변수로 변경 가능)
+# 분석 보강 결과를 기다리는 동안에도 다른 요청을 처리하도록 ThreadPoolExecutor 기본값과 같은 크기 사용
+DEFAULT_ASYNC_WORKERS = int(os.environ.get("OPTIMIZE_ASYNC_WORKERS", str(min(32, (os.cpu_count() or 1) + 4))))
 
 class PromptOptimizer:
     """
@@ -18,70 +34,76 @@ class PromptOptimizer:
     사용자 입력을 분석하고 선택된 AI 모델에 최적화된 프롬프트를 생성합니다.
     """
     
-    def __init__(self):
-        """프롬프트 최적화 엔진 초기화"""
-        self.input_analyzer = InputAnalyzer()
-        self.intent_detector = IntentDetector() # Added IntentDetector initialization
-        self.models = {}
-        self._load_models()
-    
-    def _load_models(self):
-        """사용 가능한 모든 모델을 동적으로 로드합니다."""
-        # 텍스트 모델 로드
-        self._load_models_from_directory('text_models')
-        
-        # 이미지 모델 로드
-        self._load_models_from_directory('image_models')
-        
-        # 비디오 모델 로드
-        self._load_models_from_directory('video_models')
+    def __init__(self, enrichment_stages: Optional[List[EnrichmentStage]] = None,
+                 enrichment_deadline_ms: float = DEFAULT_DEADLINE_MS,
+                 preload_models: Optional[List[str]] = None,
+                 model_manifest_path: str = DEFAULT_MANIFEST_PATH,
+                 result_cache: Optional[OptimizationResultCache] = None,
+                 batch_workers: int = DEFAULT_BATCH_WORKERS,
+                 async_workers: int = DEFAULT_ASYNC_WORKERS):
+        """
+        프롬프트 최적화 엔진 초기화
         
-        # 음악 모델 로드
-        self._load_models_from_directory('music_models')
+        Args:
+            enrichment_stages: 기본 분석 뒤에 선택적으로 합칠 분석 보강 단계 목록
+                               (None이면 NLP 보강 단계, 빈 목록이면 사용 안 함)
+            enrichment_deadline_ms: 요청당 분석 보강 시간 예산(밀리초)
+            preload_models: 생성 시 미리 불러올 모델 ID 목록 (None이면 MODEL_PRELOAD 환경 변수)
+            model_manifest_path: 모델 매니페스트 파일 경로
+            result_cache: 최적화 결과 캐시 (None이면 기본 설정, max_entries=0이면 사용 안 함)
+            batch_workers: 배치 요청에서 모델별 프롬프트 생성을 실행할 최대 작업 스레드 수
+                           (1이면 요청 스레드에서 차례로 실행)
+            async_workers: 비동기 API(optimize_prompt_async)의 분석/프롬프트 생성 단계를 실행할 작업 스레드 수
+        """
+        # 의도/작업 유형 통합 분류 서비스: 입력 분석기가 분석 결과의 intent/task_type 필드로
+        # 텍스트당 한 번만 계산하고, 모델은 그 결과를 intent_result로 받음
+        self.intent_signal = IntentSignal()
+        self.input_analyzer = InputAnalyzer(intent_signal=self.intent_signal)
+        self.intent_detector = self.intent_signal.detector
+        if enrichment_stages is None:
+            enrichment_stages = [NLPEnrichmentStage()]
+        self.enrichment = EnrichmentRunner(enrichment_stages, deadline_ms=enrichment_deadline_ms)
+        # 매니페스트 기반 모델 레지스트리: 모델은 처음 요청될 때 임포트/생성 (preload 목록은 미리)
+        self.models = ModelRegistry.from_manifest(model_manifest_path)
+        self.input_analyzer.register_model_categories(self.models.categories())
+        self.preload_models(preload_models if preload_models is not None else preload_from_env())
+        # (모델, 입력 텍스트, 추가 매개변수)가 같은 반복 요청은 이전 결과를 재사용
+        self.result_cache = result_cache if result_cache is not None else OptimizationResultCache()
+        # 결과 캐시 키에 넣는 분석기 상태 버전: (분석기, 키워드 색인 버전, 의도 모델)이 바뀌면 증가
+        self._analysis_state: Tuple[Any, ...] = (None, None, None)
+        self._analysis_version = 0
+        self._version_lock = threading.Lock()
+        # 배치 요청의 모델별 단계 실행기 (처음 배치 요청 시 생성)
+        self.batch_workers = max(1, batch_workers)
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        # 비동기 API의 단계 실행기 (처음 비동기 요청 시 생성)
+        self.async_workers = max(1, async_workers)
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_lock = threading.Lock()
     
-    def _load_models_from_directory(self, directory: str):
-        """지정된 디렉토리에서 모델을 로드합니다."""
-        try:
-            # 모듈 경로 생성
-            module_path = f'..models.{directory}'
-            
-            # 디렉토리 내 모든 Python 파일 가져오기
-            # __file__ is optimizer.py, so dirname is services. '..' goes to src, then 'models'
-            module_dir = os.path.join(os.path.dirname(__file__), '..', 'models', directory)
-            
-            if not os.path.exists(module_dir):
-                print(f"Model directory not found: {module_dir}") # Added a print for debugging
-                return
-            
-            for filename in os.listdir(module_dir):
-                if filename.endswith('.py') and not filename.startswith('__'):
-                    # 파일 이름에서 모듈 이름 추출
-                    module_name = filename[:-3]
-                    
-                    try:
-                        # 모듈 동적 로드
-                        module = importlib.import_module(f'{module_path}.{module_name}', package=__package__)
-                        
-                        # __all__ 리스트에서 클래스 이름들 가져오기
-                        if hasattr(module, '__all__'): # Kept from 18484904e94c2c1fa8167b2fc37183a158c51fff version
-                            for class_name in module.__all__:
-                                try:
-                                    # 클래스 가져오기
-                                    model_class = getattr(module, class_name)
-
-                                    # BaseModel을 상속받은 클래스인지 확인
-                                    if isinstance(model_class, type) and issubclass(model_class, BaseModel) and model_class is not BaseModel:
-                                        # 모델 인스턴스 생성 및 저장
-                                        model_instance = model_class()
-                                        self.models[model_instance.model_id] = model_instance
-                                        print(f"모델 로드 성공: {model_instance.model_id} ({model_instance.model_name})")
-                                except Exception as e:
-                                    print(f"모델 클래스 로드 중 오류 발생: {class_name} - {str(e)}")
-                    except ImportError as e: # Catch import error for individual modules
-                        print(f"Error importing module {module_name} in {directory}: {e}")
+    def preload_models(self, model_ids: List[str]) -> List[str]:
+        """
+        자주 쓰는 모델을 첫 요청 전에 미리 불러옵니다.
+        
+        Args:
+            model_ids: 미리 불러올 모델 ID 목록
             
-        except Exception as e:
-            print(f"모델 디렉토리 로드 중 오류 발생: {directory} - {str(e)}")
+        Returns:
+            불러온 모델 ID 목록
+        """
+        return self.models.preload(model_ids)
+    
+    def register_model(self, model: BaseModel):
+        """
+        모델을 등록하고 입력 분석기의 모델 ID -> 카테고리 색인에 추가합니다.
+        
+        Args:
+            model: 등록할 모델 인스턴스
+        """
+        self.models.register(model)
+        self.input_analyzer.register_model_categories({model.model_id: model.category})
+        # 교체된 모델의 버전 키는 다음 요청에서 다시 계산되지만, 분류 색인이 바뀌었으므로 결과도 비움
+        self.result_cache.clear()
     
     def get_available_models(self) -> List[Dict[str, Any]]:
         """
@@ -92,7 +114,12 @@ class PromptOptimizer:
         """
         models_info = []
         
-        for model_id, model in self.models.items():
+        for model_id in self.models:
+            # 레지스트리는 매니페스트의 요약 정보로 답하므로 모델을 불러오지 않음
+            if isinstance(self.models, ModelRegistry):
+                models_info.append(self.models.describe(model_id))
+                continue
+            model = self.models[model_id]
             models_info.append({
                 "model_id": model_id,
                 "model_name": model.model_name,
@@ -103,7 +130,8 @@ class PromptOptimizer:
         
         return models_info
     
-    def optimize_prompt(self, input_text: str, model_id: str, additional_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def optimize_prompt(self, input_text: str, model_id: str, additional_params: Optional[Dict[str, Any]] = None,
+                        use_cache: bool = True) -> Dict[str, Any]:
         """
         사용자 입력을 분석하고 선택된 모델에 최적화된 프롬프트를 생성합니다.
         
@@ -111,6 +139,7 @@ class PromptOptimizer:
             input_text: 사용자가 입력한 기본 요청 텍스트
             model_id: 최적화할 대상 모델 ID
             additional_params: 추가 매개변수 (선택 사항)
+            use_cache: False면 결과 캐시를 조회/저장하지 않고 새로 계산
             
         Returns:
             최적화된 프롬프트 및 관련 정보를 담은 딕셔너리
@@ -120,25 +149,256 @@ class PromptOptimizer:
         
         # 모델 존재 여부 확인
         if model_id not in self.models:
-            return {
-                "success": False,
-                "error": f"지원하지 않는 모델 ID: {model_id}",
-                "available_models": list(self.models.keys())
-            }
+            return self._unknown_model_result(model_id)
         
-        try:
-            # 입력 분석
-            analysis_result = self.input_analyzer.analyze(input_text, model_id)
-            
-            # 의도 분석
-            intent_result = self.intent_detector.detect_intent(input_text) # Using IntentDetector
+        cache_key = self._cache_key(input_text, model_id, additional_params, use_cache)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = self._optimize_prompt(input_text, model_id, additional_params)
+        self._store_result(cache_key, result)
+        return result
+    
+    def optimize_batch(self, input_text: str, model_ids: List[str], additional_params: Optional[Dict[str, Any]] = None,
+                       use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        같은 입력을 여러 모델에 대해 한 번에 최적화합니다.
+        
+        입력 분석, 의도 분류, 분석 보강은 모델 수와 관계없이 한 번만 수행하고, 모델별 프롬프트 생성과
+        생성 매개변수 계산은 크기가 제한된 작업 스레드 풀에서 함께 실행합니다.
+        
+        Args:
+            input_text: 사용자가 입력한 기본 요청 텍스트
+            model_ids: 최적화할 대상 모델 ID 목록 (중복은 한 번만 처리)
+            additional_params: 추가 매개변수 (선택 사항)
+            use_cache: False면 결과 캐시를 조회/저장하지 않고 새로 계산
             
-            # 선택된 모델 가져오기
-            model = self.models[model_id]
+        Returns:
+            model_ids 순서의 모델별 결과 목록 (각 항목은 optimize_prompt 결과와 같은 형식이며,
+            지원하지 않는 모델이나 실패한 모델은 해당 항목에만 오류를 담음)
+        """
+        if not additional_params:
+            additional_params = {}
+        model_ids = list(dict.fromkeys(model_ids))
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        cache_keys: Dict[str, Any] = {}
+        for model_id in model_ids:
+            if model_id not in self.models:
+                results[model_id] = self._unknown_model_result(model_id)
+                continue
+            cache_keys[model_id] = self._cache_key(input_text, model_id, additional_params, use_cache)
+            if cache_keys[model_id] is not None:
+                cached = self.result_cache.get(cache_keys[model_id])
+                if cached is not None:
+                    results[model_id] = cached
+        
+        pending = [model_id for model_id in model_ids if model_id not in results]
+        if pending:
+            results.update(self._optimize_models(input_text, pending, additional_params))
+            for model_id in pending:
+                self._store_result(cache_keys[model_id], results[model_id])
+        
+        return [results[model_id] for model_id in model_ids]
+    
+    async def optimize_prompt_async(self, input_text: str, model_id: str,
+                                    additional_params: Optional[Dict[str, Any]] = None,
+                                    use_cache: bool = True) -> Dict[str, Any]:
+        """
+        optimize_prompt의 asyncio 버전 (결과는 optimize_prompt와 같음)
+        
+        결과 캐시 조회와 분석 단계, 모델별 프롬프트 생성 단계를 작업 스레드 풀에서 차례로 실행합니다
+        (캐시 키 계산의 모델 지연 로딩/버전 해시, 적중 결과 역직렬화도 이벤트 루프를 막지 않도록).
+        대기 중에 취소되면(클라이언트 연결 종료 등) 아직 시작하지 않은 단계는 실행하지 않습니다.
+        """
+        if not additional_params:
+            additional_params = {}
+        
+        # 모델 존재 여부 확인 (매니페스트 조회만 하므로 모델을 불러오지 않음)
+        if model_id not in self.models:
+            return self._unknown_model_result(model_id)
+        
+        loop = asyncio.get_running_loop()
+        executor = self._get_async_executor()
+        
+        def start() -> Tuple[Optional[Any], Optional[Dict[str, Any]], Optional[Tuple[BaseModel, Dict[str, Any], Dict[str, Any]]]]:
+            # 캐시 적중이면 (키, 결과, None), 아니면 (키, 오류 결과 또는 None, 분석 단계 결과)
+            cache_key = self._cache_key(input_text, model_id, additional_params, use_cache)
+            cached = self.result_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return cache_key, cached, None
+            try:
+                return cache_key, None, self._prepare_analysis(input_text, model_id, additional_params)
+            except Exception as e:
+                return cache_key, self._error_result(input_text, model_id, e), None
+        
+        cache_key, result, prepared = await loop.run_in_executor(executor, start)
+        if prepared is None:
+            return result
+        model, analysis_result, intent_result = prepared
+        
+        def finish() -> Dict[str, Any]:
+            # 지연 분석 필드 계산과 캐시 저장(직렬화)도 작업 스레드에서 수행
+            result = self._run_model(input_text, model_id, model, analysis_result, intent_result)
+            self._store_result(cache_key, result)
+            return result
+        
+        return await loop.run_in_executor(executor, finish)
+    
+    async def optimize_batch_async(self, input_text: str, model_ids: List[str],
+                                   additional_params: Optional[Dict[str, Any]] = None,
+                                   use_cache: bool = True) -> List[Dict[str, Any]]:
+        """optimize_batch의 asyncio 버전 (배치 전체를 작업 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_executor(), functools.partial(
+                self.optimize_batch, input_text, model_ids, additional_params, use_cache=use_cache))
+    
+    def _cache_key(self, input_text: str, model_id: str, additional_params: Dict[str, Any], use_cache: bool) -> Optional[Any]:
+        """결과 캐시 키 (우회 요청이거나 캐시할 수 없는 요청이면 None)"""
+        if not use_cache or not self.result_cache.enabled:
+            self.result_cache.record_bypass()
+            return None
+        try:
+            cache_key = self.result_cache.make_key(model_id, self.models[model_id], input_text, additional_params,
+                                                   self._get_analysis_version())
+        except Exception:
+            cache_key = None
+        if cache_key is None:
+            self.result_cache.record_uncacheable()
+        return cache_key
+    
+    def _get_analysis_version(self) -> int:
+        """
+        입력 분석기 상태 버전을 반환합니다. 분석기 교체, 키워드 색인 재생성(rebuild_keyword_index),
+        의도 모델 교체 뒤에는 새 버전이 되어 이전 상태로 만든 결과는 더 이상 조회되지 않습니다.
+        """
+        analyzer = self.input_analyzer
+        model = analyzer.intent_signal.detector.model
+        with self._version_lock:
+            seen_analyzer, seen_index, seen_model = self._analysis_state
+            if analyzer is not seen_analyzer or analyzer.index_version != seen_index or model is not seen_model:
+                self._analysis_state = (analyzer, analyzer.index_version, model)
+                self._analysis_version += 1
+            return self._analysis_version
+    
+    def _store_result(self, cache_key: Optional[Any], result: Dict[str, Any]) -> None:
+        """캐시할 수 있는 결과를 저장합니다."""
+        if cache_key is None:
+            return
+        if self._is_cacheable(result):
+            # 지연 계산 분석 결과는 남은 필드를 모두 계산한 일반 딕셔너리로 저장
+            stored = dict(result, analysis_result=dict(result["analysis_result"].items()))
+            self.result_cache.put(cache_key, stored)
+        else:
+            self.result_cache.record_uncacheable()
+    
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any]) -> bool:
+        """
+        성공했고 모든 분석 보강 단계가 시간 예산 안에 반영된 결과만 캐시합니다
+        (시간 초과로 기본 분석만 쓴 결과를 TTL 동안 고정하지 않도록).
+        """
+        if not result.get("success"):
+            return False
+        report = result["analysis_result"].get("enrichment") or {}
+        return all(record.get("applied") for record in report.values())
+    
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """최적화 결과 캐시의 사용 통계를 반환합니다."""
+        return self.result_cache.get_stats()
+    
+    def _optimize_prompt(self, input_text: str, model_id: str, additional_params: Dict[str, Any]) -> Dict[str, Any]:
+        """결과 캐시 없이 분석부터 프롬프트 생성까지 수행합니다."""
+        try:
+            model, analysis_result, intent_result = self._prepare_analysis(input_text, model_id, additional_params)
+        except Exception as e:
+            return self._error_result(input_text, model_id, e)
+        
+        return self._run_model(input_text, model_id, model, analysis_result, intent_result)
+    
+    def _prepare_analysis(self, input_text: str, model_id: str, additional_params: Dict[str, Any]) -> Tuple[BaseModel, Dict[str, Any], Dict[str, Any]]:
+        """
+        모델별 프롬프트 생성 전 단계 (입력 분석, 의도 분류, 분석 보강 병합)
+        
+        Returns:
+            (모델, 분석 결과, 의도 분석 결과)
+        """
+        # 요청당 한 번 토큰화하여 분석, 의도 감지, 모델별 프롬프트 생성 단계가 공유
+        tokenized_input = TokenizedInput(input_text)
+        
+        # 분석 보강 단계(NLP 등)는 작업 스레드에서 기본 분석과 함께 진행
+        pending_enrichment = self.enrichment.start(input_text)
+        
+        # 입력 분석
+        analysis_result = self.input_analyzer.analyze(tokenized_input, model_id)
+        
+        # 의도 분석 (분석 결과의 task_type과 같은 분류 결과를 공유,
+        # intent 필드가 없는 분석기면 직접 분류)
+        intent_result = analysis_result.get("intent")
+        if intent_result is None:
+            intent_result = self.intent_signal.detect(tokenized_input)
+        
+        # 선택된 모델 가져오기
+        model = self.models[model_id]
+        
+        # 시간 예산 안에 끝난 보강 결과만 병합 (늦으면 기본 분석만으로 진행)
+        enrichment_fields, enrichment_report = pending_enrichment.collect()
+        analysis_result.update(enrichment_fields)
+        analysis_result["enrichment"] = enrichment_report
+        
+        # 추가 매개변수 병합
+        analysis_result.update(additional_params)
+        return model, analysis_result, intent_result
+    
+    def _optimize_models(self, input_text: str, model_ids: List[str], additional_params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """공유 분석 한 번으로 여러 모델의 결과를 만듭니다 (결과 캐시 없음)."""
+        try:
+            tokenized_input = TokenizedInput(input_text)
+            pending_enrichment = self.enrichment.start(input_text)
             
-            # 추가 매개변수 병합
-            analysis_result.update(additional_params)
+            # 텍스트 기반 필드는 모델 수와 관계없이 한 번만 계산
+            analysis_results = self.input_analyzer.analyze_models(tokenized_input, model_ids)
+            intent_result = analysis_results[model_ids[0]].get("intent")
+            if intent_result is None:
+                intent_result = self.intent_signal.detect(tokenized_input)
             
+            enrichment_fields, enrichment_report = pending_enrichment.collect()
+        except Exception as e:
+            return {model_id: self._error_result(input_text, model_id, e) for model_id in model_ids}
+        
+        def run(model_id: str) -> Dict[str, Any]:
+            try:
+                model = self.models[model_id]
+                analysis_result = analysis_results[model_id]
+                # 모델이 결과를 수정해도 서로 영향을 주지 않도록 공유 값은 모델마다 복사
+                analysis_result.update(copy.deepcopy(enrichment_fields))
+                analysis_result["enrichment"] = copy.deepcopy(enrichment_report)
+                analysis_result.update(copy.deepcopy(additional_params))
+                model_intent = copy.deepcopy(intent_result)
+            except Exception as e:
+                return self._error_result(input_text, model_id, e)
+            return self._run_model(input_text, model_id, model, analysis_result, model_intent)
+        
+        if len(model_ids) == 1 or self.batch_workers == 1:
+            return {model_id: run(model_id) for model_id in model_ids}
+        return dict(zip(model_ids, self._get_batch_executor().map(run, model_ids)))
+    
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """모델별 프롬프트 생성을 실행할 작업 스레드 풀 (처음 배치 요청 시 생성)"""
+        if self._batch_executor is None:
+            with self._batch_lock:
+                if self._batch_executor is None:
+                    self._batch_executor = ThreadPoolExecutor(max_workers=self.batch_workers,
+                                                              thread_name_prefix="optimize-batch")
+        return self._batch_executor
+    
+    def _run_model(self, input_text: str, model_id: str, model: BaseModel,
+                   analysis_result: Dict[str, Any], intent_result: Dict[str, Any]) -> Dict[str, Any]:
+        """분석이 끝난 요청에 대해 모델별 프롬프트와 생성 매개변수를 만듭니다."""
+        try:
             # 프롬프트 최적화
             optimized_prompt = model.optimize_prompt(analysis_result, intent_result)
             
@@ -166,12 +426,39 @@ class PromptOptimizer:
                 "intent_result": intent_result
             }
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"프롬프트 최적화 중 오류 발생: {str(e)}",
-                "original_input": input_text,
-                "model_id": model_id
-            }
+            return self._error_result(input_text, model_id, e)
+    
+    def _unknown_model_result(self, model_id: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"지원하지 않는 모델 ID: {model_id}",
+            "available_models": list(self.models.keys())
+        }
+    
+    @staticmethod
+    def _error_result(input_text: str, model_id: str, error: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"프롬프트 최적화 중 오류 발생: {str(error)}",
+            "original_input": input_text,
+            "model_id": model_id
+        }
+    
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        """비동기 API의 분석/프롬프트 생성 단계를 실행할 작업 스레드 풀 (처음 비동기 요청 시 생성)"""
+        if self._async_executor is None:
+            with self._batch_lock:
+                if self._async_executor is None:
+                    self._async_executor = ThreadPoolExecutor(max_workers=self.async_workers,
+                                                              thread_name_prefix="optimize-async")
+        return self._async_executor
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """분석 보강, 배치 요청, 비동기 API의 작업 스레드를 종료합니다."""
+        self.enrichment.shutdown(wait=wait)
+        for executor in (self._batch_executor, self._async_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
     
     def get_model_specific_tips(self, model_id: str, capability: Optional[str] = None) -> List[str]:
         """
@@ -0,0 +1,137 @@
+"""
+최적화 결과 캐시 모듈: 같은 (모델, 입력 텍스트, 추가 매개변수) 요청의 최적화 결과를
+직렬화된 바이트로 기억하여 분석/의도 분류/프롬프트 생성을 다시 하지 않고 돌려줍니다.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import inspect
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from ..utils.cache import LRUCache
+
+# 기본 최대 항목 수, 직렬화된 결과 크기 합계 상한(바이트), 유효 시간(초) (환경 변수로 변경 가능)
+DEFAULT_MAX_ENTRIES = int(os.environ.get("RESULT_CACHE_SIZE", "2048"))
+DEFAULT_MAX_BYTES = int(os.environ.get("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+DEFAULT_TTL_SECONDS = float(os.environ.get("RESULT_CACHE_TTL", "600"))
+
+
+def model_version(model: Any) -> str:
+    """
+    모델 클래스와 템플릿 데이터로 정해지는 버전 키를 반환합니다.
+
+    클래스 계층의 이름과 소스 파일 내용, 인스턴스 속성(템플릿/키워드 사전 등)을 해시하므로
+    모델 코드나 템플릿이 바뀌면 이전 버전으로 만든 결과는 더 이상 조회되지 않습니다.
+    """
+    digest = hashlib.sha256()
+    for cls in type(model).__mro__:
+        if cls is object:
+            continue
+        digest.update(f"{cls.__module__}.{cls.__qualname__}\n".encode("utf-8"))
+        try:
+            with open(inspect.getsourcefile(cls), "rb") as f:
+                digest.update(f.read())
+        except (TypeError, OSError):
+            pass
+    digest.update(json.dumps(vars(model), sort_keys=True, ensure_ascii=False, default=repr).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class OptimizationResultCache:
+    """
+    PromptOptimizer.optimize_prompt 결과 캐시
+
+    키는 (모델 ID, 모델 버전, 분석기 버전, 입력 텍스트 해시, 추가 매개변수)이며, 값은 pickle로 직렬화한
+    결과라서 조회할 때마다 호출자가 자유롭게 수정할 수 있는 새 딕셔너리를 돌려줍니다.
+    항목 수와 직렬화된 크기 합계로 LRU 제거, TTL로 만료하며 hit/miss/eviction을 집계합니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            max_entries: 최대 항목 수 (0이면 캐시 미사용)
+            max_bytes: 직렬화된 결과 크기 합계 상한, None이면 항목 수로만 제한
+            ttl_seconds: 항목 유효 시간(초), None이면 만료 없음
+        """
+        self._cache = LRUCache(max_size=max_entries, ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+        # 모델 ID -> (모델 인스턴스, 버전 키) (모델이 교체되면 다시 계산)
+        self._versions: Dict[str, Tuple[Any, str]] = {}
+        self._lock = threading.Lock()
+        self.bypasses = 0
+        self.uncacheable = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.max_size > 0
+
+    def version_of(self, model_id: str, model: Any) -> str:
+        """모델의 버전 키 (인스턴스마다 한 번 계산)"""
+        cached = self._versions.get(model_id)
+        if cached is not None and cached[0] is model:
+            return cached[1]
+        version = model_version(model)
+        with self._lock:
+            self._versions[model_id] = (model, version)
+        return version
+
+    def make_key(self, model_id: str, model: Any, input_text: str, additional_params: Optional[Dict[str, Any]],
+                 analysis_version: int = 0) -> Optional[Tuple[str, str, int, str, str]]:
+        """
+        캐시 키를 만듭니다.
+
+        Args:
+            analysis_version: 입력 분석기 상태 버전 (키워드 색인이나 의도 모델이 바뀌면 달라짐)
+
+        Returns:
+            캐시 키 (추가 매개변수를 JSON으로 직렬화할 수 없으면 None)
+        """
+        try:
+            params = json.dumps(additional_params or {}, sort_keys=True, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        text_hash = hashlib.sha256(input_text.encode("utf-8", "surrogatepass")).hexdigest()
+        return (model_id, self.version_of(model_id, model), analysis_version, text_hash, params)
+
+    def get(self, key: Tuple[str, str, int, str, str]) -> Optional[Dict[str, Any]]:
+        """기억한 결과의 새 사본을 반환합니다 (없거나 만료되었으면 None)."""
+        data = self._cache.get(key)
+        return pickle.loads(data) if data is not None else None
+
+    def put(self, key: Tuple[str, str, int, str, str], result: Dict[str, Any]) -> bool:
+        """
+        결과를 직렬화해 저장합니다.
+
+        Returns:
+            저장 여부 (직렬화할 수 없는 결과는 저장하지 않음)
+        """
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.record_uncacheable()
+            return False
+        self._cache.put(key, data)
+        return True
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.bypasses += 1
+
+    def record_uncacheable(self) -> None:
+        with self._lock:
+            self.uncacheable += 1
+
+    def clear(self) -> None:
+        """기억한 결과와 모델 버전 키를 모두 버립니다 (분석기 사전 변경 등)."""
+        self._cache.clear()
+        with self._lock:
+            self._versions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 사용 통계 (LRUCache 통계 + 우회/저장 불가 요청 수)"""
+        stats = self._cache.get_stats()
+        stats.update(bypasses=self.bypasses, uncacheable=self.uncacheable)
+        return stats
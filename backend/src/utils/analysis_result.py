@@ -0,0 +1,291 @@
+"""
+분석 결과 모듈: 필드를 처음 읽을 때 계산하고 기억하는 지연 분석 결과 객체와
+모델별 필드 사용 통계를 제공합니다.
+"""
+
+import copy
+import threading
+from typing import Dict, Any, Callable, Optional, Tuple
+
+_MISSING = object()
+
+
+class AnalysisCore:
+    """
+    텍스트만으로 결정되는(모델과 무관한) 분석 필드를 지연 계산하여 기억하는 객체
+
+    같은 텍스트에 대한 여러 AnalysisResult가 하나의 AnalysisCore를 공유하므로,
+    어느 모델이 먼저 읽든 각 필드는 한 번만 계산됩니다.
+    """
+
+    def __init__(self, text: str, fields: Tuple[str, ...], compute: Callable[[str, str, Dict[str, Any]], Any],
+                 scratch: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            text: 분석할 (정규화된) 텍스트
+            fields: 제공하는 필드 이름 (결과 딕셔너리의 키 순서)
+            compute: (텍스트, 필드 이름, 중간 결과 저장소) -> 필드 값
+            scratch: 미리 계산해 둔 중간 결과 (증분 분석 등)
+        """
+        self.text = text
+        self.fields = fields
+        self._compute = compute
+        self._values: Dict[str, Any] = {}
+        # 여러 필드가 함께 쓰는 중간 결과 (키워드 매칭, 힌트 스캔 등)
+        self._scratch: Dict[str, Any] = dict(scratch) if scratch else {}
+        self._lock = threading.Lock()
+
+    def get(self, field: str, source: Optional[str] = None) -> Any:
+        """
+        필드 값을 반환합니다. 처음 요청된 필드는 계산 후 기억합니다.
+
+        source에 같은 텍스트의 요청별 토큰화 결과(TokenizedInput)를 넘기면 계산에 사용합니다.
+        """
+        value = self._values.get(field, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                value = self._values.get(field, _MISSING)
+                if value is _MISSING:
+                    value = self._compute(self.text if source is None else source, field, self._scratch)
+                    self._values[field] = value
+        return value
+
+    @property
+    def computed_fields(self) -> Tuple[str, ...]:
+        """지금까지 계산된 필드 이름"""
+        return tuple(field for field in self.fields if field in self._values)
+
+
+class FieldAccessStats:
+    """모델별로 분석 결과의 어떤 필드가 실제로 읽혔는지 집계하는 스레드 안전 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 모델 ID -> 생성된 결과 수
+        self._results: Dict[str, int] = {}
+        # 모델 ID -> {필드: 해당 필드를 읽은 결과 수}
+        self._fields: Dict[str, Dict[str, int]] = {}
+
+    def record_result(self, model_id: str) -> None:
+        """모델에 대한 분석 결과가 하나 생성되었음을 기록합니다."""
+        with self._lock:
+            self._results[model_id] = self._results.get(model_id, 0) + 1
+
+    def record_access(self, model_id: str, field: str) -> None:
+        """결과 하나에서 필드가 처음 읽혔음을 기록합니다."""
+        with self._lock:
+            fields = self._fields.setdefault(model_id, {})
+            fields[field] = fields.get(field, 0) + 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모델별 통계를 반환합니다.
+
+        Returns:
+            {모델 ID: {"results": 생성된 결과 수, "fields": {필드: 읽은 결과 수}}}
+        """
+        with self._lock:
+            return {
+                model_id: {"results": count, "fields": dict(self._fields.get(model_id, {}))}
+                for model_id, count in self._results.items()
+            }
+
+    def reset(self) -> None:
+        """모든 통계를 초기화합니다."""
+        with self._lock:
+            self._results.clear()
+            self._fields.clear()
+
+
+class AnalysisResult(dict):
+    """
+    기존 분석 결과 딕셔너리와 호환되는 지연 계산 결과 객체
+
+    모델별 필드(input_text, selected_model, model_category)는 생성 시 채워지고,
+    텍스트 기반 필드는 처음 읽힐 때 AnalysisCore에서 복사해 와 기억합니다.
+    `get`, `[]`, `in`, `update` 등 딕셔너리 연산은 그대로 동작하며, 키/값 전체를
+    순회하거나 비교, 직렬화하면 남은 필드를 모두 계산합니다.
+    """
+
+    def __init__(self, fields: Dict[str, Any], core: AnalysisCore,
+                 copy_value: Callable[[Any], Any] = copy.deepcopy,
+                 access_stats: Optional[FieldAccessStats] = None, source: Optional[str] = None):
+        """
+        Args:
+            fields: 즉시 채울 필드 (모델별 필드)
+            core: 텍스트 기반 필드를 제공하는 AnalysisCore
+            copy_value: 공유된 core 값을 결과에 넣기 전에 복사하는 함수
+            access_stats: 필드 사용 통계 (None이면 기록하지 않음)
+            source: core 필드를 계산할 때 쓸 요청별 토큰화 텍스트 (None이면 core.text)
+        """
+        super().__init__(fields)
+        self._core = core
+        self._source = source
+        self._copy_value = copy_value
+        self._pending = set(core.fields)
+        self._access_stats = access_stats
+        self._model_id = fields.get("selected_model", "")
+        self._accessed = set()
+        self._overlay_fields = tuple(fields)
+        # 필드가 읽힌 순서대로 저장되므로 전체 순회 전에 키 순서를 다시 맞춰야 하는지 여부
+        self._ordered = False
+        if access_stats is not None:
+            access_stats.record_result(self._model_id)
+
+    # 내부 도우미
+
+    def _record(self, key: Any) -> None:
+        if self._access_stats is not None and key not in self._accessed:
+            self._accessed.add(key)
+            self._access_stats.record_access(self._model_id, key)
+
+    def _is_pending(self, key: Any) -> bool:
+        return key in self._pending and not dict.__contains__(self, key)
+
+    def _resolve(self, key: str) -> Any:
+        """대기 중인 필드를 계산하여 결과에 저장합니다."""
+        value = self._copy_value(self._core.get(key, self._source))
+        dict.__setitem__(self, key, value)
+        self._pending.discard(key)
+        self._ordered = False
+        return value
+
+    def _materialize(self) -> None:
+        """남은 필드를 모두 계산하고 키 순서를 기존 결과와 같게 맞춥니다."""
+        for field in self._core.fields:
+            if self._is_pending(field):
+                self._resolve(field)
+        self._pending.clear()
+
+        if self._ordered:
+            return
+
+        # 모델별 필드 -> 텍스트 기반 필드 -> 그 밖에 추가된 키 순서로 재배치
+        core_fields = [field for field in self._core.fields if dict.__contains__(self, field)]
+        head = [(key, value) for key, value in dict.items(self) if key not in self._core.fields]
+        overlay_count = sum(1 for key, _ in head if key in self._overlay_fields)
+        ordered = head[:overlay_count] + [(field, dict.__getitem__(self, field)) for field in core_fields] + head[overlay_count:]
+        dict.clear(self)
+        dict.update(self, ordered)
+        self._ordered = True
+
+    @property
+    def pending_fields(self) -> Tuple[str, ...]:
+        """아직 계산되지 않은 필드 이름"""
+        return tuple(field for field in self._core.fields if self._is_pending(field))
+
+    # 조회
+
+    def __missing__(self, key: Any) -> Any:
+        if self._is_pending(key):
+            return self._resolve(key)
+        raise KeyError(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._record(key)
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._record(key)
+        value = dict.get(self, key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self._is_pending(key):
+            return self._resolve(key)
+        return default
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or self._is_pending(key)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self.pending_fields)
+
+    # 전체 순회
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        if isinstance(other, AnalysisResult):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    # 변경
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if self._is_pending(key):
+            self._pending.discard(key)
+            self._ordered = False
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if self._is_pending(key):
+            self._pending.discard(key)
+            return
+        dict.__delitem__(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if self._is_pending(key):
+            self._resolve(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if self._is_pending(key):
+            return self._resolve(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self._pending.clear()
+        dict.clear(self)
+
+    # 복사 / 직렬화
+
+    def copy(self) -> Dict[str, Any]:
+        """모든 필드를 계산한 일반 딕셔너리 사본을 반환합니다."""
+        self._materialize()
+        return dict(dict.items(self))
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return copy.deepcopy(self.copy(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """모든 필드를 계산한 일반 딕셔너리를 반환합니다."""
+        return self.copy()
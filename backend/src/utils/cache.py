@@ -0,0 +1,115 @@
+"""
+캐시 모듈: 크기 제한(LRU)과 만료 시간(TTL)을 함께 적용하는 스레드 안전 캐시를 제공합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Hashable
+
+
+class LRUCache:
+    """
+    최대 항목 수(또는 size_of로 잰 전체 크기)를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    저장 후 ttl_seconds가 지난 항목은 만료된 것으로 취급하는 캐시
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = 600.0,
+                 clock: Callable[[], float] = time.monotonic, max_bytes: Optional[int] = None,
+                 size_of: Callable[[Any], int] = len):
+        """
+        Args:
+            max_size: 최대 항목 수 (0이면 캐시를 사용하지 않음)
+            ttl_seconds: 항목 유효 시간(초), None이면 만료 없음
+            clock: 현재 시각을 반환하는 함수 (테스트용)
+            max_bytes: 저장한 값 크기 합계의 상한, None이면 항목 수로만 제한
+            size_of: 값 하나의 크기(바이트)를 반환하는 함수 (max_bytes를 쓸 때만 호출)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._clock = clock
+        # 키 -> (만료 시각, 값, 크기), 마지막 항목이 가장 최근에 사용된 항목
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 default를 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value, size = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        값을 저장하고 최대 항목 수나 크기 합계를 넘으면 가장 오래된 항목부터 제거합니다.
+
+        크기 하나가 max_bytes보다 큰 값은 저장하지 않습니다.
+        """
+        if self.max_size <= 0:
+            return
+        size = self._size_of(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (expires_at, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_size or (
+                    self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and (entry[0] is None or entry[0] > self._clock())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 사용 통계를 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
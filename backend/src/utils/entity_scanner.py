@@ -0,0 +1,138 @@
+"""
+엔티티 스캐너: 이메일, URL, 전화번호, 숫자, 대문자로 시작하는 영어 단어 패턴을 이름 붙은 그룹
+하나의 정규식으로 컴파일하여 입력을 한 번만 순회하며 위치와 유형을 함께 추출합니다.
+"""
+
+import re
+import heapq
+import bisect
+import threading
+from itertools import accumulate
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .keyword_matcher import TokenBatch
+
+# (라벨, 시작, 끝, 텍스트)
+EntitySpan = Tuple[str, int, int, str]
+
+# 영문자/숫자 경계: \b는 한글도 단어 문자로 보므로 "Apple과", "5678입니다"처럼
+# 한글 조사가 바로 붙은 경우를 놓침
+LATIN_BEFORE = r'(?<![A-Za-z0-9_])'
+LATIN_AFTER = r'(?![A-Za-z0-9_])'
+
+# 엔티티 패턴: (라벨, 패턴). 같은 위치에서 시작하는 매칭은 선언 순서가 우선순위이며,
+# 매칭된 구간은 소비되므로 이메일/URL/전화번호 안의 숫자나 단어는 따로 추출되지 않습니다.
+# 어느 패턴도 공백을 포함하지 않고 공백과 텍스트 경계를 똑같이 취급하므로, 매칭은 공백으로
+# 나눈 토큰마다 따로 찾아도 같습니다 (`EntityScanner.values_many`가 이용).
+ENTITY_PATTERNS: List[Tuple[str, str]] = [
+    ("EMAIL", LATIN_BEFORE + r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}' + LATIN_AFTER),
+    ("URL", r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'),
+    ("PHONE", r'(?<!\d)(?:\d{2,3}-\d{3,4}-\d{4}|\d{10,11})(?!\d)'),
+    ("NUMBER", r'(?<![A-Za-z0-9_.])\d+(?:\.\d+)?' + LATIN_AFTER),
+    # 대문자로 시작하는 영어 단어 (JavaScript 같은 카멜 표기 포함, GPT 같은 약어 제외)
+    ("CAPITALIZED", LATIN_BEFORE + r'[A-Z][a-z]+(?:[A-Z][a-z]+)*' + LATIN_AFTER)
+]
+
+# NLPAnalyzer가 엔티티로 내보내는 라벨 (대문자 단어는 품사 태그의 고유명사로 대신함)
+NLP_ENTITY_LABELS = ("EMAIL", "URL", "PHONE", "NUMBER")
+
+_span_order = itemgetter(1, 2, 0)
+
+
+class EntityScanner:
+    """
+    엔티티 패턴을 하나의 정규식으로 묶은 스캐너
+
+    - 패턴마다 라벨 이름의 그룹을 두고, 매칭마다 `lastgroup`으로 유형을 판별합니다.
+    - 결과는 겹치지 않는 (라벨, 시작, 끝, 텍스트) 목록이며 위치 순입니다.
+    """
+
+    def __init__(self, patterns: Optional[List[Tuple[str, str]]] = None):
+        """
+        Args:
+            patterns: (라벨, 패턴) 목록 (None이면 ENTITY_PATTERNS)
+        """
+        # 매칭이 공백을 넘지 않는 것이 보장된 패턴인지 (토큰 단위 배치 스캔 가능 여부)
+        self.token_local = patterns is None
+        if patterns is None:
+            patterns = ENTITY_PATTERNS
+        self.labels = tuple(label for label, _ in patterns)
+        self._pattern = re.compile('|'.join(f'(?P<{label}>{pattern})' for label, pattern in patterns))
+
+    def scan(self, text: str) -> List[EntitySpan]:
+        """텍스트를 한 번 순회하여 모든 엔티티의 (라벨, 시작, 끝, 텍스트)를 반환합니다."""
+        return [(match.lastgroup, match.start(), match.end(), match.group())
+                for match in self._pattern.finditer(text)]
+
+    def values(self, text: str, label: str) -> List[str]:
+        """한 유형의 엔티티 텍스트를 처음 나온 순서대로 중복 없이 반환합니다."""
+        return list(dict.fromkeys(value for span_label, _, _, value in self.scan(text) if span_label == label))
+
+    def values_many(self, tokens: "TokenBatch", label: str) -> List[List[str]]:
+        """
+        토큰화된 여러 텍스트에 대해 `values`를 텍스트마다 호출한 것과 같은 결과를 반환합니다.
+
+        배치의 고유 토큰을 줄바꿈으로 이어 붙여 한 번만 스캔하고, 매칭 위치를 토큰으로
+        되돌려 텍스트별로 토큰 등장 순서대로 모읍니다. 사용자 지정 패턴은 매칭이 공백을
+        넘을 수 있으므로 텍스트마다 스캔합니다.
+        """
+        if not self.token_local:
+            return [self.values(text, label) for text in tokens.texts]
+
+        vocabulary = tokens.vocabulary
+        starts = list(accumulate((len(token) + 1 for token in vocabulary), initial=0))
+        token_values: Dict[int, List[str]] = {}
+        for match in self._pattern.finditer("\n".join(vocabulary)):
+            if match.lastgroup == label:
+                token_id = bisect.bisect_right(starts, match.start()) - 1
+                token_values.setdefault(token_id, []).append(match.group())
+
+        if not token_values:
+            return [[] for _ in tokens.texts]
+        return [
+            list(dict.fromkeys(value for token_id in token_ids for value in token_values[token_id])) if token_ids else []
+            for token_ids in tokens.select(token_values)
+        ]
+
+    def entities(self, text: str, labels: Iterable[str] = NLP_ENTITY_LABELS,
+                 extra: Iterable[EntitySpan] = ()) -> List[Dict[str, Any]]:
+        """
+        지정한 유형의 엔티티를 엔티티 딕셔너리 목록으로 반환합니다.
+
+        Args:
+            text: 입력 텍스트
+            labels: 포함할 라벨
+            extra: 함께 합칠 다른 출처의 엔티티 (예: 품사 태그의 고유명사)
+        """
+        labels = set(labels)
+        return to_entity_dicts([span for span in self.scan(text) if span[0] in labels], extra)
+
+
+def to_entity_dicts(spans: List[EntitySpan], extra: Iterable[EntitySpan] = ()) -> List[Dict[str, Any]]:
+    """
+    엔티티 구간을 위치 순의 {'text', 'label', 'start', 'end'} 목록으로 만듭니다.
+
+    spans는 scan 결과처럼 위치 순이고 겹치지 않는 구간이어야 하며, extra는 집합으로 중복을
+    제거한 뒤 위치 순으로 끼워 넣습니다.
+    """
+    extra = set(extra)
+    if extra:
+        spans = list(heapq.merge(spans, sorted(extra, key=_span_order), key=_span_order))
+    return [{'text': value, 'label': label, 'start': start, 'end': end}
+            for label, start, end, value in spans]
+
+
+_shared_scanner: Optional[EntityScanner] = None
+_shared_lock = threading.Lock()
+
+
+def get_entity_scanner() -> EntityScanner:
+    """모든 분석기가 공유하는 EntityScanner를 반환합니다 (처음 호출 시 한 번 컴파일)."""
+    global _shared_scanner
+    if _shared_scanner is None:
+        with _shared_lock:
+            if _shared_scanner is None:
+                _shared_scanner = EntityScanner()
+    return _shared_scanner
@@ -0,0 +1,652 @@
+"""
+구조 힌트/제약 조건 스캐너: 형식, 길이, 섹션, 단어/문장 수, 톤, 대상 독자, 시간,
+포함/제외 조건 패턴을 하나의 정규식으로 컴파일하여 입력을 한 번만 순회합니다.
+"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate, compress
+from operator import itemgetter
+from typing import Dict, List, Any, Tuple, Optional, Mapping
+
+from .keyword_matcher import KeywordTableMatcher, TokenBatch
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 첫 매칭 우선 테이블: 선언 순서가 곧 우선순위입니다 (대소문자 무시)
+FIRST_MATCH_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "format": [
+        ("list", r'목록|리스트|항목|bullet|list'),
+        ("table", r'표|테이블|table'),
+        ("essay", r'에세이|논설|essay'),
+        ("code", r'코드|프로그램|함수|code|function'),
+        ("json", r'json|제이슨|JSON'),
+        ("markdown", r'마크다운|markdown|MD')
+    ],
+    "length": [
+        ("short", r'짧은|간단한|short|brief'),
+        ("medium", r'중간|medium'),
+        ("long", r'긴|상세한|포괄적인|long|detailed|comprehensive')
+    ],
+    "tone": [
+        ("professional", r'전문적|프로페셔널|professional'),
+        ("friendly", r'친근한|우호적|friendly'),
+        ("formal", r'격식|공식적|formal'),
+        ("informal", r'비격식|informal|casual'),
+        ("enthusiastic", r'열정적|enthusiastic'),
+        ("serious", r'진지한|serious'),
+        ("humorous", r'유머러스|재미있는|humorous|funny')
+    ],
+    "audience": [
+        ("general", r'일반|대중|general|public'),
+        ("expert", r'전문가|expert|specialist'),
+        ("beginner", r'초보자|입문자|beginner|novice'),
+        ("children", r'어린이|아동|children|kids'),
+        ("teenager", r'청소년|teenager|adolescent'),
+        ("adult", r'성인|adult')
+    ]
+}
+
+# 테이블별 (이벤트 키, 카테고리) 목록 (선언 순서)
+FIRST_MATCH_KEYS: Dict[str, List[Tuple[str, str]]] = {
+    table: [(f"{table}:{category}", category) for category, _ in categories]
+    for table, categories in FIRST_MATCH_TABLES.items()
+}
+
+# \d+로 시작하는 패턴의 가장 왼쪽 매칭은 항상 숫자열의 첫 자리에서 시작하므로
+# 숫자 중간 위치는 후보에서 제외합니다.
+NUMBER_START = r'(?<!\d)\d'
+
+# 숫자 값으로 인정하는 최대 자릿수: 더 긴 숫자열은 숫자 힌트로 보지 않음
+# (수만 자리 숫자열의 int 변환 비용과 변환 한도 오류를 막음)
+MAX_NUMBER_DIGITS = 12
+
+# 숫자 값 그룹: 숫자열 전체가 MAX_NUMBER_DIGITS 이하일 때만 매칭
+NUMBER_VALUE = r'(?P<{name}_value>\d{{1,%d}})(?!\d)' % MAX_NUMBER_DIGITS
+
+# 포함/제외 조건 값 그룹: 문장 부호 전까지, 최대 {cap}자까지만 캡처하여 매칭 하나의 비용을 상수로 제한
+CAPTURE_VALUE = r'(?P<{name}_value>[^.!?]{{0,{cap}}})'
+
+# 기본 입력 길이 상한(글자 수)과 포함/제외 조건 하나의 캡처 길이 상한
+MAX_INPUT_CHARS = 20000
+MAX_CAPTURE_CHARS = 300
+
+# 가장 왼쪽 매칭 하나만 필요한 패턴: (키, 패턴, 대소문자 무시 여부, 트리거)
+# 값 그룹은 {name} 자리에 이름이 채워지며, 트리거는 패턴이 시작될 수 있는 리터럴(또는 \d)의 교대입니다.
+LEFTMOST_PATTERNS: List[Tuple[str, str, bool, str]] = [
+    ("section", r'섹션|부분|챕터|section|part|chapter', True, r'섹션|부분|챕터|section|part|chapter'),
+    ("number", NUMBER_VALUE, False, NUMBER_START),
+    ("word_count", NUMBER_VALUE + r'\s*(?:단어|words)', True, NUMBER_START),
+    ("sentence_count", NUMBER_VALUE + r'\s*(?:문장|sentences)', True, NUMBER_START),
+    ("time", NUMBER_VALUE + r'\s*(?P<{name}_unit>분|시간|hours?|minutes?)', True, NUMBER_START)
+]
+
+# 모든 비중첩 매칭을 수집하는 패턴 (re.findall 의미): (테이블, 패턴, 대소문자 무시 여부, 트리거)
+CAPTURE_PATTERNS: List[Tuple[str, str, bool, str]] = [
+    ("include", r'포함해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*' + CAPTURE_VALUE, False, r'포함해'),
+    ("include", r'반드시\s*' + CAPTURE_VALUE, False, r'반드시'),
+    ("include", r'include\s*' + CAPTURE_VALUE, True, r'include'),
+    ("exclude", r'제외해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*' + CAPTURE_VALUE, False, r'제외해'),
+    ("exclude", r'포함하지?\s*(?:말아야|마세요|않음|않습니다)[\s\.:]*' + CAPTURE_VALUE, False, r'포함하'),
+    ("exclude", r'exclude\s*' + CAPTURE_VALUE, True, r'exclude'),
+    ("exclude", r'avoid\s*' + CAPTURE_VALUE, True, r'avoid')
+]
+
+# 입력 길이 상한을 적용할 때 자르는 위치로 쓰는 문장 끝 문자
+SENTENCE_TERMINATORS = ".!?"
+
+# 결과가 확정된 그룹을 제외한 스캐너로 바꿀 만큼 남은 텍스트가 긴지 판단하는 기준 (글자 수)
+PRUNE_MIN_REMAINING = 2048
+
+# 배치 스캔 시 텍스트 사이에 넣는 구분 문자: 어떤 패턴에도 소비되지 않고 캡처를 끝냄
+BATCH_SEPARATOR = "!"
+
+# (시작 위치, 키, 끝 위치, 값) 형태의 스캔 이벤트
+HintEvent = Tuple[int, str, int, Any]
+
+
+def _scoped(pattern: str, ignore_case: bool, lowered: bool) -> str:
+    """
+    패턴을 그룹으로 감싸고 대소문자 무시 여부를 적용합니다.
+
+    lowered이면 소문자로 변환한 텍스트에 대해 매칭하도록 이스케이프 시퀀스와 그룹
+    문법((?P<...>)을 제외한 리터럴만 소문자로 바꿉니다.
+    """
+    if not ignore_case:
+        return f"(?:{pattern})"
+    if not lowered:
+        return f"(?i:{pattern})"
+    return "(?:" + re.sub(r'\\.|\(\?P<|[^\\(]+', lambda m: m.group(0) if m.group(0)[0] in '\\(' else m.group(0).lower(), pattern) + ")"
+
+
+def _literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """공백 없는 리터럴만의 교대 패턴이면 소문자로 바꾼 리터럴 목록을, 아니면 None을 반환합니다."""
+    alternatives = pattern.split("|")
+    if all(alternative and re.escape(alternative) == alternative and not any(char.isspace() for char in alternative)
+           for alternative in alternatives):
+        return [alternative.lower() for alternative in alternatives]
+    return None
+
+
+def _guard_pattern(triggers: List[str]) -> str:
+    """
+    트리거 교대 목록을 하나의 후보 위치 필터 정규식으로 만듭니다.
+
+    리터럴 트리거는 소문자로 바꿔 접두사 트라이 형태의 정규식으로 합치므로 각 위치에서
+    트리거 수와 무관하게 글자 단위로 분기하며, \\d 같은 정규식 트리거는 그대로 덧붙입니다.
+    필터는 실제 패턴보다 넓기만 하면 되므로 대소문자 구분은 본문 패턴에 맡깁니다.
+    """
+    trie: Dict[str, Any] = {}
+    special: List[str] = []
+
+    for trigger in triggers:
+        for alternative in trigger.split("|"):
+            if alternative.startswith(("\\", "(")):
+                if alternative not in special:
+                    special.append(alternative)
+                continue
+            node = trie
+            for char in alternative.lower():
+                if node.get("") is True:
+                    break
+                node = node.setdefault(char, {})
+            else:
+                # 더 짧은 접두사만으로 충분하므로 하위 노드는 버림
+                node.clear()
+                node[""] = True
+
+    def serialize(node: Dict[str, Any]) -> str:
+        if node.get("") is True:
+            return ""
+        leaves = sorted(char for char, child in node.items() if child.get("") is True)
+        branches = [re.escape(char) + serialize(child) for char, child in sorted(node.items()) if child.get("") is not True]
+        if len(leaves) == 1:
+            branches.append(re.escape(leaves[0]))
+        elif leaves:
+            branches.append("[" + "".join(re.escape(char) for char in leaves) + "]")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    alternatives = [serialize(trie)] if trie else []
+    return "|".join(alternatives + special)
+
+
+class HintScanner:
+    """
+    구조 힌트와 제약 조건 추출에 쓰이는 모든 패턴을 이름 있는 그룹의 교대(alternation)로
+    묶은 단일 스캐너
+
+    각 후보 위치에서 테이블별 전방 탐색(lookahead)을 수행하므로 서로 겹치는 매칭도
+    모두 기록되며, `resolve`가 기존 구현과 같은 첫 매칭 우선순위와
+    re.findall의 비중첩 의미를 재현합니다.
+    """
+
+    def __init__(self, max_input_chars: Optional[int] = MAX_INPUT_CHARS, max_capture_chars: int = MAX_CAPTURE_CHARS):
+        """
+        전체 패턴 집합에 대한 단일 패스 정규식을 컴파일합니다.
+
+        Args:
+            max_input_chars: 포함/제외 조건을 스캔할 최대 입력 길이(글자 수), None이면 제한 없음.
+                더 긴 입력은 이 길이 안의 마지막 문장 끝까지만 포함/제외 조건을 찾고, 전방 탐색 길이가
+                고정된 나머지 패턴(구조 힌트, 톤, 대상 독자, 시간)은 전체 텍스트를 스캔합니다.
+            max_capture_chars: 포함/제외 조건 하나의 최대 캡처 길이(글자 수)
+        """
+        self.max_input_chars = max_input_chars
+        self.max_capture_chars = max_capture_chars
+
+        # 그룹 이름 -> 이벤트 키 (첫 매칭 우선 테이블은 "테이블:카테고리")
+        self._event_keys: Dict[str, str] = {}
+        for table, categories in FIRST_MATCH_TABLES.items():
+            for index, (category, _) in enumerate(categories):
+                self._event_keys[f"{table}_{index}"] = f"{table}:{category}"
+        for key, _, _, _ in LEFTMOST_PATTERNS:
+            self._event_keys[key] = key
+        self._capture_keys = [f"{table}_{index}" for index, (table, _, _, _) in enumerate(CAPTURE_PATTERNS)]
+        for key in self._capture_keys:
+            self._event_keys[key] = key
+
+        self._all_groups = frozenset(self._event_keys)
+        # 입력 길이 상한을 넘는 입력에서 전체 텍스트를 스캔하는 그룹과 잘린 앞부분만 스캔하는 그룹
+        self._capture_groups = frozenset(self._capture_keys)
+        self._fixed_groups = self._all_groups - self._capture_groups
+
+        # 패턴에 등장하는 가장 긴 리터럴 길이: 실패한 매칭 시도가 읽을 수 있는 고정 길이 구간의 상한
+        sources = [pattern for categories in FIRST_MATCH_TABLES.values() for _, pattern in categories]
+        sources += [pattern for _, pattern, _, _ in LEFTMOST_PATTERNS + CAPTURE_PATTERNS]
+        self.max_literal_length = max(len(word) for source in sources for word in re.findall(r'[^\W\d_]+', source))
+
+        # (소문자 변환 여부, 남은 그룹 집합) -> (정규식, 그룹 정보)
+        self._compiled: Dict[Tuple[bool, frozenset], Tuple[Any, List[Optional[Tuple[str, str, Tuple[int, ...]]]]]] = {}
+        self.pattern = self._get_compiled(True, self._all_groups)[0]
+
+        self._batch_matcher, self._number_pattern, self._number_value_keys, self._number_suffix_keys = self._compile_batch()
+        self._capture_patterns = [
+            (group, re.compile(_scoped(pattern.format(name=group, cap=self.max_capture_chars), ignore_case, True)))
+            for group, (_, pattern, ignore_case, _) in zip(self._capture_keys, CAPTURE_PATTERNS)
+        ]
+
+    def _compile_batch(self):
+        """
+        배치 스캔(`scan_many`)에 쓰는 리터럴 매처와 숫자 정규식을 만듭니다.
+
+        첫 매칭 우선 테이블과 숫자가 아닌 가장 왼쪽 매칭 패턴은 키워드 매처 하나로, 숫자로
+        시작하는 패턴들은 숫자열마다 한 번 매칭하면서 단위 접미사를 전방 탐색으로 확인하는
+        정규식 하나로 합칩니다. 리터럴 교대가 아닌 패턴이 있거나 numpy가 없으면 매처는 None입니다.
+
+        Returns:
+            (리터럴 매처 또는 None, 숫자 정규식, 숫자 값만으로 된 키 목록, [(접미사가 있는 키, 값 그룹 이름 목록)])
+        """
+        tables: Dict[str, Dict[str, List[str]]] = {}
+        for table, categories in FIRST_MATCH_TABLES.items():
+            tables[table] = {category: _literal_alternatives(pattern) for category, pattern in categories}
+
+        number_parts = []
+        value_keys: List[str] = []
+        suffix_keys: List[Tuple[str, Tuple[str, ...]]] = []
+        for key, pattern, ignore_case, _ in LEFTMOST_PATTERNS:
+            if not pattern.startswith(NUMBER_VALUE):
+                tables[key] = {key: _literal_alternatives(pattern)}
+            elif pattern == NUMBER_VALUE:
+                value_keys.append(key)
+            else:
+                # 숫자열 첫 자리에서만 시작하는 숫자 값 뒤의 접미사
+                suffix = _scoped(pattern[len(NUMBER_VALUE):].format(name=key), ignore_case, True)
+                number_parts.append(f"(?:(?=(?P<{key}>{suffix}))|)")
+                suffix_keys.append((key, tuple(re.findall(r'\?P<(' + key + r'_\w+)>', suffix))))
+        number_pattern = re.compile(r'(?P<value>\d(?<!\d\d)\d{0,%d})(?!\d)' % (MAX_NUMBER_DIGITS - 1) + "".join(number_parts))
+
+        literal = all(alternatives is not None for categories in tables.values() for alternatives in categories.values())
+        matcher = KeywordTableMatcher(tables) if NUMPY_AVAILABLE and literal else None
+        return matcher, number_pattern, value_keys, suffix_keys
+
+    def _get_compiled(self, lowered: bool, groups: frozenset):
+        """남은 그룹 집합에 대한 스캐너를 컴파일하거나 캐시에서 가져옵니다."""
+        cache_key = (lowered, groups)
+        compiled = self._compiled.get(cache_key)
+        if compiled is None:
+            compiled = self._compile(lowered, groups)
+            self._compiled[cache_key] = compiled
+        return compiled
+
+    def _compile(self, lowered: bool, groups: frozenset):
+        """
+        남은 그룹들의 패턴을 하나의 정규식으로 컴파일합니다.
+
+        대소문자 무시 패턴은 소문자로 변환한 텍스트에 대해 대소문자 구분 매칭으로
+        처리합니다 (IGNORECASE 교대 매칭보다 훨씬 빠름). 변환 후 길이가 달라지는
+        드문 입력에는 lowered=False로 IGNORECASE 스캐너를 사용합니다.
+
+        Returns:
+            (컴파일된 정규식, match.groups() 순서의 [(그룹 이름, 이벤트 키, 값 그룹 번호 목록) 또는 None])
+        """
+        parts = []
+        triggers: List[str] = []
+        # (그룹 이름, 값 그룹 이름 목록)
+        named_groups: List[Tuple[str, Tuple[str, ...]]] = []
+
+        # 첫 매칭 우선 테이블: 같은 위치에서는 선언 순서가 앞선 카테고리가 선택됨
+        for table, categories in FIRST_MATCH_TABLES.items():
+            alternatives = []
+            for index, (_, pattern) in enumerate(categories):
+                group = f"{table}_{index}"
+                if group not in groups:
+                    continue
+                alternatives.append(f"(?P<{group}>{_scoped(pattern, True, lowered)})")
+                named_groups.append((group, ()))
+                triggers.append(pattern)
+            if alternatives:
+                parts.append(f"(?:(?=(?:{'|'.join(alternatives)}))|)")
+
+        for key, pattern, ignore_case, trigger in LEFTMOST_PATTERNS:
+            if key not in groups:
+                continue
+            body = _scoped(pattern.format(name=key), ignore_case, lowered)
+            parts.append(f"(?:(?=(?P<{key}>{body}))|)")
+            named_groups.append((key, tuple(re.findall(r'\?P<(' + key + r'_\w+)>', body))))
+            triggers.append(trigger)
+
+        for index, (table, pattern, ignore_case, trigger) in enumerate(CAPTURE_PATTERNS):
+            group = f"{table}_{index}"
+            if group not in groups:
+                continue
+            body = _scoped(pattern.format(name=group, cap=self.max_capture_chars), ignore_case, lowered)
+            parts.append(f"(?:(?=(?P<{group}>{body}))|)")
+            named_groups.append((group, (f"{group}_value",)))
+            triggers.append(trigger)
+
+        # 후보 위치 필터: 남은 패턴 중 하나라도 시작될 수 있는 위치에서만 매칭 객체를 생성
+        guard = _guard_pattern(triggers)
+        if not lowered:
+            guard = f"(?i:{guard})"
+        pattern = re.compile(f"(?={guard})" + "".join(parts))
+        # match.groups() 순서에 맞춘 그룹 정보 (값 그룹 자리는 None)
+        slots: List[Optional[Tuple[str, str, Tuple[int, ...]]]] = [None] * pattern.groups
+        for group, value_groups in named_groups:
+            slots[pattern.groupindex[group] - 1] = (
+                group, self._event_keys[group], tuple(pattern.groupindex[name] for name in value_groups)
+            )
+        return pattern, slots
+
+    def _prune(self, groups: frozenset, group: str) -> frozenset:
+        """
+        그룹이 매칭된 뒤 결과에 더 이상 영향을 줄 수 없는 그룹을 제외합니다.
+
+        첫 매칭 우선 테이블은 매칭된 카테고리와 그보다 우선순위가 낮은 카테고리를,
+        가장 왼쪽 매칭 패턴은 자기 자신을 제외하며 포함/제외 조건은 끝까지 수집합니다.
+        """
+        if group in self._capture_keys:
+            return groups
+        table, _, index = group.rpartition("_")
+        if table in FIRST_MATCH_TABLES and index.isdigit():
+            return frozenset(
+                g for g in groups
+                if not (g.startswith(table + "_") and g[len(table) + 1:].isdigit() and int(g[len(table) + 1:]) >= int(index))
+            )
+        return groups - {group}
+
+    def collect(self, text: str, pos: int = 0, endpos: Optional[int] = None, prune: bool = True,
+                lowered_text: Optional[str] = None, groups: Optional[frozenset] = None) -> List[HintEvent]:
+        """
+        텍스트를 순회하여 시작 위치가 [pos, endpos) 안에 있는 이벤트를 수집합니다.
+
+        prune이 True이면 결과가 확정된 그룹을 제외한 스캐너로 바꿔 가며 나머지를
+        이어서 스캔하므로, 각 키의 첫 이벤트와 모든 포함/제외 이벤트만 보장됩니다.
+        전방 탐색은 endpos 이후의 텍스트도 볼 수 있으며, 캡처 값은 원문에서 잘라냅니다.
+        lowered_text에 이미 소문자로 변환한 텍스트를 넘기면 변환을 생략하며,
+        groups를 넘기면 해당 그룹의 이벤트만 수집합니다.
+        """
+        if lowered_text is None:
+            lowered_text = text.lower()
+        lowered = len(lowered_text) == len(text)
+        target = lowered_text if lowered else text
+
+        events: List[HintEvent] = []
+        if groups is None:
+            groups = self._all_groups
+        position = pos
+        # 남은 텍스트가 짧으면 스캐너를 바꾸는 비용이 더 크므로 그대로 끝까지 스캔
+        prune_until = len(target) - PRUNE_MIN_REMAINING if prune else -1
+
+        while True:
+            pattern, slots = self._get_compiled(lowered, groups)
+            remaining = groups
+
+            for match in pattern.finditer(target, position):
+                start = match.start()
+                if endpos is not None and start >= endpos:
+                    return events
+                # 매칭된(비어 있지 않은) 그룹만 순회: 이벤트 그룹은 항상 트리거를 포함해 비어 있지 않음
+                for slot in compress(slots, match.groups()):
+                    if slot is None:
+                        continue
+                    group, key, value_groups = slot
+                    if len(value_groups) == 1:
+                        value = text[match.start(value_groups[0]):match.end(value_groups[0])]
+                    elif value_groups:
+                        value = tuple(text[match.start(value):match.end(value)] for value in value_groups)
+                    else:
+                        value = None
+                    events.append((start, key, match.end(group), value))
+                    if start < prune_until:
+                        remaining = self._prune(remaining, group)
+
+                if remaining != groups:
+                    # 남은 그룹 집합이 바뀌면 다음 위치부터 더 작은 스캐너로 이어서 스캔
+                    groups = remaining
+                    position = start + 1
+                    break
+            else:
+                return events
+
+    def rescan_start(self, text: str, pos: int, events: List[HintEvent]) -> int:
+        """
+        text[pos]부터 바뀌었을 때 결과가 달라질 수 있는 가장 이른 매칭 시작 위치를 반환합니다.
+
+        모든 패턴은 위치마다 독립적인 전방 탐색이므로 그 앞의 이벤트는 그대로 유효합니다.
+        이벤트가 된 매칭은 끝 위치(탐욕적 반복을 멈춘 글자 포함)가 pos 이상인 경우만,
+        실패한 시도는 리터럴, 공백, 숫자열만 읽을 수 있으므로 pos에서 그만큼 거슬러 올라간
+        위치 이후에서 시작한 경우만 영향을 받습니다.
+        """
+        restart = pos
+        for _ in range(2):
+            # 리터럴 한 개 길이만큼, 이어서 그 앞의 공백/숫자열만큼 후퇴
+            restart = max(0, restart - self.max_literal_length)
+            while restart > 0 and (text[restart - 1].isspace() or text[restart - 1].isdigit()):
+                restart -= 1
+
+        for start, _, end, _ in events:
+            if start >= restart:
+                break
+            if end >= pos:
+                restart = start
+                break
+        return restart
+
+    def resolve(self, events: List[HintEvent], input_chars: Optional[int] = None,
+                analyzed_chars: Optional[int] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        위치순으로 정렬된 이벤트 목록에서 구조 힌트와 제약 조건 딕셔너리를 만듭니다.
+
+        입력이 잘렸거나(analyzed_chars < input_chars) 캡처 길이 상한에 닿은 포함/제외 조건이
+        있으면 constraints["truncated"]에 그 내용을 기록합니다.
+
+        Returns:
+            (structure_hints, constraints)
+        """
+        # 키 -> 첫 이벤트의 값
+        first: Dict[str, Any] = {}
+        captures: Dict[str, List[str]] = {key: [] for key in self._capture_keys}
+        next_allowed: Dict[str, int] = {key: 0 for key in self._capture_keys}
+        capped_captures = 0
+
+        for start, key, end, value in events:
+            if key in captures:
+                # re.findall과 같이 이전 매칭이 끝난 위치부터만 다음 매칭을 인정
+                if start >= next_allowed[key]:
+                    captures[key].append(value)
+                    next_allowed[key] = end
+                    if len(value) >= self.max_capture_chars:
+                        capped_captures += 1
+            elif key not in first:
+                first[key] = value
+
+        categories = {table: self._first_category(table, first) for table in FIRST_MATCH_TABLES}
+        return self._build(categories, first, captures, capped_captures, input_chars, analyzed_chars)
+
+    def _build(self, categories: Mapping[str, Optional[str]], first: Mapping[str, Any],
+               captures: Mapping[str, List[str]], capped_captures: int,
+               input_chars: Optional[int], analyzed_chars: Optional[int]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        테이블별 카테고리, 키별 첫 매칭 값, 포함/제외 캡처 목록으로 (structure_hints, constraints)를 만듭니다.
+
+        Args:
+            categories: 첫 매칭 우선 테이블 -> 선택된 카테고리 (없으면 None)
+            first: 가장 왼쪽 매칭 패턴의 키 -> 첫 매칭 값
+            captures: 포함/제외 패턴 그룹 이름 -> 비중첩 캡처 값 목록 (매칭이 없는 그룹은 생략 가능)
+            capped_captures: 캡처 길이 상한에 닿은 캡처 수
+        """
+        structure_hints: Dict[str, Any] = {
+            "format": categories["format"],
+            "sections": [],
+            "length": None
+        }
+
+        # 섹션 힌트: 섹션 언급이 있으면 텍스트의 첫 숫자로 섹션 수 추정
+        if "section" in first and "number" in first:
+            structure_hints["sections"] = [f"Section {i+1}" for i in range(min(int(first["number"]), 10))]
+
+        structure_hints["length"] = categories["length"]
+
+        if "word_count" in first:
+            structure_hints["word_count"] = int(first["word_count"])
+        if "sentence_count" in first:
+            structure_hints["sentence_count"] = int(first["sentence_count"])
+
+        constraints: Dict[str, Any] = {
+            "include": [],
+            "exclude": [],
+            "tone": categories["tone"],
+            "audience": categories["audience"],
+            "time_constraint": None
+        }
+
+        # 패턴 선언 순서대로 포함/제외 요소 병합
+        if captures:
+            for key, (table, _, _, _) in zip(self._capture_keys, CAPTURE_PATTERNS):
+                for match in captures.get(key, ()):
+                    if match.strip():
+                        constraints[table].append(match.strip())
+
+        if "time" in first:
+            value, unit = first["time"]
+            if '시간' in unit or 'hour' in unit.lower():
+                constraints["time_constraint"] = f"{int(value)} hours"
+            else:
+                constraints["time_constraint"] = f"{int(value)} minutes"
+
+        input_truncated = input_chars is not None and analyzed_chars is not None and analyzed_chars < input_chars
+        if input_truncated or capped_captures:
+            constraints["truncated"] = {
+                "input_chars": input_chars,
+                "analyzed_chars": analyzed_chars,
+                "capped_captures": capped_captures
+            }
+
+        return structure_hints, constraints
+
+    def analyzed_length(self, text: str) -> int:
+        """
+        입력 길이 상한을 적용했을 때 포함/제외 조건을 스캔할 앞부분의 길이를 반환합니다.
+
+        문장 중간에서 자르지 않도록 상한 안의 마지막 문장 끝 문자 직후에서 자르며,
+        상한 안에 문장 끝이 없으면 상한 위치에서 자릅니다.
+        """
+        limit = self.max_input_chars
+        if limit is None or len(text) <= limit:
+            return len(text)
+        boundary = max(text.rfind(terminator, 0, limit) for terminator in SENTENCE_TERMINATORS) + 1
+        return boundary if boundary > 0 else limit
+
+    def scan(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        텍스트를 한 번 스캔하여 (structure_hints, constraints)를 반환합니다.
+
+        입력 길이 상한을 넘으면 포함/제외 조건만 잘린 앞부분에서 찾고
+        constraints["truncated"]에 분석한 길이를 기록합니다.
+        """
+        length = self.analyzed_length(text)
+        # TokenizedInput이면 요청에서 이미 만든 소문자 텍스트를 재사용
+        lowered_text = text.lower()
+        if length < len(text):
+            events = self.collect(text, lowered_text=lowered_text, groups=self._fixed_groups)
+            # 소문자 변환으로 길이가 바뀌면 앞부분의 위치를 맞출 수 없으므로 다시 변환
+            prefix_lowered = lowered_text[:length] if len(lowered_text) == len(text) else None
+            events += self.collect(text[:length], lowered_text=prefix_lowered, groups=self._capture_groups)
+            return self.resolve(sorted(events, key=itemgetter(0)), len(text), length)
+        return self.resolve(self.collect(text, lowered_text=lowered_text), len(text), length)
+
+    def scan_many(self, texts: List[str], tokens: Optional[TokenBatch] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        여러 텍스트를 한 번에 스캔하여 `scan`을 텍스트마다 호출한 것과 같은 결과를 반환합니다.
+
+        형식/길이/톤/대상 독자와 섹션 패턴은 공백 없는 리터럴의 교대이고 결과가 등장 여부로만
+        정해지므로, 배치의 고유 토큰마다 한 번씩 키워드 매칭한 결과를 텍스트별로 합칩니다.
+        숫자 패턴과 포함/제외 조건은 소문자로 바꾼 텍스트를 구분 문자("!")로 이어 붙여 정규식마다
+        한 번씩 순회합니다. 구분 문자는 어떤 패턴도 소비하지 않고 캡처를 끝내므로 텍스트 끝과
+        똑같이 동작합니다. 길이 상한에 걸리거나 소문자 변환으로 길이가 바뀌는 텍스트는 `scan`으로
+        따로 처리합니다 (numpy가 없으면 모든 텍스트).
+
+        Args:
+            texts: 스캔할 텍스트 목록
+            tokens: texts를 이미 토큰화한 TokenBatch (None이면 새로 토큰화)
+        """
+        if self._batch_matcher is None or not texts:
+            return [self.scan(text) for text in texts]
+
+        lowered_texts = [text.lower() for text in texts]
+        batched = [
+            len(lowered) == len(text) and self.analyzed_length(text) == len(text)
+            for text, lowered in zip(texts, lowered_texts)
+        ]
+        if tokens is None:
+            tokens = TokenBatch(texts)
+
+        # 리터럴 패턴: 테이블별로 선언 순서가 가장 앞선 등장 카테고리 (섹션은 등장 여부)
+        matcher = self._batch_matcher
+        presence = matcher.count_matrix(lowered_texts, tokens) > 0
+        # 매칭이 있는 텍스트만 딕셔너리를 만듦 (대부분의 텍스트는 숫자/포함 조건이 없음)
+        firsts: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        table_categories = []
+        for table, columns in matcher.table_slices.items():
+            table_presence = presence[:, columns]
+            found = table_presence.any(axis=1)
+            if table in FIRST_MATCH_TABLES:
+                names = np.array(list(matcher.tables[table]) + [None], dtype=object)
+                best = np.where(found, table_presence.argmax(axis=1), len(names) - 1)
+                table_categories.append(names[best].tolist())
+            else:
+                for row in np.flatnonzero(found).tolist():
+                    firsts[row] = {table: None}
+        categories = [dict(zip(FIRST_MATCH_TABLES, row_categories)) for row_categories in zip(*table_categories)]
+
+        joined = BATCH_SEPARATOR.join(lowered if ok else "" for lowered, ok in zip(lowered_texts, batched))
+        original = BATCH_SEPARATOR.join(text if ok else "" for text, ok in zip(texts, batched))
+        # 텍스트별 끝 위치(구분 문자 포함): 매칭 시작 위치의 bisect_right가 곧 텍스트 번호
+        boundaries = list(accumulate(len(text) + len(BATCH_SEPARATOR) if ok else len(BATCH_SEPARATOR)
+                                     for text, ok in zip(texts, batched)))
+
+        # 숫자 패턴: 숫자열마다 한 번 매칭하며 키별로 텍스트의 첫 매칭만 기록
+        # (매칭 객체를 모아 두지 않고 바로 처리하여 배치 크기만큼의 객체가 쌓이지 않게 함)
+        for match in self._number_pattern.finditer(joined):
+            row = bisect_right(boundaries, match.start())
+            first = firsts[row]
+            if first is None:
+                first = firsts[row] = {}
+            for key in self._number_value_keys:
+                if key not in first:
+                    first[key] = match.group("value")
+            # 접미사가 있는 키는 전방 탐색 그룹이 하나라도 매칭된(lastindex가 값 그룹이 아닌) 숫자열만 확인
+            if match.lastindex == 1:
+                continue
+            for key, unit_groups in self._number_suffix_keys:
+                if key in first or match.start(key) < 0:
+                    continue
+                value = match.group("value")
+                if unit_groups:
+                    value = (value,) + tuple(original[match.start(group):match.end(group)] for group in unit_groups)
+                first[key] = value
+
+        # 포함/제외 조건: 패턴별 비중첩 매칭 (값은 원문에서 잘라냄)
+        captures: List[Optional[Dict[str, List[str]]]] = [None] * len(texts)
+        capped_captures = [0] * len(texts)
+        for key, pattern in self._capture_patterns:
+            value_group = f"{key}_value"
+            for match in pattern.finditer(joined):
+                row = bisect_right(boundaries, match.start())
+                value = original[match.start(value_group):match.end(value_group)]
+                if captures[row] is None:
+                    captures[row] = {}
+                captures[row].setdefault(key, []).append(value)
+                if len(value) >= self.max_capture_chars:
+                    capped_captures[row] += 1
+
+        # 매칭이 없는 텍스트는 읽기 전용 빈 딕셔너리 하나를 공유
+        no_matches: Dict[str, Any] = {}
+        return [
+            self._build(row_categories, first if first is not None else no_matches,
+                        row_captures if row_captures is not None else no_matches,
+                        capped, len(text), len(text)) if ok else self.scan(text)
+            for text, ok, row_categories, first, row_captures, capped
+            in zip(texts, batched, categories, firsts, captures, capped_captures)
+        ]
+
+    @staticmethod
+    def _first_category(table: str, first: Mapping[str, Any]) -> Optional[str]:
+        """테이블 선언 순서상 가장 먼저 등장한 카테고리를 반환합니다."""
+        for key, category in FIRST_MATCH_KEYS[table]:
+            if key in first:
+                return category
+        return None
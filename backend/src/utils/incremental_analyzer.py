@@ -0,0 +1,200 @@
+"""
+증분 분석 모듈: 입력 중인 텍스트의 편집(delta)마다 바뀐 부분 주변만 다시 스캔하여
+키워드 매칭 수, 카테고리 점수, 구조 힌트/제약 조건을 갱신합니다.
+"""
+
+from typing import TYPE_CHECKING
+
+from .analysis_result import AnalysisCore, AnalysisResult
+
+if TYPE_CHECKING:
+    from .input_analyzer import InputAnalyzer
+
+
+class IncrementalAnalysisSession:
+    """
+    실시간 미리보기를 위한 증분 분석 세션
+
+    편집 구간 [start, end)가 replacement로 바뀌면
+    - 키워드: 편집 구간과 겹치는 매칭만 이전/새 텍스트에서 각각 빼고 더하며
+      (최장 키워드 길이만큼의 주변 창만 오토마톤으로 스캔),
+    - 구조 힌트/제약 조건: 결과가 달라질 수 있는 가장 이른 위치부터 편집 구간 끝까지만
+      다시 스캔하고, 그 뒤의 이벤트는 위치만 옮깁니다.
+    - 복잡성 판단에 쓰는 공백 기준 단어 수도 편집 구간 경계에서만 다시 셉니다.
+
+    키워드 추출(keywords)과 엔티티(entities)는 전체 텍스트 기준이므로 해당 필드를
+    읽을 때만 계산합니다. 반환 값은 `InputAnalyzer.analyze`와 같은 AnalysisResult입니다.
+    """
+
+    def __init__(self, analyzer: "InputAnalyzer", selected_model: str, input_text: str = ""):
+        """
+        Args:
+            analyzer: 키워드 사전과 스캐너를 제공하는 InputAnalyzer
+            selected_model: 사용자가 선택한 AI 모델 ID
+            input_text: 초기 텍스트
+        """
+        self._analyzer = analyzer
+        self.selected_model = selected_model
+        self._model_category = analyzer._get_model_category(selected_model)
+        # 전체 스캔 횟수 (초기화, 키워드 사전 변경, 위치를 맞출 수 없는 편집)
+        self.full_scans = 0
+        self.reset(input_text)
+
+    @property
+    def text(self) -> str:
+        """현재 텍스트"""
+        return self._text
+
+    def reset(self, input_text: str) -> AnalysisResult:
+        """텍스트 전체를 다시 스캔하여 세션 상태를 초기화합니다."""
+        self._text = input_text
+        self._lowered = input_text.lower()
+        # 소문자 변환 후 길이가 달라지는 드문 입력은 위치를 맞출 수 없으므로 매번 전체 스캔
+        self._aligned = len(self._lowered) == len(input_text)
+
+        self._matcher = self._analyzer._keyword_matcher
+        self._pattern_counts = [0] * len(self._matcher.automaton.patterns)
+        self._present = set()
+        self._count_keywords(self._lowered, 0, len(self._lowered), 0, len(self._lowered), 1)
+
+        self._word_count = len(input_text.split())
+
+        scanner = self._analyzer._hint_scanner
+        if self._aligned:
+            self._events = scanner.collect(input_text, prune=False, lowered_text=self._lowered)
+        else:
+            self._events = scanner.collect(input_text, prune=False)
+
+        self.full_scans += 1
+        return self.analysis()
+
+    def apply(self, start: int, end: int, replacement: str) -> AnalysisResult:
+        """
+        텍스트의 [start, end) 구간을 replacement로 바꾸고 갱신된 분석 결과를 반환합니다.
+
+        삽입은 start == end, 삭제는 replacement == ""로 표현합니다.
+        """
+        old_text = self._text
+        if not 0 <= start <= end <= len(old_text):
+            raise ValueError(f"Invalid edit range [{start}, {end}) for text of length {len(old_text)}")
+
+        new_text = old_text[:start] + replacement + old_text[end:]
+        replacement_lower = replacement.lower()
+
+        # 키워드 사전이 다시 만들어졌거나 위치를 맞출 수 없으면 전체 스캔
+        if (not self._aligned or len(replacement_lower) != len(replacement)
+                or self._matcher is not self._analyzer._keyword_matcher):
+            return self.reset(new_text)
+
+        old_lower = self._lowered
+        new_lower = old_lower[:start] + replacement_lower + old_lower[end:]
+        new_end = start + len(replacement)
+        reach = self._matcher.automaton.max_pattern_length
+
+        # 키워드: 편집 구간과 겹치거나 걸쳐 있는 매칭만 빼고 다시 더함
+        self._count_keywords(old_lower, max(0, start - reach + 1), min(len(old_text), end + reach - 1), start, end, -1)
+        self._count_keywords(new_lower, max(0, start - reach + 1), min(len(new_text), new_end + reach - 1), start, new_end, 1)
+
+        # 단어 수: 앞 글자가 바뀌었을 수 있는 위치까지 포함해 단어 시작 위치만 다시 셈
+        self._word_count += (
+            self._count_word_starts(new_text, start, min(len(new_text), new_end + 1))
+            - self._count_word_starts(old_text, start, min(len(old_text), end + 1))
+        )
+
+        # 힌트: 영향받는 첫 위치부터 편집 구간 직후 위치까지만 다시 스캔
+        scanner = self._analyzer._hint_scanner
+        restart = scanner.rescan_start(old_text, start, self._events)
+        delta = len(replacement) - (end - start)
+        events = [event for event in self._events if event[0] < restart]
+        events.extend(scanner.collect(new_text, restart, new_end + 1, prune=False, lowered_text=new_lower))
+        events.extend(
+            (event_start + delta, key, event_end + delta, value)
+            for event_start, key, event_end, value in self._events if event_start > end
+        )
+
+        self._text = new_text
+        self._lowered = new_lower
+        self._events = events
+        return self.analysis()
+
+    def append(self, text: str) -> AnalysisResult:
+        """텍스트 끝에 문자열을 덧붙입니다."""
+        return self.apply(len(self._text), len(self._text), text)
+
+    def set_text(self, input_text: str) -> AnalysisResult:
+        """
+        전체 텍스트를 받아 이전 텍스트와의 공통 접두사/접미사를 제외한 구간만 편집으로 적용합니다.
+        """
+        old_text = self._text
+        prefix = self._common_prefix_length(old_text, input_text)
+        if prefix == len(old_text) == len(input_text):
+            return self.analysis()
+        limit = min(len(old_text), len(input_text)) - prefix
+        suffix = self._common_prefix_length(old_text[::-1][:limit], input_text[::-1][:limit])
+        return self.apply(prefix, len(old_text) - suffix, input_text[prefix:len(input_text) - suffix])
+
+    def analysis(self) -> AnalysisResult:
+        """현재 텍스트의 분석 결과를 반환합니다 (키워드 추출/엔티티는 읽을 때 계산)."""
+        analyzer = self._analyzer
+        scanner = analyzer._hint_scanner
+        if scanner.analyzed_length(self._text) < len(self._text):
+            # 입력 길이 상한을 넘으면 잘린 앞부분만 스캔 (InputAnalyzer.analyze와 같은 결과)
+            hint_scan = scanner.scan(self._text)
+        else:
+            hint_scan = scanner.resolve(self._events, len(self._text), len(self._text))
+        scratch = {
+            "keyword_matches": self._matcher.count_pattern_ids(self._present),
+            "hint_scan": hint_scan,
+            "word_count": self._word_count
+        }
+        core = AnalysisCore(analyzer._normalize_text(self._text), analyzer.CORE_FIELDS, analyzer._compute_core_field, scratch)
+        return AnalysisResult(
+            {
+                "input_text": self._text,
+                "selected_model": self.selected_model,
+                "model_category": self._model_category
+            },
+            core,
+            copy_value=analyzer._copy_result,
+            access_stats=analyzer.field_access_stats
+        )
+
+    def _count_keywords(self, lowered: str, window_start: int, window_end: int,
+                        region_start: int, region_end: int, sign: int) -> None:
+        """창 안에서 [region_start, region_end) 구간과 겹치거나 걸친 매칭 수를 sign만큼 반영합니다."""
+        automaton = self._matcher.automaton
+        patterns = automaton.patterns
+        counts = self._pattern_counts
+        present = self._present
+
+        for match_start, pattern_id in automaton.iter_matches(lowered, window_start, window_end):
+            if match_start < region_end and match_start + len(patterns[pattern_id]) > region_start:
+                counts[pattern_id] += sign
+                if counts[pattern_id]:
+                    present.add(pattern_id)
+                else:
+                    present.discard(pattern_id)
+
+    @staticmethod
+    def _count_word_starts(text: str, start: int, end: int) -> int:
+        """[start, end) 안에서 공백이 아닌 글자가 공백(또는 텍스트 시작) 뒤에 오는 위치 수를 셉니다."""
+        count = 0
+        previous_space = start == 0 or text[start - 1].isspace()
+        for char in text[start:end]:
+            is_space = char.isspace()
+            if previous_space and not is_space:
+                count += 1
+            previous_space = is_space
+        return count
+
+    @staticmethod
+    def _common_prefix_length(a: str, b: str) -> int:
+        """두 문자열의 공통 접두사 길이를 구간 비교(이분 탐색)로 구합니다."""
+        low, high = 0, min(len(a), len(b))
+        while low < high:
+            middle = (low + high + 1) // 2
+            if a[low:middle] == b[low:middle]:
+                low = middle
+            else:
+                high = middle - 1
+        return low
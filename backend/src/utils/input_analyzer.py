@@ -3,12 +3,80 @@
 """
 
 import re
-from typing import Dict, List, Any, Tuple
+import sys
+import heapq
+import hashlib
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Any, Tuple, Optional
+
+from .keyword_matcher import KeywordTableMatcher, TokenBatch, score_categories
+from .hint_scanner import HintScanner, MAX_INPUT_CHARS, MAX_CAPTURE_CHARS
+from .cache import LRUCache
+from .analysis_result import AnalysisCore, AnalysisResult, FieldAccessStats
+from .incremental_analyzer import IncrementalAnalysisSession
+from .tokenized_input import TokenizedInput, get_tokenized
+from .korean_tokenizer import get_korean_tokenizer
+from .entity_scanner import get_entity_scanner
+from .intent_signal import IntentSignal
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 키워드 추출 시 한 번에 소문자로 변환해 토큰화하는 구간 길이 (글자 수)
+KEYWORD_CHUNK_CHARS = 65536
+
+# 두 글자 이상인 단어 (\b\w+\b 중 한 글자 단어를 제외한 것과 같음)
+KEYWORD_PATTERN = re.compile(r'\w\w+')
+
+# 구간 경계로 쓰는 공백 문자 (단어를 나누지 않고, 그리스어 종결 시그마 등 문맥에 따른 소문자 변환도 바꾸지 않음)
+CHUNK_BOUNDARY_PATTERN = re.compile(r'\s')
+
 
 class InputAnalyzer:
     """사용자 입력을 분석하여 프롬프트 최적화에 필요한 정보를 추출하는 클래스"""
     
-    def __init__(self):
+    # 모델과 무관하게 텍스트만으로 결정되는 분석 필드
+    CORE_FIELDS = ("keywords", "task_type", "intent", "style", "complexity", "entities", "structure_hints", "constraints")
+    
+    def __init__(self, cache_size: int = 1024, cache_ttl: Optional[float] = 600.0,
+                 max_input_chars: Optional[int] = MAX_INPUT_CHARS, max_capture_chars: int = MAX_CAPTURE_CHARS,
+                 keyword_top_k: int = 10, intent_signal: Optional[IntentSignal] = None):
+        """
+        Args:
+            cache_size: 텍스트 기반 분석 결과(core) 캐시의 최대 항목 수 (0이면 캐시 미사용)
+            cache_ttl: 캐시 항목 유효 시간(초), None이면 만료 없음
+            max_input_chars: 포함/제외 조건을 스캔할 최대 입력 길이, None이면 제한 없음 (구조 힌트는 전체 텍스트)
+            max_capture_chars: 포함/제외 조건 하나의 최대 캡처 길이
+            keyword_top_k: 추출할 상위 키워드 수
+            intent_signal: 의도/작업 유형 통합 분류 서비스 (None이면 번들 의도 분류기 사용)
+        """
+        self.keyword_top_k = keyword_top_k
+        
+        # 의도(intent)와 작업 유형(task_type) 필드를 함께 정하는 분류 서비스
+        self.intent_signal = intent_signal if intent_signal is not None else IntentSignal()
+        
+        # 키워드 추출 시 제외할 불용어 (실제 구현에서는 더 포괄적인 불용어 목록 사용)
+        self.stopwords = frozenset(["그", "이", "저", "것", "수", "를", "에", "의", "가", "은", "는", "이다", "있다", "하다", "있", "하", "되"])
+        
+        # 키워드에서 조사/어미를 떼어 내는 한국어 토크나이저 (프로세스 공유)
+        self._korean_tokenizer = get_korean_tokenizer()
+        
+        # 엔티티 추출에 쓰는 엔티티 스캐너 (NLPAnalyzer와 공유)
+        self._entity_scanner = get_entity_scanner()
+        
+        # 정규화된 텍스트 해시 -> 모델 무관 분석 결과 (AnalysisCore, 필드는 지연 계산)
+        self._core_cache = LRUCache(max_size=cache_size, ttl_seconds=cache_ttl)
+        
+        # 모델 ID -> 카테고리 색인 (로드된 모델의 capabilities로 register_model_categories에서 채움)
+        self._model_categories: Dict[str, str] = {}
+        
+        # 모델별로 분석 결과의 어떤 필드를 실제로 읽는지 집계
+        self.field_access_stats = FieldAccessStats()
+        
         # 작업 유형 키워드 (확장 가능)
         self.task_keywords = {
             "creative_writing": ["글", "시", "소설", "이야기", "스토리", "작성", "창작", "스크립트", "대본"],
@@ -41,6 +109,25 @@ class InputAnalyzer:
             "medium": ["중간", "균형", "적절한"],
             "low": ["간단", "기본", "쉬운", "초보적"]
         }
+        
+        # 세 키워드 사전을 하나의 오토마톤으로 컴파일 (사전 변경 시 rebuild_keyword_index 호출)
+        # index_version은 색인을 다시 만들 때마다 증가 (분석 결과를 기억하는 외부 캐시의 키에 사용)
+        self.index_version = 0
+        self.rebuild_keyword_index()
+        
+        # 구조 힌트/제약 조건 패턴을 하나로 묶은 단일 패스 스캐너
+        self._hint_scanner = HintScanner(max_input_chars=max_input_chars, max_capture_chars=max_capture_chars)
+
+    def rebuild_keyword_index(self):
+        """작업 유형/스타일/복잡성 키워드 사전으로 단일 패스 매처를 다시 만듭니다."""
+        self._keyword_matcher = KeywordTableMatcher({
+            "task": self.task_keywords,
+            "style": self.style_keywords,
+            "complexity": self.complexity_indicators
+        })
+        # 사전이 바뀌면 캐시된 분석 결과도 무효
+        self._core_cache.clear()
+        self.index_version += 1
 
     def analyze(self, input_text: str, selected_model: str) -> Dict[str, Any]:
         """
@@ -53,24 +140,278 @@ class InputAnalyzer:
         Returns:
             분석 결과를 담은 딕셔너리
         """
-        # 기본 분석 결과 구조
-        analysis_result = {
-            "input_text": input_text,
-            "selected_model": selected_model,
-            "model_category": self._get_model_category(selected_model),
-            "keywords": self._extract_keywords(input_text),
-            "task_type": self._identify_task_type(input_text),
-            "style": self._identify_style(input_text),
-            "complexity": self._assess_complexity(input_text),
-            "entities": self._extract_entities(input_text),
-            "structure_hints": self._extract_structure_hints(input_text),
-            "constraints": self._extract_constraints(input_text)
-        }
+        return self._build_result(input_text, selected_model, self._get_core(input_text))
+    
+    def analyze_models(self, input_text: str, selected_models: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        같은 입력을 여러 모델용으로 분석합니다. 결과는 모델마다 `analyze`를 호출한 것과 같지만,
+        텍스트 기반 필드는 캐시 사용 여부와 관계없이 모델 수와 무관하게 한 번만 계산합니다.
+        
+        Args:
+            input_text: 사용자가 입력한 기본 요청 텍스트
+            selected_models: AI 모델 ID 목록
+            
+        Returns:
+            모델 ID -> 서로 독립적인 분석 결과 딕셔너리
+        """
+        core = self._get_core(input_text)
+        return {model_id: self._build_result(input_text, model_id, core) for model_id in selected_models}
+    
+    def _build_result(self, input_text: str, selected_model: str, core: AnalysisCore) -> AnalysisResult:
+        """모델별 필드를 채우고 텍스트 기반 필드는 core에서 지연 복사하는 분석 결과를 만듭니다."""
+        # 요청별 토큰화 결과가 있으면 필드 계산에 재사용 (캐시되는 core에는 보관하지 않음)
+        source = None
+        if isinstance(input_text, TokenizedInput):
+            source = self._normalize_text(input_text)
+        
+        # 모델에 따라 달라지는 필드만 채우고, 텍스트 기반 필드는 처음 읽을 때 core에서 복사
+        return AnalysisResult(
+            {
+                "input_text": input_text,
+                "selected_model": selected_model,
+                "model_category": self._get_model_category(selected_model)
+            },
+            core,
+            copy_value=self._copy_result,
+            access_stats=self.field_access_stats,
+            source=source
+        )
+    
+    def _get_core(self, input_text: str) -> AnalysisCore:
+        """
+        텍스트 기반 분석 결과 객체를 캐시에서 가져오거나 새로 만들어 캐시에 저장합니다.
+        
+        반환된 객체의 필드 값은 캐시와 공유되므로 수정하면 안 됩니다.
+        """
+        normalized = self._normalize_text(input_text)
+        key = hashlib.sha256(normalized.encode("utf-8", "surrogatepass")).hexdigest()
+        
+        core = self._core_cache.get(key)
+        if core is None:
+            core = AnalysisCore(str(normalized), self.CORE_FIELDS, self._compute_core_field)
+            self._core_cache.put(key, core)
+        return core
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """
+        캐시 키용 텍스트 정규화: 앞뒤 공백은 어떤 분석 필드에도 영향을 주지 않으므로 제거합니다.
+        
+        TokenizedInput.strip은 토큰화 결과(소문자 텍스트)를 유지한 TokenizedInput을 반환합니다.
+        """
+        return text.strip()
+    
+    def _compute_core_field(self, input_text: str, field: str, scratch: Dict[str, Any]) -> Any:
+        """
+        선택한 모델과 무관하게 텍스트만으로 결정되는 분석 필드 하나를 계산합니다.
+        
+        여러 필드가 함께 쓰는 키워드 매칭과 힌트 스캔 결과는 scratch에 보관해 재사용합니다.
+        """
+        if field == "keywords":
+            return self._extract_keywords(input_text)
+        if field == "entities":
+            return self._extract_entities(input_text)
+        
+        if field == "intent":
+            return self._detect_intent(input_text, scratch)
+        
+        if field in ("task_type", "style", "complexity"):
+            # 세 키워드 사전은 한 번의 순회로 함께 매칭
+            if "keyword_matches" not in scratch:
+                scratch["keyword_matches"] = self._match_keyword_tables(input_text)
+            keyword_matches = scratch["keyword_matches"]
+            if field == "task_type":
+                # 키워드 매칭이 없을 때만 의도 분류 결과로 작업 유형을 정함
+                task_scores = score_categories(self.task_keywords, keyword_matches["task"])
+                if task_scores:
+                    return self.intent_signal.task_type(task_scores)
+                return self.intent_signal.task_type(task_scores, self._detect_intent(input_text, scratch))
+            if field == "style":
+                return self._identify_style(input_text, keyword_matches)
+            return self._assess_complexity(input_text, keyword_matches, scratch.get("word_count"))
+        
+        if field in ("structure_hints", "constraints"):
+            # 구조 힌트와 제약 조건도 한 번의 스캔으로 함께 추출
+            if "hint_scan" not in scratch:
+                scratch["hint_scan"] = self._scan_hints(input_text)
+            if field == "structure_hints":
+                return self._extract_structure_hints(input_text, scratch["hint_scan"])
+            return self._extract_constraints(input_text, scratch["hint_scan"])
+        
+        raise KeyError(field)
+    
+    def _detect_intent(self, input_text: str, scratch: Dict[str, Any]) -> Dict[str, Any]:
+        """의도를 텍스트당 한 번만 분류합니다 (intent 필드와 task_type 필드가 공유)."""
+        if "intent" not in scratch:
+            scratch["intent"] = self.intent_signal.detect(input_text)
+        return scratch["intent"]
+    
+    def start_session(self, selected_model: str, input_text: str = "") -> IncrementalAnalysisSession:
+        """
+        입력 중인 텍스트를 편집 단위로 다시 분석하는 증분 분석 세션을 시작합니다.
         
-        return analysis_result
+        Args:
+            selected_model: 사용자가 선택한 AI 모델 ID
+            input_text: 초기 텍스트
+            
+        Returns:
+            편집(apply/append/set_text)마다 갱신된 분석 결과를 반환하는 세션
+        """
+        return IncrementalAnalysisSession(self, selected_model, input_text)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """텍스트 기반 분석 결과 캐시의 사용 통계를 반환합니다."""
+        return self._core_cache.get_stats()
+    
+    def get_field_access_stats(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 분석 결과 필드 사용 통계를 반환합니다."""
+        return self.field_access_stats.get_stats()
+    
+    def clear_cache(self):
+        """텍스트 기반 분석 결과 캐시를 비웁니다."""
+        self._core_cache.clear()
+    
+    def analyze_many(self, texts: List[str], selected_model: str) -> List[Dict[str, Any]]:
+        """
+        여러 입력을 한 번에 분석합니다. 결과는 입력마다 `analyze`를 호출한 것과 같습니다.
+        
+        배치 전체를 공백 기준으로 한 번 토큰화하여 키워드, 엔티티, 구조 힌트의 리터럴 패턴은
+        고유 토큰마다 한 번씩만 계산하고, 작업 유형/스타일/복잡성 점수는 키워드 x 카테고리
+        발생 행렬로, 의도는 분류기 한 번 호출로 계산합니다. 중복 입력은 한 번만 분석합니다.
+        numpy가 없으면 `analyze`를 반복 호출합니다.
+        
+        Args:
+            texts: 분석할 입력 텍스트 목록
+            selected_model: 사용자가 선택한 AI 모델 ID
+            
+        Returns:
+            입력 순서와 같은 순서의 분석 결과 딕셔너리 목록
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.analyze(text, selected_model) for text in texts]
+        
+        # 앞뒤 공백은 분석 결과에 영향을 주지 않으므로 `analyze`와 같이 정규화한 텍스트 단위로 한 번만 분석
+        normalized_texts = [str(self._normalize_text(text)) for text in texts]
+        unique_texts = list(dict.fromkeys(normalized_texts))
+        # 모든 단계가 공유하는 공백 기준 토큰화 (고유 토큰 단위로 한 번씩만 계산)
+        tokens = TokenBatch(unique_texts)
+        counts = self._keyword_matcher.count_matrix([text.lower() for text in unique_texts], tokens)
+        slices = self._keyword_matcher.table_slices
+        
+        task_scores = self._rank_count_matrix(counts[:, slices["task"]], self.task_keywords, [])
+        intents = self.intent_signal.detect_many(unique_texts)
+        task_types = [self.intent_signal.task_type(scores, intent) for scores, intent in zip(task_scores, intents)]
+        styles = self._rank_count_matrix(counts[:, slices["style"]], self.style_keywords, [("neutral", 1.0)])
+        complexities = self._assess_complexity_matrix(tokens.token_counts.tolist(), counts[:, slices["complexity"]])
+        keywords = self._extract_keywords_many(tokens)
+        entities = self._entity_scanner.values_many(tokens, "CAPITALIZED")
+        hint_scans = self._hint_scanner.scan_many(unique_texts, tokens)
+        model_category = self._get_model_category(selected_model)
+        
+        # 정규화한 텍스트가 같은 입력에는 첫 결과의 필드를 복사한 서로 독립적인 결과 객체를 돌려줌
+        results = []
+        first_results: Dict[str, Dict[str, Any]] = {}
+        unique_index = {text: index for index, text in enumerate(unique_texts)}
+        for text, normalized in zip(texts, normalized_texts):
+            first = first_results.get(normalized)
+            if first is not None:
+                result = {"input_text": text, "selected_model": selected_model, "model_category": model_category}
+                result.update((field, self._copy_result(first[field])) for field in self.CORE_FIELDS)
+            else:
+                index = unique_index[normalized]
+                result = first_results[normalized] = {
+                    "input_text": text,
+                    "selected_model": selected_model,
+                    "model_category": model_category,
+                    "keywords": keywords[index],
+                    "task_type": task_types[index],
+                    "intent": intents[index],
+                    "style": styles[index],
+                    "complexity": complexities[index],
+                    "entities": entities[index],
+                    "structure_hints": hint_scans[index][0],
+                    "constraints": hint_scans[index][1]
+                }
+            results.append(result)
+        return results
+    
+    @classmethod
+    def _copy_result(cls, value: Any) -> Any:
+        """분석 결과의 딕셔너리/리스트 구조만 재귀적으로 복사합니다 (deepcopy보다 가벼움)."""
+        if isinstance(value, dict):
+            return {key: cls._copy_result(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._copy_result(item) for item in value]
+        return value
+    
+    @staticmethod
+    def _rank_count_matrix(counts, categories: Dict[str, List[str]], default: List[Tuple[str, float]]) -> List[List[Tuple[str, float]]]:
+        """
+        텍스트 x 카테고리 매칭 수 행렬을 `score_categories`와 같은 정렬 목록으로 변환합니다.
+        
+        점수 내림차순 안정 정렬이므로 동점일 때는 카테고리 선언 순서를 유지합니다.
+        """
+        names = list(categories)
+        sizes = np.array([len(keywords) for keywords in categories.values()], dtype=np.int64)
+        
+        # 매칭 수 패턴이 같은 행은 한 번만 정렬 (행을 바이트열 하나로 보고 비교하는 편이 axis=0보다 빠름)
+        counts = np.ascontiguousarray(counts)
+        row_bytes = counts.view(np.dtype((np.void, counts.dtype.itemsize * counts.shape[1]))).reshape(-1)
+        _, first_rows, inverse = np.unique(row_bytes, return_index=True, return_inverse=True)
+        unique_counts = counts[first_rows]
+        scores = unique_counts / sizes
+        order = np.argsort(-scores, axis=1, kind="stable")
+        sorted_scores = np.take_along_axis(scores, order, axis=1).tolist()
+        matched_counts = (unique_counts > 0).sum(axis=1).tolist()
+        
+        unique_ranked = []
+        for row_order, row_scores, matched in zip(order.tolist(), sorted_scores, matched_counts):
+            if matched:
+                unique_ranked.append([(names[column], row_scores[rank]) for rank, column in enumerate(row_order[:matched])])
+            else:
+                unique_ranked.append(default)
+        return [list(unique_ranked[row]) for row in inverse.reshape(-1).tolist()]
+    
+    def _assess_complexity_matrix(self, word_counts: List[int], counts) -> List[str]:
+        """
+        텍스트 x 복잡성 수준 매칭 수 행렬로 `_assess_complexity`와 같은 결과를 계산합니다.
+        word_counts는 텍스트별 공백 기준 단어 수입니다.
+        """
+        levels = list(self.complexity_indicators)
+        best = counts.argmax(axis=1).tolist() if levels else [0] * len(word_counts)
+        has_match = (counts.max(axis=1) > 0).tolist() if levels else [False] * len(word_counts)
+        
+        complexities = []
+        for word_count, column, matched in zip(word_counts, best, has_match):
+            if matched:
+                complexities.append(levels[column])
+            else:
+                # 기본 복잡성 평가 로직 (텍스트 길이 기반)
+                if word_count > 50:
+                    complexities.append("high")
+                elif word_count > 20:
+                    complexities.append("medium")
+                else:
+                    complexities.append("low")
+        return complexities
+    
+    def register_model_categories(self, categories: Dict[str, str]):
+        """
+        모델 ID -> 카테고리 색인에 항목을 추가하거나 갱신합니다.
+        
+        Args:
+            categories: 모델 ID -> 카테고리(text, image, video, music)
+        """
+        self._model_categories.update(categories)
     
     def _get_model_category(self, model_id: str) -> str:
-        """모델 ID를 기반으로 모델 카테고리(텍스트, 이미지, 비디오)를 반환합니다."""
+        """모델 ID를 기반으로 모델 카테고리(텍스트, 이미지, 비디오, 음악)를 반환합니다."""
+        # 등록된 모델은 색인에서 바로 조회
+        category = self._model_categories.get(model_id)
+        if category is not None:
+            return category
+        
+        # 등록되지 않은 모델 ID는 알려진 모델 이름이 포함되어 있는지로 추정
         text_models = ["gpt-4o", "claude-sonnet-4", "gemini-ultra", "llama-3"]
         image_models = ["dall-e-3", "midjourney-v6", "stable-diffusion-xl"]
         video_models = ["runway-gen-3"]
@@ -92,42 +433,132 @@ class InputAnalyzer:
         # 기본값은 텍스트 모델로 가정
         return "text"
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """텍스트에서 중요 키워드를 추출합니다."""
-        # 간단한 키워드 추출 로직 (실제로는 더 복잡한 NLP 기법 사용 가능)
-        words = re.findall(r'\b\w+\b', text.lower())
-        # 불용어 제거 (실제 구현에서는 더 포괄적인 불용어 목록 사용)
-        stopwords = ["그", "이", "저", "것", "수", "를", "에", "의", "가", "은", "는", "이다", "있다", "하다"]
-        keywords = [word for word in words if word not in stopwords and len(word) > 1]
-        
-        # 빈도수 기반 상위 키워드 추출
-        keyword_freq = {}
-        for word in keywords:
-            if word in keyword_freq:
-                keyword_freq[word] += 1
-            else:
-                keyword_freq[word] = 1
-                
-        # 빈도수 기준 상위 10개 키워드 반환
-        sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, freq in sorted_keywords[:10]]
+    def _extract_keywords(self, text: str, top_k: Optional[int] = None) -> List[str]:
+        """
+        텍스트에서 빈도수 기준 상위 키워드를 추출합니다.
+        
+        텍스트를 단어 경계에서 나눈 구간 단위로 소문자 변환/토큰화하여 Counter에 누적하므로
+        전체 토큰 목록이나 소문자 사본을 만들지 않으며, 상위 k개는 힙으로 선택합니다.
+        한국어 단어는 조사/어미를 뗀 어간 기준으로 셉니다.
+        TokenizedInput이면 요청에서 이미 만든 토큰을 그대로 사용합니다.
+        빈도가 같으면 먼저 등장한 단어가 앞에 옵니다.
+        
+        Args:
+            text: 분석할 텍스트
+            top_k: 반환할 키워드 수 (None이면 keyword_top_k)
+        """
+        if top_k is None:
+            top_k = self.keyword_top_k
+        
+        tokenized = get_tokenized(text)
+        if tokenized is not None:
+            # 요청에서 이미 만든 토큰을 재사용 (한 글자 단어는 아래에서 제외)
+            keyword_freq = Counter(tokenized.tokens)
+            for word in [word for word in keyword_freq if len(word) < 2]:
+                del keyword_freq[word]
+            return self._top_keywords(keyword_freq, top_k)
+        
+        # 단어 빈도 (삽입 순서 = 첫 등장 순서)
+        keyword_freq = Counter()
+        start = 0
+        while start < len(text):
+            end = start + KEYWORD_CHUNK_CHARS
+            if end < len(text):
+                # 단어 중간에서 자르지 않도록 다음 공백 문자까지 구간을 늘림
+                boundary = CHUNK_BOUNDARY_PATTERN.search(text, end)
+                end = boundary.start() if boundary else len(text)
+            keyword_freq.update(KEYWORD_PATTERN.findall(text[start:end].lower()))
+            start = end
+        
+        return self._top_keywords(keyword_freq, top_k)
     
-    def _identify_task_type(self, text: str) -> List[Tuple[str, float]]:
-        """텍스트에서 작업 유형을 식별합니다."""
-        text_lower = text.lower()
-        task_scores = {}
+    def _top_keywords(self, keyword_freq: Counter, top_k: int) -> List[str]:
+        """
+        불용어를 제외한 단어 빈도에서 상위 top_k개 단어를 선택합니다.
         
-        # 각 작업 유형별 키워드 매칭 점수 계산
-        for task, keywords in self.task_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
-            if score > 0:
-                task_scores[task] = score / len(keywords)  # 정규화된 점수
+        한국어 단어는 조사/어미를 뗀 어간으로 합쳐 셉니다 (예: 사진을, 사진의 -> 사진).
+        """
+        for stopword in self.stopwords:
+            keyword_freq.pop(stopword, None)
+        
+        stem = self._korean_tokenizer.stem
+        stemmed = Counter()
+        for word, count in keyword_freq.items():
+            stemmed[stem(word)] += count
+        keyword_freq = stemmed
+        for stopword in self.stopwords:
+            keyword_freq.pop(stopword, None)
+        
+        # heapq.nlargest는 안정 정렬 후 앞부분을 자른 것과 같은 순서를 보장
+        top_keywords = heapq.nlargest(top_k, keyword_freq.items(), key=itemgetter(1))
+        # 캐시된 여러 분석 결과가 같은 키워드 문자열을 공유하도록 intern
+        return [sys.intern(word) for word, _ in top_keywords]
+    
+    def _extract_keywords_many(self, tokens: TokenBatch, top_k: Optional[int] = None) -> List[List[str]]:
+        """
+        토큰화된 여러 텍스트에 대해 `_extract_keywords`를 텍스트마다 호출한 것과 같은 결과를 반환합니다.
+        
+        단어(\\w\\w+)는 공백을 넘지 않으므로 고유 토큰마다 한 번씩만 단어를 찾아 불용어 제외와
+        어간 변환을 마친 어간 ID 목록으로 만들고, 배치 전체의 (텍스트, 어간) 쌍을 정렬로 묶어
+        빈도 내림차순, 첫 등장 순으로 텍스트별 상위 top_k개를 고릅니다.
+        """
+        if top_k is None:
+            top_k = self.keyword_top_k
+        
+        stem = self._korean_tokenizer.stem
+        stopwords = self.stopwords
+        stem_ids: Dict[str, int] = {}
+        token_stem_counts = []
+        token_stems: List[int] = []
+        for token in tokens.lowered_vocabulary:
+            before = len(token_stems)
+            for word in KEYWORD_PATTERN.findall(token):
+                if word in stopwords:
+                    continue
+                word_stem = stem(word)
+                if word_stem in stopwords:
+                    continue
+                token_stems.append(stem_ids.setdefault(word_stem, len(stem_ids)))
+            token_stem_counts.append(len(token_stems) - before)
+        
+        num_texts = len(tokens)
+        if not token_stems or top_k <= 0:
+            return [[] for _ in range(num_texts)]
+        
+        # 배치 전체 토큰 순서대로 펼친 (텍스트, 어간) 목록
+        stem_counts = np.array(token_stem_counts, dtype=np.int64)[tokens.token_ids]
+        stem_starts = (np.cumsum(token_stem_counts) - token_stem_counts)[tokens.token_ids]
+        positions = np.repeat(stem_starts - (np.cumsum(stem_counts) - stem_counts), stem_counts) + np.arange(int(stem_counts.sum()))
+        stems = np.array(token_stems, dtype=np.int64)[positions]
+        rows = np.repeat(np.repeat(np.arange(num_texts), tokens.token_counts), stem_counts)
+        
+        # (텍스트, 어간)별 빈도와 첫 등장 위치
+        pairs, first_seen, frequency = np.unique(rows * len(stem_ids) + stems, return_index=True, return_counts=True)
+        pair_rows = pairs // len(stem_ids)
+        order = np.lexsort((first_seen, -frequency, pair_rows))
+        pair_rows = pair_rows[order]
+        pair_stems = (pairs % len(stem_ids))[order]
+        
+        # 텍스트마다 앞에서 top_k개
+        row_starts = np.searchsorted(pair_rows, np.arange(num_texts))
+        keep = np.arange(len(pair_rows)) - row_starts[pair_rows] < top_k
+        bounds = np.searchsorted(pair_rows[keep], np.arange(num_texts + 1)).tolist()
+        # 캐시된 여러 분석 결과가 같은 키워드 문자열을 공유하도록 intern
+        words = np.array([sys.intern(word) for word in stem_ids], dtype=object)
+        selected = words[pair_stems[keep]].tolist()
+        return [selected[bounds[row]:bounds[row + 1]] for row in range(num_texts)]
+    
+    def _match_keyword_tables(self, text: str) -> Dict[str, Dict[str, int]]:
+        """작업 유형/스타일/복잡성 사전의 카테고리별 매칭 키워드 수를 한 번에 계산합니다."""
+        return self._keyword_matcher.count_matches(text.lower())
+    
+    def _identify_task_type(self, text: str, keyword_matches: Optional[Dict[str, Dict[str, int]]] = None) -> List[Tuple[str, float]]:
+        """텍스트에서 작업 유형을 식별합니다."""
+        if keyword_matches is None:
+            keyword_matches = self._match_keyword_tables(text)
         
-        # 점수 기준 내림차순 정렬
-        sorted_tasks = sorted(task_scores.items(), key=lambda x: x[1], reverse=True)
+        # 정규화된 점수 기준 내림차순 정렬
+        sorted_tasks = score_categories(self.task_keywords, keyword_matches["task"])
         
         # 점수가 있는 작업이 없으면 기본값 반환
         if not sorted_tasks:
@@ -135,22 +566,13 @@ class InputAnalyzer:
             
         return sorted_tasks
     
-    def _identify_style(self, text: str) -> List[Tuple[str, float]]:
+    def _identify_style(self, text: str, keyword_matches: Optional[Dict[str, Dict[str, int]]] = None) -> List[Tuple[str, float]]:
         """텍스트에서 스타일을 식별합니다."""
-        text_lower = text.lower()
-        style_scores = {}
-        
-        # 각 스타일별 키워드 매칭 점수 계산
-        for style, keywords in self.style_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_lower:
-                    score += 1
-            if score > 0:
-                style_scores[style] = score / len(keywords)  # 정규화된 점수
+        if keyword_matches is None:
+            keyword_matches = self._match_keyword_tables(text)
         
-        # 점수 기준 내림차순 정렬
-        sorted_styles = sorted(style_scores.items(), key=lambda x: x[1], reverse=True)
+        # 정규화된 점수 기준 내림차순 정렬
+        sorted_styles = score_categories(self.style_keywords, keyword_matches["style"])
         
         # 점수가 있는 스타일이 없으면 기본값 반환
         if not sorted_styles:
@@ -158,23 +580,21 @@ class InputAnalyzer:
             
         return sorted_styles
     
-    def _assess_complexity(self, text: str) -> str:
-        """텍스트의 복잡성 수준을 평가합니다."""
-        text_lower = text.lower()
-        complexity_scores = {}
-        
-        # 복잡성 지표별 키워드 매칭 점수 계산
-        for level, indicators in self.complexity_indicators.items():
-            score = 0
-            for indicator in indicators:
-                if indicator in text_lower:
-                    score += 1
-            complexity_scores[level] = score
+    def _assess_complexity(self, text: str, keyword_matches: Optional[Dict[str, Dict[str, int]]] = None,
+                           word_count: Optional[int] = None) -> str:
+        """텍스트의 복잡성 수준을 평가합니다. word_count는 미리 계산된 공백 기준 단어 수입니다."""
+        if keyword_matches is None:
+            keyword_matches = self._match_keyword_tables(text)
+        
+        # 복잡성 지표별 키워드 매칭 점수
+        matched = keyword_matches["complexity"]
+        complexity_scores = {level: matched.get(level, 0) for level in self.complexity_indicators}
         
         # 가장 높은 점수의 복잡성 수준 반환
         if not complexity_scores or max(complexity_scores.values()) == 0:
             # 기본 복잡성 평가 로직 (텍스트 길이, 문장 구조 등 기반)
-            word_count = len(text.split())
+            if word_count is None:
+                word_count = len(text.split())
             if word_count > 50:
                 return "high"
             elif word_count > 20:
@@ -187,138 +607,25 @@ class InputAnalyzer:
     def _extract_entities(self, text: str) -> List[str]:
         """텍스트에서 중요 엔티티(인물, 장소, 조직 등)를 추출합니다."""
         # 간단한 엔티티 추출 로직 (실제로는 NER 모델 사용 가능)
-        # 여기서는 대문자로 시작하는 단어를 엔티티로 간주 (영어 기준)
-        entities = re.findall(r'\b[A-Z][a-z]+\b', text)
-        
-        # 한글 고유명사 추출 (실제로는 한국어 NER 모델 사용 필요)
-        # 여기서는 간단한 예시만 구현
-        korean_entities = []
-        
-        return list(set(entities + korean_entities))
+        # 여기서는 대문자로 시작하는 영어 단어를 엔티티로 간주하며, 공유 엔티티 스캐너가
+        # 이메일/URL 등을 먼저 소비하므로 그 안의 단어는 엔티티로 잡지 않음
+        # (한글 고유명사는 한국어 NER 모델이 필요하여 추출하지 않음)
+        return self._entity_scanner.values(text, "CAPITALIZED")
     
-    def _extract_structure_hints(self, text: str) -> Dict[str, Any]:
-        """텍스트에서 출력 구조에 관한 힌트를 추출합니다."""
-        structure_hints = {
-            "format": None,
-            "sections": [],
-            "length": None
-        }
-        
-        # 형식 힌트 추출
-        format_patterns = {
-            "list": r'목록|리스트|항목|bullet|list',
-            "table": r'표|테이블|table',
-            "essay": r'에세이|논설|essay',
-            "code": r'코드|프로그램|함수|code|function',
-            "json": r'json|제이슨|JSON',
-            "markdown": r'마크다운|markdown|MD'
-        }
-        
-        for format_type, pattern in format_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                structure_hints["format"] = format_type
-                break
-        
-        # 섹션 힌트 추출
-        section_matches = re.findall(r'섹션|부분|챕터|section|part|chapter', text, re.IGNORECASE)
-        if section_matches:
-            # 섹션 수 추정 (간단한 로직)
-            numbers = re.findall(r'\d+', text)
-            if numbers:
-                structure_hints["sections"] = [f"Section {i+1}" for i in range(min(int(numbers[0]), 10))]
-        
-        # 길이 힌트 추출
-        length_patterns = {
-            "short": r'짧은|간단한|short|brief',
-            "medium": r'중간|medium',
-            "long": r'긴|상세한|포괄적인|long|detailed|comprehensive'
-        }
-        
-        for length_type, pattern in length_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                structure_hints["length"] = length_type
-                break
-                
-        # 구체적인 단어/문장 수 힌트 추출
-        word_count_match = re.search(r'(\d+)\s*(단어|words)', text, re.IGNORECASE)
-        if word_count_match:
-            structure_hints["word_count"] = int(word_count_match.group(1))
-            
-        sentence_count_match = re.search(r'(\d+)\s*(문장|sentences)', text, re.IGNORECASE)
-        if sentence_count_match:
-            structure_hints["sentence_count"] = int(sentence_count_match.group(1))
-        
-        return structure_hints
+    def _scan_hints(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """구조 힌트와 제약 조건 패턴을 한 번의 스캔으로 함께 추출합니다."""
+        return self._hint_scanner.scan(text)
     
-    def _extract_constraints(self, text: str) -> Dict[str, Any]:
-        """텍스트에서 제약 조건을 추출합니다."""
-        constraints = {
-            "include": [],
-            "exclude": [],
-            "tone": None,
-            "audience": None,
-            "time_constraint": None
-        }
-        
-        # 포함해야 할 요소 추출
-        include_matches = re.findall(r'포함해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*([^.!?]*)', text)
-        include_matches += re.findall(r'반드시\s*([^.!?]*)', text)
-        include_matches += re.findall(r'include\s*([^.!?]*)', text, re.IGNORECASE)
-        
-        for match in include_matches:
-            if match.strip():
-                constraints["include"].append(match.strip())
-        
-        # 제외해야 할 요소 추출
-        exclude_matches = re.findall(r'제외해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*([^.!?]*)', text)
-        exclude_matches += re.findall(r'포함하지?\s*(?:말아야|마세요|않음|않습니다)[\s\.:]*([^.!?]*)', text)
-        exclude_matches += re.findall(r'exclude\s*([^.!?]*)', text, re.IGNORECASE)
-        exclude_matches += re.findall(r'avoid\s*([^.!?]*)', text, re.IGNORECASE)
-        
-        for match in exclude_matches:
-            if match.strip():
-                constraints["exclude"].append(match.strip())
-        
-        # 톤/어조 추출
-        tone_patterns = {
-            "professional": r'전문적|프로페셔널|professional',
-            "friendly": r'친근한|우호적|friendly',
-            "formal": r'격식|공식적|formal',
-            "informal": r'비격식|informal|casual',
-            "enthusiastic": r'열정적|enthusiastic',
-            "serious": r'진지한|serious',
-            "humorous": r'유머러스|재미있는|humorous|funny'
-        }
-        
-        for tone, pattern in tone_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                constraints["tone"] = tone
-                break
-        
-        # 대상 독자 추출
-        audience_patterns = {
-            "general": r'일반|대중|general|public',
-            "expert": r'전문가|expert|specialist',
-            "beginner": r'초보자|입문자|beginner|novice',
-            "children": r'어린이|아동|children|kids',
-            "teenager": r'청소년|teenager|adolescent',
-            "adult": r'성인|adult'
-        }
-        
-        for audience, pattern in audience_patterns.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                constraints["audience"] = audience
-                break
+    def _extract_structure_hints(self, text: str, hint_scan: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """텍스트에서 출력 구조에 관한 힌트(형식, 섹션, 길이, 단어/문장 수)를 추출합니다."""
+        if hint_scan is None:
+            hint_scan = self._scan_hints(text)
         
-        # 시간 제약 추출
-        time_match = re.search(r'(\d+)\s*(분|시간|hours?|minutes?)', text, re.IGNORECASE)
-        if time_match:
-            value = int(time_match.group(1))
-            unit = time_match.group(2)
-            
-            if '시간' in unit or 'hour' in unit.lower():
-                constraints["time_constraint"] = f"{value} hours"
-            else:
-                constraints["time_constraint"] = f"{value} minutes"
+        return hint_scan[0]
+    
+    def _extract_constraints(self, text: str, hint_scan: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """텍스트에서 제약 조건(포함/제외 요소, 톤, 대상 독자, 시간)을 추출합니다."""
+        if hint_scan is None:
+            hint_scan = self._scan_hints(text)
         
-        return constraints
+        return hint_scan[1]
@@ -0,0 +1,67 @@
+"""
+의도/작업 유형 통합 분류 모듈: 의도 분류기와 작업 유형 키워드 점수를 요청당 한 번 계산하여
+모델 클래스가 쓰는 두 가지 보기(intent_result의 primary_intent, analysis_result의 task_type)를
+함께 제공합니다.
+"""
+
+from typing import Dict, List, Any, Tuple, Optional, Sequence
+
+from .intent_detector import IntentDetector
+
+# 키워드로 작업 유형을 정하지 못했을 때 의도로 정하는 작업 유형
+INTENT_TASK_TYPES = {
+    "translation": "translation",
+    "summarization": "summarization",
+    "explanation": "question_answering"
+}
+
+# 의도로 작업 유형을 정할 최소 신뢰도
+MIN_INTENT_TASK_CONFIDENCE = 0.5
+
+# 키워드도 의도도 없을 때의 작업 유형
+DEFAULT_TASK_TYPE = [("general", 1.0)]
+
+
+class IntentSignal:
+    """
+    의도 분류기와 작업 유형 키워드 점수를 합친 분류 서비스
+
+    - detect: IntentDetector.detect_intent와 같은 형태의 의도 딕셔너리 (primary_intent, confidence, details)
+    - task_type: 키워드 점수 목록, 매칭된 키워드가 없으면 의도에서 정한 작업 유형 (없으면 general)
+
+    InputAnalyzer가 텍스트마다 한 번 계산해 분석 결과의 intent/task_type 필드로 캐시합니다.
+    """
+
+    def __init__(self, detector: Optional[IntentDetector] = None,
+                 min_task_confidence: float = MIN_INTENT_TASK_CONFIDENCE):
+        """
+        Args:
+            detector: 의도 분류기 (None이면 번들 가중치를 불러온 IntentDetector)
+            min_task_confidence: 의도로 작업 유형을 정할 최소 신뢰도
+        """
+        self.detector = detector if detector is not None else IntentDetector()
+        self.min_task_confidence = min_task_confidence
+
+    def detect(self, text: str) -> Dict[str, Any]:
+        """텍스트의 의도를 분류합니다."""
+        return self.detector.detect_intent(text)
+
+    def detect_many(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """여러 텍스트의 의도를 한 번의 배치 분류로 처리합니다."""
+        return self.detector.detect_intents(texts)
+
+    def task_type(self, task_scores: List[Tuple[str, float]], intent: Optional[Dict[str, Any]] = None) -> List[Tuple[str, float]]:
+        """
+        작업 유형 점수 목록을 정합니다.
+
+        Args:
+            task_scores: 작업 유형 키워드 점수 (score_categories 결과, 매칭이 없으면 빈 목록)
+            intent: detect 결과 (키워드 매칭이 없을 때만 사용)
+        """
+        if task_scores:
+            return list(task_scores)
+        if intent is not None:
+            task = INTENT_TASK_TYPES.get(intent["primary_intent"])
+            if task is not None and intent["confidence"] >= self.min_task_confidence:
+                return [(task, intent["confidence"])]
+        return list(DEFAULT_TASK_TYPE)
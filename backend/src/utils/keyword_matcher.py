@@ -0,0 +1,377 @@
+"""
+키워드 매칭 모듈: 여러 키워드 사전을 하나의 Aho-Corasick 오토마톤으로 컴파일하여
+입력 텍스트를 한 번만 순회하면서 모든 사전의 매칭 결과를 계산합니다.
+"""
+
+import re
+from collections import deque, defaultdict
+from itertools import chain
+from typing import Dict, List, Tuple, Set, Any, Iterator, Iterable, Mapping, Sequence, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# 배치 매칭 시 텍스트 사이에 넣는 구분 문자 (키워드에 등장하지 않는 문자)
+BATCH_SEPARATOR = "\x00"
+
+
+class KeywordAutomaton:
+    """
+    다중 패턴 문자열 매칭을 위한 Aho-Corasick 오토마톤
+
+    각 키워드에는 (사전 이름, 카테고리) 형태의 payload가 연결되며,
+    `scan`은 텍스트 길이에 선형인 시간으로 등장한 키워드 집합을 반환합니다.
+    """
+
+    def __init__(self):
+        """빈 오토마톤을 초기화합니다."""
+        # 상태별 전이 테이블, 실패 링크, 출력(패턴 ID) 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        # 패턴 ID -> 키워드 문자열 / payload 목록
+        self.patterns: List[str] = []
+        self.payloads: List[List[Tuple[str, str]]] = []
+        self._pattern_ids: Dict[str, int] = {}
+
+        # 키워드에 등장하는 문자 집합 (그 외 문자는 루트 상태로 바로 복귀)
+        self._alphabet: Set[str] = set()
+        self.max_pattern_length = 0
+        self._built = False
+
+    def add(self, keyword: str, payload: Tuple[str, str]) -> None:
+        """
+        키워드와 payload를 등록합니다.
+
+        같은 키워드가 여러 번 등록되면 하나의 패턴에 payload만 누적됩니다.
+        """
+        if not keyword:
+            return
+
+        pattern_id = self._pattern_ids.get(keyword)
+        if pattern_id is None:
+            pattern_id = len(self.patterns)
+            self._pattern_ids[keyword] = pattern_id
+            self.patterns.append(keyword)
+            self.payloads.append([])
+            self._insert(keyword, pattern_id)
+
+        self.payloads[pattern_id].append(payload)
+        self._built = False
+
+    def _insert(self, keyword: str, pattern_id: int) -> None:
+        """트라이에 키워드를 삽입합니다."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(pattern_id)
+        self._alphabet.update(keyword)
+        self.max_pattern_length = max(self.max_pattern_length, len(keyword))
+
+    def build(self) -> None:
+        """BFS로 실패 링크를 계산하고 출력 목록을 병합합니다."""
+        queue = deque()
+        for next_state in self._goto[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                # 접미사로 끝나는 패턴도 현재 상태의 출력에 포함
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self._built = True
+
+    def iter_matches(self, text: str, start: int = 0, end: int = None) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트의 [start, end) 구간에서 모든 (시작 위치, 패턴 ID) 매칭을 순서대로 반환합니다.
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+        patterns = self.patterns
+
+        if end is None:
+            end = len(text)
+
+        state = 0
+        for index in range(start, end):
+            char = text[index]
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                yield index - len(patterns[pattern_id]) + 1, pattern_id
+
+    def scan(self, text: str) -> Set[int]:
+        """
+        텍스트를 한 번 순회하여 등장한 패턴 ID 집합을 반환합니다.
+
+        등장 횟수가 아닌 등장 여부만 필요하므로 도달한 상태만 모아 두었다가
+        마지막에 출력 목록을 펼칩니다.
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        alphabet = self._alphabet
+
+        visited = set()
+        state = 0
+        for char in text:
+            if char not in alphabet:
+                state = 0
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if state:
+                visited.add(state)
+
+        matched = set()
+        for state in visited:
+            matched.update(output[state])
+        return matched
+
+
+class TokenBatch:
+    """
+    여러 텍스트를 공백 기준으로 한 번 토큰화한 결과 (배치 분석 단계들이 공유, numpy 필요)
+
+    배치 전체의 고유 토큰 사전(`vocabulary`)과 텍스트 순서대로 이어 붙인 토큰 ID 배열로
+    나타내므로, 공백을 넘지 않는 매칭은 고유 토큰마다 한 번만 계산한 뒤 텍스트별로 합칠 수
+    있습니다. 공백 문자는 소문자 변환의 영향을 받지 않으므로 토큰을 각각 소문자로 바꾼 결과는
+    텍스트 전체를 소문자로 바꿔 나눈 결과와 같습니다.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        """
+        Args:
+            texts: 토큰화할 텍스트 목록
+        """
+        self.texts = texts
+        tokenized = [text.split() for text in texts]
+        # 처음 보는 토큰에는 다음 ID를 배정 (토큰마다 파이썬 코드를 거치지 않도록 defaultdict 사용)
+        vocabulary: Dict[str, int] = defaultdict()
+        vocabulary.default_factory = vocabulary.__len__
+        # 텍스트별 공백 기준 단어 수 (len(text.split())와 같음)
+        self.token_counts = np.fromiter(map(len, tokenized), dtype=np.int64, count=len(tokenized))
+        self.token_ids = np.fromiter(
+            map(vocabulary.__getitem__, chain.from_iterable(tokenized)),
+            dtype=np.int64, count=int(self.token_counts.sum())
+        )
+        self.vocabulary: List[str] = list(vocabulary)
+        # 텍스트별 첫 토큰의 token_ids 내 위치
+        self.offsets = np.cumsum(self.token_counts) - self.token_counts
+        self._lowered_vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def lowered_vocabulary(self) -> List[str]:
+        """vocabulary를 각각 소문자로 변환한 목록 (처음 사용할 때 한 번 계산)"""
+        if self._lowered_vocabulary is None:
+            self._lowered_vocabulary = [token.lower() for token in self.vocabulary]
+        return self._lowered_vocabulary
+
+    def any_rows(self, vocabulary_flags):
+        """
+        고유 토큰 x 열 불리언 행렬을 텍스트 x 열 행렬로 합칩니다 (토큰 중 하나라도 참이면 참).
+
+        열 8개를 1바이트로 묶어 텍스트 구간별로 비트 OR 축약합니다.
+        """
+        num_columns = vocabulary_flags.shape[1]
+        text_bits = np.zeros((len(self.texts), (num_columns + 7) // 8), dtype=np.uint8)
+        non_empty = self.token_counts > 0
+        if len(self.token_ids):
+            packed = np.packbits(vocabulary_flags, axis=1, bitorder="little")
+            text_bits[non_empty] = np.bitwise_or.reduceat(packed[self.token_ids], self.offsets[non_empty], axis=0)
+        return np.unpackbits(text_bits, axis=1, count=num_columns, bitorder="little").astype(bool)
+
+    def select(self, vocabulary_ids: Iterable[int]) -> List[List[int]]:
+        """텍스트별로 vocabulary_ids에 속한 토큰의 ID를 등장 순서대로 반환합니다."""
+        mask = np.zeros(len(self.vocabulary), dtype=bool)
+        mask[np.fromiter(vocabulary_ids, dtype=np.int64)] = True
+        selected = mask[self.token_ids]
+        ids = self.token_ids[selected].tolist()
+        rows = np.repeat(np.arange(len(self.texts)), self.token_counts)[selected]
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(self.texts))))).tolist()
+        return [ids[bounds[row]:bounds[row + 1]] for row in range(len(self.texts))]
+
+
+class KeywordTableMatcher:
+    """
+    여러 키워드 사전({카테고리: [키워드, ...]})을 하나의 오토마톤으로 묶어
+    사전별, 카테고리별 매칭 키워드 수를 한 번의 순회로 계산하는 클래스
+    """
+
+    def __init__(self, tables: Mapping[str, Mapping[str, Sequence[str]]]):
+        """
+        Args:
+            tables: 사전 이름 -> {카테고리: 키워드 목록} 매핑
+        """
+        self.tables = tables
+        self.automaton = KeywordAutomaton()
+
+        for table_name, categories in tables.items():
+            for category, keywords in categories.items():
+                for keyword in keywords:
+                    self.automaton.add(keyword, (table_name, category))
+
+        self.automaton.build()
+
+        # 행렬 연산용 열 순서: 사전 선언 순서 -> 카테고리 선언 순서
+        self.columns: List[Tuple[str, str]] = [
+            (table_name, category)
+            for table_name, categories in tables.items()
+            for category in categories
+        ]
+        self.table_slices: Dict[str, slice] = {}
+        offset = 0
+        for table_name, categories in tables.items():
+            self.table_slices[table_name] = slice(offset, offset + len(categories))
+            offset += len(categories)
+        self._incidence = None
+
+    def incidence_matrix(self):
+        """
+        패턴 x (사전, 카테고리) 발생 행렬을 반환합니다 (numpy 필요).
+
+        한 카테고리에 같은 키워드가 중복 등록된 경우 해당 칸의 값은 중복 횟수입니다.
+        """
+        if self._incidence is None:
+            column_index = {column: index for index, column in enumerate(self.columns)}
+            incidence = np.zeros((len(self.automaton.patterns), len(self.columns)), dtype=np.int64)
+            for pattern_id, payloads in enumerate(self.automaton.payloads):
+                for payload in payloads:
+                    incidence[pattern_id, column_index[payload]] += 1
+            self._incidence = incidence
+        return self._incidence
+
+    def presence_matrix(self, texts_lower: Sequence[str], tokens: Optional[TokenBatch] = None):
+        """
+        텍스트 x 패턴 등장 여부(0/1) 행렬을 계산합니다 (numpy 필요).
+
+        공백이 없는 키워드는 공백으로 나뉜 한 토큰 안에서만 등장할 수 있으므로 배치 전체의
+        고유 토큰마다 한 번씩만 오토마톤을 돌려 토큰 x 패턴 비트 행렬을 만들고, 텍스트별로
+        토큰 행을 비트 OR로 합칩니다. 공백이 포함된 키워드만 모든 텍스트를 구분 문자로
+        이어 붙인 문자열에서 따로 검색합니다.
+
+        Args:
+            texts_lower: 소문자로 변환된 텍스트 목록
+            tokens: 같은 텍스트(원문 또는 소문자)를 이미 토큰화한 TokenBatch (None이면 새로 토큰화)
+        """
+        automaton = self.automaton
+        num_patterns = len(automaton.patterns)
+        presence = np.zeros((len(texts_lower), num_patterns), dtype=np.uint8)
+        if not texts_lower or not num_patterns:
+            return presence
+
+        if tokens is None:
+            tokens = TokenBatch(texts_lower)
+        if len(tokens.token_ids):
+            # 대소문자만 다른 토큰은 오토마톤을 한 번만 돌림
+            vocabulary_presence = np.zeros((len(tokens.vocabulary), num_patterns), dtype=bool)
+            scanned: Dict[str, List[int]] = {}
+            for token_id, token in enumerate(tokens.lowered_vocabulary):
+                matched = scanned.get(token)
+                if matched is None:
+                    matched = scanned[token] = list(automaton.scan(token))
+                if matched:
+                    vocabulary_presence[token_id, matched] = True
+            presence = tokens.any_rows(vocabulary_presence).astype(np.uint8)
+
+        spaced = [
+            (pattern_id, keyword) for pattern_id, keyword in enumerate(automaton.patterns)
+            if any(char.isspace() for char in keyword)
+        ]
+        if spaced:
+            joined = BATCH_SEPARATOR.join(texts_lower)
+            lengths = np.fromiter((len(text) + len(BATCH_SEPARATOR) for text in texts_lower), dtype=np.int64, count=len(texts_lower))
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            for pattern_id, keyword in spaced:
+                positions = [match.start() for match in re.finditer(re.escape(keyword), joined)]
+                if positions:
+                    presence[np.searchsorted(starts, positions, side="right") - 1, pattern_id] = 1
+
+        return presence
+
+    def count_matrix(self, texts_lower: Sequence[str], tokens: Optional[TokenBatch] = None):
+        """
+        소문자로 변환된 여러 텍스트의 (사전, 카테고리)별 매칭 키워드 수를 한 번에 계산합니다.
+
+        `count_matches`를 텍스트마다 호출한 결과와 같은 값을 텍스트 x `columns` 정수 행렬로
+        반환합니다 (numpy 필요). 행렬 곱은 BLAS를 쓰도록 실수형으로 계산합니다.
+        tokens는 `presence_matrix`와 같이 이미 만든 토큰화 결과입니다.
+        """
+        counts = self.presence_matrix(texts_lower, tokens).astype(np.float64) @ self.incidence_matrix().astype(np.float64)
+        return np.rint(counts).astype(np.int64)
+
+    def count_matches(self, text_lower: str) -> Dict[str, Dict[str, int]]:
+        """
+        소문자로 변환된 텍스트에서 사전별, 카테고리별 매칭 키워드 수를 계산합니다.
+
+        기존 `keyword in text_lower` 방식과 동일하게 키워드 등장 여부만 세며,
+        한 카테고리에 같은 키워드가 중복 등록된 경우 중복 횟수만큼 셉니다.
+
+        Returns:
+            사전 이름 -> {카테고리: 매칭 수} (매칭이 없는 카테고리는 생략)
+        """
+        return self.count_pattern_ids(self.automaton.scan(text_lower))
+
+    def count_pattern_ids(self, pattern_ids) -> Dict[str, Dict[str, int]]:
+        """등장한 패턴 ID 목록을 사전별, 카테고리별 매칭 수로 집계합니다."""
+        counts: Dict[str, Dict[str, int]] = {table_name: {} for table_name in self.tables}
+        payloads = self.automaton.payloads
+
+        for pattern_id in pattern_ids:
+            for table_name, category in payloads[pattern_id]:
+                table_counts = counts[table_name]
+                table_counts[category] = table_counts.get(category, 0) + 1
+
+        return counts
+
+
+def score_categories(categories: Mapping[str, Sequence[str]], matched: Dict[str, int]) -> List[Tuple[str, float]]:
+    """
+    카테고리별 매칭 수를 키워드 수로 정규화하고 점수 내림차순으로 정렬합니다.
+
+    카테고리 선언 순서를 유지한 뒤 안정 정렬하므로 동점일 때의 순서는
+    기존 구현과 같습니다.
+    """
+    scores: Dict[str, Any] = {}
+    for category, keywords in categories.items():
+        score = matched.get(category, 0)
+        if score > 0:
+            scores[category] = score / len(keywords)
+
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
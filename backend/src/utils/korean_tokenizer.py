@@ -0,0 +1,251 @@
+"""
+한국어 형태소 토크나이저 모듈: 트라이 사전과 조사/어미 규칙으로 어절을 명사/용언 어간과
+조사/어미로 나누는 가벼운 토크나이저를 제공합니다.
+"""
+
+import os
+import re
+import threading
+from typing import List, Dict, Tuple, Optional, Iterator
+
+# 기본 사전 파일
+DEFAULT_DICTIONARY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'korean_dictionary.tsv')
+
+# 텍스트를 한글 어절/라틴 문자/숫자/기타 문자/기호 단위로 나눔
+SEGMENT_PATTERN = re.compile(r'([가-힣]+)|([A-Za-z]+)|([0-9]+(?:\.[0-9]+)?)|([^\W\d_]+)|(\S)')
+
+# 한글 음절 범위와 종성(받침) 수
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JONGSEONG_COUNT = 28
+RIEUL_JONGSEONG = 8
+
+# 어절 분석 결과를 기억할 최대 어절 수
+WORD_CACHE_SIZE = 65536
+
+# 문장 부호 품사
+PUNCTUATION_TAGS = {'.': 'SF', '?': 'SF', '!': 'SF', ',': 'SP', ';': 'SP', ':': 'SP'}
+
+
+def final_consonant(char: str) -> Optional[int]:
+    """한글 음절의 종성 번호를 반환합니다 (0이면 받침 없음, 한글이 아니면 None)."""
+    code = ord(char)
+    if HANGUL_BASE <= code <= HANGUL_LAST:
+        return (code - HANGUL_BASE) % JONGSEONG_COUNT
+    return None
+
+
+def satisfies_condition(stem: str, condition: str) -> bool:
+    """앞말의 마지막 글자가 조사/어미의 결합 조건(받침 유무)을 만족하는지 확인합니다."""
+    if condition == '-' or not stem:
+        return True
+    jong = final_consonant(stem[-1])
+    if jong is None:
+        # 한글이 아닌 앞말(영문, 숫자 등)은 발음을 알 수 없으므로 허용
+        return True
+    if condition == 'final':
+        return jong != 0
+    if condition == 'open':
+        return jong == 0
+    if condition == 'open_rieul':
+        return jong == 0 or jong == RIEUL_JONGSEONG
+    return True
+
+
+class Trie:
+    """
+    문자 단위 트라이 (노드는 딕셔너리, 단어 끝 노드는 빈 문자열 키에 값을 저장)
+    """
+
+    def __init__(self):
+        self.root: Dict[str, dict] = {}
+
+    def add(self, word: str, value) -> None:
+        """단어와 값을 추가합니다. 같은 단어에 값이 여러 개면 목록으로 저장합니다."""
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        node.setdefault('', []).append(value)
+
+    def get(self, word: str) -> list:
+        """단어에 저장된 값 목록을 반환합니다 (없으면 빈 목록)."""
+        node = self.root
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get('', [])
+
+    def prefixes(self, text: str) -> List[Tuple[int, list]]:
+        """text의 앞부분 중 트라이에 있는 단어의 (길이, 값 목록)을 긴 순서로 반환합니다."""
+        found = []
+        node = self.root
+        for index, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            values = node.get('')
+            if values:
+                found.append((index + 1, values))
+        found.reverse()
+        return found
+
+
+class KoreanTokenizer:
+    """
+    트라이 사전 기반 한국어 형태소 토크나이저
+
+    어절마다
+    1. 사전에 있는 가장 긴 명사/용언 어간 뒤에 남는 부분이 조사/어미이면 그대로 나누고,
+    2. 아니면 어절 끝에서 가장 긴 조사/어미를 받침 조건과 최소 어간 길이를 지켜 떼어 내며,
+    3. 둘 다 아니면 어절 전체를 명사로 봅니다.
+    품사 표기는 세종 품사 태그(NNG, VV, JKO, EF 등)를 따르며, 어절 분석 결과는 기억해 둡니다.
+    """
+
+    def __init__(self, entries: Optional[List[Tuple[str, str, str, int]]] = None, cache_size: int = WORD_CACHE_SIZE):
+        """
+        Args:
+            entries: (표층형, 품사, 결합 조건, 최소 어간 길이) 목록 (None이면 기본 사전 파일)
+            cache_size: 어절 분석 결과를 기억할 최대 어절 수
+        """
+        if entries is None:
+            entries = self.load_entries(DEFAULT_DICTIONARY_PATH)
+        # 명사/용언 어간 (앞에서부터 찾음)
+        self._stems = Trie()
+        # 명사 뒤에 붙는 조사/서술격 조사/하다 결합형, 용언 어간 뒤에 붙는 어미 (뒤에서부터 찾도록 뒤집어 저장)
+        self._noun_suffixes = Trie()
+        self._verb_suffixes = Trie()
+        self._suffixes = Trie()
+        self.stem_tags: Dict[str, str] = {}
+
+        for surface, tag, condition, min_stem in entries:
+            if tag.startswith('E'):
+                entry = (surface, tag, condition, min_stem, 'VV')
+                self._verb_suffixes.add(surface, entry)
+                self._suffixes.add(surface[::-1], entry)
+            elif tag.startswith('J') or tag in ('VCP', 'XSV'):
+                entry = (surface, tag, condition, min_stem, 'NNG')
+                self._noun_suffixes.add(surface, entry)
+                self._suffixes.add(surface[::-1], entry)
+            else:
+                self._stems.add(surface, tag)
+                self.stem_tags.setdefault(surface, tag)
+
+        self.cache_size = cache_size
+        self._cache: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+
+    @staticmethod
+    def load_entries(path: str) -> List[Tuple[str, str, str, int]]:
+        """사전 파일(TSV)을 읽어 (표층형, 품사, 결합 조건, 최소 어간 길이) 목록을 반환합니다."""
+        entries = []
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line or line.startswith('#'):
+                    continue
+                surface, tag, condition, min_stem = line.split('\t')
+                entries.append((surface, tag, condition, 1 if min_stem == '-' else int(min_stem)))
+        return entries
+
+    def analyze_word(self, word: str) -> Tuple[Tuple[str, str], ...]:
+        """한글 어절 하나를 (형태소, 품사) 튜플로 나눕니다."""
+        result = self._cache.get(word)
+        if result is None:
+            result = self._analyze_word(word)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[word] = result
+        return result
+
+    def _analyze_word(self, word: str) -> Tuple[Tuple[str, str], ...]:
+        # 1. 사전 어간 + 조사/어미
+        for length, tags in self._stems.prefixes(word):
+            stem = word[:length]
+            if length == len(word):
+                return ((word, tags[0]),)
+            rest = word[length:]
+            for tag in tags:
+                suffixes = self._noun_suffixes if tag.startswith('N') else self._verb_suffixes
+                for surface, suffix_tag, condition, _, _ in suffixes.get(rest):
+                    if satisfies_condition(stem, condition):
+                        return ((stem, tag), (rest, suffix_tag))
+
+        # 2. 어절 끝의 가장 긴 조사/어미
+        for length, entries in self._suffixes.prefixes(word[::-1]):
+            stem = word[:-length]
+            for surface, suffix_tag, condition, min_stem, stem_tag in entries:
+                if len(stem) >= min_stem and satisfies_condition(stem, condition):
+                    return ((stem, stem_tag), (surface, suffix_tag))
+
+        # 3. 어절 전체를 명사로
+        return ((word, 'NNG'),)
+
+    def iter_pos(self, text: str) -> Iterator[Tuple[str, str]]:
+        """텍스트의 (형태소, 품사)를 차례로 생성합니다."""
+        previous_end = -1
+        analyze_word = self.analyze_word
+        for match in SEGMENT_PATTERN.finditer(text):
+            hangul, latin, number, letters, symbol = match.groups()
+            if hangul:
+                if match.start() == previous_end:
+                    # 영문/숫자 바로 뒤에 붙은 조사 (예: GPT를)
+                    suffixes = self._noun_suffixes.get(hangul)
+                    if suffixes:
+                        yield (hangul, suffixes[0][1])
+                        previous_end = match.end()
+                        continue
+                yield from analyze_word(hangul)
+            elif latin:
+                yield (latin, 'SL')
+            elif number:
+                yield (number, 'SN')
+            elif letters:
+                yield (letters, 'SH')
+            else:
+                yield (symbol, PUNCTUATION_TAGS.get(symbol, 'SW'))
+            previous_end = match.end()
+
+    def pos(self, text: str) -> List[Tuple[str, str]]:
+        """텍스트를 (형태소, 품사) 목록으로 분석합니다."""
+        return list(self.iter_pos(text))
+
+    def morphs(self, text: str) -> List[str]:
+        """텍스트를 형태소 목록으로 나눕니다."""
+        return [morpheme for morpheme, _ in self.iter_pos(text)]
+
+    def nouns(self, text: str) -> List[str]:
+        """텍스트의 명사 목록을 반환합니다."""
+        return [morpheme for morpheme, tag in self.iter_pos(text) if tag.startswith('N')]
+
+    def stem(self, word: str) -> str:
+        """
+        단어에서 끝에 붙은 조사/어미를 뗀 앞부분을 반환합니다 (키워드 정규화용).
+
+        한글이 아닌 부분 뒤에 조사가 붙은 단어(예: python의)는 조사만 뗍니다.
+        """
+        index = len(word)
+        while index > 0 and final_consonant(word[index - 1]) is not None:
+            index -= 1
+        if index == len(word):
+            return word
+        if index > 0:
+            return word[:index] if self._noun_suffixes.get(word[index:]) else word
+        return self.analyze_word(word)[0][0]
+
+
+_shared_tokenizer: Optional[KoreanTokenizer] = None
+_shared_lock = threading.Lock()
+
+
+def get_korean_tokenizer() -> KoreanTokenizer:
+    """
+    프로세스에서 공유하는 KoreanTokenizer를 반환합니다 (처음 호출 시 사전을 한 번 불러옴).
+
+    fork 방식 워커는 부모 프로세스에서 미리 호출해 두면 사전을 복사 없이 공유합니다.
+    """
+    global _shared_tokenizer
+    if _shared_tokenizer is None:
+        with _shared_lock:
+            if _shared_tokenizer is None:
+                _shared_tokenizer = KoreanTokenizer()
+    return _shared_tokenizer
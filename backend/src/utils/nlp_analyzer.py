@@ -3,29 +3,183 @@ NLP 기반 텍스트 분석 모듈
 한국어와 영어를 위한 고급 텍스트 분석 기능을 제공합니다.
 """
 
+import os
 import re
-from typing import List, Dict, Any, Tuple, Optional
+import hashlib
+import importlib.util
+import threading
+from typing import List, Dict, Tuple, Optional
 import logging
 from dataclasses import dataclass
-from langdetect import detect, LangDetectException
-
-# 언어별 NLP 라이브러리 임포트
-try:
-    import nltk
-    NLP_AVAILABLE = True
-except ImportError:
-    NLP_AVAILABLE = False
+from langdetect import detect, DetectorFactory, LangDetectException
+
+from .cache import LRUCache
+from .korean_tokenizer import get_korean_tokenizer
+from .entity_scanner import get_entity_scanner
+from .sentiment_lexicon import get_sentiment_engine
+
+# langdetect의 확률적 샘플링 결과를 실행마다 같게 고정
+DetectorFactory.seed = 0
+
+# 언어별 NLP 라이브러리 확인 (임포트는 워밍업 스레드에서 수행)
+NLP_AVAILABLE = importlib.util.find_spec("nltk") is not None
+if not NLP_AVAILABLE:
     logging.warning("NLTK 라이브러리가 설치되지 않았습니다. 기본 분석 기능만 사용됩니다.")
 
-# NLTK 데이터 다운로드 (필요시)
-if NLP_AVAILABLE:
-    try:
-        nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
-        nltk.download('wordnet', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-    except:
-        pass
+# 워밍업이 끝나면 nltk 모듈이 설정됨
+nltk = None
+
+# NLTK 데이터를 찾을 로컬 경로 (NLTK_DATA 환경 변수와 기본 경로보다 먼저 탐색)
+NLTK_DATA_DIR = os.environ.get(
+    'NLTK_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'nltk_data')
+)
+
+# 리소스 이름 -> nltk.data 경로
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger'
+}
+
+# 토큰화/품사 태깅에 꼭 필요한 리소스
+REQUIRED_NLTK_RESOURCES = ('punkt', 'averaged_perceptron_tagger')
+
+
+class NLTKWarmup:
+    """
+    NLTK 임포트와 리소스 로딩을 백그라운드 스레드에서 한 번만 수행하고 준비 상태를 알려주는 객체
+
+    리소스는 로컬 데이터 경로에서만 찾으며 네트워크로 다운로드하지 않습니다.
+    (배포 시 `download_nltk_resources`로 미리 받아 둡니다.)
+    """
+
+    def __init__(self, data_dir: str = NLTK_DATA_DIR, resources: Optional[Dict[str, str]] = None,
+                 required: Tuple[str, ...] = REQUIRED_NLTK_RESOURCES):
+        """
+        Args:
+            data_dir: NLTK 데이터를 찾을 로컬 경로
+            resources: 확인할 리소스 (이름 -> nltk.data 경로)
+            required: 없으면 NLTK 분석을 사용하지 않는 리소스 이름
+        """
+        self.data_dir = data_dir
+        self.resources = dict(NLTK_RESOURCES if resources is None else resources)
+        self.required = required
+        self.logger = logging.getLogger(__name__)
+        # 워밍업 결과: NLTK 분석 사용 가능 여부와 찾지 못한 리소스
+        self.available = False
+        self.missing: List[str] = []
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """워밍업이 끝났는지 여부 (성공/실패 무관)"""
+        return self._ready.is_set()
+
+    def start(self) -> threading.Thread:
+        """백그라운드 워밍업을 시작합니다. 이미 시작되었으면 기존 스레드를 반환합니다."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.run, name="nltk-warmup", daemon=True)
+                self._thread.start()
+            return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """워밍업이 끝날 때까지 기다리고 준비 여부를 반환합니다."""
+        return self._ready.wait(timeout)
+
+    def run(self) -> bool:
+        """워밍업을 현재 스레드에서 수행하고 NLTK 분석 사용 가능 여부를 반환합니다."""
+        global nltk
+        try:
+            if not NLP_AVAILABLE:
+                return False
+
+            import nltk as nltk_module
+            if self.data_dir not in nltk_module.data.path:
+                nltk_module.data.path.insert(0, self.data_dir)
+
+            missing = []
+            for name, path in self.resources.items():
+                try:
+                    nltk_module.data.find(path)
+                except LookupError:
+                    missing.append(name)
+            self.missing = missing
+
+            if any(name in missing for name in self.required):
+                self.logger.info(f"NLTK 데이터가 로컬 경로에 없습니다 ({', '.join(missing)}). 기본 분석 기능만 사용됩니다.")
+                return False
+
+            # 토크나이저와 태거를 미리 메모리에 올려 첫 요청의 지연을 없앰
+            nltk_module.pos_tag(nltk_module.word_tokenize("test"))
+            nltk = nltk_module
+            self.available = True
+            self.logger.info("NLTK 기본 분석기가 초기화되었습니다.")
+            return True
+        except Exception as e:
+            self.logger.warning(f"NLTK 초기화 실패: {e}")
+            return False
+        finally:
+            self._ready.set()
+
+
+# 문자 체계 판별용 패턴 (한글 음절/자모, ASCII 라틴 문자, 확장 라틴 문자, 전체 문자)
+HANGUL_PATTERN = re.compile(r'[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]')
+ASCII_LATIN_PATTERN = re.compile(r'[A-Za-z]')
+EXTENDED_LATIN_PATTERN = re.compile(r'[\u00c0-\u024f]')
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+# 문자 비율을 셀 때 보는 최대 길이 (앞부분만으로 충분히 판별 가능)
+SCRIPT_SAMPLE_CHARS = 2000
+
+# 이 비율 이상이 한글이면 한국어
+HANGUL_RATIO_THRESHOLD = 0.5
+
+# 이 비율 이상이 ASCII 라틴 문자이고 확장 라틴 문자가 없으면 영어
+LATIN_RATIO_THRESHOLD = 0.9
+
+
+def detect_script_language(text: str) -> Optional[str]:
+    """
+    한글/라틴 문자 비율로 한국어('ko')나 영어('en')를 판별합니다.
+
+    어느 쪽도 우세하지 않거나 다른 문자 체계가 섞여 판별할 수 없으면 None을 반환합니다.
+    """
+    sample = text[:SCRIPT_SAMPLE_CHARS]
+    letters = len(LETTER_PATTERN.findall(sample))
+    if not letters:
+        return None
+
+    if len(HANGUL_PATTERN.findall(sample)) / letters >= HANGUL_RATIO_THRESHOLD:
+        return 'ko'
+    if (len(ASCII_LATIN_PATTERN.findall(sample)) / letters >= LATIN_RATIO_THRESHOLD
+            and not EXTENDED_LATIN_PATTERN.search(sample)):
+        return 'en'
+    return None
+
+
+# 프로세스 전체가 공유하는 워밍업 상태
+nltk_warmup = NLTKWarmup()
+
+
+def start_nltk_warmup() -> threading.Thread:
+    """서버 시작 후 호출하여 공유 NLTK 워밍업을 백그라운드에서 시작합니다."""
+    return nltk_warmup.start()
+
+
+def download_nltk_resources(data_dir: str = NLTK_DATA_DIR) -> Dict[str, bool]:
+    """
+    배포/빌드 단계에서 NLTK 리소스를 로컬 데이터 경로에 내려받습니다 (네트워크 필요).
+
+    Returns:
+        리소스 이름 -> 다운로드 성공 여부
+    """
+    import nltk as nltk_module
+    return {name: bool(nltk_module.download(name, download_dir=data_dir, quiet=True)) for name in NLTK_RESOURCES}
 
 
 @dataclass
@@ -37,94 +191,173 @@ class NLPAnalysisResult:
     entities: List[Dict[str, str]]
     key_phrases: List[str]
     sentiment: str
-    intent: str
+    intent: Optional[str]
     complexity_score: float
 
 
 class NLPAnalyzer:
     """고급 NLP 기반 텍스트 분석기"""
     
-    def __init__(self):
+    def __init__(self, warmup: Optional[NLTKWarmup] = None, start_warmup: bool = True,
+                 language_cache_size: int = 4096, classify_intent: bool = True):
+        """
+        Args:
+            warmup: NLTK 워밍업 상태 (None이면 프로세스 공유 상태)
+            start_warmup: 생성 시 백그라운드 워밍업을 시작할지 여부
+            language_cache_size: 언어 감지 결과를 기억할 최대 텍스트 수 (0이면 사용 안 함)
+            classify_intent: 규칙 기반 의도 분류 여부 (False면 intent는 None,
+                             요청 처리에서는 InputAnalyzer의 intent 필드를 사용)
+        """
         self.logger = logging.getLogger(__name__)
-        self._initialize_nlp_models()
-        
-    def _initialize_nlp_models(self):
-        """NLP 모델 초기화 (기본 NLTK만 사용)"""
-        self.nltk_available = NLP_AVAILABLE
-        
-        if NLP_AVAILABLE:
-            try:
-                # NLTK 토크나이저 테스트
-                nltk.word_tokenize("test")
-                self.logger.info("NLTK 기본 분석기가 초기화되었습니다.")
-            except:
-                self.logger.info("NLTK 데이터가 완전히 다운로드되지 않았습니다.")
-                self.nltk_available = False
+        self.classify_intent = classify_intent
+        # 텍스트 해시 -> 감지된 언어
+        self._language_cache = LRUCache(max_size=language_cache_size, ttl_seconds=None)
+        self.warmup = warmup if warmup is not None else nltk_warmup
+        # 모든 분석기가 공유하는 엔티티 스캐너
+        self._entity_scanner = get_entity_scanner()
+        # 모든 분석기가 공유하는 감성 사전 매처
+        self._sentiment_engine = get_sentiment_engine()
+        if start_warmup and NLP_AVAILABLE:
+            self.warmup.start()
+
+    @property
+    def ready(self) -> bool:
+        """NLTK 워밍업이 끝났는지 여부"""
+        return self.warmup.ready
+
+    @property
+    def nltk_available(self) -> bool:
+        """워밍업이 끝났고 NLTK 리소스를 사용할 수 있는지 여부"""
+        return self.warmup.ready and self.warmup.available
     
     def analyze(self, text: str) -> NLPAnalysisResult:
         """텍스트를 종합적으로 분석"""
         # 언어 감지
         language = self._detect_language(text)
-        
-        # 언어별 분석 수행
+
+        # 한국어는 NLTK 없이 자체 토크나이저로 분석
         if language == 'ko':
             return self._analyze_korean(text)
-        elif language == 'en':
+
+        # 워밍업 중에는 요청을 막지 않고 기본 분석 사용
+        if not self.ready:
+            return self._analyze_basic(text, language)
+        
+        # 언어별 분석 수행
+        if language == 'en':
             return self._analyze_english(text)
         else:
             # 기타 언어는 기본 분석
             return self._analyze_basic(text, language)
     
     def _detect_language(self, text: str) -> str:
-        """텍스트의 언어를 감지"""
-        try:
-            lang = detect(text)
-            return lang
-        except LangDetectException:
-            # 언어 감지 실패시 기본값으로 영어 반환
-            return 'en'
+        """
+        텍스트의 언어를 감지
+
+        한글/라틴 문자 비율로 판별되면 그 결과를 쓰고, 애매한 텍스트만 langdetect로 감지합니다.
+        결과는 텍스트별로 기억합니다.
+        """
+        key = hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+        lang = self._language_cache.get(key)
+        if lang is None:
+            lang = detect_script_language(text)
+            if lang is None:
+                try:
+                    lang = detect(text)
+                except LangDetectException:
+                    # 언어 감지 실패시 기본값으로 영어 반환
+                    lang = 'en'
+            self._language_cache.put(key, lang)
+        return lang
     
+    def analyze_batch(self, texts: List[str]) -> List[NLPAnalysisResult]:
+        """
+        여러 텍스트를 한 번에 분석합니다 (대량 프롬프트 재분석용).
+
+        영어 텍스트는 토큰 목록을 한 번의 `pos_tag_sents` 호출로 태깅하므로 태거 로딩 비용을
+        텍스트마다 치르지 않습니다. 한국어는 자체 토크나이저(어절 분석 결과 공유)로 분석합니다.
+        결과는 텍스트마다 `analyze`를 호출한 것과 같습니다.
+        """
+        languages = [self._detect_language(text) for text in texts]
+        use_nltk = self.ready and NLP_AVAILABLE and self.nltk_available
+
+        results: List[Optional[NLPAnalysisResult]] = [None] * len(texts)
+        groups: Dict[str, List[int]] = {'en': []}
+        for index, language in enumerate(languages):
+            if language == 'ko':
+                results[index] = self._analyze_korean(texts[index])
+            elif language in groups and use_nltk:
+                groups[language].append(index)
+            else:
+                results[index] = self._analyze_basic(texts[index], language)
+
+        builders = {'en': self._build_english_result}
+        for language, indices in groups.items():
+            if not indices:
+                continue
+            tokenized = []
+            for index in indices:
+                try:
+                    tokenized.append((index, nltk.word_tokenize(texts[index])))
+                except Exception:
+                    # 개별 분석과 같은 오류 처리 경로로 보냄
+                    results[index] = self.analyze(texts[index])
+            try:
+                tagged = nltk.pos_tag_sents([tokens for _, tokens in tokenized])
+            except Exception:
+                for index, _ in tokenized:
+                    results[index] = self.analyze(texts[index])
+                continue
+            for (index, tokens), pos_tags in zip(tokenized, tagged):
+                try:
+                    results[index] = builders[language](texts[index], tokens, pos_tags)
+                except Exception as e:
+                    self.logger.error(f"배치 분석 오류: {e}")
+                    results[index] = self._analyze_basic(texts[index], language)
+
+        return results
+
     def _analyze_korean(self, text: str) -> NLPAnalysisResult:
         """한국어 텍스트 분석"""
-        if not NLP_AVAILABLE or not self.nltk_available:
-            return self._analyze_basic(text, 'ko')
-        
         try:
-            # 형태소 분석
-            tokens = nltk.word_tokenize(text)
-            pos_tags = nltk.pos_tag(tokens)
-            
-            # 명사 추출 (주요 키워드)
-            nouns = [word for word, pos in pos_tags if pos.startswith('N')]
-            
-            # 엔티티 추출 (간단한 규칙 기반)
-            entities = self._extract_korean_entities(text, pos_tags)
-            
-            # 핵심 구문 추출
-            key_phrases = self._extract_korean_key_phrases(pos_tags, nouns)
-            
-            # 감성 분석 (간단한 규칙 기반)
-            sentiment = self._analyze_korean_sentiment(text)
-            
-            # 의도 분류
-            intent = self._classify_korean_intent(text, pos_tags)
-            
-            # 복잡도 점수
-            complexity_score = self._calculate_complexity(text, tokens)
-            
-            return NLPAnalysisResult(
-                language='ko',
-                tokens=tokens,
-                pos_tags=pos_tags,
-                entities=entities,
-                key_phrases=key_phrases,
-                sentiment=sentiment,
-                intent=intent,
-                complexity_score=complexity_score
-            )
+            # 형태소 분석 (트라이 사전 기반 토크나이저, 조사/어미 분리)
+            pos_tags = get_korean_tokenizer().pos(text)
+            tokens = [word for word, _ in pos_tags]
+            return self._build_korean_result(text, tokens, pos_tags)
         except Exception as e:
             self.logger.error(f"한국어 분석 오류: {e}")
             return self._analyze_basic(text, 'ko')
+
+    def _build_korean_result(self, text: str, tokens: List[str], pos_tags: List[Tuple[str, str]]) -> NLPAnalysisResult:
+        """태깅된 한국어 텍스트로 분석 결과를 만듭니다."""
+        # 명사 추출 (주요 키워드)
+        nouns = [word for word, pos in pos_tags if pos.startswith('N')]
+        
+        # 엔티티 추출 (간단한 규칙 기반)
+        entities = self._extract_korean_entities(text, pos_tags)
+        
+        # 핵심 구문 추출
+        key_phrases = self._extract_korean_key_phrases(pos_tags, nouns)
+        
+        # 감성 분석 (간단한 규칙 기반)
+        sentiment = self._analyze_korean_sentiment(text)
+        
+        # 의도 분류
+        intent = self._classify_korean_intent(text, pos_tags) if self.classify_intent else None
+        
+        # 복잡도 점수
+        complexity_score = self._calculate_complexity(text, tokens)
+        
+        return NLPAnalysisResult(
+            language='ko',
+            tokens=tokens,
+            pos_tags=pos_tags,
+            entities=entities,
+            key_phrases=key_phrases,
+            sentiment=sentiment,
+            intent=intent,
+            complexity_score=complexity_score
+        )
     
     def _analyze_english(self, text: str) -> NLPAnalysisResult:
         """영어 텍스트 분석"""
@@ -135,35 +368,38 @@ class NLPAnalyzer:
             # NLTK 분석
             tokens = nltk.word_tokenize(text)
             pos_tags = nltk.pos_tag(tokens)
-            
-            # 엔티티 추출
-            entities = self._extract_english_entities(text, pos_tags)
-            
-            # 핵심 구문 추출 (명사구)
-            key_phrases = self._extract_english_key_phrases(pos_tags, tokens)
-            
-            # 감성 분석 (간단한 규칙 기반)
-            sentiment = self._analyze_english_sentiment(text)
-            
-            # 의도 분류
-            intent = self._classify_english_intent(text)
-            
-            # 복잡도 점수
-            complexity_score = self._calculate_complexity(text, tokens)
-            
-            return NLPAnalysisResult(
-                language='en',
-                tokens=tokens,
-                pos_tags=pos_tags,
-                entities=entities,
-                key_phrases=key_phrases,
-                sentiment=sentiment,
-                intent=intent,
-                complexity_score=complexity_score
-            )
+            return self._build_english_result(text, tokens, pos_tags)
         except Exception as e:
             self.logger.error(f"영어 분석 오류: {e}")
             return self._analyze_basic(text, 'en')
+
+    def _build_english_result(self, text: str, tokens: List[str], pos_tags: List[Tuple[str, str]]) -> NLPAnalysisResult:
+        """태깅된 영어 텍스트로 분석 결과를 만듭니다."""
+        # 엔티티 추출
+        entities = self._extract_english_entities(text, pos_tags)
+        
+        # 핵심 구문 추출 (명사구)
+        key_phrases = self._extract_english_key_phrases(pos_tags, tokens)
+        
+        # 감성 분석 (간단한 규칙 기반)
+        sentiment = self._analyze_english_sentiment(text)
+        
+        # 의도 분류
+        intent = self._classify_english_intent(text) if self.classify_intent else None
+        
+        # 복잡도 점수
+        complexity_score = self._calculate_complexity(text, tokens)
+        
+        return NLPAnalysisResult(
+            language='en',
+            tokens=tokens,
+            pos_tags=pos_tags,
+            entities=entities,
+            key_phrases=key_phrases,
+            sentiment=sentiment,
+            intent=intent,
+            complexity_score=complexity_score
+        )
     
     def _analyze_basic(self, text: str, language: str) -> NLPAnalysisResult:
         """기본적인 텍스트 분석 (NLP 라이브러리 없이)"""
@@ -183,7 +419,7 @@ class NLPAnalyzer:
         sentiment = 'neutral'
         
         # 기본 의도 분류
-        intent = self._classify_basic_intent(text)
+        intent = self._classify_basic_intent(text) if self.classify_intent else None
         
         # 복잡도 점수
         complexity_score = len(text) / 100.0  # 매우 단순한 측정
@@ -200,40 +436,8 @@ class NLPAnalyzer:
         )
     
     def _extract_korean_entities(self, text: str, pos_tags: List[Tuple[str, str]]) -> List[Dict[str, str]]:
-        """한국어 엔티티 추출"""
-        entities = []
-        
-        # 이메일 패턴
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        for match in re.finditer(email_pattern, text):
-            entities.append({
-                'text': match.group(),
-                'label': 'EMAIL',
-                'start': match.start(),
-                'end': match.end()
-            })
-        
-        # 전화번호 패턴
-        phone_pattern = r'(\d{2,3}-\d{3,4}-\d{4})|(\d{10,11})'
-        for match in re.finditer(phone_pattern, text):
-            entities.append({
-                'text': match.group(),
-                'label': 'PHONE',
-                'start': match.start(),
-                'end': match.end()
-            })
-        
-        # 조직명/회사명 추출 (NNP 태그 활용)
-        for word, tag in pos_tags:
-            if tag == 'NNP' and len(word) > 1:  # 고유명사
-                entities.append({
-                    'text': word,
-                    'label': 'ORG',
-                    'start': text.find(word),
-                    'end': text.find(word) + len(word)
-                })
-        
-        return entities
+        """한국어 엔티티 추출 (공유 엔티티 스캐너 + NNP 태그의 조직명/회사명)"""
+        return self._entity_scanner.entities(text, extra=self._proper_noun_spans(text, pos_tags, ('NNP',), 'ORG'))
     
     def _extract_korean_key_phrases(self, pos_tags: List[Tuple[str, str]], nouns: List[str]) -> List[str]:
         """한국어 핵심 구문 추출"""
@@ -256,22 +460,11 @@ class NLPAnalyzer:
         # 중요 명사 추가
         key_phrases.extend([noun for noun in nouns if len(noun) > 1])
         
-        return list(set(key_phrases))  # 중복 제거
+        return list(dict.fromkeys(key_phrases))  # 중복 제거 (처음 나온 순서 유지)
     
     def _analyze_korean_sentiment(self, text: str) -> str:
-        """한국어 감성 분석 (간단한 규칙 기반)"""
-        positive_words = ['좋다', '훌륭', '최고', '멋지다', '행복', '기쁘다', '사랑', '감사']
-        negative_words = ['나쁘다', '싫다', '최악', '화나다', '슬프다', '실망', '문제', '오류']
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        
-        if positive_count > negative_count:
-            return 'positive'
-        elif negative_count > positive_count:
-            return 'negative'
-        else:
-            return 'neutral'
+        """한국어 감성 분석 (감성 사전 매칭)"""
+        return self._sentiment_engine.analyze(text, 'ko').label
     
     def _classify_korean_intent(self, text: str, pos_tags: List[Tuple[str, str]]) -> str:
         """한국어 의도 분류"""
@@ -280,7 +473,7 @@ class NLPAnalyzer:
             return 'question'
         
         # 요청/명령 의도
-        if any(tag == 'VV' for _, tag in pos_tags):  # 동사가 있으면
+        if any(tag in ('VV', 'XSV') for _, tag in pos_tags):  # 동사(하다 결합형 포함)가 있으면
             if any(word in text for word in ['해줘', '하세요', '부탁', '요청']):
                 return 'request'
         
@@ -291,21 +484,8 @@ class NLPAnalyzer:
         return 'general'
     
     def _analyze_english_sentiment(self, text: str) -> str:
-        """영어 감성 분석 (간단한 규칙 기반)"""
-        positive_words = ['good', 'great', 'excellent', 'love', 'happy', 'wonderful', 'best']
-        negative_words = ['bad', 'hate', 'terrible', 'worst', 'sad', 'angry', 'problem']
-        
-        tokens_lower = text.lower().split()
-        
-        positive_count = sum(1 for word in positive_words if word in tokens_lower)
-        negative_count = sum(1 for word in negative_words if word in tokens_lower)
-        
-        if positive_count > negative_count:
-            return 'positive'
-        elif negative_count > positive_count:
-            return 'negative'
-        else:
-            return 'neutral'
+        """영어 감성 분석 (감성 사전 매칭)"""
+        return self._sentiment_engine.analyze(text, 'en').label
     
     def _classify_english_intent(self, text: str) -> str:
         """영어 의도 분류"""
@@ -326,30 +506,18 @@ class NLPAnalyzer:
         return 'general'
     
     def _extract_basic_entities(self, text: str) -> List[Dict[str, str]]:
-        """기본적인 엔티티 추출 (정규식 기반)"""
-        entities = []
-        
-        # URL 패턴
-        url_pattern = r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'
-        for match in re.finditer(url_pattern, text):
-            entities.append({
-                'text': match.group(),
-                'label': 'URL',
-                'start': match.start(),
-                'end': match.end()
-            })
-        
-        # 숫자 패턴
-        number_pattern = r'\b\d+(?:\.\d+)?\b'
-        for match in re.finditer(number_pattern, text):
-            entities.append({
-                'text': match.group(),
-                'label': 'NUMBER',
-                'start': match.start(),
-                'end': match.end()
-            })
-        
-        return entities
+        """기본적인 엔티티 추출 (이메일/URL/전화번호/숫자를 한 번의 스캔으로)"""
+        return self._entity_scanner.entities(text)
+    
+    @staticmethod
+    def _proper_noun_spans(text: str, pos_tags: List[Tuple[str, str]], tags: Tuple[str, ...], label: str) -> List[Tuple[str, int, int, str]]:
+        """품사 태그의 고유명사를 엔티티 구간으로 바꿉니다 (위치는 텍스트에서 처음 나온 곳)."""
+        spans = []
+        for word, tag in pos_tags:
+            if tag in tags and len(word) > 1:  # 고유명사
+                start = text.find(word)
+                spans.append((label, start, start + len(word), word))
+        return spans
     
     def _classify_basic_intent(self, text: str) -> str:
         """기본적인 의도 분류"""
@@ -379,23 +547,8 @@ class NLPAnalyzer:
         return complexity
     
     def _extract_english_entities(self, text: str, pos_tags: List[Tuple[str, str]]) -> List[Dict[str, str]]:
-        """영어 엔티티 추출 (기본 규칙 기반)"""
-        entities = []
-        
-        # 기본 엔티티 추출 재사용
-        entities.extend(self._extract_basic_entities(text))
-        
-        # 고유명사 추출
-        for word, tag in pos_tags:
-            if tag in ['NNP', 'NNPS'] and len(word) > 1:  # 고유명사
-                entities.append({
-                    'text': word,
-                    'label': 'PERSON_OR_ORG',
-                    'start': text.find(word),
-                    'end': text.find(word) + len(word)
-                })
-        
-        return entities
+        """영어 엔티티 추출 (공유 엔티티 스캐너 + NNP/NNPS 태그의 인물/조직명)"""
+        return self._entity_scanner.entities(text, extra=self._proper_noun_spans(text, pos_tags, ('NNP', 'NNPS'), 'PERSON_OR_ORG'))
     
     def _extract_english_key_phrases(self, pos_tags: List[Tuple[str, str]], tokens: List[str]) -> List[str]:
         """영어 핵심 구문 추출"""
@@ -420,4 +573,4 @@ class NLPAnalyzer:
         # 중요한 단어들 추가 (길이가 긴 단어)
         key_phrases.extend([word for word in tokens if len(word) > 5])
         
-        return list(set(key_phrases))  # 중복 제거 
\ No newline at end of file
+        return list(dict.fromkeys(key_phrases))  # 중복 제거 (처음 나온 순서 유지) 
\ No newline at end of file
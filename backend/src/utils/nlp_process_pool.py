@@ -0,0 +1,198 @@
+"""
+NLP 프로세스 풀 모듈: CPU를 많이 쓰는 NLPAnalyzer 분석(토큰화, 품사 태깅)을 자식 프로세스에서
+실행하여 스레드 기반 요청 처리가 GIL에 막히지 않도록 합니다.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Any, Tuple, Optional
+
+from .nlp_analyzer import NLPAnalyzer, NLPAnalysisResult, NLTKWarmup, NLTK_DATA_DIR
+from .korean_tokenizer import get_korean_tokenizer
+
+# 자식 프로세스마다 하나씩 만드는 분석기 (initializer에서 생성)
+_worker_analyzer: Optional[NLPAnalyzer] = None
+
+
+def pack_result(result: NLPAnalysisResult) -> Tuple:
+    """
+    NLPAnalysisResult를 프로세스 간 전달용 튜플로 압축합니다.
+
+    품사 태그의 단어가 tokens와 같으면 태그만 저장하고, 엔티티는 딕셔너리 대신 튜플로 저장합니다.
+    """
+    words = [word for word, _ in result.pos_tags]
+    if words == result.tokens:
+        tags: Any = [tag for _, tag in result.pos_tags]
+    else:
+        tags = (words, [tag for _, tag in result.pos_tags])
+    entities = [tuple(entity.items()) for entity in result.entities]
+    return (result.language, result.tokens, tags, entities, result.key_phrases,
+            result.sentiment, result.intent, result.complexity_score)
+
+
+def unpack_result(data: Tuple) -> NLPAnalysisResult:
+    """pack_result로 압축한 튜플을 NLPAnalysisResult로 되돌립니다."""
+    language, tokens, tags, entities, key_phrases, sentiment, intent, complexity_score = data
+    if isinstance(tags, tuple):
+        pos_tags = list(zip(*tags))
+    else:
+        pos_tags = list(zip(tokens, tags))
+    return NLPAnalysisResult(
+        language=language,
+        tokens=tokens,
+        pos_tags=pos_tags,
+        entities=[dict(entity) for entity in entities],
+        key_phrases=key_phrases,
+        sentiment=sentiment,
+        intent=intent,
+        complexity_score=complexity_score
+    )
+
+
+def _init_worker(data_dir: str) -> None:
+    """자식 프로세스 초기화: NLTK 리소스와 한국어 사전을 동기적으로 불러온 분석기를 준비합니다."""
+    global _worker_analyzer
+    warmup = NLTKWarmup(data_dir=data_dir)
+    warmup.run()
+    get_korean_tokenizer()
+    _worker_analyzer = NLPAnalyzer(warmup=warmup, start_warmup=False)
+
+
+def _analyze_in_worker(text: str) -> Tuple:
+    """자식 프로세스에서 텍스트를 분석하고 압축된 결과를 반환합니다."""
+    return pack_result(_worker_analyzer.analyze(text))
+
+
+def _ping_worker() -> bool:
+    """초기화가 끝났는지 확인하는 빈 작업"""
+    return _worker_analyzer is not None
+
+
+class NLPProcessPool:
+    """
+    NLPAnalyzer.analyze 작업을 자식 프로세스 풀에 넘기는 실행기
+
+    - 각 자식 프로세스는 시작할 때 NLTK 리소스를 미리 불러옵니다.
+    - 대기 중인 작업 수가 max_pending에 이르면 새 작업은 풀에 넣지 않고 바로 기본 분석으로 처리합니다.
+    - 작업이 timeout 안에 끝나지 않거나 풀이 실패하면 요청 스레드에서 `_analyze_basic`으로 처리합니다.
+      (이미 실행 중인 자식 작업은 중단되지 않고 결과만 버려집니다.)
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 64, timeout: Optional[float] = 2.0,
+                 data_dir: str = NLTK_DATA_DIR, start_method: str = "spawn"):
+        """
+        Args:
+            max_workers: 자식 프로세스 수
+            max_pending: 실행 중/대기 중 작업 수 상한 (bounded queue)
+            timeout: 작업별 기본 제한 시간(초), None이면 무제한
+            data_dir: 자식 프로세스가 NLTK 데이터를 찾을 로컬 경로
+            start_method: multiprocessing 시작 방식 (스레드가 있는 서버에서는 spawn 권장)
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(data_dir,)
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # 기본 분석 대체 경로와 언어 감지에만 쓰는 요청 프로세스 쪽 분석기
+        self._fallback = NLPAnalyzer(warmup=NLTKWarmup(data_dir=data_dir), start_warmup=False)
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "completed": 0, "rejected": 0, "timeouts": 0, "failures": 0}
+
+    def __enter__(self) -> "NLPProcessPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def start(self) -> None:
+        """모든 자식 프로세스를 띄우고 초기화(리소스 로딩)가 끝날 때까지 기다립니다."""
+        futures = [self._executor.submit(_ping_worker) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    def submit(self, text: str) -> Optional[Future]:
+        """
+        분석 작업을 풀에 넣습니다. 대기열이 가득 차면 None을 반환합니다.
+
+        반환된 Future의 결과는 pack_result 형식의 튜플입니다.
+        """
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+            return None
+        try:
+            future = self._executor.submit(_analyze_in_worker, text)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._count("submitted")
+        return future
+
+    def analyze(self, text: str, timeout: Optional[float] = None) -> NLPAnalysisResult:
+        """
+        텍스트를 자식 프로세스에서 분석합니다.
+
+        Args:
+            text: 분석할 텍스트
+            timeout: 제한 시간(초), None이면 풀의 기본값
+
+        Returns:
+            분석 결과 (대기열 초과/시간 초과/실패 시 기본 분석 결과)
+        """
+        return self._collect(text, self._try_submit(text), timeout)
+
+    def analyze_many(self, texts: List[str], timeout: Optional[float] = None) -> List[NLPAnalysisResult]:
+        """여러 텍스트를 풀에 함께 넣고 입력 순서대로 결과를 반환합니다."""
+        futures = [self._try_submit(text) for text in texts]
+        return [self._collect(text, future, timeout) for text, future in zip(texts, futures)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 처리 통계를 반환합니다."""
+        with self._stats_lock:
+            return dict(self._stats, max_workers=self.max_workers, max_pending=self.max_pending)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """자식 프로세스를 종료합니다."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _try_submit(self, text: str) -> Optional[Future]:
+        try:
+            return self.submit(text)
+        except Exception as e:
+            self.logger.warning(f"NLP 작업 제출 실패: {e}")
+            self._count("failures")
+            return None
+
+    def _collect(self, text: str, future: Optional[Future], timeout: Optional[float]) -> NLPAnalysisResult:
+        """작업 결과를 기다리고, 작업이 없거나 실패하면 기본 분석 결과를 반환합니다."""
+        if future is None:
+            return self._analyze_basic(text)
+
+        try:
+            data = future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timeouts")
+            return self._analyze_basic(text)
+        except Exception as e:
+            self.logger.warning(f"NLP 작업 실패: {e}")
+            self._count("failures")
+            return self._analyze_basic(text)
+
+        self._count("completed")
+        return unpack_result(data)
+
+    def _analyze_basic(self, text: str) -> NLPAnalysisResult:
+        return self._fallback._analyze_basic(text, self._fallback._detect_language(text))
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
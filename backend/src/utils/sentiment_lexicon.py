@@ -0,0 +1,138 @@
+"""
+감성 사전 모듈: 한국어/영어 감성 사전 파일을 한 번 읽어 언어별 단일 매처로 컴파일하고,
+텍스트를 한 번 순회하여 긍정/부정 표현 수와 감성 점수를 계산합니다.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional
+
+from .keyword_matcher import KeywordAutomaton
+
+# 기본 사전 파일 (언어 -> 경로)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+DEFAULT_LEXICON_PATHS = {
+    'ko': os.path.join(DATA_DIR, 'sentiment_ko.tsv'),
+    'en': os.path.join(DATA_DIR, 'sentiment_en.tsv'),
+}
+
+POLARITIES = ('positive', 'negative')
+
+
+@dataclass
+class SentimentResult:
+    """감성 분석 결과 (긍정/부정 표현 수는 서로 다른 사전 항목 수)"""
+    label: str
+    positive: int
+    negative: int
+    score: float
+
+
+def load_lexicon(path: str) -> List[Tuple[str, str]]:
+    """사전 파일(TSV)을 읽어 (표현, 극성) 목록을 반환합니다."""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            expression, polarity = line.split('\t')
+            if polarity not in POLARITIES:
+                raise ValueError(f"알 수 없는 극성: {polarity} ({path})")
+            entries.append((expression, polarity))
+    return entries
+
+
+class SentimentLexicon:
+    """
+    한 언어의 감성 사전을 컴파일한 매처
+
+    - substring: 표현이 텍스트의 부분 문자열이면 매칭 (Aho-Corasick 오토마톤으로 한 번 순회, 한국어)
+    - token: 소문자 텍스트를 공백으로 나눈 토큰과 같으면 매칭 (토큰 사전 조회, 영어)
+    """
+
+    def __init__(self, entries: List[Tuple[str, str]], match: str = 'substring'):
+        """
+        Args:
+            entries: (표현, 극성) 목록
+            match: 매칭 방식 ('substring' 또는 'token')
+        """
+        if match not in ('substring', 'token'):
+            raise ValueError(f"지원하지 않는 매칭 방식: {match}")
+        self.match = match
+        self.size = len(entries)
+
+        if match == 'substring':
+            self._automaton = KeywordAutomaton()
+            for expression, polarity in entries:
+                self._automaton.add(expression, ('sentiment', polarity))
+            self._automaton.build()
+            # 패턴 ID -> 극성 (같은 표현이 두 극성에 모두 있으면 처음 등록한 극성)
+            self._polarities = [payloads[0][1] for payloads in self._automaton.payloads]
+        else:
+            self._token_polarities: Dict[str, str] = {}
+            for expression, polarity in entries:
+                self._token_polarities.setdefault(expression.lower(), polarity)
+
+    def count(self, text: str) -> Tuple[int, int]:
+        """텍스트에 등장한 (긍정 표현 수, 부정 표현 수)를 반환합니다."""
+        if self.match == 'substring':
+            matched = [self._polarities[pattern_id] for pattern_id in self._automaton.scan(text)]
+        else:
+            lookup = self._token_polarities
+            matched = [lookup[token] for token in set(text.lower().split()) if token in lookup]
+        positive = matched.count('positive')
+        return positive, len(matched) - positive
+
+    def analyze(self, text: str) -> SentimentResult:
+        """긍정/부정 표현 수로 감성 레이블과 -1~1 범위의 점수를 계산합니다."""
+        positive, negative = self.count(text)
+        total = positive + negative
+        score = (positive - negative) / total if total else 0.0
+        if positive > negative:
+            label = 'positive'
+        elif negative > positive:
+            label = 'negative'
+        else:
+            label = 'neutral'
+        return SentimentResult(label=label, positive=positive, negative=negative, score=score)
+
+
+class SentimentEngine:
+    """언어별 감성 사전 매처 모음 (사전에 없는 언어는 중립)"""
+
+    # 언어별 매칭 방식
+    MATCH_MODES = {'ko': 'substring', 'en': 'token'}
+
+    def __init__(self, lexicon_paths: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            lexicon_paths: 언어 -> 사전 파일 경로 (None이면 기본 사전 파일)
+        """
+        paths = lexicon_paths if lexicon_paths is not None else DEFAULT_LEXICON_PATHS
+        self.lexicons: Dict[str, SentimentLexicon] = {
+            language: SentimentLexicon(load_lexicon(path), self.MATCH_MODES.get(language, 'substring'))
+            for language, path in paths.items()
+        }
+
+    def analyze(self, text: str, language: str) -> SentimentResult:
+        """언어에 맞는 사전으로 텍스트의 감성을 분석합니다."""
+        lexicon = self.lexicons.get(language)
+        if lexicon is None:
+            return SentimentResult(label='neutral', positive=0, negative=0, score=0.0)
+        return lexicon.analyze(text)
+
+
+_shared_engine: Optional[SentimentEngine] = None
+_shared_lock = threading.Lock()
+
+
+def get_sentiment_engine() -> SentimentEngine:
+    """모든 분석기가 공유하는 SentimentEngine을 반환합니다 (처음 호출 시 사전을 한 번 읽어 컴파일)."""
+    global _shared_engine
+    if _shared_engine is None:
+        with _shared_lock:
+            if _shared_engine is None:
+                _shared_engine = SentimentEngine()
+    return _shared_engine
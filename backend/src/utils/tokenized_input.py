@@ -0,0 +1,110 @@
+"""
+토큰화 입력 모듈: 요청마다 한 번 만들어 파이프라인의 모든 단계(입력 분석, 의도 감지,
+모델별 프롬프트 생성)가 공유하는 토큰화 결과를 제공합니다.
+"""
+
+import re
+from typing import List, Optional, FrozenSet
+
+# 단어 토큰 (기존 키워드 추출의 \b\w+\b와 같음)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+class TokenizedInput(str):
+    """
+    원문 문자열처럼 쓰이면서 소문자 텍스트, 단어 토큰, 토큰 위치, 토큰 집합을 한 번만 계산해
+    공유하는 문자열
+
+    str을 상속하므로 기존 코드에 그대로 전달할 수 있으며, `lower()`는 처음 호출될 때만
+    소문자 텍스트를 만들고 이후에는 같은 객체를 반환합니다. 각 속성은 처음 사용할 때
+    계산되며, 전체 텍스트를 순회한 횟수는 `passes`에 기록됩니다.
+    """
+
+    def __new__(cls, text: str):
+        if isinstance(text, TokenizedInput):
+            return text
+        instance = super().__new__(cls, text)
+        instance._lowered = None
+        instance._tokens = None
+        instance._offsets = None
+        instance._token_set = None
+        instance._word_count = None
+        # strip으로 만든 경우 원본 (소문자 텍스트를 원본과 공유)
+        instance._parent = None
+        instance.passes = 0
+        return instance
+
+    def lower(self) -> str:
+        """소문자로 변환한 텍스트 (처음 한 번만 계산)"""
+        if self._lowered is None:
+            if self._parent is not None:
+                # 원본의 소문자 텍스트를 잘라 씀 (순회는 원본에서 한 번만)
+                self._lowered = self._parent.lower().strip()
+            else:
+                self._lowered = str.lower(self)
+                self.passes += 1
+        return self._lowered
+
+    @property
+    def tokens(self) -> List[str]:
+        """소문자 텍스트의 단어 토큰 목록 (\\w+)"""
+        if self._tokens is None:
+            self._tokens = TOKEN_PATTERN.findall(self.lower())
+            self.passes += 1
+        return self._tokens
+
+    @property
+    def offsets(self) -> List[int]:
+        """tokens 각각의 소문자 텍스트 기준 시작 위치"""
+        if self._offsets is None:
+            self._offsets = [match.start() for match in TOKEN_PATTERN.finditer(self.lower())]
+            self.passes += 1
+        return self._offsets
+
+    @property
+    def token_set(self) -> FrozenSet[str]:
+        """고유 토큰 집합"""
+        if self._token_set is None:
+            self._token_set = frozenset(self.tokens)
+        return self._token_set
+
+    @property
+    def word_count(self) -> int:
+        """공백 기준 단어 수 (len(text.split())와 같음)"""
+        if self._word_count is None:
+            self._word_count = len(str.split(self))
+            self.passes += 1
+        return self._word_count
+
+    def strip(self, chars: Optional[str] = None) -> str:
+        """
+        앞뒤 공백을 제거합니다. 공백만 제거하는 경우 결과도 TokenizedInput이며,
+        원본의 소문자 텍스트를 함께 잘라 재사용합니다 (공백은 소문자 변환에 영향을 주지 않음).
+        원본이 아직 소문자 텍스트를 만들지 않았으면 처음 필요할 때 원본에서 만듭니다.
+        """
+        if chars is not None:
+            return str.strip(self, chars)
+        stripped = str.strip(self)
+        if len(stripped) == len(self):
+            return self
+        result = TokenizedInput(stripped)
+        if self._lowered is not None:
+            result._lowered = self._lowered.strip()
+        else:
+            result._parent = self
+        return result
+
+    def __copy__(self) -> "TokenizedInput":
+        return self
+
+    def __deepcopy__(self, memo) -> "TokenizedInput":
+        return self
+
+    def __reduce__(self):
+        # 캐시된 토큰화 결과는 직렬화하지 않음
+        return (TokenizedInput, (str(self),))
+
+
+def get_tokenized(text: str) -> Optional[TokenizedInput]:
+    """text가 TokenizedInput이면 그대로, 아니면 None을 반환합니다."""
+    return text if isinstance(text, TokenizedInput) else None
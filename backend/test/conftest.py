@@ -12,6 +12,21 @@ from typing import Dict, Any, List
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    """src.main Flask 앱의 테스트 클라이언트를 반환합니다 (로그 파일은 임시 디렉토리에 생성)."""
+    import importlib
+    
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("server"))
+    try:
+        main = importlib.import_module("src.main")
+    finally:
+        os.chdir(cwd)
+    yield main.app.test_client()
+    main.optimizer.shutdown()
+
+
 @pytest.fixture
 def mock_input_analyzer():
     """InputAnalyzer 모의 객체를 반환합니다."""
@@ -0,0 +1,169 @@
+"""
+AnalysisResult 지연 분석 결과 단위 테스트
+"""
+
+import copy
+import json
+import pickle
+import pytest
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.intent_detector import IntentDetector
+from src.utils.analysis_result import AnalysisResult
+from src.models.image_models.imagen3_model import Imagen3Model
+
+
+TEXT = "전문가를 위한 상세한 데이터 분석 보고서를 3 섹션으로 작성해주세요. 반드시 차트를 포함해야 합니다."
+
+
+class TestAnalysisResult:
+    """AnalysisResult 클래스 테스트"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """InputAnalyzer 인스턴스를 반환합니다."""
+        return InputAnalyzer()
+
+    @pytest.fixture
+    def eager(self):
+        """캐시를 쓰지 않는 분석기에서 모든 필드를 계산한 일반 딕셔너리를 반환합니다."""
+        return InputAnalyzer(cache_size=0).analyze(TEXT, "gpt-4o").copy()
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_fields_computed_on_first_access(self, analyzer):
+        """읽은 필드만 계산되는지 테스트"""
+        scans = []
+        original_scan = analyzer._scan_hints
+        analyzer._scan_hints = lambda text: scans.append(text) or original_scan(text)
+
+        result = analyzer.analyze(TEXT, "imagen-3")
+
+        assert isinstance(result, dict)
+        assert result["input_text"] == TEXT
+        assert result.get("complexity") == "high"
+        assert result.get("style")
+        assert scans == []
+        assert "constraints" in result.pending_fields
+        assert "complexity" not in result.pending_fields
+
+        assert result["constraints"]["audience"] == "expert"
+        assert result.get("structure_hints")["sections"] == ["Section 1", "Section 2", "Section 3"]
+        assert len(scans) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_mapping_compatibility(self, analyzer, eager):
+        """기존 딕셔너리 연산이 그대로 동작하는지 테스트"""
+        result = analyzer.analyze(TEXT, "gpt-4o")
+
+        assert "constraints" in result
+        assert "unknown" not in result
+        assert result.get("unknown") is None
+        assert result.get("unknown", "default") == "default"
+        assert len(result) == len(eager)
+        with pytest.raises(KeyError):
+            result["unknown"]
+
+        assert result == eager
+        assert list(result.keys()) == list(eager.keys())
+        assert json.dumps(result, ensure_ascii=False) == json.dumps(eager, ensure_ascii=False)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_key_order_independent_of_access_order(self, analyzer, eager):
+        """필드를 읽은 순서와 관계없이 키 순서가 기존 결과와 같은지 테스트"""
+        result = analyzer.analyze(TEXT, "gpt-4o")
+        result["constraints"]
+        result["keywords"]
+        result.update({"aspect_ratio": "16:9"})
+
+        assert list(result) == list(eager) + ["aspect_ratio"]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_mutation(self, analyzer):
+        """필드 변경/삭제가 지연 필드와 섞여도 일관된지 테스트"""
+        result = analyzer.analyze(TEXT, "gpt-4o")
+
+        result["style"] = [("casual", 1.0)]
+        del result["entities"]
+        result.update(complexity="low", quality="hd")
+
+        assert result["style"] == [("casual", 1.0)]
+        assert "entities" not in result
+        assert result.pop("complexity") == "low"
+        assert result.setdefault("task_type") == analyzer.analyze(TEXT, "gpt-4o")["task_type"]
+        assert set(result) == {
+            "input_text", "selected_model", "model_category", "keywords", "task_type", "intent", "style",
+            "structure_hints", "constraints", "quality"
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_copy_and_pickle_return_plain_dicts(self, analyzer, eager):
+        """복사와 직렬화가 모든 필드를 계산한 일반 딕셔너리를 만드는지 테스트"""
+        for clone in (
+            analyzer.analyze(TEXT, "gpt-4o").copy(),
+            copy.copy(analyzer.analyze(TEXT, "gpt-4o")),
+            copy.deepcopy(analyzer.analyze(TEXT, "gpt-4o")),
+            pickle.loads(pickle.dumps(analyzer.analyze(TEXT, "gpt-4o")))
+        ):
+            assert type(clone) is dict
+            assert clone == eager
+
+
+class TestFieldAccessStats:
+    """모델별 필드 사용 통계 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_counts_fields_read_per_model(self):
+        """모델별로 읽은 필드가 결과 단위로 집계되는지 테스트"""
+        analyzer = InputAnalyzer()
+        for _ in range(2):
+            result = analyzer.analyze(TEXT, "gpt-4o")
+            result.get("style")
+            result.get("style")
+            result["complexity"]
+        analyzer.analyze(TEXT, "dall-e-3")
+
+        stats = analyzer.get_field_access_stats()
+
+        assert stats["gpt-4o"] == {"results": 2, "fields": {"style": 2, "complexity": 2}}
+        assert stats["dall-e-3"] == {"results": 1, "fields": {}}
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_model_reads_subset_of_fields(self):
+        """이미지 모델이 실제로 읽는 필드만 계산되는지 테스트"""
+        analyzer = InputAnalyzer()
+        text = "밝고 화창한 날에 해변에서 뛰노는 강아지의 사진"
+        result = analyzer.analyze(text, "imagen-3")
+
+        Imagen3Model().optimize_prompt(result, IntentDetector().detect_intent(text))
+
+        touched = analyzer.get_field_access_stats()["imagen-3"]["fields"]
+        assert "input_text" in touched
+        assert "keywords" not in touched
+        assert "keywords" in result.pending_fields
+
+
+class TestAnalysisResultBenchmark:
+    """필드 일부만 읽는 경우의 지연 계산 벤치마크"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="analysis-result")
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_partial_read(self, benchmark, lazy):
+        """input_text/style/complexity만 읽는 모델 (lazy=False는 모든 필드 계산 기준)"""
+        text = "독자는 일반 사용자이며 친근한 톤으로 상세한 제품 소개서를 작성해주세요. 반드시 가격 정보를 포함해야 합니다. " * 20
+
+        analyzer = InputAnalyzer(cache_size=0)
+
+        def analyze():
+            result = analyzer.analyze(text, "imagen-3")
+            if not lazy:
+                result.copy()
+            return result.get("input_text"), result.get("style"), result.get("complexity")
+
+        assert benchmark(analyze)[2] == "high"
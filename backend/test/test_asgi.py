@@ -0,0 +1,365 @@
+"""
+비동기 API(optimize_prompt_async)와 ASGI 앱(src.asgi) 단위/연동 테스트 및 동시 요청 벤치마크
+"""
+
+import json
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+import pytest
+from src.asgi import PromptOptimizerASGI
+from src.services.enrichment import EnrichmentStage
+from src.services.optimizer import PromptOptimizer
+
+TEXT = "노을 지는 해변에서 산책하는 고양이 사진을 상세하게 만들어주세요"
+
+# 동시 요청 수
+CONCURRENCY = 64
+
+
+class SlowStage(EnrichmentStage):
+    """시간 예산 안에서 오래 걸리는 보강 단계"""
+
+    name = "slow"
+
+    def enrich(self, text):
+        time.sleep(0.2)
+        return {"slow": True}
+
+
+async def call(app, method: str, path: str, body: Any = None, headers: Optional[Dict[str, str]] = None,
+               disconnect_after: Optional[float] = None) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+    """
+    ASGI 앱에 HTTP 요청 하나를 보냅니다.
+
+    Returns:
+        (상태 코드, 응답 헤더, 본문), 응답 없이 끝났으면 None
+        disconnect_after초 뒤에는 클라이언트 연결 종료를 알림
+    """
+    raw = json.dumps(body).encode("utf-8") if body is not None else b""
+    request_headers = {"host": "testserver", **({"content-type": "application/json"} if body is not None else {}),
+                       **(headers or {})}
+    path, _, query = path.partition("?")
+    scope = {"type": "http", "method": method, "path": path, "query_string": query.encode("latin-1"),
+             "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in request_headers.items()]}
+    messages = [{"type": "http.request", "body": raw, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(disconnect_after if disconnect_after is not None else 3600)
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    if not sent:
+        return None
+    response_headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in sent[0]["headers"]}
+    return sent[0]["status"], response_headers, b"".join(message.get("body", b"") for message in sent[1:])
+
+
+def comparable(data):
+    """비교용으로 분석 결과(시간 의존 보강 기록 포함)를 뺀 응답 본문"""
+    if isinstance(data, list):
+        return [comparable(item) for item in data]
+    if isinstance(data, dict):
+        return {key: comparable(value) for key, value in data.items() if key != "analysis_result"}
+    return data
+
+
+@pytest.fixture(scope="module")
+def optimizer():
+    """보강 단계 없이 만든 PromptOptimizer를 반환합니다."""
+    optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[])
+    yield optimizer
+    optimizer.shutdown()
+
+
+@pytest.fixture(scope="module")
+def asgi_app(optimizer):
+    """테스트용 PromptOptimizer를 쓰는 ASGI 앱을 반환합니다."""
+    return PromptOptimizerASGI(optimizer)
+
+
+class TestOptimizePromptAsync:
+    """PromptOptimizer.optimize_prompt_async 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    @pytest.mark.parametrize("model_id", ["gpt-4o", "imagen-3", "unknown-model"])
+    def test_matches_sync(self, optimizer, model_id):
+        """비동기 결과가 optimize_prompt 결과와 같은지 테스트"""
+        result = asyncio.run(optimizer.optimize_prompt_async(TEXT, model_id, use_cache=False))
+        expected = optimizer.optimize_prompt(TEXT, model_id, use_cache=False)
+
+        assert result["success"] is expected["success"]
+        assert result.get("optimized_prompt") == expected.get("optimized_prompt")
+        assert result.get("generation_params") == expected.get("generation_params")
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_concurrent_requests_share_bounded_pool(self):
+        """동시 요청이 하나의 이벤트 루프에서 async_workers 개 이하의 작업 스레드로 처리되는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[], async_workers=3)
+        threads = set()
+        model = optimizer.models["gpt-4o"]
+        original = model.optimize_prompt
+        model.optimize_prompt = lambda *args: (threads.add(threading.current_thread().name), original(*args))[1]
+
+        async def run():
+            return await asyncio.gather(*[
+                optimizer.optimize_prompt_async(f"{TEXT} {n}", "gpt-4o") for n in range(CONCURRENCY)])
+
+        try:
+            assert all(result["success"] for result in asyncio.run(run()))
+            assert 1 <= len(threads) <= 3
+            assert all(name.startswith("optimize-async") for name in threads)
+        finally:
+            optimizer.shutdown()
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_cache_hit_and_store(self, optimizer):
+        """비동기 요청도 결과 캐시를 조회/저장하는지 테스트"""
+        before = optimizer.get_result_cache_stats()
+        text = f"{TEXT} 캐시"
+        first = asyncio.run(optimizer.optimize_prompt_async(text, "dalle-3"))
+        second = asyncio.run(optimizer.optimize_prompt_async(text, "dalle-3"))
+        after = optimizer.get_result_cache_stats()
+
+        assert second["optimized_prompt"] == first["optimized_prompt"]
+        assert after["hits"] - before["hits"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_cancel_skips_model_stage(self):
+        """분석 단계 중 취소되면 모델별 프롬프트 생성을 실행하지 않는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[SlowStage()], enrichment_deadline_ms=1000, preload_models=[])
+        calls = []
+        model = optimizer.models["gpt-4o"]
+        model.optimize_prompt = lambda *args: calls.append(args) or "prompt"
+
+        async def run():
+            task = asyncio.ensure_future(optimizer.optimize_prompt_async(TEXT, "gpt-4o"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # 진행 중이던 분석 단계가 끝날 때까지 기다린 뒤 확인
+            await asyncio.sleep(0.3)
+
+        try:
+            asyncio.run(run())
+            assert calls == []
+            assert optimizer.get_result_cache_stats()["size"] == 0
+        finally:
+            optimizer.shutdown()
+
+
+class TestASGIApp:
+    """ASGI 앱 라우트 테스트 (Flask 앱과 같은 응답인지 비교)"""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("method,path,body", [
+        ("GET", "/api/models", None),
+        ("GET", "/api/model/sora/info", None),
+        ("GET", "/api/model/suno/structure", None),
+        ("GET", "/api/model/unknown-model/info", None),
+        ("GET", "/api/model/unknown-model/structure", None),
+        ("GET", "/api/model/gpt-4o/tips?capability=code_generation", None),
+        ("POST", "/api/optimize", {"input_text": TEXT, "model_id": "imagen-3"}),
+        ("POST", "/api/optimize", {"input_text": TEXT, "model_id": "unknown-model"}),
+        ("POST", "/api/optimize", {"input_text": "", "model_id": "gpt-4o"}),
+        ("POST", "/api/optimize", {"model_id": "gpt-4o"}),
+        ("POST", "/api/optimize/batch", {"input_text": TEXT, "model_ids": ["gpt-4o", "dalle-3", "unknown-model"]}),
+        ("POST", "/api/optimize/batch", {"input_text": TEXT, "model_ids": []}),
+        ("POST", "/api/compare", {"model_ids": ["gpt-4o", "dalle-3"]}),
+        ("POST", "/api/compare", {"model_ids": "gpt-4o"}),
+        ("POST", "/api/unknown", {}),
+    ])
+    def test_same_as_flask(self, asgi_app, client, method, path, body):
+        """상태 코드와 JSON 본문이 Flask 앱과 같은지 테스트"""
+        status, _, raw = asyncio.run(call(asgi_app, method, path, body))
+        expected = client.open(path, method=method, json=body)
+
+        assert status == expected.status_code
+        assert comparable(json.loads(raw)) == comparable(expected.get_json())
+
+    @pytest.mark.integration
+    def test_etag_and_not_modified(self, asgi_app, client):
+        """메타데이터 응답이 Flask와 같은 ETag를 보내고 If-None-Match에 304로 답하는지 테스트"""
+        status, headers, _ = asyncio.run(call(asgi_app, "GET", "/api/model/gpt-4o/info"))
+        assert status == 200
+        assert headers["etag"] == client.get("/api/model/gpt-4o/info").headers["ETag"]
+        assert headers["cache-control"] == "no-cache"
+
+        status, _, raw = asyncio.run(call(asgi_app, "GET", "/api/model/gpt-4o/info",
+                                          headers={"If-None-Match": headers["etag"]}))
+        assert (status, raw) == (304, b"")
+
+    @pytest.mark.integration
+    def test_health_and_cache_bypass(self, asgi_app):
+        """상태 확인 응답의 결과 캐시 통계와 Cache-Control: no-cache 우회 테스트"""
+        before = json.loads(asyncio.run(call(asgi_app, "GET", "/api/health"))[2])["result_cache"]
+        body = {"input_text": f"{TEXT} 우회", "model_id": "gpt-4o"}
+        asyncio.run(call(asgi_app, "POST", "/api/optimize", body, headers={"Cache-Control": "no-cache"}))
+        asyncio.run(call(asgi_app, "POST", "/api/optimize", dict(body, use_cache=False)))
+        after = json.loads(asyncio.run(call(asgi_app, "GET", "/api/health"))[2])["result_cache"]
+
+        assert after["bypasses"] - before["bypasses"] == 2
+
+    @pytest.mark.integration
+    def test_cors(self, asgi_app):
+        """허용된 오리진에만 CORS 헤더를 보내는지 테스트"""
+        _, headers, _ = asyncio.run(call(asgi_app, "OPTIONS", "/api/optimize", headers={
+            "Origin": "http://localhost:5173", "Access-Control-Request-Method": "POST"}))
+        assert headers["access-control-allow-origin"] == "http://localhost:5173"
+        assert "POST" in headers["access-control-allow-methods"]
+
+        _, headers, _ = asyncio.run(call(asgi_app, "GET", "/api/health", headers={"Origin": "http://evil.example"}))
+        assert "access-control-allow-origin" not in headers
+
+    @pytest.mark.integration
+    def test_invalid_json_and_large_body(self, asgi_app, monkeypatch):
+        """잘못된 JSON은 400, 너무 큰 본문은 413인지 테스트"""
+        import src.asgi
+
+        status, _, raw = asyncio.run(call(asgi_app, "POST", "/api/optimize", headers={"content-type": "application/json"}))
+        assert status == 400 and json.loads(raw)["success"] is False
+
+        monkeypatch.setattr(src.asgi, "MAX_BODY_BYTES", 10)
+        status, _, _ = asyncio.run(call(asgi_app, "POST", "/api/optimize", {"input_text": TEXT, "model_id": "gpt-4o"}))
+        assert status == 413
+
+    @pytest.mark.integration
+    def test_static_files(self, tmp_path, optimizer):
+        """프론트엔드 파일은 그대로, 없는 경로는 index.html을 보내고 디렉토리 밖은 읽지 않는지 테스트"""
+        (tmp_path / "index.html").write_text("<html>index</html>", encoding="utf-8")
+        (tmp_path / "app.js").write_text("console.log(1)", encoding="utf-8")
+        app = PromptOptimizerASGI(optimizer, static_folder=str(tmp_path))
+
+        status, headers, raw = asyncio.run(call(app, "GET", "/app.js"))
+        assert status == 200 and raw == b"console.log(1)" and "javascript" in headers["content-type"]
+        for path in ["/", "/some/route", "/../test_asgi.py"]:
+            assert asyncio.run(call(app, "GET", path))[2] == b"<html>index</html>"
+
+        assert asyncio.run(call(PromptOptimizerASGI(optimizer, static_folder=str(tmp_path / "none")), "GET", "/"))[0] == 404
+
+    @pytest.mark.integration
+    def test_disconnect_cancels_request(self):
+        """처리 중 클라이언트 연결이 끊기면 응답 없이 요청을 취소하는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[SlowStage()], enrichment_deadline_ms=1000, preload_models=[])
+        app = PromptOptimizerASGI(optimizer)
+        calls = []
+        model = optimizer.models["gpt-4o"]
+        model.optimize_prompt = lambda *args: calls.append(args) or "prompt"
+
+        async def run():
+            response = await call(app, "POST", "/api/optimize", {"input_text": TEXT, "model_id": "gpt-4o"},
+                                  disconnect_after=0.05)
+            await asyncio.sleep(0.3)
+            return response
+
+        try:
+            assert asyncio.run(run()) is None
+            assert app.disconnects == 1
+            assert calls == []
+        finally:
+            optimizer.shutdown()
+
+    @pytest.mark.integration
+    def test_model_loading_off_event_loop(self):
+        """모델 지연 로딩과 결과 캐시 키 계산이 이벤트 루프 스레드에서 실행되지 않는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[])
+        app = PromptOptimizerASGI(optimizer)
+        threads = []
+        instantiate = optimizer.models._instantiate
+        make_key = optimizer.result_cache.make_key
+        optimizer.models._instantiate = lambda entry: threads.append(threading.get_ident()) or instantiate(entry)
+        optimizer.result_cache.make_key = lambda *args: threads.append(threading.get_ident()) or make_key(*args)
+
+        async def run():
+            loop_thread = threading.get_ident()
+            responses = [
+                await call(app, "POST", "/api/optimize", {"input_text": TEXT, "model_id": "gpt-4o"}),
+                await call(app, "POST", "/api/optimize", {"input_text": TEXT, "model_id": "gpt-4o"}),
+                await call(app, "GET", "/api/model/sora/info"),
+                await call(app, "GET", "/api/model/suno/structure"),
+                await call(app, "GET", "/api/model/dalle-3/tips"),
+                await call(app, "POST", "/api/compare", {"model_ids": ["imagen-3", "grok-3"]}),
+            ]
+            return loop_thread, responses
+
+        try:
+            loop_thread, responses = asyncio.run(run())
+            assert all(status == 200 for status, _, _ in responses)
+            assert set(optimizer.models.loaded) >= {"gpt-4o", "sora", "suno", "dalle-3", "imagen-3", "grok-3"}
+            assert threads and loop_thread not in threads
+        finally:
+            optimizer.shutdown()
+
+    @pytest.mark.unit
+    def test_lifespan(self):
+        """lifespan 시작 시 PromptOptimizer를 만들고 종료 시 정리하는지 테스트"""
+        app = PromptOptimizerASGI()
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(app({"type": "lifespan"}, receive, send))
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert isinstance(app.optimizer, PromptOptimizer)
+
+
+class TestASGIBenchmark:
+    """동시 요청 64개 처리 시간 벤치마크 (이벤트 루프 하나 vs 요청당 스레드, 서버 없이 앱 직접 호출)"""
+
+    @pytest.fixture
+    def optimizer(self):
+        """기본 NLP 보강 단계를 쓰고 결과 캐시는 끈 PromptOptimizer"""
+        from src.services.result_cache import OptimizationResultCache
+
+        optimizer = PromptOptimizer(preload_models=["gpt-4o"], result_cache=OptimizationResultCache(max_entries=0))
+        yield optimizer
+        optimizer.shutdown()
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="asgi-concurrency")
+    def test_asgi(self, benchmark, optimizer):
+        """ASGI 앱: 이벤트 루프 하나에서 동시 요청 처리"""
+        app = PromptOptimizerASGI(optimizer)
+        body = {"input_text": TEXT, "model_id": "gpt-4o"}
+
+        async def burst():
+            return await asyncio.gather(*[call(app, "POST", "/api/optimize", body) for _ in range(CONCURRENCY)])
+
+        responses = benchmark(lambda: asyncio.run(burst()))
+        assert all(status == 200 for status, _, _ in responses)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="asgi-concurrency")
+    def test_flask_threads(self, benchmark, optimizer, client):
+        """Flask 앱: 요청마다 스레드 하나가 전체 파이프라인을 처리 (기존 방식, 비교 기준)"""
+        import src.main
+
+        body = {"input_text": TEXT, "model_id": "gpt-4o"}
+        original = src.main.optimizer
+        src.main.optimizer = optimizer
+        try:
+            with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+                responses = benchmark(lambda: list(pool.map(
+                    lambda _: src.main.app.test_client().post("/api/optimize", json=body), range(CONCURRENCY))))
+        finally:
+            src.main.optimizer = original
+        assert all(response.status_code == 200 for response in responses)
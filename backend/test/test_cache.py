@@ -0,0 +1,129 @@
+"""
+LRUCache 단위 테스트
+"""
+
+import threading
+import pytest
+from src.utils.cache import LRUCache
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """LRUCache 클래스 테스트"""
+
+    @pytest.mark.unit
+    def test_get_and_put(self):
+        """저장한 값을 다시 가져오는지 테스트"""
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("b", "default") == "default"
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_ttl_expiration(self):
+        """유효 시간이 지난 항목이 만료되는지 테스트"""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.get_stats()["expirations"] == 1
+
+    @pytest.mark.unit
+    def test_no_ttl(self):
+        """ttl_seconds가 None이면 만료되지 않는지 테스트"""
+        clock = FakeClock()
+        cache = LRUCache(max_size=10, ttl_seconds=None, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 1e9
+        assert cache.get("a") == 1
+
+    @pytest.mark.unit
+    def test_disabled_cache(self):
+        """max_size가 0이면 저장하지 않는지 테스트"""
+        cache = LRUCache(max_size=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_stats(self):
+        """적중/미스 통계 테스트"""
+        cache = LRUCache(max_size=10)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    @pytest.mark.unit
+    def test_concurrent_access(self):
+        """여러 스레드에서 동시에 사용해도 크기 제한이 지켜지는지 테스트"""
+        cache = LRUCache(max_size=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.put((offset, i), i)
+                cache.get((offset, i - 1))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 50
+
+    @pytest.mark.unit
+    def test_max_bytes(self):
+        """값 크기 합계가 max_bytes를 넘으면 오래된 항목부터 제거하는지 테스트"""
+        cache = LRUCache(max_size=100, max_bytes=10)
+        cache.put("a", b"xxxx")
+        cache.put("b", b"xxxx")
+        cache.get("a")
+        cache.put("c", b"xxxx")
+
+        assert "b" not in cache and "a" in cache and "c" in cache
+        assert cache.get_stats()["bytes"] == 8
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.put("a", b"x")
+        cache.put("big", b"x" * 11)
+        assert "big" not in cache
+        assert cache.get_stats()["bytes"] == 5
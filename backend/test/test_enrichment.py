@@ -0,0 +1,165 @@
+"""
+분석 보강 단계(EnrichmentRunner) 단위 테스트, PromptOptimizer 연동 테스트 및 요청 비용 벤치마크
+"""
+
+import json
+import time
+import threading
+import pytest
+from src.services.enrichment import EnrichmentRunner, EnrichmentStage, NLPEnrichmentStage
+from src.services.optimizer import PromptOptimizer
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup
+
+
+class SleepStage(EnrichmentStage):
+    """지정한 시간만큼 걸리는 보강 단계"""
+
+    def __init__(self, name: str, seconds: float, fields=None):
+        self.name = name
+        self.seconds = seconds
+        self.fields = fields or {name: True}
+        self.finished = threading.Event()
+
+    def enrich(self, text):
+        time.sleep(self.seconds)
+        self.finished.set()
+        return self.fields
+
+
+class FailingStage(EnrichmentStage):
+    """항상 실패하는 보강 단계"""
+
+    name = "failing"
+
+    def enrich(self, text):
+        raise ValueError("boom")
+
+
+@pytest.fixture
+def nlp_stage():
+    """NLTK 워밍업 없이 동작하는 NLP 보강 단계를 반환합니다."""
+    return NLPEnrichmentStage(NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False))
+
+
+class TestEnrichmentRunner:
+    """시간 예산과 실행 기록 테스트"""
+
+    @pytest.mark.unit
+    def test_applies_results_within_budget(self):
+        """예산 안에 끝난 단계의 필드를 합치고 실행 시간을 기록하는지 테스트"""
+        runner = EnrichmentRunner([SleepStage("fast", 0.001)], deadline_ms=1000)
+        fields, report = runner.enrich("text")
+
+        assert fields == {"fast": True}
+        assert report["fast"]["applied"] is True and report["fast"]["status"] == "applied"
+        assert report["fast"]["elapsed_ms"] >= 1.0
+        runner.shutdown()
+
+    @pytest.mark.unit
+    def test_skips_late_stage(self):
+        """예산을 넘긴 단계는 건너뛰고 요청 스레드가 예산 이상 기다리지 않는지 테스트"""
+        slow = SleepStage("slow", 0.3)
+        runner = EnrichmentRunner([SleepStage("fast", 0.0), slow], deadline_ms=30)
+
+        start = time.perf_counter()
+        fields, report = runner.enrich("text")
+        elapsed = time.perf_counter() - start
+
+        assert fields == {"fast": True}
+        assert report["slow"] == {"applied": False, "status": "timeout", "elapsed_ms": None,
+                                  "waited_ms": report["slow"]["waited_ms"]}
+        assert elapsed < 0.2
+        slow.finished.wait(1.0)
+        runner.shutdown()
+
+    @pytest.mark.unit
+    def test_budget_counts_from_start(self):
+        """예산이 start 시점부터 계산되어 기본 분석과 겹친 시간만큼 덜 기다리는지 테스트"""
+        runner = EnrichmentRunner([SleepStage("slow", 0.3)], deadline_ms=50)
+        pending = runner.start("text")
+        time.sleep(0.06)  # 기본 분석
+
+        fields, report = pending.collect()
+        assert fields == {} and report["slow"]["status"] == "timeout"
+        assert report["slow"]["waited_ms"] < 20
+        runner.shutdown()
+
+    @pytest.mark.unit
+    def test_failing_and_rejected_stages(self):
+        """실패한 단계와 종료된 실행기를 기본 분석으로 대체하는지 테스트"""
+        runner = EnrichmentRunner([FailingStage()], deadline_ms=1000)
+        fields, report = runner.enrich("text")
+        assert fields == {} and report["failing"]["status"] == "error"
+
+        runner.shutdown()
+        fields, report = runner.enrich("text")
+        assert fields == {} and report["failing"]["status"] == "rejected"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_nlp_stage_fields(self, nlp_stage):
+        """NLP 보강 단계가 언어, 핵심 구문, 복잡도 점수를 반환하는지 테스트"""
+        fields = nlp_stage.enrich("데이터 분석 보고서를 상세하게 작성해줘")
+        assert fields["language"] == "ko"
+        assert "데이터 분석 보고서" in fields["key_phrases"]
+        assert 0.0 <= fields["complexity_score"] <= 1.0
+
+
+class TestOptimizerEnrichment:
+    """PromptOptimizer 연동 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_nlp_fields_in_analysis_result(self, nlp_stage):
+        """NLP 결과가 분석 결과에 합쳐지고 실행 기록이 남는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[nlp_stage], enrichment_deadline_ms=1000)
+        result = optimizer.optimize_prompt("밝고 화창한 날에 해변에서 뛰노는 강아지의 사진을 생성해주세요", "imagen-3")
+
+        assert result["success"] is True
+        analysis_result = result["analysis_result"]
+        assert analysis_result["language"] == "ko"
+        assert "강아지" in analysis_result["key_phrases"]
+        assert analysis_result["enrichment"]["nlp"]["applied"] is True
+        json.dumps(result, default=str)
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_late_enrichment_keeps_basic_analysis(self):
+        """보강 단계가 늦으면 기본 분석만으로 같은 프롬프트를 만드는지 테스트"""
+        slow = SleepStage("nlp", 0.3, {"language": "xx"})
+        late = PromptOptimizer(enrichment_stages=[slow], enrichment_deadline_ms=10)
+        basic = PromptOptimizer(enrichment_stages=[])
+        text = "간단한 블로그 포스트를 작성해주세요"
+
+        result = late.optimize_prompt(text, "gpt-4o")
+        assert result["success"] is True
+        assert "language" not in result["analysis_result"]
+        assert result["analysis_result"]["enrichment"]["nlp"]["status"] == "timeout"
+        assert result["optimized_prompt"] == basic.optimize_prompt(text, "gpt-4o")["optimized_prompt"]
+        assert basic.optimize_prompt(text, "gpt-4o")["analysis_result"]["enrichment"] == {}
+        slow.finished.wait(1.0)
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_additional_params_override_enrichment(self, nlp_stage):
+        """추가 매개변수가 보강 결과보다 우선하는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[nlp_stage], enrichment_deadline_ms=1000)
+        result = optimizer.optimize_prompt("Write a short poem", "gpt-4o", {"language": "ko"})
+        assert result["analysis_result"]["language"] == "ko"
+
+
+class TestEnrichmentBenchmark:
+    """요청 하나의 처리 시간 벤치마크 (NLP 보강 포함 vs 기본 분석만)"""
+
+    TEXT = "상세한 기술 문서와 데이터 시각화 차트를 포함한 고양이 사진을 만들어주세요. Realistic photo style " * 20
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="enrichment")
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_optimize_prompt(self, benchmark, nlp_stage, enabled):
+        """NLP 보강 단계를 켜고/끈 요청 처리"""
+        optimizer = PromptOptimizer(enrichment_stages=[nlp_stage] if enabled else [], enrichment_deadline_ms=50)
+        result = benchmark(optimizer.optimize_prompt, self.TEXT, "gpt-4o")
+        assert result["success"] is True
+        if benchmark.stats:
+            assert benchmark.stats.stats.mean < 0.5
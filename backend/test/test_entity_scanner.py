@@ -0,0 +1,197 @@
+"""
+EntityScanner 단위 테스트 및 엔티티 밀집 문서(연락처 목록, 로그) 벤치마크
+"""
+
+import re
+import random
+import pytest
+from src.utils.entity_scanner import EntityScanner, get_entity_scanner, to_entity_dicts
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.keyword_matcher import TokenBatch
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup
+
+# 기존 분석기들이 따로 돌리던 패턴 (비교 기준)
+LEGACY_PATTERNS = [
+    ("EMAIL", r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    ("PHONE", r'(\d{2,3}-\d{3,4}-\d{4})|(\d{10,11})'),
+    ("URL", r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'),
+    ("NUMBER", r'\b\d+(?:\.\d+)?\b'),
+]
+
+
+def legacy_extract(text: str):
+    """패턴마다 re.finditer를 따로 돌리고 대문자 단어를 re.findall로 한 번 더 찾는 기존 방식"""
+    entities = []
+    for label, pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, text):
+            entities.append({'text': match.group(), 'label': label, 'start': match.start(), 'end': match.end()})
+    words = list(set(re.findall(r'\b[A-Z][a-z]+\b', text)))
+    return entities, words
+
+
+def single_pass_extract(scanner: EntityScanner, text: str):
+    """한 번의 스캔 결과를 엔티티 딕셔너리와 대문자 단어로 나누는 방식"""
+    spans = scanner.scan(text)
+    entities = to_entity_dicts([span for span in spans if span[0] != "CAPITALIZED"])
+    words = list(dict.fromkeys(value for label, _, _, value in spans if label == "CAPITALIZED"))
+    return entities, words
+
+
+def build_contact_list(rows: int, seed: int = 3) -> str:
+    """이름, 이메일, 전화번호, 홈페이지가 줄마다 있는 연락처 목록"""
+    rng = random.Random(seed)
+    names = ["Kim", "Lee", "Park", "Choi", "Jung", "Alice", "Brown", "Garcia"]
+    lines = []
+    for i in range(rows):
+        name = rng.choice(names)
+        lines.append(
+            f"{name} {rng.choice(names)}, {name.lower()}{i}@example.co.kr, "
+            f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}, https://www.example.com/u/{i} 담당자"
+        )
+    return "\n".join(lines)
+
+
+def build_access_log(rows: int, seed: int = 5) -> str:
+    """요청 시간, 상태 코드, 응답 크기, 지연 시간, 참조 URL이 있는 접근 로그"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(rows):
+        lines.append(
+            f"2024-05-{rng.randint(10, 28)} 12:{rng.randint(10, 59)}:{rng.randint(10, 59)} GET /api/items/{i} "
+            f"{rng.choice([200, 304, 404, 500])} {rng.randint(100, 99999)} {rng.random() * 100:.3f}ms "
+            f"ref=https://app.example.com/page?id={i} Mozilla Chrome user{i}@mail.example.org"
+        )
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    """공유 EntityScanner를 반환합니다."""
+    return get_entity_scanner()
+
+
+class TestEntityScanner:
+    """한 번의 스캔으로 유형과 위치를 추출하는지 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_typed_spans_in_one_pass(self, scanner):
+        """유형별 라벨과 위치가 원문과 일치하는지 테스트"""
+        text = "Kim 담당 kim@example.co.kr 010-1234-5678 01012345678 https://example.com/a?b=1 3.5초 2024"
+        spans = scanner.scan(text)
+
+        assert [label for label, _, _, _ in spans] == [
+            "CAPITALIZED", "EMAIL", "PHONE", "PHONE", "URL", "NUMBER", "NUMBER"
+        ]
+        assert all(text[start:end] == value for _, start, end, value in spans)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_matched_spans_are_consumed(self, scanner):
+        """이메일/URL/전화번호 안의 숫자나 단어를 따로 추출하지 않는지 테스트"""
+        spans = scanner.scan("Mail John.Smith@corp.com, call 02-123-4567, visit https://v2.example.com/3")
+        assert [value for _, _, _, value in spans] == [
+            "Mail", "John.Smith@corp.com", "02-123-4567", "https://v2.example.com/3"
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_korean_particle_boundaries(self, scanner):
+        """한글 조사가 바로 붙은 영어 단어와 숫자를 추출하는지 테스트"""
+        assert scanner.values("Apple과 Google의 JavaScript를 GPT로 비교", "CAPITALIZED") == ["Apple", "Google", "JavaScript"]
+        assert scanner.values("연락처는 5678입니다, v2 버전, 3.5초", "NUMBER") == ["5678", "3.5"]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_dedupe_and_order(self):
+        """다른 출처의 엔티티와 합칠 때 중복을 제거하고 위치 순으로 정렬하는지 테스트"""
+        spans = [("NUMBER", 0, 2, "10"), ("NUMBER", 20, 22, "30")]
+        extra = [("ORG", 10, 14, "삼성전자"), ("ORG", 10, 14, "삼성전자")]
+        assert to_entity_dicts(spans, extra) == [
+            {'text': "10", 'label': "NUMBER", 'start': 0, 'end': 2},
+            {'text': "삼성전자", 'label': "ORG", 'start': 10, 'end': 14},
+            {'text': "30", 'label': "NUMBER", 'start': 20, 'end': 22},
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_custom_patterns(self):
+        """패턴 목록을 바꿔 다른 유형을 스캔할 수 있는지 테스트"""
+        custom = EntityScanner([("HASHTAG", r'#\w+'), ("NUMBER", r'\d+')])
+        assert custom.labels == ("HASHTAG", "NUMBER")
+        assert custom.scan("#tag1 42") == [("HASHTAG", 0, 5, "#tag1"), ("NUMBER", 6, 8, "42")]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_values_many_matches_values(self, scanner):
+        """토큰 단위 배치 스캔이 텍스트별 values와 같은지 테스트 (이메일/URL 안의 단어 제외 포함)"""
+        texts = [
+            "", "Apple과 Google의 JavaScript", "Mail John.Smith@Example.com or https://Example.com/Path Now",
+            "Apple Apple\tBanana", "010-1234-5678 Seoul 3.5", "  Padded  Text  "
+        ]
+        tokens = TokenBatch(texts)
+
+        for label in scanner.labels:
+            assert scanner.values_many(tokens, label) == [scanner.values(text, label) for text in texts]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_values_many_custom_patterns(self):
+        """공백을 넘을 수 있는 사용자 지정 패턴은 텍스트마다 스캔하는지 테스트"""
+        custom = EntityScanner([("PAIR", r'[A-Z]\w+ [A-Z]\w+')])
+        texts = ["New York and Los Angeles", "no match"]
+        assert custom.values_many(TokenBatch(texts), "PAIR") == [["New York", "Los Angeles"], []]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_analyzers_share_scanner(self, scanner):
+        """InputAnalyzer와 NLPAnalyzer가 같은 스캐너를 쓰고 같은 구간을 내보내는지 테스트"""
+        analyzer = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False)
+        text = "문의는 help@example.com 또는 010-1234-5678, 자료는 https://example.com 에서 2024년까지"
+
+        assert InputAnalyzer()._entity_scanner is scanner is analyzer._entity_scanner
+        entities = analyzer.analyze(text).entities
+        assert [(entity['label'], entity['text']) for entity in entities] == [
+            ("EMAIL", "help@example.com"), ("PHONE", "010-1234-5678"),
+            ("URL", "https://example.com"), ("NUMBER", "2024")
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("build", [build_contact_list, build_access_log])
+    def test_same_typed_entities_as_legacy(self, scanner, build):
+        """엔티티 밀집 문서에서 기존 방식이 찾던 이메일/URL을 모두 같은 위치로 찾는지 테스트"""
+        text = build(200)
+        legacy, _ = legacy_extract(text)
+        current = scanner.entities(text)
+
+        for label in ("EMAIL", "URL"):
+            expected = [entity for entity in legacy if entity['label'] == label]
+            assert expected and [entity for entity in current if entity['label'] == label] == expected
+
+
+class TestEntityScannerBenchmark:
+    """엔티티 밀집 문서 추출 벤치마크 (단일 스캔 vs 패턴별 스캔)"""
+
+    DOCUMENTS = {
+        "contacts": build_contact_list(2000),
+        "access-log": build_access_log(2000),
+    }
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="entity-scanner")
+    @pytest.mark.parametrize("document", ["contacts", "access-log"])
+    def test_single_pass(self, benchmark, scanner, document):
+        """공유 스캐너 한 번으로 엔티티와 대문자 단어 추출"""
+        text = self.DOCUMENTS[document]
+        entities, words = benchmark(single_pass_extract, scanner, text)
+        assert entities and words
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="entity-scanner")
+    @pytest.mark.parametrize("document", ["contacts", "access-log"])
+    def test_legacy_passes(self, benchmark, document):
+        """패턴마다 따로 스캔 (비교 기준)"""
+        text = self.DOCUMENTS[document]
+        entities, words = benchmark(legacy_extract, text)
+        assert entities and words
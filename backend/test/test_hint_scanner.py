@@ -0,0 +1,410 @@
+"""
+HintScanner 단위 테스트 및 벤치마크
+"""
+
+import re
+import random
+import pytest
+from typing import Dict, Any
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.hint_scanner import HintScanner
+
+
+# 기존 InputAnalyzer의 패턴별 re.search/re.findall 구현 (비교 기준)
+def legacy_structure_hints(text: str) -> Dict[str, Any]:
+    """텍스트에서 출력 구조에 관한 힌트를 추출합니다."""
+    structure_hints = {
+        "format": None,
+        "sections": [],
+        "length": None
+    }
+
+    # 형식 힌트 추출
+    format_patterns = {
+        "list": r'목록|리스트|항목|bullet|list',
+        "table": r'표|테이블|table',
+        "essay": r'에세이|논설|essay',
+        "code": r'코드|프로그램|함수|code|function',
+        "json": r'json|제이슨|JSON',
+        "markdown": r'마크다운|markdown|MD'
+    }
+
+    for format_type, pattern in format_patterns.items():
+        if re.search(pattern, text, re.IGNORECASE):
+            structure_hints["format"] = format_type
+            break
+
+    # 섹션 힌트 추출
+    section_matches = re.findall(r'섹션|부분|챕터|section|part|chapter', text, re.IGNORECASE)
+    if section_matches:
+        # 섹션 수 추정 (간단한 로직)
+        numbers = re.findall(r'\d+', text)
+        if numbers:
+            structure_hints["sections"] = [f"Section {i+1}" for i in range(min(int(numbers[0]), 10))]
+
+    # 길이 힌트 추출
+    length_patterns = {
+        "short": r'짧은|간단한|short|brief',
+        "medium": r'중간|medium',
+        "long": r'긴|상세한|포괄적인|long|detailed|comprehensive'
+    }
+
+    for length_type, pattern in length_patterns.items():
+        if re.search(pattern, text, re.IGNORECASE):
+            structure_hints["length"] = length_type
+            break
+
+    # 구체적인 단어/문장 수 힌트 추출
+    word_count_match = re.search(r'(\d+)\s*(단어|words)', text, re.IGNORECASE)
+    if word_count_match:
+        structure_hints["word_count"] = int(word_count_match.group(1))
+
+    sentence_count_match = re.search(r'(\d+)\s*(문장|sentences)', text, re.IGNORECASE)
+    if sentence_count_match:
+        structure_hints["sentence_count"] = int(sentence_count_match.group(1))
+
+    return structure_hints
+
+def legacy_constraints(text: str) -> Dict[str, Any]:
+    """텍스트에서 제약 조건을 추출합니다."""
+    constraints = {
+        "include": [],
+        "exclude": [],
+        "tone": None,
+        "audience": None,
+        "time_constraint": None
+    }
+
+    # 포함해야 할 요소 추출
+    include_matches = re.findall(r'포함해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*([^.!?]*)', text)
+    include_matches += re.findall(r'반드시\s*([^.!?]*)', text)
+    include_matches += re.findall(r'include\s*([^.!?]*)', text, re.IGNORECASE)
+
+    for match in include_matches:
+        if match.strip():
+            constraints["include"].append(match.strip())
+
+    # 제외해야 할 요소 추출
+    exclude_matches = re.findall(r'제외해야?\s*(?:함|합니다|할?|하세요)[\s\.:]*([^.!?]*)', text)
+    exclude_matches += re.findall(r'포함하지?\s*(?:말아야|마세요|않음|않습니다)[\s\.:]*([^.!?]*)', text)
+    exclude_matches += re.findall(r'exclude\s*([^.!?]*)', text, re.IGNORECASE)
+    exclude_matches += re.findall(r'avoid\s*([^.!?]*)', text, re.IGNORECASE)
+
+    for match in exclude_matches:
+        if match.strip():
+            constraints["exclude"].append(match.strip())
+
+    # 톤/어조 추출
+    tone_patterns = {
+        "professional": r'전문적|프로페셔널|professional',
+        "friendly": r'친근한|우호적|friendly',
+        "formal": r'격식|공식적|formal',
+        "informal": r'비격식|informal|casual',
+        "enthusiastic": r'열정적|enthusiastic',
+        "serious": r'진지한|serious',
+        "humorous": r'유머러스|재미있는|humorous|funny'
+    }
+
+    for tone, pattern in tone_patterns.items():
+        if re.search(pattern, text, re.IGNORECASE):
+            constraints["tone"] = tone
+            break
+
+    # 대상 독자 추출
+    audience_patterns = {
+        "general": r'일반|대중|general|public',
+        "expert": r'전문가|expert|specialist',
+        "beginner": r'초보자|입문자|beginner|novice',
+        "children": r'어린이|아동|children|kids',
+        "teenager": r'청소년|teenager|adolescent',
+        "adult": r'성인|adult'
+    }
+
+    for audience, pattern in audience_patterns.items():
+        if re.search(pattern, text, re.IGNORECASE):
+            constraints["audience"] = audience
+            break
+
+    # 시간 제약 추출
+    time_match = re.search(r'(\d+)\s*(분|시간|hours?|minutes?)', text, re.IGNORECASE)
+    if time_match:
+        value = int(time_match.group(1))
+        unit = time_match.group(2)
+
+        if '시간' in unit or 'hour' in unit.lower():
+            constraints["time_constraint"] = f"{value} hours"
+        else:
+            constraints["time_constraint"] = f"{value} minutes"
+
+    return constraints
+
+
+SAMPLE_FRAGMENTS = [
+    "목록", "리스트", "표", "table", "에세이", "코드", "function", "JSON", "markdown", "MD",
+    "짧은", "중간", "긴", "상세한", "detailed", "섹션", "part", "chapter",
+    "3", "12", "500", " 단어", " words", "문장", " sentences", "분", "시간", " hours", "minutes",
+    "전문적", "친근한", "formal", "informal", "비격식", "casual", "진지한", "funny",
+    "일반", "전문가", "초보자", "어린이", "teenager", "adult",
+    "포함해야 함", "포함해야 합니다: ", "반드시 ", "include ", "Include ",
+    "제외해야 함.", "포함하지 마세요 ", "exclude ", "avoid ", "AVOID ",
+    "사진", "hello", " ", " ", "\n", ".", "!", "?", ":", "그리고 ",
+]
+
+
+def build_document(size_chars: int, dense: bool = True) -> str:
+    """
+    벤치마크용 장문 입력을 생성합니다.
+
+    dense가 False이면 앞부분의 요청문 뒤에 힌트가 거의 없는 본문이 붙은
+    (긴 문서를 붙여넣은) 형태의 입력을 만듭니다.
+    """
+    paragraph = (
+        "이 문서는 제품 소개서의 초안입니다. 각 섹션은 3개의 문단으로 구성되어야 하며 전체는 약 500 단어 분량입니다. "
+        "독자는 일반 사용자이며 친근한 톤을 유지해주세요. 반드시 가격 정보와 지원 채널을 포함해야 합니다. "
+        "경쟁사 비교는 포함하지 마세요. The appendix should include a short FAQ and avoid marketing jargon. "
+    )
+    if dense:
+        return (paragraph * (size_chars // len(paragraph) + 1))[:size_chars]
+
+    body = (
+        "우리 회사는 작년부터 고객 지원 흐름을 다시 설계해 왔고 그 과정에서 많은 것을 배웠습니다. "
+        "We moved the onboarding flow to the new workspace and the feedback from users was encouraging. "
+    )
+    return (paragraph + body * (size_chars // len(body) + 1))[:size_chars]
+
+
+class TestHintScanner:
+    """HintScanner가 기존 패턴별 검색과 같은 결과를 내는지 테스트"""
+
+    @pytest.fixture
+    def scanner(self):
+        """HintScanner 인스턴스를 반환합니다."""
+        return HintScanner()
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", [
+        "",
+        "목록 형태로 정리해주세요",
+        "informal 하지만 formal 한 문서",
+        "3개의 섹션으로 나눈 200 단어, 5 문장 분량의 상세한 markdown 문서",
+        "반드시 가격을 넣고 반드시 날짜도. 포함해야 함: 로고. 제외해야 함. 경쟁사 이름!",
+        "Please include charts. Avoid jargon? exclude the appendix",
+        "2 hours 안에 끝내야 하는 30분짜리 발표, 청소년과 성인 대상",
+        "포함하지 않습니다 광고 문구. 포함해야 합니다 연락처",
+        build_document(3000),
+    ])
+    def test_matches_legacy_extraction(self, scanner, text):
+        """대표 입력에 대해 기존 구현과 결과가 같은지 테스트"""
+        structure_hints, constraints = scanner.scan(text)
+        assert structure_hints == legacy_structure_hints(text)
+        assert constraints == legacy_constraints(text)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_random_inputs_match_legacy_extraction(self, scanner):
+        """무작위 조각 조합에 대해서도 결과가 같은지 테스트"""
+        rng = random.Random(11)
+        for _ in range(500):
+            text = "".join(rng.choice(SAMPLE_FRAGMENTS) for _ in range(rng.randint(0, 25)))
+            structure_hints, constraints = scanner.scan(text)
+            assert structure_hints == legacy_structure_hints(text), text
+            assert constraints == legacy_constraints(text), text
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_analyzer_uses_single_scan(self):
+        """analyze()가 구조 힌트와 제약 조건을 위해 한 번만 스캔하는지 테스트"""
+        analyzer = InputAnalyzer()
+        calls = []
+        original_scan = analyzer._hint_scanner.scan
+        analyzer._hint_scanner.scan = lambda text: calls.append(text) or original_scan(text)
+
+        result = analyzer.analyze("전문가를 위한 표 형식의 긴 보고서", "gpt-4o")
+
+        assert result["structure_hints"]["format"] == "table"
+        assert result["constraints"]["audience"] == "expert"
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_scan_many_matches_scan(self, scanner):
+        """구분 문자로 이어 붙인 배치 스캔이 텍스트별 스캔과 같은지 테스트"""
+        rng = random.Random(11)
+        texts = ["", "포함해야", "합니다 상세한", "3", "0 단어", "avoid!", "반드시 "] + [
+            "".join(rng.choice(SAMPLE_FRAGMENTS) for _ in range(rng.randint(0, 12)))
+            for _ in range(300)
+        ]
+
+        assert scanner.scan_many(texts) == [scanner.scan(text) for text in texts]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_scan_many_edge_inputs(self, scanner):
+        """대소문자, 앞뒤 공백, 길이가 바뀌는 소문자 변환, 캡처/입력 길이 상한에서도 같은지 테스트"""
+        texts = [
+            "  Include the Python Logo!  ", "DETAILED JSON LIST 3 SECTIONS 500 WORDS 2 HOURS",
+            "İstanbul 안내 3 섹션 10분", "ΟΔΟΣ Σ markdown", "반드시 " + "로고 " * 400,
+            "상세한 보고서. " * 3000, "12345678901234 단어 7 sentences", "Avoid jargon.Include charts"
+        ]
+
+        assert scanner.scan_many(texts) == [scanner.scan(text) for text in texts]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_tables_are_literal(self, scanner):
+        """배치 스캔이 토큰 단위 리터럴 매칭을 쓸 수 있는지 (패턴이 공백 없는 리터럴 교대인지) 테스트"""
+        assert scanner._batch_matcher is not None
+
+
+def build_adversarial(kind: str, size_chars: int) -> str:
+    """
+    캡처 구간이 서로 겹치거나 길게 늘어나는 최악의 입력을 생성합니다.
+
+    - triggers: 문장 끝 없이 포함/제외 트리거가 반복 (트리거마다 끝까지 캡처)
+    - prefix: "포함해야 합니다:" 접두사가 반복
+    - digits: 수천 자리 숫자열이 반복
+    - spaces: 숫자 뒤에 긴 공백이 이어진 단어 수 힌트가 반복
+    """
+    units = {
+        "triggers": "반드시 include avoid exclude ",
+        "prefix": "포함해야 합니다: ",
+        "digits": "1" * 5000 + " ",
+        "spaces": "3" + " " * 1000 + "단어 "
+    }
+    unit = units[kind]
+    return (unit * (size_chars // len(unit) + 1))[:size_chars]
+
+
+class TestHintScannerLimits:
+    """입력/캡처 길이 상한과 잘림 보고 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_input_truncated_at_sentence_boundary(self):
+        """입력 길이 상한을 넘으면 포함/제외 조건은 상한 안의 마지막 문장 끝까지만 찾는지 테스트"""
+        scanner = HintScanner(max_input_chars=40)
+        text = "친근한 톤으로 써주세요. 반드시 로고를 넣어주세요! 전문가 대상이며 표 형식입니다. 반드시 차트"
+
+        structure_hints, constraints = scanner.scan(text)
+
+        assert constraints["tone"] == "friendly"
+        assert constraints["include"] == ["로고를 넣어주세요"]
+        assert constraints["truncated"] == {
+            "input_chars": len(text),
+            "analyzed_chars": text.index("!") + 1,
+            "capped_captures": 0
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_structure_hints_scan_whole_input(self):
+        """입력 길이 상한 뒤의 구조 힌트, 대상 독자, 시간도 찾는지 테스트"""
+        scanner = HintScanner(max_input_chars=40)
+        text = "반드시 로고를 넣어주세요. " + "가" * 60 + ". 전문가 대상이며 표 형식, 3 섹션, 10 분. 반드시 차트"
+
+        structure_hints, constraints = scanner.scan(text)
+
+        assert structure_hints["format"] == "table"
+        assert structure_hints["sections"] == ["Section 1", "Section 2", "Section 3"]
+        assert constraints["audience"] == "expert"
+        assert constraints["time_constraint"] == "10 minutes"
+        assert constraints["include"] == ["로고를 넣어주세요"]
+        assert constraints["truncated"]["analyzed_chars"] == text.index(".") + 1
+        assert (structure_hints, constraints) == HintScanner(max_input_chars=40).scan_many([text])[0]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_input_truncated_without_sentence_boundary(self):
+        """상한 안에 문장 끝이 없으면 상한 위치에서 자르는지 테스트"""
+        scanner = HintScanner(max_input_chars=10)
+        assert scanner.analyzed_length("a" * 25) == 10
+        assert scanner.analyzed_length("a" * 10) == 10
+        assert HintScanner(max_input_chars=None).analyzed_length("a" * 25) == 25
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_capture_length_capped(self):
+        """포함/제외 조건 캡처가 상한 길이에서 끊기고 잘림이 보고되는지 테스트"""
+        scanner = HintScanner(max_capture_chars=5)
+
+        structure_hints, constraints = scanner.scan("반드시 가나다라마바사. exclude ab")
+
+        assert constraints["include"] == ["가나다라마"]
+        assert constraints["exclude"] == ["ab"]
+        assert constraints["truncated"]["capped_captures"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_no_truncation_key_for_normal_input(self):
+        """잘림이 없으면 constraints에 truncated 키가 없는지 테스트"""
+        structure_hints, constraints = HintScanner().scan(build_document(3000))
+        assert "truncated" not in constraints
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_long_digit_runs_ignored(self):
+        """MAX_NUMBER_DIGITS보다 긴 숫자열은 숫자 힌트로 쓰지 않는지 테스트"""
+        structure_hints, constraints = HintScanner().scan("1" * 5000 + " 섹션, 3 단어, 2 시간")
+
+        assert structure_hints["sections"] == ["Section 1", "Section 2", "Section 3"]
+        assert structure_hints["word_count"] == 3
+        assert constraints["time_constraint"] == "2 hours"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("kind", ["triggers", "prefix", "digits", "spaces"])
+    def test_adversarial_input_bounded(self, kind):
+        """최악의 입력에서도 분석 길이와 캡처 길이가 상한을 넘지 않는지 테스트"""
+        scanner = HintScanner()
+        text = build_adversarial(kind, 200_000)
+
+        structure_hints, constraints = scanner.scan(text)
+
+        assert constraints["truncated"]["analyzed_chars"] <= scanner.max_input_chars
+        assert all(len(value) <= scanner.max_capture_chars for value in constraints["include"] + constraints["exclude"])
+
+
+class TestHintScannerBenchmark:
+    """장문 입력에 대한 단일 패스 스캐너 벤치마크"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="hint-scan")
+    @pytest.mark.parametrize("size_chars", [10_000, 100_000])
+    @pytest.mark.parametrize("dense", [True, False])
+    def test_fused_scanner(self, benchmark, size_chars, dense):
+        """단일 패스 스캐너 (입력 길이 상한 없이 전체 스캔)"""
+        scanner = HintScanner(max_input_chars=None)
+        text = build_document(size_chars, dense)
+        structure_hints, constraints = benchmark(scanner.scan, text)
+        assert constraints["tone"] == "friendly"
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="hint-scan")
+    @pytest.mark.parametrize("size_chars", [10_000, 100_000])
+    @pytest.mark.parametrize("dense", [True, False])
+    def test_legacy_extraction(self, benchmark, size_chars, dense):
+        """기존 패턴별 검색 (비교 기준)"""
+        text = build_document(size_chars, dense)
+        constraints = benchmark(lambda: (legacy_structure_hints(text), legacy_constraints(text))[1])
+        assert constraints["tone"] == "friendly"
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="hint-adversarial")
+    @pytest.mark.parametrize("kind", ["triggers", "prefix", "digits", "spaces"])
+    @pytest.mark.parametrize("size_chars", [20_000, 200_000])
+    def test_adversarial_capped(self, benchmark, kind, size_chars):
+        """기본 상한 적용: 포함/제외 캡처 비용은 상한으로 일정하고 나머지 패턴은 입력 길이에 선형"""
+        scanner = HintScanner()
+        text = build_adversarial(kind, size_chars)
+        structure_hints, constraints = benchmark(scanner.scan, text)
+        assert constraints.get("truncated", {}).get("analyzed_chars", len(text)) <= scanner.max_input_chars
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="hint-adversarial")
+    @pytest.mark.parametrize("kind", ["triggers", "prefix"])
+    def test_adversarial_uncapped(self, benchmark, kind):
+        """상한 없는 캡처 (비교 기준): 트리거마다 문장 끝까지 캡처하여 입력 길이의 제곱에 비례"""
+        scanner = HintScanner(max_input_chars=None, max_capture_chars=10 ** 8)
+        text = build_adversarial(kind, 20_000)
+        benchmark.pedantic(scanner.scan, args=(text,), rounds=3)
@@ -0,0 +1,157 @@
+"""
+IncrementalAnalysisSession 단위 테스트 및 벤치마크
+"""
+
+import random
+import pytest
+from src.utils.input_analyzer import InputAnalyzer
+
+
+BASE_TEXT = "전문가를 위한 상세한 데이터 분석 보고서를 3 섹션으로 작성해주세요. 반드시 차트를 포함해야 합니다. "
+TYPED_TEXT = "표 형식으로 핵심 지표를 요약하고, 마지막에 결론을 친근한 톤으로 정리해주세요. "
+
+# 무작위 편집에 쓰는 조각: 키워드, 힌트 트리거, 숫자, 문장 부호, 공백이 서로 이어지도록 구성
+FRAGMENTS = [
+    "포함해야 합니다. ", "반드시 차트", "include logos", " 5 words", "3 섹션", "전문가", "상세한 ",
+    "데이터 분석", "10 분", ". ", "! ", "  ", "exclude ads", "포함하지 마세요:", "json", "hours",
+    "1", "2", " ", "a", "Hello World ", "시각화", "언어 변환", "중요 포인트"
+]
+
+
+def full_analysis(analyzer: InputAnalyzer, text: str, model_id: str = "gpt-4o"):
+    """같은 텍스트를 처음부터 분석한 결과 (비교 기준)"""
+    return analyzer.analyze(text, model_id).copy()
+
+
+class TestIncrementalAnalysisSession:
+    """IncrementalAnalysisSession 클래스 테스트"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """캐시를 쓰지 않는 InputAnalyzer 인스턴스를 반환합니다."""
+        return InputAnalyzer(cache_size=0)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_typing_matches_full_analysis(self, analyzer):
+        """한 글자씩 입력할 때마다 전체 분석과 같은 결과를 반환하는지 테스트"""
+        session = analyzer.start_session("gpt-4o")
+        for char in BASE_TEXT + TYPED_TEXT:
+            result = session.append(char)
+            assert result == full_analysis(analyzer, session.text)
+
+        assert session.text == BASE_TEXT + TYPED_TEXT
+        assert session.full_scans == 1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_random_edits_match_full_analysis(self, analyzer):
+        """무작위 삽입/삭제/치환 후에도 전체 분석과 같은 결과인지 테스트"""
+        rng = random.Random(1)
+        for _ in range(40):
+            session = analyzer.start_session("dall-e-3")
+            for _ in range(30):
+                text = session.text
+                start = rng.randint(0, len(text))
+                end = rng.randint(start, min(len(text), start + 8))
+                replacement = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 2)))
+                if rng.random() < 0.5:
+                    result = session.apply(start, end, replacement)
+                else:
+                    result = session.set_text(text[:start] + replacement + text[end:])
+                assert result == full_analysis(analyzer, session.text, "dall-e-3"), session.text
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_length_changing_lowercase_matches_full_analysis(self, analyzer):
+        """소문자 변환 후 길이가 달라지는 텍스트(전체 스캔 경로)도 전체 분석과 같은지 테스트"""
+        for text in ["İ 공식적", "İİİ 상세한 보고서", "ﬁ 전문가를 위한 데이터 분석"]:
+            session = analyzer.start_session("gpt-4o", text)
+            assert session.analysis() == full_analysis(analyzer, text), text
+
+        rng = random.Random(2)
+        fragments = FRAGMENTS + ["İ", "İİ 공식적", "ﬁle"]
+        session = analyzer.start_session("gpt-4o", "İ ")
+        for _ in range(200):
+            text = session.text
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + 8))
+            replacement = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 2)))
+            result = session.apply(start, end, replacement)
+            assert result == full_analysis(analyzer, session.text), session.text
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_hints_follow_edits(self, analyzer):
+        """편집 위치 뒤의 힌트와 앞쪽 캡처가 함께 갱신되는지 테스트"""
+        session = analyzer.start_session("gpt-4o", "3 섹션으로 작성. 반드시 차트")
+
+        result = session.append("와 표.")
+        assert result["constraints"]["include"] == ["차트와 표"]
+        assert result["structure_hints"]["sections"] == ["Section 1", "Section 2", "Section 3"]
+
+        result = session.apply(0, 1, "2")
+        assert result["structure_hints"]["sections"] == ["Section 1", "Section 2"]
+        assert result["constraints"]["include"] == ["차트와 표"]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_rebuild_keyword_index_triggers_full_scan(self, analyzer):
+        """키워드 사전을 다시 만들면 다음 편집에서 전체 스캔하는지 테스트"""
+        session = analyzer.start_session("gpt-4o", "노래를 ")
+        analyzer.task_keywords["music_creation"] = ["작곡", "노래"]
+        analyzer.rebuild_keyword_index()
+
+        result = session.append("작곡해줘")
+
+        assert session.full_scans == 2
+        assert result["task_type"][0] == ("music_creation", 1.0)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_invalid_range(self, analyzer):
+        """잘못된 편집 구간은 ValueError를 발생시키는지 테스트"""
+        session = analyzer.start_session("gpt-4o", "abc")
+        with pytest.raises(ValueError):
+            session.apply(2, 1, "x")
+        with pytest.raises(ValueError):
+            session.apply(0, 4, "x")
+
+
+class TestIncrementalAnalysisBenchmark:
+    """입력 중 한 글자 편집에 대한 증분 분석 vs 전체 재분석 벤치마크"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="incremental-analysis")
+    @pytest.mark.parametrize("repeat", [1, 5])
+    def test_keystroke_incremental(self, benchmark, repeat):
+        """증분 세션: 문서 끝에서 한 문장을 한 글자씩 입력"""
+        analyzer = InputAnalyzer(cache_size=0)
+        base = BASE_TEXT * 15 * repeat
+
+        def setup():
+            return (analyzer.start_session("gpt-4o", base),), {}
+
+        def type_sentence(session):
+            for char in TYPED_TEXT:
+                result = session.append(char)
+            return result
+
+        result = benchmark.pedantic(type_sentence, setup=setup, rounds=20)
+        assert result["input_text"] == base + TYPED_TEXT
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="incremental-analysis")
+    @pytest.mark.parametrize("repeat", [1, 5])
+    def test_keystroke_full(self, benchmark, repeat):
+        """기존 방식: 글자마다 전체 텍스트를 다시 분석 (비교 기준)"""
+        analyzer = InputAnalyzer(cache_size=0)
+        base = BASE_TEXT * 15 * repeat
+
+        def type_sentence():
+            for index in range(1, len(TYPED_TEXT) + 1):
+                result = analyzer.analyze(base + TYPED_TEXT[:index], "gpt-4o").copy()
+            return result
+
+        result = benchmark.pedantic(type_sentence, rounds=3)
+        assert result["input_text"] == base + TYPED_TEXT
@@ -2,9 +2,15 @@
 InputAnalyzer 클래스 단위 테스트
 """
 
+import re
+import random
+import tracemalloc
 import pytest
 from typing import Dict, Any, List
+from src.utils import input_analyzer as input_analyzer_module
 from src.utils.input_analyzer import InputAnalyzer
+from src.utils.keyword_matcher import TokenBatch
+from src.utils.korean_tokenizer import get_korean_tokenizer
 
 
 class TestInputAnalyzer:
@@ -377,4 +383,339 @@ class TestInputAnalyzer:
         assert "visual_creation" in task_types or "general" in task_types
         
         # 복잡성이 평가되었는지 확인
-        assert result["complexity"] in ["low", "medium", "high"] 
\ No newline at end of file
+        assert result["complexity"] in ["low", "medium", "high"] 
+
+class TestModelCategoryIndex:
+    """모델 ID -> 카테고리 색인 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_registered_categories_take_precedence(self):
+        """등록된 모델 ID는 색인에서 조회하고, 나머지는 기존 추정 방식을 쓰는지 테스트"""
+        analyzer = InputAnalyzer()
+        analyzer.register_model_categories({"imagen-3": "image", "suno": "music", "gpt-4o-image": "image"})
+
+        assert analyzer._get_model_category("imagen-3") == "image"
+        assert analyzer._get_model_category("suno") == "music"
+        assert analyzer._get_model_category("gpt-4o-image") == "image"
+        assert analyzer._get_model_category("gpt-4o") == "text"
+        assert analyzer._get_model_category("runway-gen-3") == "video"
+        assert analyzer.analyze("노래", "suno")["model_category"] == "music"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_base_model_category_from_capabilities(self):
+        """BaseModel.category가 capabilities의 생성 기능으로 결정되는지 테스트"""
+        from src.models.image_models.imagen3_model import Imagen3Model
+        from src.models.text_models.gpt_o3_model import GPTo3Model
+
+        model = Imagen3Model()
+        assert model.category == "image"
+        model.capabilities = ["style_transfer", "video_generation", "image_generation"]
+        assert model.category == "video"
+        # 생성 기능이 없으면 텍스트 모델
+        assert GPTo3Model().category == "text"
+
+
+def legacy_extract_keywords(text: str) -> List[str]:
+    """기존 InputAnalyzer의 빈도 딕셔너리 + 전체 정렬 방식에 조사/어미 제거를 더한 비교 기준"""
+    words = re.findall(r'\b\w+\b', text.lower())
+    stopwords = ["그", "이", "저", "것", "수", "를", "에", "의", "가", "은", "는", "이다", "있다", "하다", "있", "하", "되"]
+    stem = get_korean_tokenizer().stem
+    keywords = [word for word in words if word not in stopwords and len(word) > 1]
+    keywords = [stem(word) for word in keywords if stem(word) not in stopwords]
+    keyword_freq = {}
+    for word in keywords:
+        keyword_freq[word] = keyword_freq.get(word, 0) + 1
+    sorted_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)
+    return [word for word, freq in sorted_keywords[:10]]
+
+
+class TestKeywordExtraction:
+    """상위 k개 키워드 추출 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_matches_legacy_ordering(self, monkeypatch):
+        """구간 경계를 포함한 무작위 입력에서 기존과 같은 순서를 반환하는지 테스트"""
+        analyzer = InputAnalyzer()
+        # 짧은 구간으로 나눠도 결과가 같은지 확인
+        monkeypatch.setattr(input_analyzer_module, "KEYWORD_CHUNK_CHARS", 7)
+        rng = random.Random(5)
+        vocabulary = ["데이터", "분석", "이다", "있다", "a", "Ab", "AB", "x_y", "그", "İstanbul", "ΣΑΣ", "World", "123", "1"]
+
+        for _ in range(500):
+            text = "".join(
+                rng.choice(vocabulary) + rng.choice(["", " ", ".", "-", "\n"])
+                for _ in range(rng.randint(0, 40))
+            )
+            assert analyzer._extract_keywords(text) == legacy_extract_keywords(text), text
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_configurable_top_k(self):
+        """반환할 키워드 수를 설정할 수 있는지 테스트"""
+        text = "d d d d c c c b b a a e"
+        assert InputAnalyzer(keyword_top_k=2)._extract_keywords("dd dd cc cc cc bb") == ["cc", "dd"]
+        assert InputAnalyzer()._extract_keywords("dd dd cc cc cc bb", top_k=1) == ["cc"]
+        assert InputAnalyzer()._extract_keywords(text) == []
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_memory_flat_for_large_input(self):
+        """입력 크기와 무관하게 추가 메모리가 구간 크기 수준에 머무는지 테스트"""
+        analyzer = InputAnalyzer()
+        text = "상세한 기술 문서와 데이터 분석 보고서를 작성해주세요. The quick brown fox. " * 40000
+
+        tracemalloc.start()
+        try:
+            keywords = analyzer._extract_keywords(text)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert keywords[:3] == ["상세", "기술", "문서"]
+        # 입력(약 2.8M 글자)의 토큰 목록이나 소문자 사본을 만들지 않음
+        assert peak < 4 * 1024 * 1024
+
+
+class TestKeywordExtractionBenchmark:
+    """장문 입력에 대한 상위 k개 키워드 추출 벤치마크"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keywords-topk")
+    @pytest.mark.parametrize("repeat", [50, 20000])
+    def test_counter_heap(self, benchmark, repeat):
+        """구간 단위 Counter + 힙 선택"""
+        analyzer = InputAnalyzer()
+        text = "상세하고 전문적인 기술 문서와 데이터 분석 보고서를 작성해주세요. The Quick brown fox jumps. " * repeat
+        assert benchmark(analyzer._extract_keywords, text) == legacy_extract_keywords(text)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keywords-topk")
+    @pytest.mark.parametrize("repeat", [50, 20000])
+    def test_legacy_sort(self, benchmark, repeat):
+        """기존 방식: 전체 토큰 목록 + 전체 어휘 정렬 (비교 기준)"""
+        text = "상세하고 전문적인 기술 문서와 데이터 분석 보고서를 작성해주세요. The Quick brown fox jumps. " * repeat
+        benchmark(legacy_extract_keywords, text)
+
+
+def build_batch(size: int, seed: int = 3) -> List[str]:
+    """배치 분석 테스트용 입력 목록을 생성합니다 (중복 입력 포함)."""
+    import random
+    
+    rng = random.Random(seed)
+    fragments = [
+        "창의적인", "소설을", "작성해주세요", "상세하고", "포괄적인", "데이터", "분석", "보고서", "언어 변환",
+        "중요 포인트", "Create", "a", "detailed", "Python", "function", "for", "beginners", "3", "섹션",
+        "500", "단어로", "반드시", "로고를", "포함해야", "합니다.", "avoid", "jargon!", "친근한", "톤", "JSON",
+        "간단한", "이미지", "비디오", "요약", "번역", "\n", "Machine", "Learning", "2시간", "전문적인"
+    ]
+    texts = [" ".join(rng.choice(fragments) for _ in range(rng.randint(0, 30))) for _ in range(size)]
+    # 저장된 프롬프트 재최적화처럼 일부 입력은 반복됨
+    return texts + texts[: size // 10]
+
+
+class TestAnalyzeMany:
+    """InputAnalyzer.analyze_many 배치 분석 테스트"""
+    
+    @pytest.fixture
+    def analyzer(self):
+        """InputAnalyzer 인스턴스를 반환합니다."""
+        return InputAnalyzer()
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_matches_per_item_analyze(self, analyzer):
+        """배치 결과가 입력마다 analyze를 호출한 결과와 같은지 테스트"""
+        texts = build_batch(500) + [
+            "", "   ", "!@#$%^&*()", "Hello 안녕하세요 こんにちは", "테스트 " * 1000,
+            "  Include the Python Logo!  ", "DETAILED JSON LIST FOR BEGINNERS 3 SECTIONS 500 WORDS",
+            "ΟΔΟΣ Σ 2시간 İstanbul Guide", "반드시 " + "로고 " * 400, "상세한 보고서. " * 3000
+        ]
+        
+        results = analyzer.analyze_many(texts, "dall-e-3")
+        
+        assert len(results) == len(texts)
+        for text, result in zip(texts, results):
+            assert result == analyzer.analyze(text, "dall-e-3")
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_duplicate_inputs_are_independent(self, analyzer):
+        """중복 입력의 결과 객체가 서로 독립적인지 테스트"""
+        results = analyzer.analyze_many(["상세한 보고서", "상세한 보고서"], "gpt-4o")
+        
+        results[0]["keywords"].append("변경")
+        results[0]["structure_hints"]["sections"].append("Section 1")
+        
+        assert results[1] == analyzer.analyze("상세한 보고서", "gpt-4o")
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_keywords_many_matches_per_item(self, analyzer):
+        """배치 키워드 추출이 텍스트마다 추출한 결과와 같은지 테스트 (빈도 동점 순서 포함)"""
+        texts = build_batch(300) + ["사진을 사진의 사진 photo Photo PHOTO", "the and 그리고", "a b c"]
+        unique_texts = list(dict.fromkeys(texts))
+        
+        for top_k in (1, 3, 10):
+            assert analyzer._extract_keywords_many(TokenBatch(unique_texts), top_k) == [
+                analyzer._extract_keywords(text, top_k) for text in unique_texts
+            ]
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_empty_batch(self, analyzer):
+        """빈 배치 테스트"""
+        assert analyzer.analyze_many([], "gpt-4o") == []
+
+
+class TestAnalyzeManyBenchmark:
+    """10k 입력 배치 분석 벤치마크"""
+    
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="analyze-batch")
+    def test_analyze_many(self, benchmark):
+        """analyze_many: 토큰화, 키워드, 엔티티, 힌트, 점수, 의도를 배치 단위로 계산"""
+        analyzer = InputAnalyzer(cache_size=0)
+        texts = build_batch(10_000)
+        
+        results = benchmark.pedantic(analyzer.analyze_many, args=(texts, "gpt-4o"), rounds=3)
+        assert len(results) == len(texts)
+    
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="analyze-batch")
+    def test_analyze_loop(self, benchmark):
+        """입력마다 analyze 호출 후 모든 필드를 계산 (비교 기준, 캐시 미사용)"""
+        analyzer = InputAnalyzer(cache_size=0)
+        texts = build_batch(10_000)
+        
+        results = benchmark.pedantic(lambda: [dict(analyzer.analyze(text, "gpt-4o").items()) for text in texts], rounds=3)
+        assert len(results) == len(texts)
+    
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keyword-scores-batch")
+    def test_score_matrix(self, benchmark):
+        """작업 유형/스타일/복잡성 점수: 발생 행렬 기반"""
+        analyzer = InputAnalyzer()
+        texts = build_batch(10_000)
+        slices = analyzer._keyword_matcher.table_slices
+        
+        def score_batch():
+            unique_texts = list(dict.fromkeys(texts))
+            tokens = TokenBatch(unique_texts)
+            counts = analyzer._keyword_matcher.count_matrix([text.lower() for text in unique_texts], tokens)
+            return (
+                analyzer._rank_count_matrix(counts[:, slices["task"]], analyzer.task_keywords, [("general", 1.0)]),
+                analyzer._rank_count_matrix(counts[:, slices["style"]], analyzer.style_keywords, [("neutral", 1.0)]),
+                analyzer._assess_complexity_matrix(tokens.token_counts.tolist(), counts[:, slices["complexity"]])
+            )
+        
+        task_types, _, _ = benchmark.pedantic(score_batch, rounds=5)
+        assert len(task_types) == len(set(texts))
+    
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keyword-scores-batch")
+    def test_score_loop(self, benchmark):
+        """작업 유형/스타일/복잡성 점수: 입력마다 계산 (비교 기준)"""
+        analyzer = InputAnalyzer()
+        texts = build_batch(10_000)
+        
+        def score_loop():
+            scores = []
+            for text in texts:
+                matches = analyzer._match_keyword_tables(text)
+                scores.append((
+                    analyzer._identify_task_type(text, matches),
+                    analyzer._identify_style(text, matches),
+                    analyzer._assess_complexity(text, matches)
+                ))
+            return scores
+        
+        scores = benchmark.pedantic(score_loop, rounds=5)
+        assert len(scores) == len(texts)
+
+
+class TestAnalysisCoreCache:
+    """모델 무관 분석 결과(core) 캐시 테스트"""
+    
+    @pytest.fixture
+    def analyzer(self):
+        """InputAnalyzer 인스턴스를 반환합니다."""
+        return InputAnalyzer()
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_core_computed_once_across_models(self, analyzer):
+        """같은 텍스트를 여러 모델로 분석해도 core는 한 번만 계산되는지 테스트"""
+        calls = []
+        original = analyzer._match_keyword_tables
+        analyzer._match_keyword_tables = lambda text: calls.append(text) or original(text)
+        text = "전문가를 위한 상세한 데이터 분석 보고서를 표로 작성해주세요"
+        
+        results = [analyzer.analyze(text, model_id) for model_id in ["gpt-4o", "dall-e-3", "runway-gen-3"]]
+        
+        assert [r["task_type"] for r in results] == [results[0]["task_type"]] * 3
+        assert len(calls) == 1
+        assert analyzer.get_cache_stats()["misses"] == 1
+        assert [r["model_category"] for r in results] == ["text", "image", "video"]
+        assert [r["selected_model"] for r in results] == ["gpt-4o", "dall-e-3", "runway-gen-3"]
+        assert results[0]["task_type"] == results[1]["task_type"] == results[2]["task_type"]
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_cached_result_matches_uncached(self, analyzer):
+        """캐시 사용 여부와 관계없이 결과가 같은지 테스트 (앞뒤 공백만 다른 입력 포함)"""
+        uncached = InputAnalyzer(cache_size=0)
+        texts = ["간단한 요약", "  간단한 요약\n", "Create a JSON list for Experts, include examples. 3 sections"]
+        
+        for text in texts:
+            first = analyzer.analyze(text, "gpt-4o")
+            second = analyzer.analyze(text, "gpt-4o")
+            assert first == second == uncached.analyze(text, "gpt-4o")
+            assert first["input_text"] == text
+        
+        assert analyzer.get_cache_stats()["hits"] == 4
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_results_do_not_share_cached_state(self, analyzer):
+        """반환된 결과를 수정해도 캐시된 결과가 바뀌지 않는지 테스트"""
+        first = analyzer.analyze("3 섹션으로 된 상세한 보고서", "gpt-4o")
+        first["keywords"].append("변경")
+        first["structure_hints"]["sections"].clear()
+        first["constraints"]["include"].append("변경")
+        
+        second = analyzer.analyze("3 섹션으로 된 상세한 보고서", "gpt-4o")
+        
+        assert "변경" not in second["keywords"]
+        assert second["structure_hints"]["sections"] == ["Section 1", "Section 2", "Section 3"]
+        assert second["constraints"]["include"] == []
+    
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_rebuild_keyword_index_invalidates_cache(self, analyzer):
+        """키워드 사전을 다시 만들면 캐시가 비워지는지 테스트"""
+        assert analyzer.analyze("노래를 작곡해줘", "suno")["task_type"] == [("general", 1.0)]
+        
+        analyzer.task_keywords["music_creation"] = ["작곡", "노래"]
+        analyzer.rebuild_keyword_index()
+        
+        assert analyzer.analyze("노래를 작곡해줘", "suno")["task_type"] == [("music_creation", 1.0)]
+
+
+class TestAnalysisCoreCacheBenchmark:
+    """같은 텍스트로 여러 모델을 비교하는 경우의 벤치마크"""
+    
+    MODEL_IDS = ["gpt-4o", "gemini-2.5-pro", "grok-3", "dall-e-3", "imagen-3", "midjourney", "sora", "suno"]
+    
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="analyze-models")
+    @pytest.mark.parametrize("cache_size", [0, 1024])
+    def test_analyze_across_models(self, benchmark, cache_size):
+        """8개 모델로 같은 텍스트 분석 (cache_size=0은 캐시 미사용 기준)"""
+        analyzer = InputAnalyzer(cache_size=cache_size)
+        text = "독자는 일반 사용자이며 친근한 톤으로 상세한 제품 소개서를 작성해주세요. 반드시 가격 정보를 포함해야 합니다. " * 20
+        
+        results = benchmark(lambda: [analyzer.analyze(text, model_id) for model_id in self.MODEL_IDS])
+        assert len(results) == len(self.MODEL_IDS)
@@ -0,0 +1,194 @@
+"""
+IntentDetector(해시 문자 n-gram 선형 분류기) 단위 테스트, 평가 데이터 정확도/보정 테스트 및 배치 벤치마크
+"""
+
+import os
+import numpy as np
+import pytest
+from src.utils.intent_detector import (
+    IntentDetector, IntentModel, INTENT_LABELS, load_training_data, train_intent_model
+)
+from src.utils.tokenized_input import TokenizedInput
+
+EVAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "intent_eval.tsv")
+
+
+def has_hangul(text: str) -> bool:
+    return any('가' <= char <= '힣' for char in text)
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """번들 가중치를 불러온 IntentDetector를 반환합니다."""
+    return IntentDetector()
+
+
+@pytest.fixture(scope="module")
+def eval_data():
+    """학습 데이터와 겹치지 않는 평가 문장 (문장 목록, 라벨 목록)"""
+    return load_training_data(EVAL_PATH)
+
+
+class TestIntentDetector:
+    """의도 분류 결과 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text,expected", [
+        ("밝고 화창한 날에 해변에서 뛰노는 강아지의 사진을 생성해주세요", "generation"),
+        ("이 기사를 세 줄로 요약해줘", "summarization"),
+        ("블록체인이 어떻게 작동하는지 설명해줘", "explanation"),
+        ("이 문장을 영어로 번역해 주세요", "translation"),
+        ("Write a short story about a lighthouse keeper", "generation"),
+        ("What is a neural network?", "explanation"),
+    ])
+    def test_bilingual_intents(self, detector, text, expected):
+        """한국어와 영어 요청의 의도를 분류하는지 테스트"""
+        assert detector.detect_intent(text)["primary_intent"] == expected
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_output_shape(self, detector):
+        """기존과 같은 키의 결과와 0~1 범위의 신뢰도를 반환하는지 테스트"""
+        for text in ["Write a poem", "고마워요", "", "   "]:
+            result = detector.detect_intent(text)
+            assert set(result) == {"primary_intent", "confidence", "details"}
+            assert result["primary_intent"] in INTENT_LABELS
+            assert 0.0 <= result["confidence"] <= 1.0
+        assert detector.detect_intent("")["primary_intent"] == "unknown"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_matches_single(self, detector, eval_data):
+        """배치 분류 결과가 한 건씩 분류한 결과와 같은지 테스트"""
+        texts, _ = eval_data
+        assert detector.detect_intents(texts) == [detector.detect_intent(text) for text in texts]
+        assert detector.detect_intents([]) == []
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_tokenized_input_reuses_lowercase(self, detector):
+        """공유 TokenizedInput의 소문자 텍스트를 재사용하는지 테스트"""
+        text = TokenizedInput("Please translate this paragraph into Korean")
+        text.lower()
+        passes = text.passes
+        assert detector.detect_intent(text)["primary_intent"] == "translation"
+        assert text.passes == passes
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_long_input_uses_head_and_tail(self, detector):
+        """긴 입력 끝에 있는 요청 동사로 의도를 판단하는지 테스트"""
+        text = "오늘 회의에서는 예산과 일정에 대해 논의했다. " * 200 + "\n위 글을 세 줄로 요약해줘"
+        assert detector.detect_intent(text)["primary_intent"] == "summarization"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_rules_fallback_without_weights(self, tmp_path):
+        """가중치 파일이 없으면 키워드 규칙으로 대체하는지 테스트"""
+        fallback = IntentDetector(model_path=str(tmp_path / "missing.npz"))
+        assert fallback.model is None
+        assert fallback.detect_intent("Please summarize this")["primary_intent"] == "summarization"
+
+
+class TestIntentModel:
+    """가중치 파일과 학습 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("language", ["ko", "en"])
+    def test_eval_accuracy(self, detector, eval_data, language):
+        """평가 문장의 언어별 정확도가 90% 이상인지 테스트"""
+        pairs = [(text, label) for text, label in zip(*eval_data) if has_hangul(text) == (language == "ko")]
+        results = detector.detect_intents([text for text, _ in pairs])
+        correct = sum(result["primary_intent"] == label for result, (_, label) in zip(results, pairs))
+        assert len(pairs) >= 25
+        assert correct / len(pairs) >= 0.9
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_calibration(self, detector, eval_data):
+        """신뢰도가 보정되어 있는지 (신뢰도 구간별 기대 보정 오차 0.1 이하) 테스트"""
+        texts, labels = eval_data
+        probs = detector.model.predict_proba(texts)
+        assert np.allclose(probs.sum(axis=1), 1.0)
+
+        confidence = probs.max(axis=1)
+        correct = np.array([detector.model.labels[i] for i in probs.argmax(axis=1)]) == np.array(labels)
+        bins = np.minimum((confidence * 10).astype(int), 9)
+        ece = sum(abs(confidence[bins == b].mean() - correct[bins == b].mean()) * np.mean(bins == b)
+                  for b in np.unique(bins))
+        assert ece <= 0.1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_sparse_logits_match_dense(self, detector, eval_data):
+        """희소 특징으로 계산한 점수가 밀집 특징 행렬 곱과 같은지 테스트"""
+        texts = ["", "a", " ", "x" * 2000] + list(eval_data[0])
+        model = detector.model
+        dense = model.featurize(texts).astype(np.float64) @ model.weights.astype(np.float64) + model.bias
+
+        assert np.allclose(model.logits(texts), dense, atol=1e-5)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_pure_python_path_matches_numpy(self, detector, eval_data):
+        """NumPy 없이 계산한 단일 입력 확률이 predict_proba와 같은지 테스트"""
+        texts = ["", "a", " ", "İ 요약", "x" * 2000] + list(eval_data[0])
+        model = detector.model
+
+        python_probs = np.array([model.predict_proba_one(text) for text in texts])
+
+        assert np.allclose(python_probs, model.predict_proba(texts), atol=1e-6)
+        assert (python_probs.argmax(axis=1) == model.predict_proba(texts).argmax(axis=1)).all()
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_save_and_load(self, detector, tmp_path, eval_data):
+        """저장한 가중치 파일을 다시 불러와도 같은 점수를 내는지 테스트"""
+        path = str(tmp_path / "intent_model.npz")
+        detector.model.save(path)
+        restored = IntentModel.load(path)
+
+        assert restored.labels == detector.model.labels
+        assert restored.temperature == pytest.approx(detector.model.temperature)
+        assert np.allclose(restored.predict_proba(eval_data[0]), detector.model.predict_proba(eval_data[0]))
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_training(self, eval_data):
+        """번들 학습 데이터로 짧게 학습해도 평가 문장을 대부분 맞히는지 테스트"""
+        texts, labels = load_training_data()
+        assert set(labels) == set(INTENT_LABELS) and len(texts) >= 300
+
+        model, cv_accuracy = train_intent_model(texts, labels, epochs=60, folds=2)
+        predicted = [model.labels[i] for i in model.predict_proba(eval_data[0]).argmax(axis=1)]
+        assert cv_accuracy >= 0.7
+        assert np.mean(np.array(predicted) == np.array(eval_data[1])) >= 0.8
+
+
+class TestIntentBenchmark:
+    """1000개 입력 분류 벤치마크 (배치 행렬곱 vs 한 건씩)"""
+
+    TEXTS = load_training_data()[0] * 4
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="intent-classifier")
+    def test_batch(self, benchmark, detector):
+        """detect_intents로 블록마다 행렬곱 한 번"""
+        results = benchmark(detector.detect_intents, self.TEXTS)
+        assert len(results) == len(self.TEXTS)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="intent-classifier")
+    def test_single(self, benchmark, detector):
+        """detect_intent를 입력마다 호출"""
+        results = benchmark(lambda: [detector.detect_intent(text) for text in self.TEXTS])
+        assert len(results) == len(self.TEXTS)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="intent-classifier")
+    def test_keyword_rules(self, benchmark, detector):
+        """기존 키워드 규칙 (비교 기준, 한국어는 모두 unknown)"""
+        results = benchmark(lambda: [detector._detect_with_rules(text) for text in self.TEXTS])
+        assert len(results) == len(self.TEXTS)
@@ -0,0 +1,170 @@
+"""
+의도/작업 유형 통합 분류(IntentSignal) 단위 테스트, 파이프라인 연동 테스트 및 요청당 분류 비용 벤치마크
+"""
+
+import pytest
+from src.services.optimizer import PromptOptimizer
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.intent_detector import IntentDetector
+from src.utils.intent_signal import IntentSignal
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup
+
+# 한국어/영어 요청 (키워드로 작업 유형이 정해지는 입력과 아닌 입력)
+TRAFFIC = [
+    "블로그 포스트를 작성해주세요",
+    "이 문장을 영어로 번역해 주세요",
+    "노래를 작곡해줘",
+    "Summarize this article in three bullet points",
+    "Translate the following paragraph into Korean",
+    "What is a neural network?",
+    "Create a photorealistic image of a cat sitting on a windowsill",
+]
+
+
+class CountingDetector(IntentDetector):
+    """분류한 텍스트 수를 세는 의도 분류기 (detect_intent도 detect_intents를 거침)"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def detect_intents(self, texts):
+        self.calls += len(texts)
+        return super().detect_intents(texts)
+
+
+@pytest.fixture(scope="module")
+def signal():
+    """번들 의도 분류기를 쓰는 IntentSignal을 반환합니다."""
+    return IntentSignal()
+
+
+class TestIntentSignal:
+    """두 가지 보기(primary_intent, task_type) 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", TRAFFIC)
+    def test_intent_matches_detector(self, signal, text):
+        """분석 결과의 intent가 IntentDetector.detect_intent와 같은지 테스트"""
+        result = InputAnalyzer(intent_signal=signal).analyze(text, "gpt-4o")
+        assert result["intent"] == IntentDetector().detect_intent(text)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text,expected", [
+        ("Summarize this article in three bullet points", "summarization"),
+        ("Translate the following paragraph into Korean", "translation"),
+        ("What is a neural network?", "question_answering"),
+    ])
+    def test_task_type_from_intent(self, signal, text, expected):
+        """키워드가 매칭되지 않는 영어 요청은 의도로 작업 유형을 정하는지 테스트"""
+        analyzer = InputAnalyzer(intent_signal=signal)
+        assert analyzer._identify_task_type(text) == [("general", 1.0)]
+        assert analyzer.analyze(text, "gpt-4o")["task_type"][0][0] == expected
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", ["블로그 포스트를 작성해주세요", "이 문장을 영어로 번역해 주세요", "노래를 작곡해줘"])
+    def test_keyword_task_type_unchanged(self, signal, text):
+        """키워드로 정해지는 작업 유형(과 생성 의도의 general)은 그대로인지 테스트"""
+        analyzer = InputAnalyzer(intent_signal=signal)
+        assert analyzer.analyze(text, "gpt-4o")["task_type"] == analyzer._identify_task_type(text)
+
+    @pytest.mark.unit
+    def test_low_confidence_falls_back_to_general(self):
+        """신뢰도가 기준보다 낮은 의도는 작업 유형에 쓰지 않는지 테스트"""
+        signal = IntentSignal(min_task_confidence=0.99)
+        intent = {"primary_intent": "summarization", "confidence": 0.6, "details": {}}
+        assert signal.task_type([], intent) == [("general", 1.0)]
+        assert signal.task_type([("creative_writing", 1.0)], intent) == [("creative_writing", 1.0)]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_analyze_many_matches_analyze(self, signal):
+        """배치 분석의 intent/task_type이 한 건씩 분석한 결과와 같은지 테스트"""
+        analyzer = InputAnalyzer(intent_signal=signal)
+        batch = analyzer.analyze_many(TRAFFIC + TRAFFIC[:2], "gpt-4o")
+        for text, result in zip(TRAFFIC + TRAFFIC[:2], batch):
+            single = analyzer.analyze(text, "gpt-4o")
+            assert result["intent"] == single["intent"]
+            assert result["task_type"] == single["task_type"]
+
+
+class TestComputedOnce:
+    """요청당 한 번 분류 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_one_classification_per_text(self):
+        """같은 텍스트를 여러 모델로 최적화해도 의도 분류가 한 번만 실행되는지 테스트"""
+        detector = CountingDetector()
+        optimizer = PromptOptimizer(enrichment_stages=[])
+        optimizer.input_analyzer = InputAnalyzer(intent_signal=IntentSignal(detector))
+        text = "Summarize this article in three bullet points"
+
+        for model_id in ["gpt-4o", "gemini-2.5-pro", "grok-3", "imagen-3"]:
+            result = optimizer.optimize_prompt(text, model_id)
+            assert result["success"] is True
+            assert result["intent_result"]["primary_intent"] == "summarization"
+            assert result["analysis_result"]["task_type"][0][0] == "summarization"
+        assert detector.calls == 1
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_single_request_skips_numpy_path(self, monkeypatch):
+        """요청 하나의 의도 분류는 NumPy 배치 경로(predict_proba) 대신 단일 입력 경로를 쓰는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[])
+        model = optimizer.intent_detector.model
+
+        def fail(texts):
+            raise AssertionError("predict_proba called for a single request")
+
+        monkeypatch.setattr(model, "predict_proba", fail)
+        for text in TRAFFIC:
+            result = optimizer.optimize_prompt(text, "gpt-4o", use_cache=False)
+            assert result["success"] is True
+            assert result["intent_result"] == IntentDetector().detect_intent(text)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_enrichment_analyzer_skips_intent(self):
+        """보강 단계의 기본 NLPAnalyzer는 의도를 다시 분류하지 않는지 테스트"""
+        analyzer = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False, classify_intent=False)
+        assert analyzer.analyze("이 기사를 요약해줘").intent is None
+        assert NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False).analyze("이 기사를 요약해줘").intent is not None
+
+
+class TestIntentSignalBenchmark:
+    """요청 하나의 의도/작업 유형 분류 비용 벤치마크 (통합 vs 기존 세 분류기)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="intent-signal")
+    def test_unified(self, benchmark, signal):
+        """분석 결과의 intent/task_type 필드 (텍스트당 한 번, 캐시 없이 매 요청 계산)"""
+        analyzer = InputAnalyzer(cache_size=0, intent_signal=signal)
+        nlp = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False, classify_intent=False)
+
+        def request():
+            for text in TRAFFIC:
+                result = analyzer.analyze(text, "gpt-4o")
+                result["intent"], result["task_type"]
+                nlp.analyze(text)
+
+        benchmark(request)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="intent-signal")
+    def test_separate(self, benchmark, signal):
+        """기존 방식: 키워드 task_type + IntentDetector + NLPAnalyzer 규칙 의도를 각각 계산"""
+        analyzer = InputAnalyzer(cache_size=0, intent_signal=signal)
+        detector = signal.detector
+        nlp = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False)
+
+        def request():
+            for text in TRAFFIC:
+                analyzer.analyze(text, "gpt-4o")["task_type"]
+                detector.detect_intent(text)
+                nlp.analyze(text)
+
+        benchmark(request)
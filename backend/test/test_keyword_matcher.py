@@ -0,0 +1,215 @@
+"""
+KeywordAutomaton / KeywordTableMatcher 단위 테스트 및 벤치마크
+"""
+
+import random
+import numpy as np
+import pytest
+from typing import Dict, List, Tuple
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.keyword_matcher import KeywordAutomaton, KeywordTableMatcher, TokenBatch, score_categories
+
+
+def naive_scores(categories: Dict[str, List[str]], text: str) -> List[Tuple[str, float]]:
+    """기존 InputAnalyzer의 카테고리별 부분 문자열 검색 방식 (비교 기준)"""
+    text_lower = text.lower()
+    scores = {}
+    for category, keywords in categories.items():
+        score = 0
+        for keyword in keywords:
+            if keyword in text_lower:
+                score += 1
+        if score > 0:
+            scores[category] = score / len(keywords)
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+
+def build_large_tables(num_categories: int, keywords_per_category: int) -> Dict[str, List[str]]:
+    """벤치마크용 대규모 키워드 사전을 생성합니다."""
+    rng = random.Random(42)
+    syllables = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허"
+    return {
+        f"category_{i}": [
+            "".join(rng.choice(syllables) for _ in range(rng.randint(2, 5)))
+            for _ in range(keywords_per_category)
+        ]
+        for i in range(num_categories)
+    }
+
+
+def build_input(size_bytes: int) -> str:
+    """벤치마크용 입력 텍스트를 생성합니다."""
+    base = "상세하고 전문적인 기술 문서와 데이터 분석 보고서를 작성해주세요. 이미지와 차트도 포함하면 좋겠습니다. "
+    repeat = size_bytes // len(base.encode("utf-8")) + 1
+    return (base * repeat)[: size_bytes // 3]
+
+
+class TestKeywordAutomaton:
+    """KeywordAutomaton 클래스 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_overlapping_patterns(self):
+        """겹치거나 포함 관계인 패턴을 모두 찾는지 테스트"""
+        automaton = KeywordAutomaton()
+        for keyword in ["기술", "기술적", "술적", "he", "she", "hers"]:
+            automaton.add(keyword, ("table", keyword))
+
+        matched = {automaton.patterns[i] for i in automaton.scan("기술적인 ushers")}
+        assert matched == {"기술", "기술적", "술적", "he", "she", "hers"}
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_iter_matches_positions(self):
+        """매칭 시작 위치가 올바른지 테스트"""
+        automaton = KeywordAutomaton()
+        automaton.add("ab", ("t", "a"))
+        automaton.add("b", ("t", "b"))
+
+        matches = [(start, automaton.patterns[pid]) for start, pid in automaton.iter_matches("xabab")]
+        assert matches == [(1, "ab"), (2, "b"), (3, "ab"), (4, "b")]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_duplicate_keywords_across_categories(self):
+        """여러 카테고리에 등록된 키워드가 각각 집계되는지 테스트"""
+        matcher = KeywordTableMatcher({"task": {"a": ["시각화", "이미지"], "b": ["시각화", "시각화"]}})
+        counts = matcher.count_matches("데이터 시각화")
+        assert counts["task"] == {"a": 1, "b": 2}
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_count_matrix_matches_count_matches(self):
+        """배치 발생 행렬 결과가 텍스트별 집계와 같은지 테스트 (공백 포함 키워드 포함)"""
+        tables = {
+            "task": {"a": ["시각화", "언어 변환", "이미지"], "b": ["시각화", "시각화", "중요 포인트"]},
+            "style": {"c": ["상세", "he"], "d": ["she", "언어"]}
+        }
+        matcher = KeywordTableMatcher(tables)
+        texts = ["", "  ", "데이터 시각화", "언어  변환", "언어 변환 이미지", "ushers 중요 포인트", "상세한 she"]
+
+        counts = matcher.count_matrix(texts)
+
+        for row, text in enumerate(texts):
+            expected = matcher.count_matches(text)
+            for column, (table, category) in enumerate(matcher.columns):
+                assert counts[row, column] == expected[table].get(category, 0), text
+
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_count_matrix_with_token_batch(self):
+        """원문을 토큰화한 TokenBatch를 넘겨도 소문자 텍스트로 계산한 결과와 같은지 테스트"""
+        matcher = KeywordTableMatcher({"task": {"a": ["json", "언어 변환"], "b": ["όδος", "list"]}})
+        texts = ["JSON List", "ΌΔΟΣ\tlist", "", "언어  변환 JSON", "Json json"]
+        lowered = [text.lower() for text in texts]
+
+        assert (matcher.count_matrix(lowered, TokenBatch(texts)) == matcher.count_matrix(lowered)).all()
+
+
+class TestTokenBatch:
+    """배치 공유 토큰화 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_vocabulary_and_ids(self):
+        """고유 토큰 사전, 토큰 ID, 텍스트별 단어 수가 split 결과와 같은지 테스트"""
+        texts = ["a b a", "", "  ", "c\ta\nb  ", "ΟΔΟΣ Σ"]
+        tokens = TokenBatch(texts)
+
+        assert tokens.vocabulary == ["a", "b", "c", "ΟΔΟΣ", "Σ"]
+        assert tokens.token_counts.tolist() == [len(text.split()) for text in texts]
+        for text, start, count in zip(texts, tokens.offsets.tolist(), tokens.token_counts.tolist()):
+            token_ids = tokens.token_ids[start:start + count].tolist()
+            assert [tokens.vocabulary[i] for i in token_ids] == text.split()
+            # 토큰별 소문자 변환이 텍스트 전체 소문자 변환과 같음 (그리스어 종결 시그마 포함)
+            assert [tokens.lowered_vocabulary[i] for i in token_ids] == text.lower().split()
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_any_rows_and_select(self):
+        """고유 토큰 단위 값을 텍스트별로 합치는지 테스트"""
+        tokens = TokenBatch(["a b", "", "c a", "b"])
+        flags = np.array([[True, False], [False, True], [False, False]])
+
+        assert tokens.any_rows(flags).tolist() == [[True, True], [False, False], [True, False], [False, True]]
+        assert tokens.select([0, 2]) == [[0], [], [2, 0], []]
+
+
+class TestInputAnalyzerKeywordScores:
+    """InputAnalyzer 키워드 점수가 기존 방식과 동일한지 테스트"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """InputAnalyzer 인스턴스를 반환합니다."""
+        return InputAnalyzer()
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", [
+        "",
+        "창의적인 소설을 작성해주세요",
+        "상세하고 포괄적인 분석을 포함한 전문적인 보고서, 데이터 시각화 차트와 그래프",
+        "간단한 번역과 언어 변환, 요약 및 핵심 중요 포인트 정리",
+        "A Creative TECHNICAL 문서 with 기술적이고 정확한 상세한 설명",
+    ])
+    def test_scores_match_naive_implementation(self, analyzer, text):
+        """단일 패스 점수가 키워드별 부분 문자열 검색 결과와 같은지 테스트"""
+        assert analyzer._identify_task_type(text) == (naive_scores(analyzer.task_keywords, text) or [("general", 1.0)])
+        assert analyzer._identify_style(text) == (naive_scores(analyzer.style_keywords, text) or [("neutral", 1.0)])
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_random_inputs_match_naive_implementation(self, analyzer):
+        """무작위 키워드 조합에 대해서도 결과가 같은지 테스트"""
+        rng = random.Random(7)
+        vocabulary = [k for table in (analyzer.task_keywords, analyzer.style_keywords, analyzer.complexity_indicators)
+                      for keywords in table.values() for k in keywords] + ["그리고", "the", " ", "."]
+
+        for _ in range(200):
+            text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+            matches = analyzer._match_keyword_tables(text)
+            assert score_categories(analyzer.task_keywords, matches["task"]) == naive_scores(analyzer.task_keywords, text)
+            assert score_categories(analyzer.style_keywords, matches["style"]) == naive_scores(analyzer.style_keywords, text)
+            assert matches["complexity"] == {
+                level: sum(1 for k in keywords if k in text.lower())
+                for level, keywords in analyzer.complexity_indicators.items()
+                if any(k in text.lower() for k in keywords)
+            }
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_rebuild_keyword_index(self, analyzer):
+        """키워드 사전 확장 후 인덱스를 다시 만들면 반영되는지 테스트"""
+        analyzer.task_keywords["music_creation"] = ["작곡", "노래"]
+        analyzer.rebuild_keyword_index()
+        assert analyzer._identify_task_type("노래를 작곡해줘")[0] == ("music_creation", 1.0)
+
+
+class TestKeywordMatcherBenchmark:
+    """대규모 키워드 사전과 10-100KB 입력에 대한 벤치마크"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keyword-tables")
+    @pytest.mark.parametrize("size_kb", [10, 100])
+    @pytest.mark.parametrize("keywords_per_category", [10, 500])
+    def test_automaton_scaling(self, benchmark, size_kb, keywords_per_category):
+        """단일 패스 오토마톤: 키워드 수가 늘어도 입력 길이에만 비례"""
+        tables = build_large_tables(20, keywords_per_category)
+        matcher = KeywordTableMatcher({"task": tables})
+        text = build_input(size_kb * 1024)
+
+        counts = benchmark(matcher.count_matches, text)
+        assert set(counts["task"]) <= set(tables)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="keyword-tables")
+    @pytest.mark.parametrize("size_kb", [10, 100])
+    @pytest.mark.parametrize("keywords_per_category", [10, 500])
+    def test_naive_scaling(self, benchmark, size_kb, keywords_per_category):
+        """기존 방식: 카테고리 x 키워드 x 입력 길이에 비례 (비교 기준)"""
+        tables = build_large_tables(20, keywords_per_category)
+        text = build_input(size_kb * 1024)
+
+        scores = benchmark(naive_scores, tables, text)
+        assert isinstance(scores, list)
@@ -0,0 +1,165 @@
+"""
+KoreanTokenizer 단위 테스트, 샘플 말뭉치 정확도 테스트 및 처리량 벤치마크
+"""
+
+import os
+import random
+import pytest
+from typing import List, Tuple
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.korean_tokenizer import KoreanTokenizer, get_korean_tokenizer
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "korean_sample_corpus.tsv")
+
+
+def load_corpus() -> List[Tuple[str, str]]:
+    """샘플 말뭉치의 (문장, 정답 분절) 목록을 읽습니다."""
+    with open(CORPUS_PATH, encoding="utf-8") as f:
+        return [tuple(line.rstrip("\n").split("\t")) for line in f if line.strip() and not line.startswith("#")]
+
+
+def build_text(size_bytes: int, seed: int = 11) -> str:
+    """말뭉치 문장을 섞어 size_bytes 크기의 텍스트를 만듭니다."""
+    rng = random.Random(seed)
+    sentences = [sentence for sentence, _ in load_corpus()]
+    parts, size = [], 0
+    while size < size_bytes:
+        sentence = rng.choice(sentences) + ". "
+        parts.append(sentence)
+        size += len(sentence.encode("utf-8"))
+    return "".join(parts)
+
+
+@pytest.fixture(scope="module")
+def tokenizer():
+    """공유 KoreanTokenizer를 반환합니다."""
+    return get_korean_tokenizer()
+
+
+class TestKoreanTokenizer:
+    """어절 분석 규칙 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("word,expected", [
+        ("사진을", [("사진", "NNG"), ("을", "JKO")]),
+        ("언어를", [("언어", "NNG"), ("를", "JKO")]),
+        ("배경으로", [("배경", "NNG"), ("으로", "JKB")]),
+        ("작성해주세요", [("작성", "NNG"), ("해주세요", "XSV")]),
+        ("만들어주세요", [("만들", "VV"), ("어주세요", "EF")]),
+        ("웃는", [("웃", "VV"), ("는", "ETM")]),
+        ("연구원의", [("연구원", "NNG"), ("의", "JKG")]),
+    ])
+    def test_particle_and_ending_split(self, tokenizer, word, expected):
+        """명사+조사, 명사+하다, 어간+어미로 나누는지 테스트"""
+        assert list(tokenizer.analyze_word(word)) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("word", ["고양이", "정도", "회의", "결과", "휴가", "마을", "가을", "사이", "최고"])
+    def test_words_ending_like_particles_are_kept(self, tokenizer, word):
+        """조사처럼 끝나는 명사를 사전과 받침 조건으로 보호하는지 테스트"""
+        assert tokenizer.analyze_word(word) == ((word, tokenizer.stem_tags.get(word, "NNG")),)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_final_consonant_agreement(self):
+        """받침 조건이 맞지 않는 조사는 떼지 않는지 테스트"""
+        tokenizer = KoreanTokenizer(entries=[("을", "JKO", "final", 1), ("를", "JKO", "open", 1)])
+        assert tokenizer.analyze_word("책을") == (("책", "NNG"), ("을", "JKO"))
+        assert tokenizer.analyze_word("나를") == (("나", "NNG"), ("를", "JKO"))
+        assert tokenizer.analyze_word("마을") == (("마을", "NNG"),)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_mixed_script_text(self, tokenizer):
+        """영문/숫자 바로 뒤에 붙은 조사와 기호를 나누는지 테스트"""
+        assert tokenizer.pos("GPT-4o로 3.5초 영상!") == [
+            ("GPT", "SL"), ("-", "SW"), ("4", "SN"), ("o", "SL"), ("로", "JKB"),
+            ("3.5", "SN"), ("초", "NNG"), ("영상", "NNG"), ("!", "SF")
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("word,expected", [
+        ("사진을", "사진"), ("python의", "python"), ("gpt를", "gpt"), ("python", "python"),
+        ("데이터", "데이터"), ("x사진", "x사진"), ("123", "123"),
+    ])
+    def test_stem(self, tokenizer, word, expected):
+        """키워드 정규화용 어간 추출 테스트"""
+        assert tokenizer.stem(word) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_shared_instance_and_bounded_cache(self):
+        """공유 인스턴스가 한 번만 만들어지고 어절 캐시가 상한을 넘지 않는지 테스트"""
+        assert get_korean_tokenizer() is get_korean_tokenizer()
+
+        tokenizer = KoreanTokenizer(cache_size=10)
+        tokenizer.pos(" ".join(f"단어{i}를" for i in range(100)))
+        assert len(tokenizer._cache) <= 10
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_sample_corpus_accuracy(self, tokenizer):
+        """샘플 말뭉치에서 어절 분절 정확도가 95% 이상인지 테스트"""
+        correct = total = 0
+        for sentence, gold in load_corpus():
+            words, gold_words = sentence.split(), gold.split()
+            assert len(words) == len(gold_words), sentence
+            for word, expected in zip(words, gold_words):
+                total += 1
+                correct += "+".join(tokenizer.morphs(word)) == expected
+        assert total >= 200
+        assert correct / total >= 0.95
+
+
+class TestKoreanPipeline:
+    """분석 파이프라인 연동 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_nlp_analyzer_uses_morphemes(self):
+        """NLTK 없이도 한국어 분석에 형태소와 명사구를 쓰는지 테스트"""
+        analyzer = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False)
+        result = analyzer.analyze("데이터 분석 보고서를 상세하게 작성해줘")
+
+        assert result.language == "ko"
+        assert ("보고서", "NNG") in result.pos_tags and ("를", "JKO") in result.pos_tags
+        assert "데이터 분석 보고서" in result.key_phrases
+        assert "보고서를" not in result.key_phrases
+        assert result.intent == "request"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_keywords_without_particles(self):
+        """키워드 추출이 조사를 뗀 어간 기준으로 합쳐 세는지 테스트"""
+        keywords = InputAnalyzer()._extract_keywords("사진을 찍고 사진의 색감과 사진에 맞는 Python의 예제")
+        assert keywords[0] == "사진"
+        assert "python" in keywords
+        assert not any(keyword.endswith(("을", "의", "에")) for keyword in keywords if len(keyword) > 2)
+
+
+class TestKoreanTokenizerBenchmark:
+    """1MB 텍스트 처리량 벤치마크 (목표: 코어당 1MB/s 이상)"""
+
+    TEXT = build_text(1024 * 1024)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="korean-tokenizer")
+    def test_shared_tokenizer(self, benchmark, tokenizer):
+        """어절 캐시가 채워진 공유 토크나이저"""
+        result = benchmark(tokenizer.pos, self.TEXT)
+        assert result
+        if benchmark.stats:
+            assert benchmark.stats.stats.mean < 1.0
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="korean-tokenizer")
+    def test_cold_tokenizer(self, benchmark):
+        """매번 새 토크나이저 (사전 로딩 + 빈 캐시)"""
+        result = benchmark(lambda: KoreanTokenizer().pos(self.TEXT))
+        assert result
+        if benchmark.stats:
+            assert benchmark.stats.stats.mean < 1.0
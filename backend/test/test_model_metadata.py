@@ -0,0 +1,118 @@
+"""
+모델 메타데이터 스냅샷(직렬화 응답 + ETag) 단위 테스트, API 연동 테스트 및 응답 생성 벤치마크
+"""
+
+import json
+import pytest
+from src.services.model_metadata import ModelMetadataSnapshot, serialize_payload
+from src.services.optimizer import PromptOptimizer
+
+
+@pytest.fixture
+def optimizer():
+    """미리 불러오는 모델 없이 만든 PromptOptimizer를 반환합니다."""
+    return PromptOptimizer(enrichment_stages=[], preload_models=[])
+
+
+class TestModelMetadataSnapshot:
+    """스냅샷 직렬화와 무효화 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_payloads_match_optimizer(self, optimizer):
+        """직렬화된 응답이 PromptOptimizer 메서드 결과와 같은지 테스트"""
+        snapshot = ModelMetadataSnapshot(optimizer)
+
+        assert json.loads(snapshot.models().body) == {"success": True, "models": optimizer.get_available_models()}
+        assert json.loads(snapshot.model_info("sora").body) == {
+            "success": True, "model_id": "sora", "info": optimizer.get_model_info("sora")}
+        assert json.loads(snapshot.model_structure("sora").body) == {
+            "success": True, "model_id": "sora", "structure": optimizer.get_model_prompt_structure("sora")}
+        assert snapshot.model_info("unknown-model") is None
+        assert snapshot.model_structure("unknown-model") is None
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_serialized_once(self, optimizer, monkeypatch):
+        """같은 레지스트리 버전에서는 한 번만 만들고 같은 바이트를 재사용하는지 테스트"""
+        snapshot = ModelMetadataSnapshot(optimizer)
+        first = snapshot.model_info("gpt-4o")
+
+        monkeypatch.setattr(optimizer, "get_model_info", lambda model_id: pytest.fail("rebuilt"))
+        assert snapshot.model_info("gpt-4o") is first
+        assert snapshot.models() is snapshot.models()
+        assert optimizer.models.loaded == ("gpt-4o",)
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_register_model_invalidates(self, optimizer):
+        """모델 등록으로 레지스트리 버전이 바뀌면 다시 직렬화하는지 테스트"""
+        from src.models.text_models import GPT4oModel
+
+        snapshot = ModelMetadataSnapshot(optimizer)
+        before = snapshot.models()
+        model = GPT4oModel()
+        model.model_id = "custom-gpt"
+        optimizer.register_model(model)
+
+        after = snapshot.models()
+        assert after.etag != before.etag
+        assert json.loads(after.body)["models"][-1]["model_id"] == "custom-gpt"
+
+    @pytest.mark.unit
+    def test_etag_is_content_hash(self):
+        """ETag가 본문 내용으로만 정해지는지 테스트"""
+        assert serialize_payload({"a": 1, "b": "값"}) == serialize_payload({"b": "값", "a": 1})
+        assert serialize_payload({"a": 1}).etag != serialize_payload({"a": 2}).etag
+
+
+class TestMetadataEndpoints:
+    """ETag/If-None-Match API 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("path", ["/api/models", "/api/model/gpt-4o/info", "/api/model/suno/structure"])
+    def test_etag_and_not_modified(self, client, path):
+        """강한 ETag를 보내고 같은 If-None-Match에는 본문 없이 304를 반환하는지 테스트"""
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.get_json()["success"] is True
+        etag = response.headers["ETag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304 and cached.data == b""
+        assert cached.headers["ETag"] == etag
+
+        stale = client.get(path, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200 and stale.data == response.data
+
+    @pytest.mark.integration
+    def test_unknown_model(self, client):
+        """지원하지 않는 모델은 기존처럼 404 오류 응답인지 테스트"""
+        for path in ["/api/model/unknown-model/info", "/api/model/unknown-model/structure"]:
+            response = client.get(path)
+            assert response.status_code == 404
+            assert response.get_json()["success"] is False
+            assert "ETag" not in response.headers
+
+
+class TestModelMetadataBenchmark:
+    """모델 정보 응답 생성 벤치마크 (직렬화된 스냅샷 vs 매 요청 dict 생성 + JSON 직렬화)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="model-metadata")
+    def test_snapshot(self, benchmark, optimizer):
+        """레지스트리 버전마다 한 번 직렬화한 바이트 재사용"""
+        snapshot = ModelMetadataSnapshot(optimizer)
+        model_ids = list(optimizer.models)
+        benchmark(lambda: [snapshot.models()] + [snapshot.model_structure(model_id) for model_id in model_ids])
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="model-metadata")
+    def test_rebuild(self, benchmark, optimizer):
+        """요청마다 get_model_prompt_structure와 json.dumps (기존 방식, 비교 기준)"""
+        model_ids = list(optimizer.models)
+        benchmark(lambda: [json.dumps({"success": True, "models": optimizer.get_available_models()})] + [
+            json.dumps({"success": True, "model_id": model_id,
+                        "structure": optimizer.get_model_prompt_structure(model_id)})
+            for model_id in model_ids])
@@ -0,0 +1,154 @@
+"""
+ModelRegistry(매니페스트 기반 지연 로딩) 단위 테스트 및 워커 콜드 스타트/메모리 벤치마크
+"""
+
+import os
+import json
+import subprocess
+import sys
+import pytest
+from src.models.registry import ModelRegistry, load_manifest, preload_from_env
+from src.services.optimizer import PromptOptimizer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 워커 시작 후 모델 두 개만 사용: 임포트된 모델 모듈 수와 최대 상주 메모리(KB) 출력
+WORKER = (
+    "import sys, json, resource\n"
+    "from src.services.optimizer import PromptOptimizer\n"
+    "optimizer = PromptOptimizer(enrichment_stages=[]{preload})\n"
+    "for model_id in ['gpt-4o', 'dalle-3']:\n"
+    "    assert optimizer.optimize_prompt('고양이 사진', model_id)['success']\n"
+    "modules = [name for name in sys.modules if name.startswith('src.models.') and name.count('.') == 3]\n"
+    "print(json.dumps({{'modules': len(modules), 'maxrss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))\n"
+)
+
+ALL_MODELS = [entry["model_id"] for entry in load_manifest()]
+
+
+def run_worker(preload: str = "") -> dict:
+    """backend 디렉토리에서 새 인터프리터로 워커를 실행하고 출력한 통계를 반환합니다."""
+    code = WORKER.format(preload=preload)
+    stdout = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture
+def optimizer():
+    """미리 불러오는 모델 없이 만든 PromptOptimizer를 반환합니다."""
+    return PromptOptimizer(enrichment_stages=[], preload_models=[])
+
+
+class TestManifest:
+    """매니페스트와 모델 클래스 일치 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.model
+    @pytest.mark.parametrize("entry", load_manifest(), ids=lambda entry: entry["model_id"])
+    def test_manifest_matches_model(self, entry):
+        """매니페스트의 요약 정보와 기능 태그가 모델 인스턴스와 같은지 테스트"""
+        model = ModelRegistry([entry])[entry["model_id"]]
+        assert type(model).__name__ == entry["class"]
+        assert model.model_name == entry["model_name"]
+        assert model.provider == entry["provider"]
+        assert model.category == entry["category"]
+        assert model.capabilities == entry["capabilities"]
+        assert model.supports_multimodal == entry["supports_multimodal"]
+
+    @pytest.mark.unit
+    @pytest.mark.model
+    def test_manifest_covers_model_packages(self):
+        """모델 패키지의 모든 모델 클래스가 매니페스트에 있는지 테스트"""
+        from src import models
+        classes = {entry["class"] for entry in load_manifest()}
+        assert classes == set(models._MODEL_PACKAGES)
+
+    @pytest.mark.unit
+    def test_invalid_manifest(self, tmp_path):
+        """필수 키가 없는 매니페스트는 오류인지 테스트"""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"models": [{"model_id": "x", "module": "m"}]}), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_manifest(str(path))
+
+
+class TestLazyLoading:
+    """첫 요청 시 로딩 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_construction_loads_no_models(self, optimizer):
+        """생성 시 모델을 불러오지 않고 목록/카테고리는 매니페스트로 답하는지 테스트"""
+        assert optimizer.models.loaded == ()
+        assert len(optimizer.models) == len(ALL_MODELS)
+        assert "sora" in optimizer.models and "unknown-model" not in optimizer.models
+        assert [info["model_id"] for info in optimizer.get_available_models()] == ALL_MODELS
+        assert optimizer.input_analyzer._get_model_category("suno") == "music"
+        assert optimizer.models.loaded == ()
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_first_request_loads_one_model(self, optimizer):
+        """요청된 모델만 한 번 불러와 재사용하는지 테스트"""
+        result = optimizer.optimize_prompt("밝고 화창한 해변 사진", "imagen-3")
+        assert result["success"] is True
+        assert optimizer.models.loaded == ("imagen-3",)
+
+        model = optimizer.models["imagen-3"]
+        optimizer.optimize_prompt("노을 지는 도시 사진", "imagen-3")
+        assert optimizer.models["imagen-3"] is model
+        assert optimizer.optimize_prompt("test", "unknown-model")["success"] is False
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_preload(self, monkeypatch):
+        """preload 목록과 MODEL_PRELOAD 환경 변수로 모델을 미리 불러오는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[], preload_models=["gpt-4o", "missing"])
+        assert optimizer.models.loaded == ("gpt-4o",)
+
+        monkeypatch.setenv("MODEL_PRELOAD", "suno, sora")
+        assert preload_from_env() == ["suno", "sora"]
+        assert PromptOptimizer(enrichment_stages=[]).models.loaded == ("suno", "sora")
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_register_model(self, optimizer):
+        """직접 등록한 모델이 목록과 요청에 쓰이는지 테스트"""
+        from src.models.text_models import GPT4oModel
+
+        model = GPT4oModel()
+        model.model_id = "custom-gpt"
+        model.model_name = "Custom GPT"
+        optimizer.register_model(model)
+
+        assert optimizer.models["custom-gpt"] is model
+        assert optimizer.get_available_models()[-1]["model_name"] == "Custom GPT"
+        assert optimizer.optimize_prompt("블로그 글을 작성해줘", "custom-gpt")["success"] is True
+
+    @pytest.mark.unit
+    @pytest.mark.model
+    def test_worker_imports_only_used_models(self):
+        """워커가 사용한 모델 모듈만 임포트하는지 테스트"""
+        assert run_worker()["modules"] == 2
+        assert run_worker(", preload_models={!r}".format(ALL_MODELS))["modules"] == len(ALL_MODELS)
+
+
+class TestModelRegistryBenchmark:
+    """모델 두 개만 쓰는 워커의 콜드 스타트 시간 벤치마크 (새 인터프리터)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="model-registry")
+    def test_lazy_worker(self, benchmark):
+        """첫 요청 시 해당 모델만 로딩"""
+        stats = benchmark.pedantic(run_worker, rounds=5, iterations=1)
+        benchmark.extra_info.update(stats)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="model-registry")
+    def test_eager_worker(self, benchmark):
+        """시작 시 모든 모델 로딩 (기존 방식, 비교 기준)"""
+        stats = benchmark.pedantic(run_worker, args=(", preload_models={!r}".format(ALL_MODELS),),
+                                   rounds=5, iterations=1)
+        benchmark.extra_info.update(stats)
@@ -0,0 +1,324 @@
+"""
+NLPAnalyzer 지연 NLTK 로딩 단위 테스트 및 시작 시간 벤치마크
+"""
+
+import os
+import subprocess
+import sys
+import types
+import pytest
+from src.utils import nlp_analyzer
+from langdetect import detect
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup, detect_script_language
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 워커 시작: 모듈 임포트 + 분석기 생성
+LAZY_STARTUP = "from src.utils.nlp_analyzer import NLPAnalyzer; NLPAnalyzer()"
+
+# 기존 방식: 임포트 시 NLTK를 불러와 리소스를 확인한 뒤 분석기 생성 (다운로드 시도 제외)
+EAGER_STARTUP = (
+    "from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup; "
+    "warmup = NLTKWarmup(); warmup.run(); NLPAnalyzer(warmup=warmup, start_warmup=False)"
+)
+
+
+def run_python(code: str) -> str:
+    """backend 디렉토리에서 새 인터프리터로 코드를 실행하고 표준 출력을 반환합니다."""
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, check=True, capture_output=True, text=True
+    ).stdout
+
+# 실제 요청과 비슷한 한국어/영어 입력
+TRAFFIC = [
+    "밝고 화창한 날에 해변에서 뛰노는 강아지의 사진을 생성해주세요",
+    "데이터 분석 보고서를 상세하고 전문적으로 작성해주세요. 차트도 포함해 주세요.",
+    "신나는 팝 음악을 만들어주세요",
+    "Write a detailed technical blog post about vector databases.",
+    "Create a photorealistic image of a cat sitting on a windowsill at sunset",
+    "Please summarize the following meeting notes in three bullet points.",
+]
+
+
+@pytest.fixture
+def analyzer():
+    """워밍업을 시작하지 않는 NLPAnalyzer 인스턴스를 반환합니다."""
+    return NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False)
+
+
+# 대량 재분석용 혼합 입력 (기타 언어/빈 문자열 포함)
+ARCHIVE = TRAFFIC * 5 + ["Bonjour, ça va très bien", "", "고양이 사진 realistic photo style"]
+
+
+def local_nltk_warmup() -> NLTKWarmup:
+    """로컬 NLTK 데이터로 워밍업을 끝낸 상태를 반환합니다."""
+    warmup = NLTKWarmup()
+    warmup.run()
+    return warmup
+
+
+class FakeTagger:
+    """호출 수를 세는 결정적 토크나이저/태거 (배치 묶음 검증용)"""
+
+    def __init__(self):
+        self.pos_tag_calls = 0
+        self.pos_tag_sents_calls = 0
+
+    def word_tokenize(self, text):
+        return text.split()
+
+    def tag(self, tokens):
+        return [(token, 'NNP' if token[:1].isupper() else 'NN' if len(token) > 3 else 'VB') for token in tokens]
+
+    def pos_tag(self, tokens):
+        self.pos_tag_calls += 1
+        return self.tag(tokens)
+
+    def pos_tag_sents(self, sentences):
+        self.pos_tag_sents_calls += 1
+        return [self.tag(tokens) for tokens in sentences]
+
+
+@pytest.fixture
+def fake_nltk_analyzer(monkeypatch):
+    """FakeTagger로 워밍업이 끝난 NLPAnalyzer와 태거를 반환합니다."""
+    tagger = FakeTagger()
+    monkeypatch.setattr(nlp_analyzer, "nltk", tagger)
+    monkeypatch.setattr(nlp_analyzer, "NLP_AVAILABLE", True)
+    warmup = NLTKWarmup()
+    warmup.available = True
+    warmup._ready.set()
+    return NLPAnalyzer(warmup=warmup, start_warmup=False), tagger
+
+
+@pytest.fixture
+def missing_data_warmup(tmp_path):
+    """리소스가 없는 로컬 경로만 보는 워밍업 상태를 반환합니다."""
+    return NLTKWarmup(data_dir=str(tmp_path), resources={"punkt": "tokenizers/punkt_missing_for_test"},
+                      required=("punkt",))
+
+
+class TestNLTKWarmup:
+    """NLTK 워밍업과 준비 상태 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_import_does_not_load_nltk(self):
+        """모듈 임포트와 분석기 생성이 NLTK 로딩이나 다운로드를 기다리지 않는지 테스트"""
+        output = run_python(
+            "import sys; from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup; "
+            "NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False); print('nltk' in sys.modules)"
+        )
+        assert output.strip() == "False"
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_basic_analysis_until_ready(self):
+        """워밍업이 끝나기 전에는 기본 분석을 사용하는지 테스트"""
+        warmup = NLTKWarmup()
+        analyzer = NLPAnalyzer(warmup=warmup, start_warmup=False)
+
+        assert not analyzer.ready and not analyzer.nltk_available
+        assert not warmup.wait(0)
+        result = analyzer.analyze("Please help me write a short story.")
+        assert result.pos_tags == [(token, 'UNKNOWN') for token in result.tokens]
+        assert result.intent == 'request'
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.skipif(not nlp_analyzer.NLP_AVAILABLE, reason="NLTK가 설치되지 않음")
+    def test_missing_local_data(self, missing_data_warmup):
+        """로컬 데이터가 없으면 워밍업은 끝나지만 기본 분석을 계속 사용하는지 테스트"""
+        analyzer = NLPAnalyzer(warmup=missing_data_warmup)
+
+        assert missing_data_warmup.wait(30)
+        assert analyzer.ready and not analyzer.nltk_available
+        assert missing_data_warmup.missing == ["punkt"]
+        result = analyzer.analyze("Hello there, how are you?")
+        assert result.pos_tags == [(token, 'UNKNOWN') for token in result.tokens]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.skipif(not nlp_analyzer.NLP_AVAILABLE, reason="NLTK가 설치되지 않음")
+    def test_start_is_idempotent(self, missing_data_warmup):
+        """여러 분석기가 하나의 워밍업 스레드를 공유하는지 테스트"""
+        thread = missing_data_warmup.start()
+        NLPAnalyzer(warmup=missing_data_warmup)
+
+        assert missing_data_warmup.start() is thread
+        thread.join(30)
+        assert missing_data_warmup.ready
+        assert missing_data_warmup.data_dir in sys.modules["nltk"].data.path
+
+
+class TestLanguageDetection:
+    """문자 비율 기반 언어 감지 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text,expected", [
+        ("고양이 사진을 그려줘", "ko"),
+        ("GPT-4o로 보고서를 작성해주세요", "ko"),
+        ("Hello world", "en"),
+        ("Draw a cat, 4K, 16:9", "en"),
+        ("고양이 사진 realistic photo style", None),
+        ("Bonjour, ça va très bien", None),
+        ("こんにちは世界", None),
+        ("123 456 !!!", None),
+        ("", None),
+    ])
+    def test_script_fast_path(self, text, expected):
+        """한글/라틴 문자가 우세한 텍스트만 바로 판별하는지 테스트"""
+        assert detect_script_language(text) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", TRAFFIC)
+    def test_fast_path_agrees_with_langdetect(self, text):
+        """일반적인 한국어/영어 입력에서 langdetect와 결과가 같은지 테스트"""
+        assert detect_script_language(text) == detect(text)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_langdetect_only_for_ambiguous_text(self, analyzer, monkeypatch):
+        """애매한 텍스트만 langdetect를 호출하고 결과를 기억하는지 테스트"""
+        calls = []
+
+        def counting_detect(text):
+            calls.append(text)
+            return detect(text)
+
+        monkeypatch.setattr(nlp_analyzer, "detect", counting_detect)
+        for text in TRAFFIC * 3:
+            analyzer._detect_language(text)
+        assert calls == []
+
+        mixed = "Bonjour, ça va très bien aujourd'hui"
+        first = analyzer._detect_language(mixed)
+        assert [analyzer._detect_language(mixed) for _ in range(3)] == [first] * 3
+        assert calls == [mixed]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_ambiguous_detection_is_deterministic(self):
+        """langdetect 결과가 새 인터프리터에서도 같은지 테스트 (고정 시드)"""
+        code = (
+            "from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup; "
+            "a = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False); "
+            "print(a._detect_language('고양이 사진 realistic photo style, cute'))"
+        )
+        assert len({run_python(code) for _ in range(3)}) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_no_text_defaults_to_english(self, analyzer):
+        """문자가 없는 입력은 기본값 영어를 반환하는지 테스트"""
+        assert analyzer._detect_language("123 456") == "en"
+
+
+class TestLanguageDetectionBenchmark:
+    """요청당 언어 감지 비용 벤치마크 (캐시 없이)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="language-detection")
+    def test_script_detection(self, benchmark):
+        """문자 비율 빠른 경로 + 애매한 경우 langdetect"""
+        analyzer = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False, language_cache_size=0)
+        result = benchmark(lambda: [analyzer._detect_language(text) for text in TRAFFIC])
+        assert result == ["ko"] * 3 + ["en"] * 3
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="language-detection")
+    def test_langdetect_detection(self, benchmark):
+        """모든 입력에 langdetect 사용 (비교 기준)"""
+        result = benchmark(lambda: [detect(text) for text in TRAFFIC])
+        assert result == ["ko"] * 3 + ["en"] * 3
+
+
+class TestAnalyzeBatch:
+    """언어별 배치 태깅 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_matches_single_before_ready(self, analyzer):
+        """워밍업 전에도 개별 분석 결과와 같은지 테스트"""
+        assert analyzer.analyze_batch(ARCHIVE) == [analyzer.analyze(text) for text in ARCHIVE]
+        assert analyzer.analyze_batch([]) == []
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_tags_once_per_language(self, fake_nltk_analyzer):
+        """영어 그룹을 태깅 한 번으로 처리하고 결과는 개별 분석과 같은지 테스트"""
+        analyzer, tagger = fake_nltk_analyzer
+
+        expected = [analyzer.analyze(text) for text in ARCHIVE]
+        single_calls = tagger.pos_tag_calls
+        assert single_calls >= 3 * 5
+
+        # 영어만 NLTK 태거를 쓰고 한국어는 자체 토크나이저 사용
+        assert analyzer.analyze_batch(ARCHIVE) == expected
+        assert tagger.pos_tag_sents_calls == 1
+        assert tagger.pos_tag_calls == single_calls
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_tagging_failure_falls_back(self, fake_nltk_analyzer):
+        """배치 태깅이 실패하면 개별 분석 경로로 처리하는지 테스트"""
+        analyzer, tagger = fake_nltk_analyzer
+
+        def failing(sentences):
+            raise RuntimeError("tagger unavailable")
+
+        tagger.pos_tag_sents = failing
+        assert analyzer.analyze_batch(TRAFFIC) == [analyzer.analyze(text) for text in TRAFFIC]
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_batch_matches_single_with_local_data(self):
+        """로컬 NLTK 데이터가 있으면 실제 태거로도 결과가 같은지 테스트"""
+        warmup = local_nltk_warmup()
+        if not warmup.available:
+            pytest.skip(f"로컬 NLTK 데이터 없음: {warmup.missing}")
+        analyzer = NLPAnalyzer(warmup=warmup, start_warmup=False)
+        assert analyzer.analyze_batch(ARCHIVE) == [analyzer.analyze(text) for text in ARCHIVE]
+
+
+class TestAnalyzeBatchBenchmark:
+    """대량 재분석 벤치마크 (로컬 NLTK 데이터 필요)"""
+
+    @pytest.fixture
+    def warmed_analyzer(self):
+        warmup = local_nltk_warmup()
+        if not warmup.available:
+            pytest.skip(f"로컬 NLTK 데이터 없음: {warmup.missing}")
+        return NLPAnalyzer(warmup=warmup, start_warmup=False)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-batch")
+    def test_analyze_batch(self, benchmark, warmed_analyzer):
+        """언어별 한 번의 pos_tag_sents 호출"""
+        results = benchmark(warmed_analyzer.analyze_batch, ARCHIVE * 10)
+        assert len(results) == len(ARCHIVE) * 10
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-batch")
+    def test_analyze_each(self, benchmark, warmed_analyzer):
+        """텍스트마다 pos_tag 호출 (비교 기준)"""
+        results = benchmark(lambda: [warmed_analyzer.analyze(text) for text in ARCHIVE * 10])
+        assert len(results) == len(ARCHIVE) * 10
+
+
+class TestNLPStartupBenchmark:
+    """워커 콜드 스타트 시간 벤치마크 (새 인터프리터)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-startup")
+    def test_lazy_startup(self, benchmark):
+        """백그라운드 워밍업: 임포트와 생성만 기다림"""
+        benchmark.pedantic(run_python, args=(LAZY_STARTUP,), rounds=5, iterations=1)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-startup")
+    def test_eager_startup(self, benchmark):
+        """기존 방식: 시작 시 NLTK 로딩과 리소스 확인을 기다림 (비교 기준)"""
+        benchmark.pedantic(run_python, args=(EAGER_STARTUP,), rounds=5, iterations=1)
@@ -0,0 +1,125 @@
+"""
+NLPProcessPool 단위 테스트 및 동시 클라이언트 처리량 벤치마크
+"""
+
+import pickle
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.nlp_analyzer import NLPAnalyzer, NLPAnalysisResult, NLTKWarmup
+from src.utils.nlp_process_pool import NLPProcessPool, pack_result, unpack_result
+
+TEXTS = [
+    "밝고 화창한 날에 해변에서 뛰노는 강아지의 사진을 생성해주세요. 연락처는 010-1234-5678입니다.",
+    "Write a detailed technical blog post about vector databases, see https://example.com/docs 2024.",
+    "Please summarize the following meeting notes in three bullet points?",
+    "신나는 팝 음악을 만들어주세요",
+]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """자식 프로세스 2개로 시작한 풀을 반환합니다."""
+    with NLPProcessPool(max_workers=2, timeout=30.0) as instance:
+        instance.start()
+        yield instance
+
+
+@pytest.fixture
+def analyzer():
+    """요청 스레드에서 직접 분석하는 NLPAnalyzer (비교 기준)"""
+    warmup = NLTKWarmup()
+    warmup.run()
+    return NLPAnalyzer(warmup=warmup, start_warmup=False)
+
+
+class TestResultPacking:
+    """NLPAnalysisResult 압축 직렬화 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_round_trip(self, analyzer, text):
+        """압축 후 복원한 결과가 원래 결과와 같고 더 작은지 테스트"""
+        result = analyzer.analyze(text)
+        packed = pack_result(result)
+
+        assert unpack_result(pickle.loads(pickle.dumps(packed))) == result
+        assert len(pickle.dumps(packed)) < len(pickle.dumps(result))
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_round_trip_with_mismatched_tags(self):
+        """품사 태그 단어가 토큰과 다를 때도 그대로 복원되는지 테스트"""
+        result = NLPAnalysisResult(
+            language='en', tokens=["a", "b"], pos_tags=[("A", "DT")], entities=[],
+            key_phrases=[], sentiment='neutral', intent='general', complexity_score=0.5
+        )
+        assert unpack_result(pack_result(result)) == result
+
+
+class TestNLPProcessPool:
+    """프로세스 풀 분석/대체 경로 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.analyzer
+    def test_matches_in_thread_analysis(self, pool, analyzer):
+        """자식 프로세스 분석 결과가 직접 분석한 결과와 같은지 테스트"""
+        assert [pool.analyze(text) for text in TEXTS] == [analyzer.analyze(text) for text in TEXTS]
+        assert pool.analyze_many(TEXTS * 3) == [analyzer.analyze(text) for text in TEXTS * 3]
+
+    @pytest.mark.integration
+    @pytest.mark.analyzer
+    def test_timeout_falls_back_to_basic(self, pool, analyzer):
+        """제한 시간을 넘기면 기본 분석 결과를 반환하는지 테스트"""
+        text = "a long input sentence. " * 100000
+        before = pool.get_stats()["timeouts"]
+
+        result = pool.analyze(text, timeout=1e-6)
+        assert result == analyzer._analyze_basic(text, analyzer._detect_language(text))
+        assert pool.get_stats()["timeouts"] == before + 1
+
+    @pytest.mark.integration
+    @pytest.mark.analyzer
+    def test_bounded_queue_rejects_when_full(self):
+        """대기열이 가득 차면 풀에 넣지 않고 바로 기본 분석을 사용하는지 테스트"""
+        with NLPProcessPool(max_workers=1, max_pending=1, timeout=30.0) as small_pool:
+            blocker = small_pool.submit("a long input sentence. " * 100000)
+            assert blocker is not None
+
+            result = small_pool.analyze("Please help me.")
+            assert result.pos_tags == [(token, 'UNKNOWN') for token in result.tokens]
+            assert small_pool.get_stats()["rejected"] == 1
+
+            blocker.result(30)
+            assert small_pool.submit("Please help me.") is not None
+
+
+class TestNLPOffloadBenchmark:
+    """1/4/16 동시 클라이언트 처리량 벤치마크"""
+
+    # 요청 하나 분량 (긴 프롬프트)
+    WORKLOAD = [text * 40 for text in TEXTS] * 4
+
+    @staticmethod
+    def run_clients(analyze, clients: int, texts):
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            return list(executor.map(analyze, texts))
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-offload")
+    @pytest.mark.parametrize("clients", [1, 4, 16])
+    def test_process_pool(self, benchmark, clients):
+        """요청 스레드는 자식 프로세스 결과만 기다림"""
+        with NLPProcessPool(max_workers=4, timeout=30.0) as offload:
+            offload.start()
+            results = benchmark(self.run_clients, offload.analyze, clients, self.WORKLOAD)
+            assert offload.get_stats()["timeouts"] == 0
+        assert len(results) == len(self.WORKLOAD)
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="nlp-offload")
+    @pytest.mark.parametrize("clients", [1, 4, 16])
+    def test_request_threads(self, benchmark, analyzer, clients):
+        """요청 스레드에서 직접 분석 (GIL 공유, 비교 기준)"""
+        results = benchmark(self.run_clients, analyzer.analyze, clients, self.WORKLOAD)
+        assert len(results) == len(self.WORKLOAD)
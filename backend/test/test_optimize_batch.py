@@ -0,0 +1,201 @@
+"""
+다중 모델 배치 최적화(optimize_batch, /api/optimize/batch) 단위 테스트, API 테스트 및
+모델 N개 순차 요청 대비 벤치마크
+"""
+
+import itertools
+import threading
+import pytest
+from src.services.optimizer import PromptOptimizer
+from src.services.result_cache import OptimizationResultCache
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.intent_detector import IntentDetector
+from src.utils.intent_signal import IntentSignal
+
+TEXT = "노을 지는 해변에서 산책하는 고양이 사진을 상세하게 만들어주세요"
+
+# UI가 나란히 보여주는 모델 조합
+MODEL_IDS = ["gpt-4o", "gemini-2.5-pro", "grok-3", "dalle-3", "imagen-3"]
+
+# 모델마다 다른 값이 들어가는 필드와 시간에 따라 달라지는 보강 기록
+VOLATILE_FIELDS = ("enrichment",)
+
+
+class CountingDetector(IntentDetector):
+    """분류한 텍스트 수를 세는 의도 분류기"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def detect_intents(self, texts):
+        self.calls += len(texts)
+        return super().detect_intents(texts)
+
+
+@pytest.fixture
+def optimizer():
+    """결과 캐시와 보강 단계 없이 만든 PromptOptimizer를 반환합니다."""
+    optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[],
+                                result_cache=OptimizationResultCache(max_entries=0))
+    yield optimizer
+    optimizer.shutdown()
+
+
+def comparable(result):
+    """비교용으로 분석 결과의 시간 의존 필드를 뺀 결과"""
+    analysis = {key: value for key, value in dict(result["analysis_result"].items()).items()
+                if key not in VOLATILE_FIELDS}
+    return dict(result, analysis_result=analysis)
+
+
+class TestOptimizeBatch:
+    """공유 분석 배치 최적화 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_matches_single_requests(self, optimizer):
+        """모델별 결과가 optimize_prompt를 따로 호출한 결과와 같은지 테스트"""
+        results = optimizer.optimize_batch(TEXT, MODEL_IDS)
+
+        assert [result["model_id"] for result in results] == MODEL_IDS
+        for model_id, result in zip(MODEL_IDS, results):
+            assert comparable(result) == comparable(optimizer.optimize_prompt(TEXT, model_id))
+
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_analyzes_once(self, optimizer, monkeypatch):
+        """분석 캐시가 없어도 텍스트 기반 분석과 의도 분류를 한 번만 하는지 테스트"""
+        detector = CountingDetector()
+        optimizer.input_analyzer = InputAnalyzer(cache_size=0, intent_signal=IntentSignal(detector))
+        computed = []
+        compute = optimizer.input_analyzer._compute_core_field
+        monkeypatch.setattr(optimizer.input_analyzer, "_compute_core_field",
+                            lambda text, field, scratch: computed.append(field) or compute(text, field, scratch))
+
+        results = optimizer.optimize_batch(TEXT, MODEL_IDS)
+
+        assert all(result["success"] for result in results)
+        assert detector.calls == 1
+        assert len(computed) == len(set(computed))
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_per_model_errors(self, optimizer, monkeypatch):
+        """지원하지 않는 모델과 실패한 모델은 해당 항목에만 오류를 담는지 테스트"""
+        monkeypatch.setattr(optimizer.models["imagen-3"], "get_generation_parameters", lambda *args: 1 / 0)
+
+        results = optimizer.optimize_batch(TEXT, ["gpt-4o", "unknown-model", "imagen-3", "gpt-4o", "dalle-3"])
+
+        assert [result["success"] for result in results] == [True, False, False, True]
+        assert "지원하지 않는 모델 ID" in results[1]["error"]
+        assert results[2]["model_id"] == "imagen-3" and "division by zero" in results[2]["error"]
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_results_are_independent(self, optimizer):
+        """모델별 결과의 분석/의도 값을 수정해도 다른 모델 결과에 영향이 없는지 테스트"""
+        first, second = optimizer.optimize_batch(TEXT, ["gpt-4o", "grok-3"], {"tone": ["formal"]})
+
+        first["analysis_result"]["keywords"].append("changed")
+        first["analysis_result"]["tone"].append("changed")
+        first["intent_result"]["primary_intent"] = "changed"
+
+        assert "changed" not in second["analysis_result"]["keywords"]
+        assert second["analysis_result"]["tone"] == ["formal"]
+        assert second["intent_result"]["primary_intent"] != "changed"
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_bounded_pool(self, monkeypatch):
+        """모델별 단계가 batch_workers 개 이하의 작업 스레드에서 실행되는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[], batch_workers=2)
+        threads = set()
+        for model_id in MODEL_IDS:
+            model = optimizer.models[model_id]
+            original = model.optimize_prompt
+            monkeypatch.setattr(model, "optimize_prompt", lambda *args, _original=original: (
+                threads.add(threading.current_thread().name), _original(*args))[1])
+        try:
+            assert all(result["success"] for result in optimizer.optimize_batch(TEXT, MODEL_IDS))
+            assert 1 <= len(threads) <= 2
+            assert all(name.startswith("optimize-batch") for name in threads)
+        finally:
+            optimizer.shutdown()
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_shares_result_cache(self):
+        """배치 결과가 결과 캐시에 저장되어 단건 요청과 서로 재사용되는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[])
+        try:
+            optimizer.optimize_prompt(TEXT, "gpt-4o")
+            optimizer.optimize_batch(TEXT, ["gpt-4o", "dalle-3"])
+            optimizer.optimize_prompt(TEXT, "dalle-3")
+
+            stats = optimizer.get_result_cache_stats()
+            assert (stats["hits"], stats["misses"]) == (2, 2)
+        finally:
+            optimizer.shutdown()
+
+
+class TestOptimizeBatchEndpoint:
+    """POST /api/optimize/batch 테스트"""
+
+    @pytest.mark.integration
+    def test_batch_endpoint(self, client):
+        """모델별 결과를 model_ids 순서로 반환하는지 테스트"""
+        response = client.post("/api/optimize/batch", json={
+            "input_text": TEXT, "model_ids": ["gpt-4o", "unknown-model", "imagen-3"]})
+        data = response.get_json()
+
+        assert response.status_code == 200 and data["success"] is True
+        assert [result["success"] for result in data["results"]] == [True, False, True]
+        assert data["results"][2]["model_id"] == "imagen-3"
+        assert data["results"][2]["generation_params"]
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("body", [
+        {"input_text": TEXT},
+        {"input_text": TEXT, "model_ids": []},
+        {"input_text": TEXT, "model_ids": "gpt-4o"},
+        {"input_text": TEXT, "model_ids": ["gpt-4o", 3]},
+        {"input_text": TEXT, "model_ids": ["gpt-4o"] * 17},
+        {"input_text": "", "model_ids": ["gpt-4o"]},
+        {"input_text": TEXT, "model_ids": ["gpt-4o"], "additional_params": ["x"]},
+    ])
+    def test_invalid_request(self, client, body):
+        """잘못된 요청은 400 오류인지 테스트"""
+        response = client.post("/api/optimize/batch", json=body)
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+
+
+class TestOptimizeBatchBenchmark:
+    """모델 5개에 대한 같은 입력 최적화 벤치마크 (배치 1회 vs optimize_prompt 5회, 결과 캐시 없음)"""
+
+    @pytest.fixture
+    def optimizer(self):
+        """기본 NLP 보강 단계를 쓰고 결과 캐시는 끈 PromptOptimizer (모델은 미리 불러옴)"""
+        optimizer = PromptOptimizer(preload_models=MODEL_IDS, result_cache=OptimizationResultCache(max_entries=0))
+        yield optimizer
+        optimizer.shutdown()
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="optimize-batch")
+    def test_batch(self, benchmark, optimizer):
+        """분석/의도 분류/보강 한 번 + 모델별 단계 스레드 풀 실행"""
+        counter = itertools.count()
+        benchmark(lambda: optimizer.optimize_batch(f"{TEXT} {next(counter)}", MODEL_IDS))
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="optimize-batch")
+    def test_sequential(self, benchmark, optimizer):
+        """모델마다 optimize_prompt 호출 (기존 방식, 비교 기준)"""
+        counter = itertools.count()
+
+        def sequential():
+            text = f"{TEXT} {next(counter)}"
+            return [optimizer.optimize_prompt(text, model_id) for model_id in MODEL_IDS]
+
+        benchmark(sequential)
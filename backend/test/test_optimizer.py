@@ -94,6 +94,23 @@ class TestPromptOptimizer:
             assert hasattr(model, 'capabilities')
             assert hasattr(model, 'optimize_prompt')
     
+    @pytest.mark.integration
+    @pytest.mark.optimizer
+    def test_model_category_index(self, optimizer):
+        """로드된 모델의 capabilities로 카테고리 색인이 만들어지는지 테스트"""
+        expected = {"gpt-4o": "text", "imagen-3": "image", "dalle-3": "image", "sora": "video", "suno": "music"}
+        for model_id, category in expected.items():
+            assert optimizer.models[model_id].category == category
+            assert optimizer.input_analyzer._get_model_category(model_id) == category
+        
+        # 새로 등록한 모델도 바로 반영
+        from src.models.image_models.imagen3_model import Imagen3Model
+        model = Imagen3Model()
+        model.model_id = "imagen-3-fast"
+        optimizer.register_model(model)
+        assert optimizer.input_analyzer._get_model_category("imagen-3-fast") == "image"
+        assert optimizer.optimize_prompt("해변의 강아지 사진", "imagen-3-fast")["analysis_result"]["model_category"] == "image"
+    
     @pytest.mark.integration
     @pytest.mark.optimizer
     def test_get_available_models(self, optimizer):
@@ -0,0 +1,232 @@
+"""
+최적화 결과 캐시(OptimizationResultCache) 단위 테스트, API 우회 테스트 및 반복 요청 벤치마크
+"""
+
+import time
+import pytest
+from src.services.enrichment import EnrichmentStage
+from src.services.optimizer import PromptOptimizer
+from src.services.result_cache import OptimizationResultCache, model_version
+
+TEXT = "노을 지는 해변에서 산책하는 고양이 사진"
+
+# 반복 요청이 섞인 트래픽 (고유 입력 4개 x 모델 2개)
+TRAFFIC = [
+    ("블로그 포스트를 작성해주세요", "gpt-4o"),
+    ("노을 지는 해변에서 산책하는 고양이 사진", "dalle-3"),
+    ("Summarize this article in three bullet points", "gpt-4o"),
+    ("밝고 화창한 날에 해변에서 뛰노는 강아지의 사진", "imagen-3"),
+] * 2
+
+
+class SlowStage(EnrichmentStage):
+    """시간 예산보다 오래 걸리는 보강 단계"""
+
+    name = "slow"
+
+    def enrich(self, text):
+        time.sleep(0.05)
+        return {"slow": True}
+
+
+@pytest.fixture
+def optimizer():
+    """보강 단계 없이 만든 PromptOptimizer를 반환합니다."""
+    optimizer = PromptOptimizer(enrichment_stages=[], preload_models=[])
+    yield optimizer
+    optimizer.shutdown()
+
+
+def count_computations(optimizer, monkeypatch):
+    """캐시를 거치지 않은 최적화 횟수를 세는 리스트를 반환합니다."""
+    calls = []
+    compute = optimizer._optimize_prompt
+
+    def counting(*args):
+        calls.append(args[:2])
+        return compute(*args)
+
+    monkeypatch.setattr(optimizer, "_optimize_prompt", counting)
+    return calls
+
+
+class TestResultCache:
+    """캐시 적중/키/무효화 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_repeat_request_hits(self, optimizer, monkeypatch):
+        """같은 요청은 한 번만 계산하고 같은 결과를 돌려주는지 테스트"""
+        calls = count_computations(optimizer, monkeypatch)
+        first = optimizer.optimize_prompt(TEXT, "gpt-4o")
+        second = optimizer.optimize_prompt(TEXT, "gpt-4o")
+
+        assert len(calls) == 1
+        assert second == first
+        stats = optimizer.get_result_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["bytes"] > 0
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_key_includes_model_and_params(self, optimizer, monkeypatch):
+        """모델 ID와 추가 매개변수가 다르면 다시 계산하는지 테스트"""
+        calls = count_computations(optimizer, monkeypatch)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        optimizer.optimize_prompt(TEXT, "dalle-3")
+        optimizer.optimize_prompt(TEXT, "gpt-4o", {"tone": "formal"})
+        optimizer.optimize_prompt(TEXT, "gpt-4o", {"tone": "formal"})
+        optimizer.optimize_prompt(TEXT + " ", "gpt-4o")
+
+        assert len(calls) == 4
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_hit_returns_independent_copy(self, optimizer):
+        """적중 결과를 수정해도 캐시된 결과는 바뀌지 않는지 테스트"""
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        hit = optimizer.optimize_prompt(TEXT, "gpt-4o")
+        hit["optimized_prompt"] = "changed"
+        hit["analysis_result"]["keywords"].append("changed")
+
+        again = optimizer.optimize_prompt(TEXT, "gpt-4o")
+        assert again["optimized_prompt"] != "changed"
+        assert "changed" not in again["analysis_result"]["keywords"]
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_bypass(self, optimizer, monkeypatch):
+        """use_cache=False면 캐시를 조회/저장하지 않는지 테스트"""
+        calls = count_computations(optimizer, monkeypatch)
+        optimizer.optimize_prompt(TEXT, "gpt-4o", use_cache=False)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        optimizer.optimize_prompt(TEXT, "gpt-4o", use_cache=False)
+
+        assert len(calls) == 3
+        stats = optimizer.get_result_cache_stats()
+        assert (stats["bypasses"], stats["size"]) == (2, 1)
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_failures_and_timeouts_not_cached(self, monkeypatch):
+        """실패한 결과와 보강 단계가 시간 초과된 결과는 저장하지 않는지 테스트"""
+        optimizer = PromptOptimizer(enrichment_stages=[SlowStage()], enrichment_deadline_ms=1, preload_models=[])
+        try:
+            assert optimizer.optimize_prompt(TEXT, "gpt-4o")["analysis_result"]["enrichment"]["slow"]["status"] == "timeout"
+            monkeypatch.setattr(optimizer.models["dalle-3"], "optimize_prompt", lambda *args: 1 / 0)
+            assert optimizer.optimize_prompt(TEXT, "dalle-3")["success"] is False
+
+            stats = optimizer.get_result_cache_stats()
+            assert (stats["size"], stats["uncacheable"]) == (0, 2)
+        finally:
+            optimizer.shutdown()
+
+    @pytest.mark.unit
+    @pytest.mark.model
+    def test_version_tracks_class_and_templates(self, optimizer):
+        """버전 키가 모델 클래스와 템플릿 데이터에 따라 바뀌는지 테스트"""
+        from src.models.video_models import SoraModel
+
+        sora, other = SoraModel(), SoraModel()
+        assert model_version(sora) == model_version(other)
+        assert model_version(sora) != model_version(optimizer.models["pika"])
+
+        other.scene_templates = dict(other.scene_templates, custom="{subject}")
+        assert model_version(sora) != model_version(other)
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_register_model_invalidates(self, optimizer, monkeypatch):
+        """같은 ID로 템플릿이 다른 모델을 등록하면 이전 결과를 쓰지 않는지 테스트"""
+        from src.models.text_models import GPT4oModel
+
+        calls = count_computations(optimizer, monkeypatch)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        model = GPT4oModel()
+        model.best_practices = model.best_practices + ["항상 한국어로 답변"]
+        optimizer.register_model(model)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_rebuild_keyword_index_invalidates(self, optimizer, monkeypatch):
+        """분석기 키워드 사전을 다시 만들면 이전 분석으로 만든 결과를 쓰지 않는지 테스트"""
+        calls = count_computations(optimizer, monkeypatch)
+        text = "노래를 만들어줘"
+        before = optimizer.optimize_prompt(text, "gpt-4o")
+        optimizer.input_analyzer.task_keywords["music_creation"] = ["노래"]
+        optimizer.input_analyzer.rebuild_keyword_index()
+        after = optimizer.optimize_prompt(text, "gpt-4o")
+
+        assert len(calls) == 2
+        assert after["analysis_result"]["task_type"] != before["analysis_result"]["task_type"]
+        assert after["analysis_result"]["task_type"][0] == ("music_creation", 1.0)
+
+    @pytest.mark.unit
+    @pytest.mark.optimizer
+    def test_analyzer_and_intent_model_swap_invalidate(self, optimizer, monkeypatch):
+        """분석기나 의도 모델을 교체하면 다시 계산하는지 테스트"""
+        from src.utils.input_analyzer import InputAnalyzer
+
+        calls = count_computations(optimizer, monkeypatch)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        optimizer.input_analyzer = InputAnalyzer(intent_signal=optimizer.intent_signal)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        monkeypatch.setattr(optimizer.intent_detector, "model", None)
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+        optimizer.optimize_prompt(TEXT, "gpt-4o")
+
+        assert len(calls) == 3
+
+    @pytest.mark.unit
+    def test_size_bounds(self):
+        """항목 수와 직렬화 크기 합계 상한을 지키는지 테스트"""
+        cache = OptimizationResultCache(max_entries=2, max_bytes=None)
+        for n in range(3):
+            cache.put(("m", "v", str(n), "{}"), {"n": n})
+        assert cache.get(("m", "v", "0", "{}")) is None
+        assert cache.get_stats()["evictions"] == 1
+
+        cache = OptimizationResultCache(max_entries=100, max_bytes=200)
+        for n in range(10):
+            cache.put(("m", "v", str(n), "{}"), {"n": n, "text": "x" * 50})
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 200 and stats["evictions"] > 0
+        assert cache.get(("m", "v", "9", "{}"))["n"] == 9
+
+
+class TestResultCacheEndpoint:
+    """/api/optimize 캐시 우회 테스트"""
+
+    @pytest.mark.integration
+    def test_bypass_flags(self, client):
+        """use_cache: false 본문과 Cache-Control: no-cache 헤더로 캐시를 우회하는지 테스트"""
+        body = {"input_text": "결과 캐시 우회 테스트용 블로그 글", "model_id": "gpt-4o"}
+        before = client.get("/api/health").get_json()["result_cache"]
+
+        assert client.post("/api/optimize", json=body).get_json()["success"] is True
+        assert client.post("/api/optimize", json=body).get_json()["success"] is True
+        client.post("/api/optimize", json=dict(body, use_cache=False))
+        client.post("/api/optimize", json=body, headers={"Cache-Control": "no-cache"})
+
+        after = client.get("/api/health").get_json()["result_cache"]
+        assert after["bypasses"] - before["bypasses"] == 2
+        assert after["hits"] - before["hits"] >= 1
+
+
+class TestResultCacheBenchmark:
+    """반복 요청이 섞인 트래픽 처리 시간 벤치마크 (결과 캐시 vs 매 요청 계산)"""
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="result-cache")
+    def test_cached(self, benchmark, optimizer):
+        """결과 캐시 사용 (첫 라운드 이후 모두 적중)"""
+        benchmark(lambda: [optimizer.optimize_prompt(text, model_id) for text, model_id in TRAFFIC])
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="result-cache")
+    def test_uncached(self, benchmark, optimizer):
+        """매 요청 분석/프롬프트 생성 (기존 방식, 비교 기준)"""
+        benchmark(lambda: [optimizer.optimize_prompt(text, model_id, use_cache=False) for text, model_id in TRAFFIC])
@@ -0,0 +1,131 @@
+"""
+SentimentEngine(감성 사전 매처) 단위 테스트 및 긴 리뷰 텍스트 벤치마크
+"""
+
+import pytest
+from src.utils.nlp_analyzer import NLPAnalyzer, NLTKWarmup
+from src.utils.sentiment_lexicon import (
+    DEFAULT_LEXICON_PATHS, SentimentEngine, SentimentLexicon, get_sentiment_engine, load_lexicon
+)
+
+# 기존 분석기에 하드코딩되어 있던 단어 목록
+LEGACY_WORDS = {
+    'ko': (['좋다', '훌륭', '최고', '멋지다', '행복', '기쁘다', '사랑', '감사'],
+           ['나쁘다', '싫다', '최악', '화나다', '슬프다', '실망', '문제', '오류']),
+    'en': (['good', 'great', 'excellent', 'love', 'happy', 'wonderful', 'best'],
+           ['bad', 'hate', 'terrible', 'worst', 'sad', 'angry', 'problem']),
+}
+
+
+def legacy_counts(text: str, positive_words, negative_words, tokens=None):
+    """사전 단어마다 텍스트를 한 번씩 훑는 기존 방식 (비교 기준)"""
+    haystack = text if tokens is None else tokens
+    return (sum(1 for word in positive_words if word in haystack),
+            sum(1 for word in negative_words if word in haystack))
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """기본 사전 파일을 읽은 SentimentEngine을 반환합니다."""
+    return get_sentiment_engine()
+
+
+class TestSentimentLexicon:
+    """사전 매칭 결과 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("language", ["ko", "en"])
+    def test_lexicon_covers_legacy_words(self, language):
+        """기본 사전이 기존 단어 목록을 모두 같은 극성으로 포함하는지 테스트"""
+        entries = dict(load_lexicon(DEFAULT_LEXICON_PATHS[language]))
+        positive_words, negative_words = LEGACY_WORDS[language]
+        assert all(entries[word] == 'positive' for word in positive_words)
+        assert all(entries[word] == 'negative' for word in negative_words)
+        assert len(entries) >= 100
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("language,text,label", [
+        ("ko", "정말 최고의 서비스였어요. 감사합니다", "positive"),
+        ("ko", "최악이에요. 오류가 계속 나서 실망했어요", "negative"),
+        ("ko", "내일 회의 자료를 정리해 주세요", "neutral"),
+        ("en", "this is a great and wonderful tool", "positive"),
+        ("en", "the worst update, everything is broken", "negative"),
+        ("en", "schedule the meeting for tuesday", "neutral"),
+    ])
+    def test_labels(self, engine, language, text, label):
+        """긍정/부정/중립 레이블 테스트"""
+        assert engine.analyze(text, language).label == label
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_counts_and_score(self):
+        """서로 다른 사전 항목 수와 -1~1 점수를 반환하는지 테스트"""
+        lexicon = SentimentLexicon([("좋", "positive"), ("좋아", "positive"), ("문제", "negative")])
+        result = lexicon.analyze("좋아요 좋아요 그런데 문제가 있어요")
+        assert (result.positive, result.negative) == (2, 1)
+        assert result.score == pytest.approx(1 / 3)
+        assert lexicon.analyze("없음").score == 0.0
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_token_mode_matches_legacy(self, engine):
+        """영어는 기존처럼 공백 기준 토큰과 정확히 같은 단어만 매칭하는지 테스트"""
+        positive_words, negative_words = LEGACY_WORDS['en']
+        lexicon = SentimentLexicon([(word, 'positive') for word in positive_words] +
+                                   [(word, 'negative') for word in negative_words], match='token')
+        for text in ["Good good GREAT", "goodness is not bad", "bad, sad and angry", "I love it! best"]:
+            assert lexicon.count(text) == legacy_counts(text, positive_words, negative_words, text.lower().split())
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_substring_mode_matches_legacy(self):
+        """한국어는 기존처럼 부분 문자열로 매칭하는지 테스트"""
+        positive_words, negative_words = LEGACY_WORDS['ko']
+        lexicon = SentimentLexicon([(word, 'positive') for word in positive_words] +
+                                   [(word, 'negative') for word in negative_words])
+        for text in ["최고최고 감사감사", "문제와 오류, 최악", "사랑은 실망을 이긴다", "아무 말"]:
+            assert lexicon.count(text) == legacy_counts(text, positive_words, negative_words)
+
+    @pytest.mark.unit
+    def test_unknown_language_and_invalid_file(self, engine, tmp_path):
+        """사전이 없는 언어는 중립, 잘못된 극성은 오류인지 테스트"""
+        assert engine.analyze("très bien", "fr").label == "neutral"
+
+        path = tmp_path / "bad.tsv"
+        path.write_text("# comment\ngood\tgreat\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            SentimentEngine({"en": str(path)})
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_nlp_analyzer_uses_shared_engine(self, engine):
+        """NLPAnalyzer가 공유 엔진으로 감성을 분석하는지 테스트"""
+        analyzer = NLPAnalyzer(warmup=NLTKWarmup(), start_warmup=False)
+        assert analyzer._sentiment_engine is engine
+        assert analyzer.analyze("정말 멋진 사진이에요, 감사합니다").sentiment == "positive"
+
+
+class TestSentimentBenchmark:
+    """긴 리뷰 텍스트 감성 분석 벤치마크 (컴파일된 매처 vs 사전 단어마다 텍스트 검색)"""
+
+    TEXT = ("배송은 빨랐지만 포장이 엉망이었고 설명서에 오류가 있어서 조금 실망했어요. "
+            "그래도 디자인은 정말 예쁘고 성능은 최고라서 만족합니다. ") * 200
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="sentiment-lexicon")
+    def test_compiled(self, benchmark, engine):
+        """감성 사전을 하나의 오토마톤으로 컴파일해 한 번 순회"""
+        result = benchmark(engine.analyze, self.TEXT, "ko")
+        assert result.positive > 0 and result.negative > 0
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="sentiment-lexicon")
+    def test_per_word_scan(self, benchmark):
+        """같은 사전으로 단어마다 `word in text` 검색 (기존 방식)"""
+        entries = load_lexicon(DEFAULT_LEXICON_PATHS['ko'])
+        positive_words = [word for word, polarity in entries if polarity == 'positive']
+        negative_words = [word for word, polarity in entries if polarity == 'negative']
+        positive, negative = benchmark(legacy_counts, self.TEXT, positive_words, negative_words)
+        assert positive > 0 and negative > 0
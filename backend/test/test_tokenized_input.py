@@ -0,0 +1,170 @@
+"""
+TokenizedInput 단위 테스트 및 파이프라인 벤치마크
+"""
+
+import copy
+import json
+import pickle
+import random
+import re
+import pytest
+import src.services.optimizer as optimizer_module
+from src.services.optimizer import PromptOptimizer
+from src.services.result_cache import OptimizationResultCache
+from src.utils.input_analyzer import InputAnalyzer
+from src.utils.tokenized_input import TokenizedInput, get_tokenized
+
+
+class CountingStr(str):
+    """lower()/split() 호출 수(전체 텍스트 순회 수)를 세는 문자열 (비교 기준)"""
+
+    calls = 0
+
+    def lower(self):
+        CountingStr.calls += 1
+        return str.lower(self)
+
+    def split(self, *args):
+        CountingStr.calls += 1
+        return str.split(self, *args)
+
+
+def build_text(seed: int) -> str:
+    """한/영 혼합 무작위 입력을 생성합니다."""
+    rng = random.Random(seed)
+    words = ["상세한", "기술", "문서", "Data", "VISUAL", "차트", "a", "the", "고양이", "사진", "Σ", "İstanbul", "123"]
+    separators = [" ", "  ", ", ", ". ", "\n", "\t"]
+    return "".join(rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(0, 60)))
+
+
+@pytest.fixture
+def optimizer():
+    """결과 캐시를 끈 PromptOptimizer 인스턴스를 반환합니다."""
+    instance = PromptOptimizer(result_cache=OptimizationResultCache(max_entries=0))
+    instance.input_analyzer = InputAnalyzer(cache_size=0)
+    return instance
+
+
+class TestTokenizedInput:
+    """TokenizedInput 클래스 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_behaves_like_str(self):
+        """문자열 비교, 직렬화, 복사가 원문과 같은지 테스트"""
+        text = TokenizedInput("고양이 사진 Style")
+
+        assert text == "고양이 사진 Style"
+        assert hash(text) == hash("고양이 사진 Style")
+        assert json.dumps({"text": text}) == json.dumps({"text": "고양이 사진 Style"})
+        assert copy.deepcopy(text) is text
+        restored = pickle.loads(pickle.dumps(text))
+        assert isinstance(restored, TokenizedInput) and restored == text
+        assert TokenizedInput(text) is text
+        assert get_tokenized(text) is text and get_tokenized("plain") is None
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("seed", range(20))
+    def test_fields_match_str_operations(self, seed):
+        """소문자 텍스트, 토큰, 위치, 단어 수가 일반 문자열 연산 결과와 같은지 테스트"""
+        raw = build_text(seed)
+        text = TokenizedInput(raw)
+
+        assert text.lower() == raw.lower()
+        assert text.tokens == re.findall(r'\w+', raw.lower())
+        assert text.offsets == [m.start() for m in re.finditer(r'\w+', raw.lower())]
+        assert text.token_set == frozenset(text.tokens)
+        assert text.word_count == len(raw.split())
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_each_pass_runs_once(self):
+        """각 결과가 처음 사용할 때 한 번만 계산되는지 테스트"""
+        text = TokenizedInput("Hello World hello")
+        for _ in range(3):
+            text.lower()
+            text.tokens
+            text.word_count
+        assert text.passes == 3
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    def test_strip_keeps_lowered_text(self):
+        """공백 제거 후에도 이미 만든 소문자 텍스트를 재사용하는지 테스트"""
+        text = TokenizedInput("  Hello World \n")
+        text.lower()
+
+        stripped = text.strip()
+        assert isinstance(stripped, TokenizedInput) and stripped == "Hello World"
+        assert stripped.lower() == "hello world" and stripped.passes == 0
+        assert TokenizedInput("abc").strip() == "abc"
+        assert text.strip(" ") == "Hello World \n"
+
+
+class TestTokenizedPipeline:
+    """분석 파이프라인이 TokenizedInput을 공유하는지 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("seed", range(20))
+    def test_keywords_match_plain_text(self, seed):
+        """토큰 재사용 키워드 추출 결과가 일반 문자열과 같은지 테스트"""
+        analyzer = InputAnalyzer()
+        raw = build_text(seed)
+        assert analyzer._extract_keywords(TokenizedInput(raw)) == analyzer._extract_keywords(raw)
+
+    @pytest.mark.unit
+    @pytest.mark.analyzer
+    @pytest.mark.parametrize("seed", range(5))
+    def test_analyze_matches_plain_text(self, seed):
+        """TokenizedInput 분석 결과가 일반 문자열 분석 결과와 같은지 테스트"""
+        raw = build_text(seed)
+        expected = InputAnalyzer().analyze(raw, "gpt-4o").to_dict()
+        assert InputAnalyzer().analyze(TokenizedInput(raw), "gpt-4o").to_dict() == expected
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("model_id", ["gpt-4o", "imagen-3", "dalle-3"])
+    def test_single_lowercase_pass(self, optimizer, monkeypatch, model_id):
+        """요청 하나에서 의도 감지와 모델이 소문자 변환을 한 번만 수행하는지 테스트"""
+        text = "고양이 사진을 상세한 기술 문서 스타일로 만들어주세요. Realistic photo "
+
+        result = optimizer.optimize_prompt(text, model_id)
+        assert result["success"]
+        json.dumps(result, default=str)
+        shared = result["analysis_result"]["input_text"]
+        assert isinstance(shared, TokenizedInput)
+        assert shared.passes == 1
+
+        # 공유하지 않으면 단계마다 원문을 다시 순회
+        monkeypatch.setattr(optimizer_module, "TokenizedInput", lambda value: value)
+        CountingStr.calls = 0
+        legacy = optimizer.optimize_prompt(CountingStr(text), model_id)
+        json.dumps(legacy, default=str)
+        assert legacy["optimized_prompt"] == result["optimized_prompt"]
+        # 의도 감지는 분석기가 정규화한 사본에서 수행되므로 원문 객체는 모델 단계에서만 순회
+        if model_id != "gpt-4o":
+            assert CountingStr.calls >= shared.passes
+
+
+class TestTokenizedPipelineBenchmark:
+    """긴 입력에 대한 요청 전체 처리 시간 벤치마크"""
+
+    TEXT = "상세한 기술 문서와 데이터 시각화 차트를 포함한 고양이 사진. Realistic photo style " * 400
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="tokenized-pipeline")
+    @pytest.mark.parametrize("model_id", ["gpt-4o", "imagen-3"])
+    def test_shared_tokenization(self, benchmark, optimizer, model_id):
+        """요청당 한 번 토큰화하여 모든 단계가 공유"""
+        result = benchmark(lambda: json.dumps(optimizer.optimize_prompt(self.TEXT, model_id), default=str))
+        assert '"success": true' in result
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="tokenized-pipeline")
+    @pytest.mark.parametrize("model_id", ["gpt-4o", "imagen-3"])
+    def test_per_stage_tokenization(self, benchmark, optimizer, monkeypatch, model_id):
+        """단계마다 원문을 다시 순회 (비교 기준)"""
+        monkeypatch.setattr(optimizer_module, "TokenizedInput", lambda value: value)
+        result = benchmark(lambda: json.dumps(optimizer.optimize_prompt(self.TEXT, model_id), default=str))
+        assert '"success": true' in result